@@ -9,18 +9,23 @@
 import logging
 import os
 import sys
-
-# Local imports
-from csmgvt.generators import ComponentsGenerator, CSMGenerator
+from importlib.metadata import version
 
 # Internal library imports
-from ecoa_toolset.arguments import check_ecoa_xml, create_output_directory, select_output_directory
+from ecoa_toolset.arguments import check_ecoa_xml, create_output_directory, create_xml_cache, select_output_directory
 from ecoa_toolset.configuration import ecoa_std_version
-from ecoa_toolset.generators.types.generator import TypesGenerator
-from ecoa_toolset.models.ecoa_model import ECOAModel
+from ecoa_toolset.generators.container.common import Common
+from ecoa_toolset.generators.manifest import GenerationManifest
 from ecoa_toolset.utils.arguments.argument_factory import ArgumentFactory
 from ecoa_toolset.utils.arguments.custom_action import Once, OnceAndStoreTrue
-from ecoa_toolset.utils.arguments.custom_type import check_checker_value, check_project_value
+from ecoa_toolset.utils.arguments.custom_type import (
+    check_checker_value,
+    check_event_queue_value,
+    check_jobs_value,
+    check_log_buffer_value,
+    check_project_value,
+    check_xsd_value,
+)
 from ecoa_toolset.utils.arguments.optional import OptionalArgument
 from ecoa_toolset.utils.logging.logger import Logger
 
@@ -36,6 +41,24 @@ def _get_subpaths(ecoa_model) -> bool:
     return subpaths
 
 
+def _get_generation_context(args) -> str:
+    # The options affecting the generated files (not the jobs, the cache and the incremental generation itself)
+    return " ".join(
+        [
+            "ecoa-csmgvt",
+            version("ecoa-csmgvt"),
+            os.path.abspath(args.output),
+            args.dispatch,
+            str(args.threads),
+            str(args.event_queue),
+            str(args.metrics),
+            str(args.log_buffer),
+            str(args.pinfo_access),
+            str(args.warm_start),
+        ]
+    )
+
+
 def _create_argument_parser():
     return ArgumentFactory.create(
         "ecoa-csmgvt generates a framework for functional testing of an ECOA application on a desktop PC.\n"
@@ -105,7 +128,124 @@ def _create_argument_parser():
                 ),
                 action=Once,
                 type=check_checker_value,
-                required=True,
+            ),
+            OptionalArgument(
+                "-x",
+                "--xsd",
+                (
+                    "Directory of the ECOA XSDs to check the validity of the ECOA XML files in-process, while they are "
+                    + "parsed, instead of running the checker.\n"
+                    + "One of the -k/--checker and -x/--xsd options is required."
+                ),
+                action=Once,
+                type=check_xsd_value,
+            ),
+            OptionalArgument(
+                "-F",
+                "--fast-parsing",
+                (
+                    "Bind the ECOA XML files with a lightweight lxml parser instead of the strict xsdata parser, "
+                    + "leaving their validation to the checker."
+                ),
+                action=OnceAndStoreTrue,
+            ),
+            OptionalArgument(
+                "-j",
+                "--jobs",
+                "Number of worker processes used to parse the ECOA XML files.\nDefault to 1 (serial parsing).",
+                action=Once,
+                type=check_jobs_value,
+                default=1,
+            ),
+            OptionalArgument(
+                "-n",
+                "--no-cache",
+                "Always parse the ECOA XML files instead of loading the unchanged ones from the cache.",
+                action=OnceAndStoreTrue,
+            ),
+            OptionalArgument(
+                "-i",
+                "--incremental",
+                "Only generate the components whose ECOA XML inputs changed since the previous generation.",
+                action=OnceAndStoreTrue,
+            ),
+            OptionalArgument(
+                "-d",
+                "--dispatch",
+                (
+                    "Set how the container mock selects the calling module instance\nAvailable dispatches:"
+                    + "\n\t- if: if / else if chain"
+                    + "\n\t- switch: switch statement on the dense module instance identifiers"
+                    + "\nDefault to "
+                    + Common.IF_DISPATCH
+                    + "."
+                ),
+                action=Once,
+                default=Common.IF_DISPATCH,
+                choices=Common.DISPATCHES,
+            ),
+            OptionalArgument(
+                "-t",
+                "--threads",
+                "Run each protection domain of the deployment on its own worker thread, with its own queue of events.",
+                action=OnceAndStoreTrue,
+            ),
+            OptionalArgument(
+                "-e",
+                "--event-queue",
+                (
+                    "Queue the events sent by the modules instead of calling their receivers directly.\n"
+                    + "The queue holds up to EVENT_QUEUE events, dispatched in the order of the priorities of their "
+                    + "receivers."
+                ),
+                action=Once,
+                type=check_event_queue_value,
+            ),
+            OptionalArgument(
+                "-m",
+                "--metrics",
+                (
+                    "Record the call count and the latency of the container functions per module instance.\n"
+                    + "The metrics are written to CSM_metrics.csv at the end of the execution (SIGINT, SIGTERM) and "
+                    + "on SIGUSR1."
+                ),
+                action=OnceAndStoreTrue,
+            ),
+            OptionalArgument(
+                "-b",
+                "--log-buffer",
+                (
+                    "Copy the log records of the modules to a ring buffer of LOG_BUFFER records instead of printing "
+                    + "them.\n"
+                    + "A background thread writes them to the standard output, or to the file named by CSM_LOG_FILE."
+                ),
+                action=Once,
+                type=check_log_buffer_value,
+            ),
+            OptionalArgument(
+                "-a",
+                "--pinfo-access",
+                (
+                    "Set how the container mock reads the PINFO files\nAvailable accesses:"
+                    + "\n\t- stream: file stream opened per module instance"
+                    + "\n\t- mmap: file mapped read-only once at initialization, shared by the module instances"
+                    + "\nDefault to "
+                    + Common.STREAM_PINFO_ACCESS
+                    + "."
+                ),
+                action=Once,
+                default=Common.STREAM_PINFO_ACCESS,
+                choices=Common.PINFO_ACCESSES,
+            ),
+            OptionalArgument(
+                "-w",
+                "--warm-start",
+                (
+                    "Save the warm start contexts of the modules to a file mapped in memory, and restore them at "
+                    + "initialization.\n"
+                    + "The file is CSM_warm_start.bin, or the file named by CSM_WARM_START_FILE."
+                ),
+                action=OnceAndStoreTrue,
             ),
         ],
     )
@@ -122,15 +262,28 @@ def main() -> None:
 
         # Parsing CLI arguments
         args = arg_parser.parse_args()
-        check_ecoa_xml(args)
+        if args.threads and args.event_queue:
+            raise Exception("The -t/--threads and -e/--event-queue options cannot be used together.")
 
         # Init logger config for the entire app
         Logger.init(args.log, args.verbose)
 
+        # Checking the ECOA XML files
+        check_ecoa_xml(args)
+
+        # The model and the generators are imported once the arguments are checked
+        from ecoa_toolset.generators.types.generator import TypesGenerator
+        from ecoa_toolset.models.ecoa_model import ECOAModel
+
+        from csmgvt.generators import ComponentsGenerator, CSMGenerator
+
         # Parsing ECOA project XML file
         project_file_name = os.path.basename(args.project)
         logger.debug("Parsing project file %s", project_file_name)
-        ecoa_model = ECOAModel(project_file_name.split(".")[0], args.project)
+        cache = create_xml_cache(args.project, args.output, args.no_cache)
+        ecoa_model = ECOAModel(
+            project_file_name.split(".")[0], args.project, args.jobs, cache, args.xsd, args.fast_parsing
+        )
         ecoa_model.parse()
 
         logger.debug("Found %d component(s)", ecoa_model.get_component_count())
@@ -141,10 +294,26 @@ def main() -> None:
         create_output_directory(args.force, args.output, subpaths=_get_subpaths(ecoa_model))
 
         # Generating the CSM files
-        CSMGenerator(ecoa_model, args.output, args.force).generate()
+        CSMGenerator(
+            ecoa_model,
+            args.output,
+            args.force,
+            args.dispatch,
+            args.threads,
+            args.event_queue,
+            args.metrics,
+            args.log_buffer,
+            args.pinfo_access,
+            args.warm_start,
+        ).generate()
 
         # Generating the components files
-        ComponentsGenerator(ecoa_model, args.output, args.force).generate()
+        manifest = None
+        if args.incremental:
+            manifest = GenerationManifest(ecoa_model, args.output, _get_generation_context(args))
+        ComponentsGenerator(ecoa_model, args.output, args.force, manifest).generate()
+        if manifest:
+            manifest.save()
 
         # Generating the types files
         TypesGenerator(ecoa_model, args.output, args.force).generate()
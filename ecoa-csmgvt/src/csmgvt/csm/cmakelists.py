@@ -23,12 +23,15 @@ class CMakeListsGenerator(CommonCMakeListsGenerator):
         ecoa_model : The ECOA model.
         path (str) : The generation path.
         force (bool): True if the file can be overwritten, False otherwise.
+        threads (bool): True to link the csm executable and the container library with the threads library (worker
+            threads or logger).
     """
 
-    def __init__(self, ecoa_model, path: str, force: bool):
+    def __init__(self, ecoa_model, path: str, force: bool, threads: bool = False):
         super().__init__(path)
         self._ecoa_model = ecoa_model
         self._force = force
+        self._threads = threads
         self._components = {
             os.path.normpath(path).split(os.path.sep)[-2]: [
                 module_impl.name for module_impl in component_impl.module_implementation
@@ -319,6 +322,20 @@ def _generate_target_link_libraries(self) -> str:
             for module_impl_name in module_impl_names:
                 generation += Common.SPACE_INDENTATION[:2] + module_impl_name + Common.LINE_BREAK[:1]
         generation += ")" + Common.LINE_BREAK[:1]
+        if self._threads:
+            generation += (
+                Common.LINE_BREAK[:1]
+                + "# Linking the csm executable and the container library with the threads library (worker threads"
+                + Common.LINE_BREAK[:1]
+                + "# of the protection domains, flusher thread of the logger)"
+                + Common.LINE_BREAK[:2]
+                + "find_package(Threads REQUIRED)"
+                + Common.LINE_BREAK[:1]
+                + "target_link_libraries(${PROJECT_NAME} PRIVATE Threads::Threads)"
+                + Common.LINE_BREAK[:1]
+                + "target_link_libraries(container PRIVATE Threads::Threads)"
+                + Common.LINE_BREAK[:1]
+            )
         return generation
 
     def generate(self):
@@ -11,12 +11,25 @@
 
 # Internal library imports
 from ecoa_toolset.generators.common import Common
+from ecoa_toolset.generators.container.common import Common as ContainerCommon
+from ecoa_toolset.generators.container.event_queue import EventQueue
 from ecoa_toolset.generators.container.generator import ContainerGenerator
+from ecoa_toolset.generators.container.instrumentation import Instrumentation
+from ecoa_toolset.generators.container.log_masks import LogMasks
+from ecoa_toolset.generators.container.warm_start import WarmStart
 from ecoa_toolset.generators.helpers.global_variable import CMGlobalVariable, CMGlobalVariableHelper
 from ecoa_toolset.generators.helpers.platform_hook import PlatformHook, PlatformHookHelper
 from ecoa_toolset.models.helpers.module import ModuleHelper
 from ecoa_toolset.visitors.container import ContainerVisitor
 
+# Local imports
+from csmgvt.csm.event_queue import EventQueueGenerator
+from csmgvt.csm.executor import ExecutorGenerator
+from csmgvt.csm.logger import LoggerGenerator
+from csmgvt.csm.metrics import MetricsGenerator
+from csmgvt.csm.pinfo_mapping import PinfoMappingGenerator
+from csmgvt.csm.warm_start import WarmStartGenerator
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +61,118 @@ class ContainerMockGenerator:
     _platform_hook_helper = None
     _generator = None
     _visitor = None
+    _threads: bool = None
+    _event_queue: EventQueue = None
+    _event_queue_capacity: int = None
+    _instrumentation: Instrumentation = None
+    _log_buffer: int = None
+    _log_masks: LogMasks = None
+    _pinfo_access: str = None
+    _warm_start: WarmStart = None
+
+    @classmethod
+    def _generate_runtime_includes(cls, f) -> None:
+        if cls._threads:
+            f.write('#include "' + ExecutorGenerator.FILE_NAME + '"' + Common.LINE_BREAK[:1])
+        if cls._event_queue:
+            f.write('#include "' + EventQueueGenerator.FILE_NAME + '"' + Common.LINE_BREAK[:1])
+        if cls._instrumentation:
+            f.write('#include "' + MetricsGenerator.FILE_NAME + '"' + Common.LINE_BREAK[:1])
+        if cls._log_buffer:
+            f.write('#include "' + LoggerGenerator.FILE_NAME + '"' + Common.LINE_BREAK[:1])
+        if cls._pinfo_access == ContainerCommon.MMAP_PINFO_ACCESS and cls._ecoa_model.pinfos:
+            f.write('#include "' + PinfoMappingGenerator.FILE_NAME + '"' + Common.LINE_BREAK[:1])
+        if cls._warm_start:
+            f.write('#include "' + WarmStartGenerator.FILE_NAME + '"' + Common.LINE_BREAK[:1])
+
+    @classmethod
+    def _generate_event_queue_declaration(cls, f) -> None:
+        if cls._event_queue:
+            f.write(EventQueueGenerator.generate_declaration())
+
+    @classmethod
+    def _generate_event_queue_definition(cls, f) -> None:
+        if cls._event_queue:
+            f.write(EventQueueGenerator.generate_definition(cls._event_queue, cls._event_queue_capacity))
+
+    @classmethod
+    def _generate_metrics_declaration(cls, f) -> None:
+        if cls._instrumentation:
+            f.write(MetricsGenerator.generate_declaration(cls._instrumentation))
+
+    @classmethod
+    def _generate_metrics_definition(cls, f) -> None:
+        if cls._instrumentation:
+            f.write(Common.LINE_BREAK[: bool(cls._event_queue)])
+            f.write(MetricsGenerator.generate_definition(cls._instrumentation))
+
+    @classmethod
+    def _generate_logger_declaration(cls, f) -> None:
+        if cls._log_buffer:
+            f.write(LoggerGenerator.generate_declaration())
+
+    @classmethod
+    def _generate_logger_definition(cls, f) -> None:
+        if not cls._log_buffer:
+            return
+        instances = [
+            module_inst_name + ":" + component_name
+            for key, component_names in cls._ecoa_model.component_names.items()
+            for module_inst_name in [key.split(":")[1]]
+            for component_name in component_names
+        ]
+        f.write(Common.LINE_BREAK[: bool(cls._event_queue or cls._instrumentation)])
+        f.write(LoggerGenerator.generate_definition(instances, cls._log_buffer))
+
+    @classmethod
+    def _generate_warm_start_declaration(cls, f) -> None:
+        if cls._warm_start:
+            f.write(WarmStartGenerator.generate_declaration())
+
+    @classmethod
+    def _generate_warm_start_definition(cls, f) -> None:
+        if cls._warm_start:
+            f.write(Common.LINE_BREAK[: bool(cls._event_queue or cls._instrumentation or cls._log_buffer)])
+            f.write(WarmStartGenerator.generate_definition(cls._warm_start))
+
+    @classmethod
+    def _generate_log_masks(cls, f) -> None:
+        if not cls._log_masks:
+            return
+        f.write(
+            "/* Log levels enabled by the log policy of the deployment (bit 1 << level), by module instance */"
+            + Common.LINE_BREAK[:2]
+            + "static const unsigned char "
+            + LogMasks.TABLE
+            + "["
+            + str(len(cls._log_masks.masks))
+            + "] = {"
+            + ", ".join(hex(mask) for mask in cls._log_masks.masks)
+            + "};"
+            + Common.LINE_BREAK[:2]
+        )
+
+    @classmethod
+    def _generate_executors(cls, f) -> None:
+        if not cls._threads:
+            return
+        f.write("/* Protection domains executors */" + Common.LINE_BREAK[:2])
+        for protection_domain_name in dict.fromkeys(cls._ecoa_model.protection_domains.values()):
+            f.write(
+                "CM_Executor "
+                + ContainerCommon.generate_executor_name(protection_domain_name)
+                + ";"
+                + Common.LINE_BREAK[:1]
+            )
+        f.write(
+            Common.LINE_BREAK[:1]
+            + "/* Lock of the versioned data shared by the protection domains */"
+            + Common.LINE_BREAK[:2]
+            + "std::recursive_mutex "
+            + ContainerCommon.VERSIONED_DATA_MUTEX
+            + ";"
+            + Common.LINE_BREAK[:2]
+        )
 
     @classmethod
     def _generate_recovery_action(cls, module_impl) -> str:
@@ -87,6 +212,7 @@ def _generate_container_mock(cls, force: bool) -> None:
             f.write("#include <chrono>" + Common.LINE_BREAK[:1])
             f.write("#include <fstream>" + Common.LINE_BREAK[:1])
             f.write("#include <cstring>" + Common.LINE_BREAK[:1])
+            cls._generate_runtime_includes(f)
             # Component includes
             f.write("/* Components libraries */" + Common.LINE_BREAK[:1])
             for component_impl_name, externals in cls._ecoa_model.externals.items():
@@ -147,6 +273,14 @@ def _generate_container_mock(cls, force: bool) -> None:
                         f.write(variable.accept(cls._visitor))
                     f.write(Common.LINE_BREAK[:1])
 
+            # Protection domains executors, event queue, metrics, logger and warm start
+            cls._generate_executors(f)
+            cls._generate_event_queue_declaration(f)
+            cls._generate_metrics_declaration(f)
+            cls._generate_logger_declaration(f)
+            cls._generate_warm_start_declaration(f)
+            cls._generate_log_masks(f)
+
             # Generate container constructors for modules implemented in c++
             modules_implemented_in_cpp = cls._module_helper.find_all(language="c++")
             if modules_implemented_in_cpp:
@@ -243,10 +377,29 @@ def _generate_container_mock(cls, force: bool) -> None:
                 for external in externals:
                     f.write(external.accept(cls._visitor))
 
+            # Event queue and metrics, once all the queued events and the instrumented functions are known, logger and
+            # warm start, once the contexts are instantiated
+            cls._generate_event_queue_definition(f)
+            cls._generate_metrics_definition(f)
+            cls._generate_logger_definition(f)
+            cls._generate_warm_start_definition(f)
+
             logger.debug("%s generated", file_path)
 
     @classmethod
-    def generate(cls, ecoa_model, path: str, force: bool) -> None:
+    def generate(
+        cls,
+        ecoa_model,
+        path: str,
+        force: bool,
+        dispatch: str = ContainerCommon.IF_DISPATCH,
+        threads: bool = False,
+        event_queue: int = None,
+        metrics: bool = False,
+        log_buffer: int = None,
+        pinfo_access: str = ContainerCommon.STREAM_PINFO_ACCESS,
+        warm_start: bool = False,
+    ) -> None:
         """Generates the following file:
             - <output>/src/CSM_#project_name#.cpp.
 
@@ -254,12 +407,45 @@ def generate(cls, ecoa_model, path: str, force: bool) -> None:
             ecoa_model : The ECOA model.
             path (str) : The generation directory path.
             force (bool) : True if the file can be overwritten, False otherwise.
+            dispatch (str) : The dispatch of the container functions on the module instance identifier.
+            threads (bool) : True to post the calls crossing protection domains to their executors, False to call
+                all the entry points directly.
+            event_queue (int) : The capacity of the queue of the events sent by the modules, None to call the
+                receivers of the events directly.
+            metrics (bool) : True to record the call count and the latency of the container functions per module
+                instance, False otherwise.
+            log_buffer (int) : The capacity of the ring buffer of the log records, flushed by a background thread,
+                None to print the log records directly.
+            pinfo_access (str) : The access of the pinfo container functions to the PINFO files.
+            warm_start (bool) : True to save the warm start contexts to a file and to restore them at initialization,
+                False otherwise.
         """
         cls._path = path
         cls._ecoa_model = ecoa_model
+        cls._threads = threads
+        cls._event_queue = EventQueue(ecoa_model.priorities) if event_queue else None
+        cls._event_queue_capacity = event_queue
+        cls._instrumentation = Instrumentation(ecoa_model) if metrics else None
+        cls._log_buffer = log_buffer
+        cls._log_masks = LogMasks(ecoa_model) if ecoa_model.log_levels else None
+        cls._pinfo_access = pinfo_access
+        cls._warm_start = WarmStart(ecoa_model) if warm_start else None
         cls._global_variable_helper = CMGlobalVariableHelper(cls._ecoa_model)
         cls._platform_hook_helper = PlatformHookHelper(cls._ecoa_model)
         cls._module_helper = ModuleHelper(cls._ecoa_model)
-        cls._generator = ContainerGenerator(0, 2, True, False)
+        cls._generator = ContainerGenerator(
+            0,
+            2,
+            True,
+            False,
+            dispatch,
+            ecoa_model.protection_domains if threads else None,
+            cls._event_queue,
+            cls._instrumentation,
+            bool(log_buffer),
+            cls._log_masks,
+            pinfo_access,
+            cls._warm_start,
+        )
         cls._visitor = ContainerMockVisitor(cls._generator, cls._ecoa_model)
         cls._generate_container_mock(force)
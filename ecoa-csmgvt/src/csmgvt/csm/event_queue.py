@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Event queue generation class.
+"""
+
+# Standard library imports
+import logging
+import os
+
+# Internal library imports
+from ecoa_toolset.generators.common import Common
+from ecoa_toolset.generators.container.event_queue import EventQueue
+
+logger = logging.getLogger(__name__)
+
+
+class EventQueueGenerator:
+    """The event queue generator.
+
+    The event queue stores the events sent by the modules in a fixed array of slots, without allocation, and orders
+    them by a binary heap: the highest priority first and, for a same priority, the first pushed first. The main loop
+    dispatches them to their receivers.
+    """
+
+    FILE_NAME: str = "CSM_event_queue.hpp"
+
+    @classmethod
+    def _generate_class(cls) -> str:
+        return "\n".join(
+            [
+                "template <std::size_t CAPACITY, std::size_t PARAMETERS_SIZE>",
+                "class CM_Event_queue",
+                "{",
+                "public:",
+                "  struct Event",
+                "  {",
+                "    unsigned int id;",
+                "    unsigned int priority;",
+                "    unsigned long long sequence;",
+                "    unsigned char parameters[PARAMETERS_SIZE];",
+                "  };",
+                "",
+                "  CM_Event_queue(void)",
+                "    : count(0), free_count(CAPACITY), sequence(0), max_count(0), overflow_count(0)",
+                "  {",
+                "    for (std::size_t i = 0; i < CAPACITY; i++)",
+                "      free_slots[i] = CAPACITY - 1 - i;",
+                "  }",
+                "",
+                "  /* Queues an event, returns the buffer of its parameters or 0 if the queue is full */",
+                "  unsigned char * push(unsigned int id, unsigned int priority)",
+                "  {",
+                "    if (free_count == 0)",
+                "    {",
+                "      overflow_count++;",
+                "      return 0;",
+                "    }",
+                "    std::size_t slot = free_slots[--free_count];",
+                "    events[slot].id = id;",
+                "    events[slot].priority = priority;",
+                "    events[slot].sequence = sequence++;",
+                "    std::size_t i = count++;",
+                "    while (i > 0 && before(slot, heap[(i - 1) / 2]))",
+                "    {",
+                "      heap[i] = heap[(i - 1) / 2];",
+                "      i = (i - 1) / 2;",
+                "    }",
+                "    heap[i] = slot;",
+                "    if (count > max_count)",
+                "      max_count = count;",
+                "    return events[slot].parameters;",
+                "  }",
+                "",
+                "  /* Removes the next event (0 if the queue is empty), to release once dispatched */",
+                "  Event * pop(void)",
+                "  {",
+                "    if (count == 0)",
+                "      return 0;",
+                "    std::size_t slot = heap[0];",
+                "    std::size_t last = heap[--count];",
+                "    std::size_t i = 0;",
+                "    while (2 * i + 1 < count)",
+                "    {",
+                "      std::size_t child = 2 * i + 1;",
+                "      if (child + 1 < count && before(heap[child + 1], heap[child]))",
+                "        child++;",
+                "      if (!before(heap[child], last))",
+                "        break;",
+                "      heap[i] = heap[child];",
+                "      i = child;",
+                "    }",
+                "    heap[i] = last;",
+                "    return &events[slot];",
+                "  }",
+                "",
+                "  void release(Event * event)",
+                "  {",
+                "    free_slots[free_count++] = (std::size_t) (event - events);",
+                "  }",
+                "",
+                "  /* Number of queued events */",
+                "  std::size_t size(void) const { return count; }",
+                "  /* Highest number of queued events */",
+                "  std::size_t max_size(void) const { return max_count; }",
+                "  /* Number of events lost because the queue was full */",
+                "  unsigned long long overflows(void) const { return overflow_count; }",
+                "",
+                "private:",
+                "  bool before(std::size_t a, std::size_t b) const",
+                "  {",
+                "    if (events[a].priority != events[b].priority)",
+                "      return events[a].priority > events[b].priority;",
+                "    return events[a].sequence < events[b].sequence;",
+                "  }",
+                "",
+                "  Event events[CAPACITY];",
+                "  std::size_t heap[CAPACITY];",
+                "  std::size_t free_slots[CAPACITY];",
+                "  std::size_t count;",
+                "  std::size_t free_count;",
+                "  unsigned long long sequence;",
+                "  std::size_t max_count;",
+                "  unsigned long long overflow_count;",
+                "};",
+            ]
+        )
+
+    @classmethod
+    def generate_declaration(cls) -> str:
+        """Generates the declaration of the push function called by the event send container functions.
+
+        Returns:
+            str : The generated code.
+        """
+        return (
+            "/* Event queue */"
+            + Common.LINE_BREAK[:2]
+            + "unsigned char * "
+            + EventQueue.PUSH
+            + "(unsigned int id, unsigned int priority);"
+            + Common.LINE_BREAK[:2]
+        )
+
+    @classmethod
+    def _generate_parameters_union(cls, event_queue: EventQueue) -> str:
+        return (
+            "union CM_Event_parameters"
+            + Common.LINE_BREAK[:1]
+            + "{"
+            + Common.LINE_BREAK[:1]
+            + "  unsigned char none[1];"
+            + Common.LINE_BREAK[:1]
+            + "".join(
+                "  unsigned char e" + str(identifier) + "[" + size + "];" + Common.LINE_BREAK[:1]
+                for identifier, size in enumerate(event_queue.parameters_sizes)
+                if size
+            )
+            + "};"
+            + Common.LINE_BREAK[:2]
+        )
+
+    @classmethod
+    def _generate_dispatch(cls, event_queue: EventQueue) -> str:
+        return "\n".join(
+            [
+                "void " + EventQueue.DISPATCH + "(void)",
+                "{",
+                "  CM_Event_queue_type::Event * event;",
+                "  while ((event = CM_EVENT_QUEUE.pop()))",
+                "  {",
+                "    switch (event->id)",
+                "    {",
+                "".join(event_queue.cases) + "      default:",
+                "        break;",
+                "    }",
+                "    CM_EVENT_QUEUE.release(event);",
+                "  }",
+                "}",
+            ]
+        )
+
+    @classmethod
+    def _generate_report(cls) -> str:
+        return "\n".join(
+            [
+                "void " + EventQueue.REPORT + "(void)",
+                "{",
+                "  static std::size_t max_size = 0;",
+                "  static unsigned long long overflows = 0;",
+                "  if (CM_EVENT_QUEUE.max_size() != max_size || CM_EVENT_QUEUE.overflows() != overflows)",
+                "  {",
+                "    max_size = CM_EVENT_QUEUE.max_size();",
+                "    overflows = CM_EVENT_QUEUE.overflows();",
+                '    printf("[CSM] Event queue: max depth %lu / %lu, overflows %llu\\n",',
+                "           (unsigned long) max_size, (unsigned long) CM_EVENT_QUEUE_CAPACITY, overflows);",
+                "  }",
+                "}",
+            ]
+        )
+
+    @classmethod
+    def generate_definition(cls, event_queue: EventQueue, capacity: int) -> str:
+        """Generates the event queue, its push function, its dispatch function calling the receivers of the events
+        and its report function printing the counters of the queue when they change.
+
+        Args:
+            event_queue (EventQueue) : The events queued by the event send container functions.
+            capacity (int) : The number of events the queue can hold.
+
+        Returns:
+            str : The generated code.
+        """
+        return (
+            "/* Event queue */"
+            + Common.LINE_BREAK[:2]
+            + "#define CM_EVENT_QUEUE_CAPACITY "
+            + str(capacity)
+            + Common.LINE_BREAK[:2]
+            + cls._generate_parameters_union(event_queue)
+            + "typedef CM_Event_queue<CM_EVENT_QUEUE_CAPACITY, sizeof(CM_Event_parameters)> CM_Event_queue_type;"
+            + Common.LINE_BREAK[:1]
+            + "static CM_Event_queue_type CM_EVENT_QUEUE;"
+            + Common.LINE_BREAK[:2]
+            + "unsigned char * "
+            + EventQueue.PUSH
+            + "(unsigned int id, unsigned int priority)"
+            + Common.LINE_BREAK[:1]
+            + "{"
+            + Common.LINE_BREAK[:1]
+            + "  return CM_EVENT_QUEUE.push(id, priority);"
+            + Common.LINE_BREAK[:1]
+            + "}"
+            + Common.LINE_BREAK[:2]
+            + cls._generate_dispatch(event_queue)
+            + Common.LINE_BREAK[:2]
+            + cls._generate_report()
+            + Common.LINE_BREAK[:1]
+        )
+
+    @classmethod
+    def generate(cls, path: str, force: bool) -> None:
+        """Generates the following file:
+            - <output>/src/CSM_event_queue.hpp.
+
+        Args:
+            path (str) : The generation directory path.
+            force (bool) : True if the file can be overwritten, False otherwise.
+        """
+        file_path = os.path.join(path, "src", cls.FILE_NAME)
+        if os.path.exists(file_path) and force:
+            logger.debug("%s already exists, forcing, overwriting it...", file_path)
+        with open(file_path, "w") as f:
+            f.write("/* " + cls.FILE_NAME + " */" + Common.LINE_BREAK[:2])
+            f.write("#if !defined(CSM_EVENT_QUEUE_HPP)" + Common.LINE_BREAK[:1])
+            f.write("#define CSM_EVENT_QUEUE_HPP" + Common.LINE_BREAK[:2])
+            f.write("#include <cstddef>" + Common.LINE_BREAK[:2])
+            f.write(cls._generate_class() + Common.LINE_BREAK[:2])
+            f.write("#endif /* CSM_EVENT_QUEUE_HPP */" + Common.LINE_BREAK[:1])
+        logger.debug("%s generated", file_path)
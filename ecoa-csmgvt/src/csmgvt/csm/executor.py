@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Executor generation class.
+"""
+
+# Standard library imports
+import logging
+import os
+
+# Internal library imports
+from ecoa_toolset.generators.common import Common
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorGenerator:
+    """The executor generator.
+
+    An executor is the worker thread of a protection domain: it runs, one after the other, the jobs (module entry
+    points) posted to its queue by the other protection domains.
+    """
+
+    FILE_NAME: str = "CSM_executor.hpp"
+
+    @classmethod
+    def _generate_class(cls) -> str:
+        return "\n".join(
+            [
+                "class CM_Executor",
+                "{",
+                "public:",
+                "  /* Queues a job, the caller does not wait for its execution */",
+                "  void post(std::function<void()> job)",
+                "  {",
+                "    std::lock_guard<std::mutex> lock(mutex);",
+                "    jobs.push_back(std::move(job));",
+                "    job_available.notify_one();",
+                "  }",
+                "",
+                "  /* Queues a job and waits for its execution (synchronous requests) */",
+                "  void call(std::function<void()> job)",
+                "  {",
+                "    std::promise<void> done;",
+                "    std::future<void> future = done.get_future();",
+                "    post([&job, &done]() { job(); done.set_value(); });",
+                "    future.wait();",
+                "  }",
+                "",
+                "  /* Waits until the queue is empty and no job is running */",
+                "  void wait_idle(void)",
+                "  {",
+                "    std::unique_lock<std::mutex> lock(mutex);",
+                "    idle.wait(lock, [this]() { return jobs.empty() && !busy; });",
+                "  }",
+                "",
+                "  /* Runs the queued jobs until the executor is stopped and its queue is empty */",
+                "  void run(void)",
+                "  {",
+                "    std::unique_lock<std::mutex> lock(mutex);",
+                "    while (1)",
+                "    {",
+                "      job_available.wait(lock, [this]() { return stopped || !jobs.empty(); });",
+                "      if (jobs.empty())",
+                "        return;",
+                "      std::function<void()> job = std::move(jobs.front());",
+                "      jobs.pop_front();",
+                "      busy = true;",
+                "      lock.unlock();",
+                "      job();",
+                "      lock.lock();",
+                "      busy = false;",
+                "      if (jobs.empty())",
+                "        idle.notify_all();",
+                "    }",
+                "  }",
+                "",
+                "  void stop(void)",
+                "  {",
+                "    std::lock_guard<std::mutex> lock(mutex);",
+                "    stopped = true;",
+                "    job_available.notify_one();",
+                "  }",
+                "",
+                "private:",
+                "  std::mutex mutex;",
+                "  std::condition_variable job_available;",
+                "  std::condition_variable idle;",
+                "  std::deque<std::function<void()>> jobs;",
+                "  bool busy = false;",
+                "  bool stopped = false;",
+                "};",
+            ]
+        )
+
+    @classmethod
+    def generate(cls, path: str, force: bool) -> None:
+        """Generates the following file:
+            - <output>/src/CSM_executor.hpp.
+
+        Args:
+            path (str) : The generation directory path.
+            force (bool) : True if the file can be overwritten, False otherwise.
+        """
+        file_path = os.path.join(path, "src", cls.FILE_NAME)
+        if os.path.exists(file_path) and force:
+            logger.debug("%s already exists, forcing, overwriting it...", file_path)
+        with open(file_path, "w") as f:
+            f.write("/* " + cls.FILE_NAME + " */" + Common.LINE_BREAK[:2])
+            f.write("#if !defined(CSM_EXECUTOR_HPP)" + Common.LINE_BREAK[:1])
+            f.write("#define CSM_EXECUTOR_HPP" + Common.LINE_BREAK[:2])
+            for library in ["condition_variable", "deque", "functional", "future", "mutex", "thread"]:
+                f.write("#include <" + library + ">" + Common.LINE_BREAK[:1])
+            f.write(Common.LINE_BREAK[:1])
+            f.write(cls._generate_class() + Common.LINE_BREAK[:2])
+            f.write("#endif /* CSM_EXECUTOR_HPP */" + Common.LINE_BREAK[:1])
+        logger.debug("%s generated", file_path)
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Logger generation class.
+"""
+
+# Standard library imports
+import logging
+import os
+from typing import List
+
+# Internal library imports
+from ecoa_toolset.generators.common import Common
+from ecoa_toolset.generators.container.common import Common as ContainerCommon
+
+logger = logging.getLogger(__name__)
+
+
+class LoggerGenerator:
+    """The logger generator.
+
+    The log container functions copy their records (module instance identifier, level, timestamp and text) to a
+    fixed-size ring buffer, without lock nor allocation, instead of printing them. A background thread writes the
+    records by batches to the standard output, or to the file named by the CSM_LOG_FILE environment variable. The
+    records pushed while the buffer is full are dropped and counted.
+    """
+
+    FILE_NAME: str = "CSM_logger.hpp"
+    START: str = "cm_logger_start"
+    STOP: str = "cm_logger_stop"
+
+    @classmethod
+    def _generate_push(cls) -> List[str]:
+        return [
+            "  /* Copies a record to the buffer without waiting (multiple producers), the record is dropped if the",
+            "     buffer is full */",
+            "  void push(unsigned int mod_id, unsigned int level, const char * text)",
+            "  {",
+            "    std::size_t position = enqueue_position.load(std::memory_order_relaxed);",
+            "    Record * record;",
+            "    while (1)",
+            "    {",
+            "      record = &records[position % CAPACITY];",
+            "      std::size_t sequence = record->sequence.load(std::memory_order_acquire);",
+            "      std::ptrdiff_t difference = (std::ptrdiff_t) sequence - (std::ptrdiff_t) position;",
+            "      if (difference == 0)",
+            "      {",
+            "        if (enqueue_position.compare_exchange_weak(position, position + 1, std::memory_order_relaxed))",
+            "          break;",
+            "      }",
+            "      else if (difference < 0)",
+            "      {",
+            "        dropped_count.fetch_add(1, std::memory_order_relaxed);",
+            "        return;",
+            "      }",
+            "      else",
+            "        position = enqueue_position.load(std::memory_order_relaxed);",
+            "    }",
+            "    record->mod_id = mod_id;",
+            "    record->level = level;",
+            "    record->timestamp = std::chrono::steady_clock::now() - start;",
+            "    record->size = (unsigned int) strnlen(text, CM_LOG_TEXT_SIZE);",
+            "    memcpy(record->text, text, record->size);",
+            "    record->sequence.store(position + 1, std::memory_order_release);",
+            "  }",
+        ]
+
+    @classmethod
+    def _generate_flush(cls) -> List[str]:
+        return [
+            "  /* Writes the records of the buffer by batches (single consumer), returns false if it was empty */",
+            "  bool flush(FILE * file, bool colors, const char * const * instances, std::size_t instances_count)",
+            "  {",
+            "    static const char * const levels[] =",
+            '      {"TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "FATAL_ERROR"};',
+            '    static const char * const level_colors[] = {"32", "32", "32", "33", "31", "41"};',
+            '    const char * format = colors ? "[\\x1B[%sm%s\\x1B[39m] %lld.%06lld %s %.*s\\n"',
+            '                                 : "[%s%s] %lld.%06lld %s %.*s\\n";',
+            "    char batch[CM_LOG_BATCH_SIZE];",
+            "    std::size_t size = 0;",
+            "    bool flushed = false;",
+            "    while (1)",
+            "    {",
+            "      Record * record = &records[dequeue_position % CAPACITY];",
+            "      if (record->sequence.load(std::memory_order_acquire) != dequeue_position + 1)",
+            "        break;",
+            "      if (CM_LOG_BATCH_SIZE - size < CM_LOG_RECORD_SIZE)",
+            "      {",
+            "        fwrite(batch, 1, size, file);",
+            "        size = 0;",
+            "      }",
+            "      unsigned int level = record->level < 6 ? record->level : 5;",
+            "      long long timestamp =",
+            "        std::chrono::duration_cast<std::chrono::microseconds>(record->timestamp).count();",
+            "      int length = snprintf(batch + size, CM_LOG_BATCH_SIZE - size, format,",
+            '                            colors ? level_colors[level] : "", levels[level],',
+            "                            timestamp / 1000000, timestamp % 1000000,",
+            '                            record->mod_id < instances_count ? instances[record->mod_id] : "?",',
+            "                            (int) record->size, record->text);",
+            "      if (length > 0 && size + (std::size_t) length < CM_LOG_BATCH_SIZE)",
+            "        size += (std::size_t) length;",
+            "      record->sequence.store(dequeue_position + CAPACITY, std::memory_order_release);",
+            "      dequeue_position++;",
+            "      flushed = true;",
+            "    }",
+            "    unsigned long long dropped = dropped_count.load(std::memory_order_relaxed);",
+            "    if (dropped != reported_dropped_count)",
+            "    {",
+            "      reported_dropped_count = dropped;",
+            "      int length = snprintf(batch + size, CM_LOG_BATCH_SIZE - size,",
+            '                            "[CSM] Logger: %llu record(s) dropped\\n", dropped);',
+            "      if (length > 0 && size + (std::size_t) length < CM_LOG_BATCH_SIZE)",
+            "        size += (std::size_t) length;",
+            "    }",
+            "    if (size)",
+            "    {",
+            "      fwrite(batch, 1, size, file);",
+            "      fflush(file);",
+            "    }",
+            "    return flushed;",
+            "  }",
+        ]
+
+    @classmethod
+    def _generate_class(cls) -> str:
+        return "\n".join(
+            [
+                "#define CM_LOG_TEXT_SIZE 256",
+                "#define CM_LOG_BATCH_SIZE 65536",
+                "/* Room left in the batch for a formatted record */",
+                "#define CM_LOG_RECORD_SIZE (CM_LOG_TEXT_SIZE + 512)",
+                "",
+                "template <std::size_t CAPACITY>",
+                "class CM_Logger",
+                "{",
+                "public:",
+                "  CM_Logger(void)",
+                "    : enqueue_position(0), dequeue_position(0), dropped_count(0), reported_dropped_count(0),",
+                "      stopped(false), start(std::chrono::steady_clock::now())",
+                "  {",
+                "    for (std::size_t i = 0; i < CAPACITY; i++)",
+                "      records[i].sequence.store(i, std::memory_order_relaxed);",
+                "  }",
+                "",
+            ]
+            + cls._generate_push()
+            + [""]
+            + cls._generate_flush()
+            + [
+                "",
+                "  /* Flushes the buffer until the logger is stopped */",
+                "  void run(FILE * file, bool colors, const char * const * instances, std::size_t instances_count)",
+                "  {",
+                "    while (!stopped.load(std::memory_order_acquire))",
+                "      if (!flush(file, colors, instances, instances_count))",
+                "        std::this_thread::sleep_for(std::chrono::milliseconds(1));",
+                "    flush(file, colors, instances, instances_count);",
+                "  }",
+                "",
+                "  void stop(void)",
+                "  {",
+                "    stopped.store(true, std::memory_order_release);",
+                "  }",
+                "",
+                "  /* Number of records lost because the buffer was full */",
+                "  unsigned long long dropped(void) const { return dropped_count.load(std::memory_order_relaxed); }",
+                "",
+                "private:",
+                "  struct Record",
+                "  {",
+                "    std::atomic<std::size_t> sequence;",
+                "    unsigned int mod_id;",
+                "    unsigned int level;",
+                "    std::chrono::steady_clock::duration timestamp;",
+                "    unsigned int size;",
+                "    char text[CM_LOG_TEXT_SIZE];",
+                "  };",
+                "",
+                "  Record records[CAPACITY];",
+                "  std::atomic<std::size_t> enqueue_position;",
+                "  std::size_t dequeue_position;",
+                "  std::atomic<unsigned long long> dropped_count;",
+                "  unsigned long long reported_dropped_count;",
+                "  std::atomic<bool> stopped;",
+                "  std::chrono::steady_clock::time_point start;",
+                "};",
+            ]
+        )
+
+    @classmethod
+    def generate_declaration(cls) -> str:
+        """Generates the declaration of the push function called by the log container functions.
+
+        Returns:
+            str : The generated code.
+        """
+        return (
+            "/* Logger */"
+            + Common.LINE_BREAK[:2]
+            + "void "
+            + ContainerCommon.LOG_PUSH
+            + "(unsigned int mod_id, unsigned int level, const char * text);"
+            + Common.LINE_BREAK[:2]
+        )
+
+    @classmethod
+    def _generate_start_stop(cls) -> str:
+        return "\n".join(
+            [
+                "/* Starts the flusher thread, writing to the file named by CSM_LOG_FILE or to the standard output */",
+                "void " + cls.START + "(void)",
+                "{",
+                '  const char * file_name = getenv("CSM_LOG_FILE");',
+                '  cm_log_file = file_name ? fopen(file_name, "w") : 0;',
+                "  if (file_name && !cm_log_file)",
+                '    printf("[CSM] Logger: cannot write %s, logging to the standard output\\n", file_name);',
+                "  bool colors = !cm_log_file;",
+                "  if (!cm_log_file)",
+                "    cm_log_file = stdout;",
+                "  cm_logger_thread = std::thread(&CM_Logger_type::run, &CM_LOGGER, cm_log_file, colors,",
+                "                                 cm_logger_instances, sizeof(cm_logger_instances) / sizeof(char *));",
+                "}",
+                "",
+                "/* Stops the flusher thread once the buffer is flushed */",
+                "void " + cls.STOP + "(void)",
+                "{",
+                "  CM_LOGGER.stop();",
+                "  if (cm_logger_thread.joinable())",
+                "    cm_logger_thread.join();",
+                "  if (cm_log_file && cm_log_file != stdout)",
+                "    fclose(cm_log_file);",
+                "  cm_log_file = 0;",
+                "}",
+            ]
+        )
+
+    @classmethod
+    def generate_definition(cls, instances: List[str], capacity: int) -> str:
+        """Generates the logger, its push function and the functions starting and stopping its flusher thread.
+
+        Args:
+            instances (List[str]) : The name of each module instance, indexed by its identifier.
+            capacity (int) : The number of records the ring buffer can hold.
+
+        Returns:
+            str : The generated code.
+        """
+        return (
+            "/* Logger */"
+            + Common.LINE_BREAK[:2]
+            + "#define CM_LOG_BUFFER_CAPACITY "
+            + str(capacity)
+            + Common.LINE_BREAK[:2]
+            + "typedef CM_Logger<CM_LOG_BUFFER_CAPACITY> CM_Logger_type;"
+            + Common.LINE_BREAK[:1]
+            + "static CM_Logger_type CM_LOGGER;"
+            + Common.LINE_BREAK[:1]
+            + "static std::thread cm_logger_thread;"
+            + Common.LINE_BREAK[:1]
+            + "static FILE * cm_log_file = 0;"
+            + Common.LINE_BREAK[:2]
+            + "static const char * const cm_logger_instances[] ="
+            + Common.LINE_BREAK[:1]
+            + "{"
+            + Common.LINE_BREAK[:1]
+            + "".join('  "' + instance + '",' + Common.LINE_BREAK[:1] for instance in instances or ["?"])
+            + "};"
+            + Common.LINE_BREAK[:2]
+            + "void "
+            + ContainerCommon.LOG_PUSH
+            + "(unsigned int mod_id, unsigned int level, const char * text)"
+            + Common.LINE_BREAK[:1]
+            + "{"
+            + Common.LINE_BREAK[:1]
+            + "  CM_LOGGER.push(mod_id, level, text);"
+            + Common.LINE_BREAK[:1]
+            + "}"
+            + Common.LINE_BREAK[:2]
+            + cls._generate_start_stop()
+            + Common.LINE_BREAK[:1]
+        )
+
+    @classmethod
+    def generate(cls, path: str, force: bool) -> None:
+        """Generates the following file:
+            - <output>/src/CSM_logger.hpp.
+
+        Args:
+            path (str) : The generation directory path.
+            force (bool) : True if the file can be overwritten, False otherwise.
+        """
+        file_path = os.path.join(path, "src", cls.FILE_NAME)
+        if os.path.exists(file_path) and force:
+            logger.debug("%s already exists, forcing, overwriting it...", file_path)
+        with open(file_path, "w") as f:
+            f.write("/* " + cls.FILE_NAME + " */" + Common.LINE_BREAK[:2])
+            f.write("#if !defined(CSM_LOGGER_HPP)" + Common.LINE_BREAK[:1])
+            f.write("#define CSM_LOGGER_HPP" + Common.LINE_BREAK[:2])
+            for library in ["atomic", "chrono", "cstddef", "stdio.h", "string.h", "thread"]:
+                f.write("#include <" + library + ">" + Common.LINE_BREAK[:1])
+            f.write(Common.LINE_BREAK[:1])
+            f.write(cls._generate_class() + Common.LINE_BREAK[:2])
+            f.write("#endif /* CSM_LOGGER_HPP */" + Common.LINE_BREAK[:1])
+        logger.debug("%s generated", file_path)
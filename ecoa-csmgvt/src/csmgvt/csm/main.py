@@ -8,11 +8,18 @@
 # Standard library imports
 import logging
 import os
-from typing import TextIO
+from typing import List, TextIO, Tuple
 
 # Internal library imports
 from ecoa_toolset.generators.common import Common
-from ecoa_toolset.generators.helpers.platform_hook import PlatformHook, PlatformHookHelper
+from ecoa_toolset.generators.container.common import Common as ContainerCommon
+from ecoa_toolset.generators.container.event_queue import EventQueue
+from ecoa_toolset.generators.container.instrumentation import Instrumentation
+from ecoa_toolset.generators.helpers.platform_hook import PlatformHookHelper
+
+# Local imports
+from csmgvt.csm.executor import ExecutorGenerator
+from csmgvt.csm.logger import LoggerGenerator
 
 logger = logging.getLogger(__name__)
 
@@ -26,14 +33,22 @@ class MainGenerator:
     _platform_hook_helper = None
     _modules = []
     _hooks = []
+    _threads: bool = None
+    _executors: List[str] = []
+    _event_queue: bool = None
+    _metrics: bool = None
+    _log_buffer: bool = None
+    _trigger_calls: List[Tuple[int, float, str, str]] = []
 
     @classmethod
     def _generate_includes(cls, f: TextIO) -> None:
         # Standard includes
         f.write("/* Standards libraries */" + Common.LINE_BREAK[:1])
-        libraries = ["stdio", "stdlib", "string"]
+        libraries = ["stdio", "stdlib", "string"] + (["signal"] if cls._metrics else [])
         for library in libraries:
             f.write("#include <" + library + ".h" + ">" + Common.LINE_BREAK[:1])
+        if cls._trigger_calls:
+            f.write("#include <chrono>" + Common.LINE_BREAK[:1] + "#include <thread>" + Common.LINE_BREAK[:1])
         f.write(Common.LINE_BREAK[:1])
         # Module includes
         f.write("/* Modules libraries */" + Common.LINE_BREAK[:1])
@@ -45,6 +60,9 @@ def _generate_includes(cls, f: TextIO) -> None:
                 f.write("hpp")
             f.write('"' + Common.LINE_BREAK[:1])
         f.write(Common.LINE_BREAK[:1])
+        if cls._threads:
+            f.write("/* Protection domains executors */" + Common.LINE_BREAK[:1])
+            f.write('#include "' + ExecutorGenerator.FILE_NAME + '"' + Common.LINE_BREAK[:2])
 
     @classmethod
     def _generate_c_lang_modules_instanciation(
@@ -108,137 +126,356 @@ def _generate_modules_instanciation(cls, f: TextIO) -> None:
                     )
         f.write(Common.LINE_BREAK[:1])
 
+    @classmethod
+    def _generate_received_call(
+        cls, language: str, module_impl_name: str, module_inst_name: str, component_name: str, operation_name: str
+    ) -> str:
+        if "c++" == language.lower():
+            return module_inst_name + "_" + component_name + "_Module." + operation_name + "__received();"
+        return (
+            module_impl_name
+            + "__"
+            + operation_name
+            + "__received(&"
+            + module_inst_name
+            + "_"
+            + component_name
+            + "_Context);"
+        )
+
+    @classmethod
+    def _generate_entry_point_call(cls, call: str, module_inst_name: str, component_name: str, indent: int) -> str:
+        """Generates the call of a module entry point, posted to the executor of its protection domain if the CSM
+        runs one worker thread per protection domain."""
+        executor = None
+        if cls._threads:
+            executor = ContainerCommon.get_executor(
+                cls._ecoa_model.protection_domains, None, module_inst_name + ":" + component_name
+            )
+        if executor:
+            call = executor + ".post([]() { " + call + " });"
+        return Common.SPACE_INDENTATION[:indent] + call + Common.LINE_BREAK[:1]
+
     @classmethod
     def _generate_trigger_event_received_call(
         cls, module_impl, module_inst_name, component_name, operation_name
     ) -> str:
-        generation = ""
-        if "c++" == module_impl.language.lower():
-            generation += (
-                Common.SPACE_INDENTATION[:4]
-                + module_inst_name
-                + "_"
-                + component_name
-                + "_Module."
-                + operation_name
-                + "__received();"
-                + Common.LINE_BREAK[:1]
-            )
-        elif "c" == module_impl.language.lower():
-            generation += (
-                Common.SPACE_INDENTATION[:4]
-                + module_impl.name
-                + "__"
-                + operation_name
-                + "__received(&"
-                + module_inst_name
-                + "_"
-                + component_name
-                + "_Context);"
-                + Common.LINE_BREAK[:1]
-            )
-        return generation
+        call = cls._generate_received_call(
+            module_impl.language, module_impl.name, module_inst_name, component_name, operation_name
+        )
+        return cls._generate_entry_point_call(call, module_inst_name, component_name, 6)
 
     @classmethod
-    def _generate_trigger_event_received_calls(cls, trigger) -> str:
-        generation = ""
+    def _generate_trigger_event_received_calls(cls, trigger) -> List[Tuple[int, float, str, str]]:
+        calls = []
         for key_receiver, receiver in trigger.receivers.items():
             module_inst_name, component_name = tuple(key_receiver.split(":"))
             module_inst = cls._ecoa_model.module_insts.get(receiver.component_impl_name + ":" + module_inst_name)
             module_impl = cls._ecoa_model.module_impls.get(
                 receiver.component_impl_name + ":" + module_inst.implementation_name
             )
-            generation += cls._generate_trigger_event_received_call(
-                module_impl, module_inst_name, component_name, receiver.name
+            calls.append(
+                (
+                    cls._ecoa_model.priorities.get(trigger.name + ":" + component_name, 0),
+                    trigger.periods.get(key_receiver) or 0.0,
+                    trigger.name + " -> " + key_receiver + " " + receiver.name,
+                    cls._generate_trigger_event_received_call(
+                        module_impl, module_inst_name, component_name, receiver.name
+                    ),
+                )
             )
-        return generation
+        return calls
 
     @classmethod
-    def _generate_main_loop(cls, f: TextIO):
+    def _get_trigger_calls(cls) -> List[Tuple[int, float, str, str]]:
+        triggers = [trigger for v in cls._ecoa_model.triggers.values() for trigger in v]
+        calls = [call for trigger in triggers for call in cls._generate_trigger_event_received_calls(trigger)]
+        if cls._event_queue:
+            # Highest trigger priority first, the events sent by the triggered modules are queued
+            calls.sort(key=lambda call: call[0], reverse=True)
+        return calls
+
+    @classmethod
+    def _generate_triggers_declaration(cls, f: TextIO) -> None:
+        if not cls._trigger_calls:
+            return
         f.write(
-            Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[:2]
-            + "/* Call the entry points linked to the activation of the concerned modules */"
+            "/* Periodic triggers */"
+            + Common.LINE_BREAK[:2]
+            + "struct CM_Trigger"
             + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[:2]
-            + "while (1)"
+            + "{"
+            + Common.LINE_BREAK[:1]
+            + "  const char * name;"
+            + Common.LINE_BREAK[:1]
+            + "  std::chrono::nanoseconds period;"
+            + Common.LINE_BREAK[:1]
+            + "  std::chrono::steady_clock::time_point deadline;"
+            + Common.LINE_BREAK[:1]
+            + "  unsigned long long activations;"
+            + Common.LINE_BREAK[:1]
+            + "  unsigned long long overruns;"
+            + Common.LINE_BREAK[:1]
+            + "  std::chrono::nanoseconds max_jitter;"
+            + Common.LINE_BREAK[:1]
+            + "};"
+            + Common.LINE_BREAK[:2]
+            + "static CM_Trigger cm_triggers[] ="
             + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[:2]
             + "{"
+            + Common.LINE_BREAK[:1]
+        )
+        for _, period, description, _ in cls._trigger_calls:
+            f.write(
+                Common.SPACE_INDENTATION[:2]
+                + '{"'
+                + description
+                + '", std::chrono::nanoseconds('
+                + str(round(period * 1e9))
+                + "LL), std::chrono::steady_clock::time_point(), 0, 0, std::chrono::nanoseconds(0)},"
+                + Common.LINE_BREAK[:1]
+            )
+        f.write("};" + Common.LINE_BREAK[:2] + cls._generate_triggers_functions() + Common.LINE_BREAK[:1])
+
+    @classmethod
+    def _generate_triggers_functions(cls) -> str:
+        return Common.LINE_BREAK[:1].join(
+            [
+                "static void cm_start_triggers(void)",
+                "{",
+                "  std::chrono::steady_clock::time_point now = std::chrono::steady_clock::now();",
+                "  for (CM_Trigger & trigger : cm_triggers)",
+                "    trigger.deadline = now + trigger.period;",
+                "}",
+                "",
+                "/* Sleeps until the earliest deadline of the triggers */",
+                "static void cm_wait_triggers(void)",
+                "{",
+                "  std::chrono::steady_clock::time_point deadline = cm_triggers[0].deadline;",
+                "  for (const CM_Trigger & trigger : cm_triggers)",
+                "    if (trigger.deadline < deadline)",
+                "      deadline = trigger.deadline;",
+                "  std::this_thread::sleep_until(deadline);",
+                "}",
+                "",
+                "/* Returns true if the deadline of the trigger is reached and sets its next deadline, the activations",
+                "   missed by a late trigger are skipped and counted as overruns */",
+                "static bool cm_trigger_is_due(CM_Trigger & trigger, std::chrono::steady_clock::time_point now)",
+                "{",
+                "  if (now < trigger.deadline)",
+                "    return false;",
+                "  std::chrono::nanoseconds jitter = std::chrono::duration_cast<std::chrono::nanoseconds>(now - "
+                "trigger.deadline);",
+                "  if (jitter > trigger.max_jitter)",
+                "    trigger.max_jitter = jitter;",
+                "  trigger.activations++;",
+                "  trigger.deadline += trigger.period;",
+                "  if (trigger.period.count() > 0 && trigger.deadline <= now)",
+                "  {",
+                "    while (trigger.deadline <= now)",
+                "    {",
+                "      trigger.deadline += trigger.period;",
+                "      trigger.overruns++;",
+                "    }",
+                '    printf("[CSM] Trigger %s overrun: %llu overrun(s) in %llu activation(s), max jitter %lld us\\n",',
+                "           trigger.name, trigger.overruns, trigger.activations,",
+                "           (long long) (trigger.max_jitter.count() / 1000));",
+                "  }",
+                "  return true;",
+                "}",
+            ]
+        )
+
+    @classmethod
+    def _generate_event_queue_dispatch_call(cls, f: TextIO, indent: int) -> None:
+        if cls._event_queue:
+            f.write(Common.SPACE_INDENTATION[:indent] + EventQueue.DISPATCH + "();" + Common.LINE_BREAK[:1])
+
+    @classmethod
+    def _generate_wait_executors_call(cls, f: TextIO, indent: int) -> None:
+        if cls._threads:
+            f.write(Common.SPACE_INDENTATION[:indent] + "cm_wait_executors();" + Common.LINE_BREAK[:1])
+
+    @classmethod
+    def _generate_trigger_activations(cls, f: TextIO) -> None:
+        f.write(
+            Common.SPACE_INDENTATION[:4]
+            + "/* Waiting for the next deadline of the periodic triggers. */"
+            + Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[:4]
+            + "cm_wait_triggers();"
+            + Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[:4]
+            + "std::chrono::steady_clock::time_point now = std::chrono::steady_clock::now();"
             + Common.LINE_BREAK[:2]
             + Common.SPACE_INDENTATION[:4]
+            + "/* Activating the trigger entry points. */"
+            + Common.LINE_BREAK[:1]
         )
-        triggers = [trigger for v in cls._ecoa_model.triggers.values() for trigger in v]
-        if triggers:
-            f.write("/* Activating the trigger entry points. */" + Common.LINE_BREAK[:1])
-            for trigger in triggers:
-                f.write(cls._generate_trigger_event_received_calls(trigger))
+        for index, (_, _, _, call) in enumerate(cls._trigger_calls):
+            f.write(
+                Common.SPACE_INDENTATION[:4]
+                + "if (cm_trigger_is_due(cm_triggers["
+                + str(index)
+                + "], now))"
+                + Common.LINE_BREAK[:1]
+                + Common.SPACE_INDENTATION[:4]
+                + "{"
+                + Common.LINE_BREAK[:1]
+                + call
+                + Common.SPACE_INDENTATION[:4]
+                + "}"
+                + Common.LINE_BREAK[:1]
+            )
+        cls._generate_wait_executors_call(f, 4)
+        cls._generate_event_queue_dispatch_call(f, 4)
+        if cls._event_queue:
+            f.write(Common.SPACE_INDENTATION[:4] + EventQueue.REPORT + "();" + Common.LINE_BREAK[:1])
+
+    @classmethod
+    def _generate_install_signal_handlers(cls, f: TextIO) -> None:
+        if not cls._metrics:
+            return
         f.write(
-            Common.LINE_BREAK[:2]
+            Common.SPACE_INDENTATION[:2]
+            + "signal(SIGINT, cm_request_stop);"
+            + Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[:2]
+            + "signal(SIGTERM, cm_request_stop);"
+            + Common.LINE_BREAK[:1]
+            + "#if defined(SIGUSR1)"
+            + Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[:2]
+            + "signal(SIGUSR1, cm_request_report);"
+            + Common.LINE_BREAK[:1]
+            + "#endif"
+            + Common.LINE_BREAK[:1]
+        )
+
+    @classmethod
+    def _generate_requested_report(cls, f: TextIO) -> None:
+        if not cls._metrics:
+            return
+        f.write(
+            Common.SPACE_INDENTATION[:4]
+            + "if (cm_report_requested)"
+            + Common.LINE_BREAK[:1]
             + Common.SPACE_INDENTATION[:4]
-            + "/* Insert run logic here. */"
+            + "{"
+            + Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[:6]
+            + "cm_report_requested = 0;"
+            + Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[:6]
+            + Instrumentation.REPORT
+            + "();"
             + Common.LINE_BREAK[:1]
             + Common.SPACE_INDENTATION[:4]
-            + "/* Insert report logic here. */"
+            + "}"
+            + Common.LINE_BREAK[:1]
+        )
+
+    @classmethod
+    def _generate_metrics_declaration(cls, f: TextIO) -> None:
+        if not cls._metrics:
+            return
+        f.write(
+            "extern void "
+            + Instrumentation.REPORT
+            + "(void);"
+            + Common.LINE_BREAK[:2]
+            + "/* Stop and metrics report requests (signals) */"
+            + Common.LINE_BREAK[:2]
+            + "static volatile sig_atomic_t cm_stop_requested = 0;"
+            + Common.LINE_BREAK[:1]
+            + "static volatile sig_atomic_t cm_report_requested = 0;"
+            + Common.LINE_BREAK[:2]
+            + "static void cm_request_stop(int)"
+            + Common.LINE_BREAK[:1]
+            + "{"
+            + Common.LINE_BREAK[:1]
+            + "  cm_stop_requested = 1;"
+            + Common.LINE_BREAK[:1]
+            + "}"
+            + Common.LINE_BREAK[:2]
+            + "static void cm_request_report(int)"
+            + Common.LINE_BREAK[:1]
+            + "{"
+            + Common.LINE_BREAK[:1]
+            + "  cm_report_requested = 1;"
             + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[:2]
             + "}"
             + Common.LINE_BREAK[:2]
         )
 
     @classmethod
-    def _generate_initialize_modules(cls, f: TextIO, hook: PlatformHook, component_name: str) -> None:
-        if "c++" == hook.language.lower():
+    def _generate_logger_declaration(cls, f: TextIO) -> None:
+        if cls._log_buffer:
             f.write(
-                Common.SPACE_INDENTATION[:2]
-                + hook.module_inst_name
-                + "_"
-                + component_name
-                + "_Module.INITIALIZE__received();"
-                + Common.LINE_BREAK[:1]
-            )
-        elif "c" == hook.language.lower():
-            f.write(
-                Common.SPACE_INDENTATION[:2]
-                + hook.module_impl_name
-                + "__INITIALIZE__received(&"
-                + hook.module_inst_name
-                + "_"
-                + component_name
-                + "_Context);"
+                "extern void "
+                + LoggerGenerator.START
+                + "(void);"
                 + Common.LINE_BREAK[:1]
+                + "extern void "
+                + LoggerGenerator.STOP
+                + "(void);"
+                + Common.LINE_BREAK[:2]
             )
 
     @classmethod
-    def _generate_start_modules(cls, f: TextIO, hook: PlatformHook, component_name: str) -> None:
-        if "c++" == hook.language.lower():
-            f.write(
-                Common.SPACE_INDENTATION[:2]
-                + hook.module_inst_name
-                + "_"
-                + component_name
-                + "_Module.START__received();"
-                + Common.LINE_BREAK[:1]
-            )
-        elif "c" == hook.language.lower():
-            f.write(
-                Common.SPACE_INDENTATION[:2]
-                + hook.module_impl_name
-                + "__START__received(&"
-                + hook.module_inst_name
-                + "_"
-                + component_name
-                + "_Context);"
-                + Common.LINE_BREAK[:1]
-            )
+    def _generate_logger_call(cls, f: TextIO, function_name: str) -> None:
+        if cls._log_buffer:
+            f.write(Common.SPACE_INDENTATION[:2] + function_name + "();" + Common.LINE_BREAK[:2])
+
+    @classmethod
+    def _generate_main_loop(cls, f: TextIO):
+        f.write(
+            Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[:2]
+            + "/* Call the entry points linked to the activation of the concerned modules */"
+            + Common.LINE_BREAK[:1]
+        )
+        if cls._trigger_calls:
+            f.write(Common.SPACE_INDENTATION[:2] + "cm_start_triggers();" + Common.LINE_BREAK[:1])
+        cls._generate_install_signal_handlers(f)
+        f.write(
+            Common.SPACE_INDENTATION[:2]
+            + ("while (!cm_stop_requested)" if cls._metrics else "while (1)")
+            + Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[:2]
+            + "{"
+            + Common.LINE_BREAK[:1]
+        )
+        if cls._trigger_calls:
+            cls._generate_trigger_activations(f)
+        f.write(
+            Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[:4]
+            + "/* Insert run logic here. */"
+            + Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[:4]
+            + "/* Insert report logic here. */"
+            + Common.LINE_BREAK[:1]
+        )
+        cls._generate_requested_report(f)
+        f.write(Common.SPACE_INDENTATION[:2] + "}" + Common.LINE_BREAK[:2])
+
+    @classmethod
+    def _generate_lifecycle_calls(cls, f: TextIO, operation_name: str) -> None:
+        for hook in cls._hooks:
+            for component_name in hook.component_names:
+                call = cls._generate_received_call(
+                    hook.language, hook.module_impl_name, hook.module_inst_name, component_name, operation_name
+                )
+                f.write(cls._generate_entry_point_call(call, hook.module_inst_name, component_name, 2))
+        cls._generate_wait_executors_call(f, 2)
+        cls._generate_event_queue_dispatch_call(f, 2)
 
     @classmethod
     def _generate_initialize_start_modules(cls, f: TextIO) -> None:
         # Initialize lifecycle function
         f.write(Common.SPACE_INDENTATION[:2] + "/* Initializing the ECOA modules. */" + Common.LINE_BREAK[:1])
-        for hook in cls._hooks:
-            for component_name in hook.component_names:
-                cls._generate_initialize_modules(f, hook, component_name)
+        cls._generate_lifecycle_calls(f, "INITIALIZE")
         # Insert arguments logic
         f.write(
             Common.LINE_BREAK[:1]
@@ -248,76 +485,106 @@ def _generate_initialize_start_modules(cls, f: TextIO) -> None:
         )
         # Start lifecycle function
         f.write(Common.SPACE_INDENTATION[:2] + "// Starting the ECOA modules." + Common.LINE_BREAK[:1])
-        for hook in cls._hooks:
-            for component_name in hook.component_names:
-                cls._generate_start_modules(f, hook, component_name)
+        cls._generate_lifecycle_calls(f, "START")
 
     @classmethod
-    def _generate_stop_modules(cls, f: TextIO, hook: PlatformHook, component_name: str) -> None:
-        if "c++" == hook.language.lower():
-            f.write(
-                Common.SPACE_INDENTATION[:2]
-                + hook.module_inst_name
-                + "_"
-                + component_name
-                + "_Module.STOP__received();"
-                + Common.LINE_BREAK[:1]
-            )
-        elif "c" == hook.language.lower():
-            f.write(
-                Common.SPACE_INDENTATION[:2]
-                + hook.module_impl_name
-                + "__STOP__received(&"
-                + hook.module_inst_name
-                + "_"
-                + component_name
-                + "_Context);"
-                + Common.LINE_BREAK[:1]
+    def _generate_stop_shutdown_modules(cls, f: TextIO) -> None:
+        # Stop lifecycle function
+        f.write(Common.SPACE_INDENTATION[:2] + "// Stopping the ECOA modules." + Common.LINE_BREAK[:1])
+        cls._generate_lifecycle_calls(f, "STOP")
+        # Shutdown lifecycle function
+        f.write(
+            Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[:2]
+            + "// Shutting down the ECOA modules."
+            + Common.LINE_BREAK[:1]
+        )
+        cls._generate_lifecycle_calls(f, "SHUTDOWN")
+
+    @classmethod
+    def _generate_executors_declaration(cls, f: TextIO) -> None:
+        if not cls._threads:
+            return
+        f.write("extern CM_Executor " + (", ".join(cls._executors)) + ";" + Common.LINE_BREAK[:2])
+        f.write(
+            "static void cm_wait_executors(void)"
+            + Common.LINE_BREAK[:1]
+            + "{"
+            + Common.LINE_BREAK[:1]
+            + "".join(
+                Common.SPACE_INDENTATION[:2] + executor + ".wait_idle();" + Common.LINE_BREAK[:1]
+                for executor in cls._executors
             )
+            + "}"
+            + Common.LINE_BREAK[:2]
+        )
 
     @classmethod
-    def _generate_shudown_modules(cls, f: TextIO, hook: PlatformHook, component_name: str) -> None:
-        if "c++" == hook.language.lower():
+    def _generate_event_queue_declaration(cls, f: TextIO) -> None:
+        if cls._event_queue:
             f.write(
-                Common.SPACE_INDENTATION[:2]
-                + hook.module_inst_name
-                + "_"
-                + component_name
-                + "_Module.SHUTDOWN__received();"
+                "extern void "
+                + EventQueue.DISPATCH
+                + "(void);"
                 + Common.LINE_BREAK[:1]
+                + "extern void "
+                + EventQueue.REPORT
+                + "(void);"
+                + Common.LINE_BREAK[:2]
             )
-        elif "c" == hook.language.lower():
+
+    @classmethod
+    def _generate_start_executors(cls, f: TextIO) -> None:
+        if not cls._threads:
+            return
+        f.write(
+            Common.SPACE_INDENTATION[:2] + "/* Starting the protection domains executors. */" + Common.LINE_BREAK[:1]
+        )
+        for executor in cls._executors:
             f.write(
                 Common.SPACE_INDENTATION[:2]
-                + hook.module_impl_name
-                + "__SHUTDOWN__received(&"
-                + hook.module_inst_name
-                + "_"
-                + component_name
-                + "_Context);"
+                + "std::thread "
+                + executor.replace(ContainerCommon.EXECUTOR_PREFIX, "CM_THREAD_")
+                + "(&CM_Executor::run, &"
+                + executor
+                + ");"
                 + Common.LINE_BREAK[:1]
             )
+        f.write(Common.LINE_BREAK[:1])
 
     @classmethod
-    def _generate_stop_shutdown_modules(cls, f: TextIO) -> None:
-        # Stop lifecycle function
-        f.write(Common.SPACE_INDENTATION[:2] + "// Stopping the ECOA modules." + Common.LINE_BREAK[:1])
-        for hook in cls._hooks:
-            for component_name in hook.component_names:
-                cls._generate_stop_modules(f, hook, component_name)
-        # Shutdown lifecycle function
+    def _generate_stop_executors(cls, f: TextIO) -> None:
+        if not cls._threads:
+            return
         f.write(
             Common.LINE_BREAK[:1]
             + Common.SPACE_INDENTATION[:2]
-            + "// Shutting down the ECOA modules."
+            + "/* Stopping the protection domains executors. */"
             + Common.LINE_BREAK[:1]
         )
-        for hook in cls._hooks:
-            for component_name in hook.component_names:
-                cls._generate_shudown_modules(f, hook, component_name)
+        for executor in cls._executors:
+            f.write(
+                Common.SPACE_INDENTATION[:2]
+                + executor
+                + ".stop();"
+                + Common.LINE_BREAK[:1]
+                + Common.SPACE_INDENTATION[:2]
+                + executor.replace(ContainerCommon.EXECUTOR_PREFIX, "CM_THREAD_")
+                + ".join();"
+                + Common.LINE_BREAK[:1]
+            )
 
     @classmethod
-    def generate(cls, ecoa_model, path: str, force: bool) -> None:
+    def generate(
+        cls,
+        ecoa_model,
+        path: str,
+        force: bool,
+        threads: bool = False,
+        event_queue: bool = False,
+        metrics: bool = False,
+        log_buffer: bool = False,
+    ) -> None:
         """Generates the following file:
             - <output>/src/main.cpp.
 
@@ -325,9 +592,26 @@ def generate(cls, ecoa_model, path: str, force: bool) -> None:
             ecoa_model : The ECOA model.
             path (str) : The generation directory path.
             force (bool) : True if the file can be overwritten, False otherwise.
+            threads (bool) : True to run each protection domain on its own worker thread, False to call all the
+                entry points from the main thread.
+            event_queue (bool) : True to dispatch the queued events after each activation of the modules, False if
+                the events are not queued.
+            metrics (bool) : True to stop on SIGINT and SIGTERM and to report the metrics of the container
+                functions on exit and on SIGUSR1, False to loop forever.
+            log_buffer (bool) : True to start the flusher thread of the logger before initializing the modules and
+                to stop it on exit, False if the log records are printed directly.
         """
         cls._ecoa_model = ecoa_model
         cls._path = path
+        cls._executors = [
+            ContainerCommon.generate_executor_name(protection_domain_name)
+            for protection_domain_name in dict.fromkeys(ecoa_model.protection_domains.values())
+        ]
+        cls._threads = threads and bool(cls._executors)
+        cls._event_queue = event_queue
+        cls._metrics = metrics
+        cls._log_buffer = log_buffer
+        cls._trigger_calls = cls._get_trigger_calls()
         cls._platform_hook_helper = PlatformHookHelper(cls._ecoa_model)
         cls._hooks = cls._platform_hook_helper.find_all().values()
         file_name = "main.cpp"
@@ -348,18 +632,29 @@ def generate(cls, ecoa_model, path: str, force: bool) -> None:
                 f.write("extern void cm_shutdown(void);" + Common.LINE_BREAK[:1])
                 visited = True
             f.write(Common.LINE_BREAK[:visited])
+            cls._generate_executors_declaration(f)
+            cls._generate_event_queue_declaration(f)
+            cls._generate_metrics_declaration(f)
+            cls._generate_logger_declaration(f)
+            cls._generate_triggers_declaration(f)
             # Start of main function
             f.write("int main(void)" + Common.LINE_BREAK[:1] + "{" + Common.LINE_BREAK[:1])
+            cls._generate_logger_call(f, LoggerGenerator.START)
             if cls._ecoa_model.module_impls:
                 f.write(Common.SPACE_INDENTATION[:2] + "cm_initialize();" + Common.LINE_BREAK[:2])
+            cls._generate_start_executors(f)
             # Initialize and start modules
             cls._generate_initialize_start_modules(f)
             # Main logic
             cls._generate_main_loop(f)
             # stop and shutdown modules
             cls._generate_stop_shutdown_modules(f)
+            cls._generate_stop_executors(f)
             if cls._ecoa_model.pinfos:
                 f.write(Common.LINE_BREAK[:1] + Common.SPACE_INDENTATION[:2] + "cm_shutdown();" + Common.LINE_BREAK[:2])
+            if cls._metrics:
+                f.write(Common.SPACE_INDENTATION[:2] + Instrumentation.REPORT + "();" + Common.LINE_BREAK[:2])
+            cls._generate_logger_call(f, LoggerGenerator.STOP)
             # End of main function
             f.write(Common.SPACE_INDENTATION[:2] + "return 0;" + Common.LINE_BREAK[:1] + "}" + Common.LINE_BREAK[:1])
         logger.debug("%s generated", file_path)
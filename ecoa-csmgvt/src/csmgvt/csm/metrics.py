@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Metrics generation class.
+"""
+
+# Standard library imports
+import logging
+import os
+
+# Internal library imports
+from ecoa_toolset.generators.common import Common
+from ecoa_toolset.generators.container.instrumentation import Instrumentation
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsGenerator:
+    """The metrics generator.
+
+    A metric counts the calls of a container function by a module instance and records their latencies in fixed
+    log-linear buckets (8 buckets per power of two, i.e. a relative error below 12.5%), without allocation. The
+    report writes the call count, the call rate and the min/avg/max/p99 latencies of each metric to a CSV file.
+    """
+
+    FILE_NAME: str = "CSM_metrics.hpp"
+    REPORT_FILE_NAME: str = "CSM_metrics.csv"
+
+    @classmethod
+    def _generate_functions(cls) -> str:
+        return "\n".join(
+            [
+                "#define CM_METRIC_SUB_BUCKETS 8",
+                "#define CM_METRIC_BUCKETS (CM_METRIC_SUB_BUCKETS * 40)",
+                "",
+                "struct CM_Metric",
+                "{",
+                "  unsigned long long count;",
+                "  unsigned long long total;",
+                "  unsigned long long min;",
+                "  unsigned long long max;",
+                "  unsigned int buckets[CM_METRIC_BUCKETS];",
+                "};",
+                "",
+                "/* Monotonic time in nanoseconds */",
+                "inline unsigned long long cm_metric_now(void)",
+                "{",
+                "  return (unsigned long long) std::chrono::duration_cast<std::chrono::nanoseconds>(",
+                "           std::chrono::steady_clock::now().time_since_epoch())",
+                "    .count();",
+                "}",
+                "",
+                "inline unsigned int cm_metric_msb(unsigned long long value)",
+                "{",
+                "#if defined(__GNUC__)",
+                "  return 63 - __builtin_clzll(value);",
+                "#else",
+                "  unsigned int msb = 0;",
+                "  while (value >>= 1)",
+                "    msb++;",
+                "  return msb;",
+                "#endif",
+                "}",
+                "",
+                "/* Latencies below CM_METRIC_SUB_BUCKETS have their own bucket, the others share a bucket with the",
+                "   latencies having the same 4 most significant bits */",
+                "inline unsigned int cm_metric_bucket(unsigned long long latency)",
+                "{",
+                "  if (latency < CM_METRIC_SUB_BUCKETS)",
+                "    return (unsigned int) latency;",
+                "  unsigned int msb = cm_metric_msb(latency);",
+                "  unsigned int bucket = (msb - 2) * CM_METRIC_SUB_BUCKETS",
+                "                        + (unsigned int) ((latency >> (msb - 3)) & (CM_METRIC_SUB_BUCKETS - 1));",
+                "  return bucket < CM_METRIC_BUCKETS ? bucket : CM_METRIC_BUCKETS - 1;",
+                "}",
+                "",
+                "/* Highest latency of a bucket */",
+                "inline unsigned long long cm_metric_bucket_max(unsigned int bucket)",
+                "{",
+                "  if (bucket < CM_METRIC_SUB_BUCKETS)",
+                "    return bucket;",
+                "  unsigned int shift = bucket / CM_METRIC_SUB_BUCKETS - 1;",
+                "  unsigned long long sub_bucket = CM_METRIC_SUB_BUCKETS + bucket % CM_METRIC_SUB_BUCKETS;",
+                "  return ((sub_bucket + 1) << shift) - 1;",
+                "}",
+                "",
+                "inline void cm_metric_record(CM_Metric & metric, unsigned long long latency)",
+                "{",
+                "  if (metric.count == 0 || latency < metric.min)",
+                "    metric.min = latency;",
+                "  if (latency > metric.max)",
+                "    metric.max = latency;",
+                "  metric.count++;",
+                "  metric.total += latency;",
+                "  metric.buckets[cm_metric_bucket(latency)]++;",
+                "}",
+                "",
+                "/* Latency below which the given ratio of the calls are, bounded by the highest recorded latency */",
+                "inline unsigned long long cm_metric_percentile(const CM_Metric & metric, double ratio)",
+                "{",
+                "  unsigned long long rank = (unsigned long long) (ratio * metric.count);",
+                "  unsigned long long count = 0;",
+                "  for (unsigned int bucket = 0; bucket < CM_METRIC_BUCKETS; bucket++)",
+                "  {",
+                "    count += metric.buckets[bucket];",
+                "    if (count > rank)",
+                "      return cm_metric_bucket_max(bucket) < metric.max ? cm_metric_bucket_max(bucket) : metric.max;",
+                "  }",
+                "  return metric.max;",
+                "}",
+                "",
+                "/* Records the latency of the enclosing scope in a metric */",
+                "class CM_Probe",
+                "{",
+                "public:",
+                "  explicit CM_Probe(CM_Metric * metric) : metric(metric), start(cm_metric_now()) {}",
+                "  ~CM_Probe(void) { cm_metric_record(*metric, cm_metric_now() - start); }",
+                "",
+                "private:",
+                "  CM_Metric * metric;",
+                "  unsigned long long start;",
+                "};",
+            ]
+        )
+
+    @classmethod
+    def generate_declaration(cls, instrumentation: Instrumentation) -> str:
+        """Generates the declaration of the metrics recorded by the container functions and the index of each module
+        instance among the instances of its module implementation.
+
+        Args:
+            instrumentation (Instrumentation) : The metrics recorded by the instrumented container functions.
+
+        Returns:
+            str : The generated code.
+        """
+        return (
+            "/* Metrics */"
+            + Common.LINE_BREAK[:2]
+            + "extern CM_Metric "
+            + Instrumentation.METRICS
+            + "[];"
+            + Common.LINE_BREAK[:1]
+            + "static const unsigned int "
+            + Instrumentation.INSTANCE_INDEXES
+            + "["
+            + str(max(len(instrumentation.instance_indexes), 1))
+            + "] = {"
+            + ", ".join(str(index) for index in instrumentation.instance_indexes)
+            + "};"
+            + Common.LINE_BREAK[:2]
+        )
+
+    @classmethod
+    def _generate_report(cls) -> str:
+        return "\n".join(
+            [
+                "void " + Instrumentation.REPORT + "(void)",
+                "{",
+                '  FILE * file = fopen("' + cls.REPORT_FILE_NAME + '", "w");',
+                "  if (!file)",
+                "  {",
+                '    printf("[CSM] Metrics: cannot write ' + cls.REPORT_FILE_NAME + '\\n");',
+                "    return;",
+                "  }",
+                "  double elapsed = (cm_metric_now() - cm_metrics_start) / 1e9;",
+                '  fprintf(file, "instance,operation,count,rate_per_s,min_ns,avg_ns,max_ns,p99_ns\\n");',
+                "  for (unsigned int i = 0; i < CM_METRICS_COUNT; i++)",
+                "  {",
+                "    const CM_Metric & metric = " + Instrumentation.METRICS + "[i];",
+                '    fprintf(file, "%s,%s,%llu,%.3f,%llu,%llu,%llu,%llu\\n", cm_metrics_names[i].instance,',
+                "            cm_metrics_names[i].operation, metric.count, elapsed > 0 ? metric.count / elapsed : 0.0,",
+                "            metric.min, metric.count ? metric.total / metric.count : 0ULL, metric.max,",
+                "            cm_metric_percentile(metric, 0.99));",
+                "  }",
+                "  fclose(file);",
+                '  printf("[CSM] Metrics: ' + cls.REPORT_FILE_NAME + ' written\\n");',
+                "}",
+            ]
+        )
+
+    @classmethod
+    def generate_definition(cls, instrumentation: Instrumentation) -> str:
+        """Generates the metrics recorded by the container functions, their names and the report function writing
+        them to the CSV file.
+
+        Args:
+            instrumentation (Instrumentation) : The metrics recorded by the instrumented container functions.
+
+        Returns:
+            str : The generated code.
+        """
+        size = str(max(len(instrumentation.metrics), 1))
+        names = "".join(
+            '  {"'
+            + ":".join(instrumentation.instances[mod_id])
+            + '", "'
+            + operation_name
+            + '"},'
+            + Common.LINE_BREAK[:1]
+            for mod_id, operation_name in instrumentation.metrics
+        )
+        return (
+            "/* Metrics */"
+            + Common.LINE_BREAK[:2]
+            + "#define CM_METRICS_COUNT "
+            + str(len(instrumentation.metrics))
+            + Common.LINE_BREAK[:2]
+            + "CM_Metric "
+            + Instrumentation.METRICS
+            + "["
+            + size
+            + "];"
+            + Common.LINE_BREAK[:2]
+            + "static const struct"
+            + Common.LINE_BREAK[:1]
+            + "{"
+            + Common.LINE_BREAK[:1]
+            + "  const char * instance;"
+            + Common.LINE_BREAK[:1]
+            + "  const char * operation;"
+            + Common.LINE_BREAK[:1]
+            + "} cm_metrics_names["
+            + size
+            + "] ="
+            + Common.LINE_BREAK[:1]
+            + "{"
+            + Common.LINE_BREAK[:1]
+            + names
+            + "};"
+            + Common.LINE_BREAK[:2]
+            + "static const unsigned long long cm_metrics_start = cm_metric_now();"
+            + Common.LINE_BREAK[:2]
+            + cls._generate_report()
+            + Common.LINE_BREAK[:1]
+        )
+
+    @classmethod
+    def generate(cls, path: str, force: bool) -> None:
+        """Generates the following file:
+            - <output>/src/CSM_metrics.hpp.
+
+        Args:
+            path (str) : The generation directory path.
+            force (bool) : True if the file can be overwritten, False otherwise.
+        """
+        file_path = os.path.join(path, "src", cls.FILE_NAME)
+        if os.path.exists(file_path) and force:
+            logger.debug("%s already exists, forcing, overwriting it...", file_path)
+        with open(file_path, "w") as f:
+            f.write("/* " + cls.FILE_NAME + " */" + Common.LINE_BREAK[:2])
+            f.write("#if !defined(CSM_METRICS_HPP)" + Common.LINE_BREAK[:1])
+            f.write("#define CSM_METRICS_HPP" + Common.LINE_BREAK[:2])
+            f.write("#include <chrono>" + Common.LINE_BREAK[:2])
+            f.write(cls._generate_functions() + Common.LINE_BREAK[:2])
+            f.write("#endif /* CSM_METRICS_HPP */" + Common.LINE_BREAK[:1])
+        logger.debug("%s generated", file_path)
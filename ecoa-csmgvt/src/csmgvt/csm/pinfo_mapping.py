@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""PINFO mapping generation class.
+"""
+
+# Standard library imports
+import logging
+import os
+
+# Internal library imports
+from ecoa_toolset.generators.common import Common
+from ecoa_toolset.generators.container.common import Common as ContainerCommon
+
+logger = logging.getLogger(__name__)
+
+
+class PinfoMappingGenerator:
+    """The PINFO mapping generator.
+
+    Each PINFO file is mapped read-only once by cm_initialize and shared by all the module instances referencing it:
+    the pinfo container functions copy from the mapping and only move the index of the calling instance. An empty
+    file has a valid mapping of size 0, a file which cannot be mapped has no data and its reads fail.
+    """
+
+    FILE_NAME: str = "CSM_pinfo_mapping.hpp"
+
+    @classmethod
+    def _generate_functions(cls) -> str:
+        mapping = ContainerCommon.PINFO_MAPPING
+        return "\n".join(
+            [
+                "struct " + mapping,
+                "{",
+                "  const unsigned char * data;",
+                "  unsigned int size;",
+                "};",
+                "",
+                "inline void " + ContainerCommon.PINFO_MAP + "(" + mapping + " * mapping, const char * path)",
+                "{",
+                "  mapping->data = 0;",
+                "  mapping->size = 0;",
+                "#if defined(_WIN32)",
+                "  /* No mapping, the file is loaded once */",
+                '  FILE * file = fopen(path, "rb");',
+                "  if (file && fseek(file, 0, SEEK_END) == 0 && ftell(file) >= 0)",
+                "  {",
+                "    unsigned int size = (unsigned int) ftell(file);",
+                "    unsigned char * data = (unsigned char *) malloc(size ? size : 1);",
+                "    rewind(file);",
+                "    if (data && fread(data, 1, size, file) == size)",
+                "    {",
+                "      mapping->data = data;",
+                "      mapping->size = size;",
+                "    }",
+                "    else",
+                "      free(data);",
+                "  }",
+                "  if (file)",
+                "    fclose(file);",
+                "#else",
+                "  struct stat status;",
+                "  int fd = open(path, O_RDONLY);",
+                "  if (fd >= 0 && fstat(fd, &status) == 0)",
+                "  {",
+                "    if (status.st_size == 0)",
+                '      mapping->data = (const unsigned char *) "";',
+                "    else",
+                "    {",
+                "      void * data = mmap(0, (size_t) status.st_size, PROT_READ, MAP_PRIVATE, fd, 0);",
+                "      if (data != MAP_FAILED)",
+                "      {",
+                "        mapping->data = (const unsigned char *) data;",
+                "        mapping->size = (unsigned int) status.st_size;",
+                "      }",
+                "    }",
+                "  }",
+                "  if (fd >= 0)",
+                "    close(fd);",
+                "#endif",
+                "  if (!mapping->data)",
+                '    printf("[CSM] PINFO: cannot map %s\\n", path);',
+                "}",
+                "",
+                "inline void " + ContainerCommon.PINFO_UNMAP + "(" + mapping + " * mapping)",
+                "{",
+                "#if defined(_WIN32)",
+                "  free((void *) mapping->data);",
+                "#else",
+                "  if (mapping->data && mapping->size)",
+                "    munmap((void *) mapping->data, mapping->size);",
+                "#endif",
+                "  mapping->data = 0;",
+                "  mapping->size = 0;",
+                "}",
+            ]
+        )
+
+    @classmethod
+    def generate(cls, path: str, force: bool) -> None:
+        """Generates the following file:
+            - <output>/src/CSM_pinfo_mapping.hpp.
+
+        Args:
+            path (str) : The generation directory path.
+            force (bool) : True if the file can be overwritten, False otherwise.
+        """
+        file_path = os.path.join(path, "src", cls.FILE_NAME)
+        if os.path.exists(file_path) and force:
+            logger.debug("%s already exists, forcing, overwriting it...", file_path)
+        with open(file_path, "w") as f:
+            f.write("/* " + cls.FILE_NAME + " */" + Common.LINE_BREAK[:2])
+            f.write("#if !defined(CSM_PINFO_MAPPING_HPP)" + Common.LINE_BREAK[:1])
+            f.write("#define CSM_PINFO_MAPPING_HPP" + Common.LINE_BREAK[:2])
+            f.write("#include <stdio.h>" + Common.LINE_BREAK[:1])
+            f.write("#include <stdlib.h>" + Common.LINE_BREAK[:1])
+            f.write("#if !defined(_WIN32)" + Common.LINE_BREAK[:1])
+            f.write("#include <fcntl.h>" + Common.LINE_BREAK[:1])
+            f.write("#include <sys/mman.h>" + Common.LINE_BREAK[:1])
+            f.write("#include <sys/stat.h>" + Common.LINE_BREAK[:1])
+            f.write("#include <unistd.h>" + Common.LINE_BREAK[:1])
+            f.write("#endif" + Common.LINE_BREAK[:2])
+            f.write(cls._generate_functions() + Common.LINE_BREAK[:2])
+            f.write("#endif /* CSM_PINFO_MAPPING_HPP */" + Common.LINE_BREAK[:1])
+        logger.debug("%s generated", file_path)
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Warm start generation class.
+"""
+
+# Standard library imports
+import logging
+import os
+import zlib
+
+# Internal library imports
+from ecoa_toolset.generators.common import Common
+from ecoa_toolset.generators.container.warm_start import WarmStart
+
+logger = logging.getLogger(__name__)
+
+
+class WarmStartGenerator:
+    """The warm start generator.
+
+    The warm start contexts are saved to a file mapped in memory (shared mapping), preallocated at its final size: a
+    header (magic number, format version, number of contexts and layout signature) followed by two copies of each
+    context, each with a sequence number, a size and a CRC32. A save overwrites the oldest copy of the context, so that
+    an interrupted save leaves the previous one valid. cm_initialize restores the latest valid copy of each context,
+    and resets the file when its header does not match the generated CSM. On Windows (_WIN32), without shared mapping,
+    the file is loaded once and each saved copy is written to it, its sequence number last.
+    """
+
+    FILE_NAME: str = "CSM_warm_start.hpp"
+    DEFAULT_FILE_NAME: str = "CSM_warm_start.bin"
+
+    @classmethod
+    def _generate_crc(cls) -> str:
+        return "\n".join(
+            [
+                "/* CRC32 (IEEE 802.3) */",
+                "class CM_Crc32",
+                "{",
+                "public:",
+                "  CM_Crc32(void)",
+                "  {",
+                "    for (unsigned int i = 0; i < 256; i++)",
+                "    {",
+                "      unsigned int crc = i;",
+                "      for (int bit = 0; bit < 8; bit++)",
+                "        crc = (crc & 1) ? (crc >> 1) ^ 0xEDB88320u : crc >> 1;",
+                "      table[i] = crc;",
+                "    }",
+                "  }",
+                "",
+                "  unsigned int compute(const void * data, std::size_t size, unsigned int crc) const",
+                "  {",
+                "    const unsigned char * bytes = (const unsigned char *) data;",
+                "    crc = ~crc;",
+                "    while (size--)",
+                "      crc = table[(crc ^ *bytes++) & 0xFF] ^ (crc >> 8);",
+                "    return ~crc;",
+                "  }",
+                "",
+                "private:",
+                "  unsigned int table[256];",
+                "};",
+                "",
+                "inline unsigned int cm_warm_start_crc(const void * data, std::size_t size, unsigned int crc = 0)",
+                "{",
+                "  static const CM_Crc32 crc32;",
+                "  return crc32.compute(data, size, crc);",
+                "}",
+            ]
+        )
+
+    @classmethod
+    def _generate_structures(cls) -> str:
+        return "\n".join(
+            [
+                '#define CM_WARM_START_MAGIC 0x43535753u /* "SWSC" */',
+                "#define CM_WARM_START_VERSION 1u",
+                "",
+                "/* Warm start context of a module instance (no context if its size is 0) */",
+                "struct CM_Warm_start_slot",
+                "{",
+                "  void * data;",
+                "  unsigned int size;",
+                "};",
+                "",
+                "struct CM_Warm_start_header",
+                "{",
+                "  unsigned int magic;",
+                "  unsigned int version;",
+                "  unsigned int count;",
+                "  unsigned int layout;",
+                "};",
+                "",
+                "/* Copy of a context, followed by its data, valid if its sequence is not 0 and its CRC matches */",
+                "struct CM_Warm_start_copy",
+                "{",
+                "  unsigned long long sequence;",
+                "  unsigned int size;",
+                "  unsigned int crc;",
+                "};",
+            ]
+        )
+
+    @classmethod
+    def _generate_map(cls) -> str:
+        return "\n".join(
+            [
+                "  /* Maps the file and restores the valid contexts, returns their number or -1 if not mapped */",
+                "  int map(const char * path)",
+                "  {",
+                "    std::size_t size = sizeof(CM_Warm_start_header);",
+                "    unsigned int layout = signature;",
+                "    for (unsigned int i = 0; i < COUNT; i++)",
+                "    {",
+                "      offsets[i] = size;",
+                "      size += 2 * copy_size(i);",
+                "      layout = cm_warm_start_crc(&slots[i].size, sizeof(slots[i].size), layout);",
+                "    }",
+                "#if defined(_WIN32)",
+                '    FILE * stream = fopen(path, "r+b");',
+                "    bool reset = !stream || fseek(stream, 0, SEEK_END) != 0 || (std::size_t) ftell(stream) != size;",
+                "    if (reset && stream)",
+                "      fclose(stream);",
+                "    if (reset)",
+                '      stream = fopen(path, "w+b");',
+                "    unsigned char * data = stream ? (unsigned char *) calloc(size, 1) : 0;",
+                "    bool loaded = reset || (fseek(stream, 0, SEEK_SET) == 0 && fread(data, 1, size, stream) == size);",
+                "    if (!data || !loaded)",
+                "    {",
+                "      free(data);",
+                "      if (stream)",
+                "        fclose(stream);",
+                "      return -1;",
+                "    }",
+                "    file = stream;",
+                "    region = data;",
+                "#else",
+                "    int fd = open(path, O_RDWR | O_CREAT, 0644);",
+                "    if (fd < 0)",
+                "      return -1;",
+                "    struct stat status;",
+                "    bool reset = fstat(fd, &status) != 0 || (std::size_t) status.st_size != size;",
+                "    void * data = MAP_FAILED;",
+                "    if (!reset || ftruncate(fd, (off_t) size) == 0)",
+                "      data = mmap(0, size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);",
+                "    close(fd);",
+                "    if (data == MAP_FAILED)",
+                "      return -1;",
+                "    region = (unsigned char *) data;",
+                "#endif",
+                "    CM_Warm_start_header * header = (CM_Warm_start_header *) region;",
+                "    if (reset || header->magic != CM_WARM_START_MAGIC || header->version != CM_WARM_START_VERSION",
+                "        || header->count != COUNT || header->layout != layout)",
+                "    {",
+                "      memset(region, 0, size);",
+                "      header->magic = CM_WARM_START_MAGIC;",
+                "      header->version = CM_WARM_START_VERSION;",
+                "      header->count = COUNT;",
+                "      header->layout = layout;",
+                "      write_through(region, size);",
+                "      return 0;",
+                "    }",
+                "    int restored = 0;",
+                "    for (unsigned int i = 0; i < COUNT; i++)",
+                "      restored += restore(i);",
+                "    return restored;",
+                "  }",
+            ]
+        )
+
+    @classmethod
+    def _generate_class(cls) -> str:
+        return "\n".join(
+            [
+                "template <unsigned int COUNT>",
+                "class CM_Warm_start",
+                "{",
+                "public:",
+                "  CM_Warm_start(const CM_Warm_start_slot * slots, unsigned int signature)",
+                "    : slots(slots), signature(signature), region(0)",
+                "#if defined(_WIN32)",
+                "    , file(0)",
+                "#endif",
+                "  {",
+                "  }",
+                "",
+                cls._generate_map(),
+                "",
+                "  /* Copies the context of a module instance to its oldest copy */",
+                "  void save(unsigned int id)",
+                "  {",
+                "    if (!region || id >= COUNT || !slots[id].size)",
+                "      return;",
+                "    CM_Warm_start_copy * first = copy(id, 0);",
+                "    CM_Warm_start_copy * second = copy(id, 1);",
+                "    CM_Warm_start_copy * target = first->sequence <= second->sequence ? first : second;",
+                "    unsigned long long sequence = (target == first ? second : first)->sequence + 1;",
+                "    target->sequence = 0;",
+                "    std::atomic_signal_fence(std::memory_order_seq_cst);",
+                "    memcpy(target + 1, slots[id].data, slots[id].size);",
+                "    target->size = slots[id].size;",
+                "    target->crc = cm_warm_start_crc(target + 1, slots[id].size);",
+                "    write_through(target, copy_size(id));",
+                "    std::atomic_signal_fence(std::memory_order_seq_cst);",
+                "    target->sequence = sequence;",
+                "    write_through(&target->sequence, sizeof(target->sequence));",
+                "  }",
+                "",
+                "private:",
+                "  /* Writes a part of the region to the file, the region being the file itself when mapped */",
+                "  void write_through(const void * data, std::size_t size)",
+                "  {",
+                "#if defined(_WIN32)",
+                "    std::size_t offset = (const unsigned char *) data - region;",
+                "    if (fseek(file, (long) offset, SEEK_SET) == 0 && fwrite(data, 1, size, file) == size)",
+                "      fflush(file);",
+                "#else",
+                "    (void) data;",
+                "    (void) size;",
+                "#endif",
+                "  }",
+                "",
+                "  std::size_t copy_size(unsigned int id) const",
+                "  {",
+                "    return sizeof(CM_Warm_start_copy) + ((slots[id].size + 7) & ~7u);",
+                "  }",
+                "",
+                "  CM_Warm_start_copy * copy(unsigned int id, unsigned int index) const",
+                "  {",
+                "    return (CM_Warm_start_copy *) (region + offsets[id] + index * copy_size(id));",
+                "  }",
+                "",
+                "  /* Restores the latest valid copy of a context, returns 1 if restored, 0 otherwise */",
+                "  int restore(unsigned int id)",
+                "  {",
+                "    const CM_Warm_start_copy * latest = 0;",
+                "    for (unsigned int index = 0; slots[id].size && index < 2; index++)",
+                "    {",
+                "      const CM_Warm_start_copy * candidate = copy(id, index);",
+                "      if (candidate->sequence && candidate->size == slots[id].size",
+                "          && candidate->crc == cm_warm_start_crc(candidate + 1, candidate->size)",
+                "          && (!latest || candidate->sequence > latest->sequence))",
+                "        latest = candidate;",
+                "    }",
+                "    if (!latest)",
+                "      return 0;",
+                "    memcpy(slots[id].data, latest + 1, latest->size);",
+                "    return 1;",
+                "  }",
+                "",
+                "  const CM_Warm_start_slot * slots;",
+                "  unsigned int signature;",
+                "  unsigned char * region;",
+                "#if defined(_WIN32)",
+                "  FILE * file;",
+                "#endif",
+                "  std::size_t offsets[COUNT];",
+                "};",
+            ]
+        )
+
+    @classmethod
+    def generate_declaration(cls) -> str:
+        """Generates the declaration of the save function called by the save_warm_start_context container functions
+        and of the restore function called by cm_initialize.
+
+        Returns:
+            str : The generated code.
+        """
+        return (
+            "/* Warm start */"
+            + Common.LINE_BREAK[:2]
+            + "void "
+            + WarmStart.SAVE
+            + "(unsigned int mod_id);"
+            + Common.LINE_BREAK[:1]
+            + "void "
+            + WarmStart.RESTORE
+            + "(void);"
+            + Common.LINE_BREAK[:2]
+        )
+
+    @classmethod
+    def _generate_slots(cls, warm_start: WarmStart) -> str:
+        return "".join(
+            ("  {&" + context + ", sizeof(" + context + ")}," if context else "  {0, 0},") + Common.LINE_BREAK[:1]
+            for context in warm_start.contexts or [None]
+        )
+
+    @classmethod
+    def generate_definition(cls, warm_start: WarmStart) -> str:
+        """Generates the warm start contexts of the module instances, the file they are saved to, the save function
+        and the restore function mapping the file, named by CSM_WARM_START_FILE (CSM_warm_start.bin by default).
+
+        Args:
+            warm_start (WarmStart) : The warm start contexts of the module instances.
+
+        Returns:
+            str : The generated code.
+        """
+        # The signature of the contexts layout, completed by their sizes once compiled
+        signature = zlib.crc32(";".join(context or "" for context in warm_start.contexts).encode())
+        return "\n".join(
+            [
+                "/* Warm start */",
+                "",
+                "#define CM_WARM_START_COUNT " + str(max(len(warm_start.contexts), 1)),
+                "",
+                "static const CM_Warm_start_slot cm_warm_start_slots[CM_WARM_START_COUNT] =",
+                "{",
+                cls._generate_slots(warm_start) + "};",
+                "static CM_Warm_start<CM_WARM_START_COUNT> CM_WARM_START(cm_warm_start_slots, "
+                + hex(signature)
+                + "u);",
+                "",
+                "void " + WarmStart.SAVE + "(unsigned int mod_id)",
+                "{",
+                "  CM_WARM_START.save(mod_id);",
+                "}",
+                "",
+                "void " + WarmStart.RESTORE + "(void)",
+                "{",
+                '  const char * path = getenv("CSM_WARM_START_FILE");',
+                "  if (!path)",
+                '    path = "' + cls.DEFAULT_FILE_NAME + '";',
+                "  int restored = CM_WARM_START.map(path);",
+                "  if (restored < 0)",
+                '    printf("[CSM] Warm start: cannot map %s\\n", path);',
+                "  else",
+                '    printf("[CSM] Warm start: %d context(s) restored from %s\\n", restored, path);',
+                "}",
+                "",
+            ]
+        )
+
+    @classmethod
+    def generate(cls, path: str, force: bool) -> None:
+        """Generates the following file:
+            - <output>/src/CSM_warm_start.hpp.
+
+        Args:
+            path (str) : The generation directory path.
+            force (bool) : True if the file can be overwritten, False otherwise.
+        """
+        file_path = os.path.join(path, "src", cls.FILE_NAME)
+        if os.path.exists(file_path) and force:
+            logger.debug("%s already exists, forcing, overwriting it...", file_path)
+        with open(file_path, "w") as f:
+            f.write("/* " + cls.FILE_NAME + " */" + Common.LINE_BREAK[:2])
+            f.write("#if !defined(CSM_WARM_START_HPP)" + Common.LINE_BREAK[:1])
+            f.write("#define CSM_WARM_START_HPP" + Common.LINE_BREAK[:2])
+            f.write("#include <atomic>" + Common.LINE_BREAK[:1])
+            f.write("#include <cstddef>" + Common.LINE_BREAK[:1])
+            f.write("#include <stdio.h>" + Common.LINE_BREAK[:1])
+            f.write("#include <stdlib.h>" + Common.LINE_BREAK[:1])
+            f.write("#include <string.h>" + Common.LINE_BREAK[:1])
+            f.write("#if !defined(_WIN32)" + Common.LINE_BREAK[:1])
+            f.write("#include <fcntl.h>" + Common.LINE_BREAK[:1])
+            f.write("#include <sys/mman.h>" + Common.LINE_BREAK[:1])
+            f.write("#include <sys/stat.h>" + Common.LINE_BREAK[:1])
+            f.write("#include <unistd.h>" + Common.LINE_BREAK[:1])
+            f.write("#endif" + Common.LINE_BREAK[:2])
+            f.write(cls._generate_crc() + Common.LINE_BREAK[:2])
+            f.write(cls._generate_structures() + Common.LINE_BREAK[:2])
+            f.write(cls._generate_class() + Common.LINE_BREAK[:2])
+            f.write("#endif /* CSM_WARM_START_HPP */" + Common.LINE_BREAK[:1])
+        logger.debug("%s generated", file_path)
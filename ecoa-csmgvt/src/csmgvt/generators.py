@@ -9,12 +9,22 @@
 import logging
 import os
 
+# Internal library imports
+from ecoa_toolset.generators.container.common import Common
+from ecoa_toolset.generators.manifest import GenerationManifest
+
 # Local imports
 from csmgvt.component.external import ExternalInterfaceGenerator
 from csmgvt.component.module.cmakelists import CMakeListsGenerator as ModuleCMakeListsGenerator
 from csmgvt.csm.cmakelists import CMakeListsGenerator as CSMCMakeListsGenerator
 from csmgvt.csm.container import ContainerMockGenerator
+from csmgvt.csm.event_queue import EventQueueGenerator
+from csmgvt.csm.executor import ExecutorGenerator
+from csmgvt.csm.logger import LoggerGenerator
 from csmgvt.csm.main import MainGenerator
+from csmgvt.csm.metrics import MetricsGenerator
+from csmgvt.csm.pinfo_mapping import PinfoMappingGenerator
+from csmgvt.csm.warm_start import WarmStartGenerator
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +44,37 @@ def generate_directory(path: str) -> None:
 
 
 class ComponentsGenerator:
-    """The Components Generator."""
+    """The Components Generator.
 
-    def __init__(self, ecoa_model, output: str, force: bool):
+    Args:
+        ecoa_model : The ECOA model.
+        output (str) : The output directory path.
+        force (bool) : True if the files can be overwritten, false otherwise.
+        manifest (GenerationManifest) : The dependency manifest, None to generate all the components.
+    """
+
+    def __init__(self, ecoa_model, output: str, force: bool, manifest: GenerationManifest = None):
         self._ecoa_model = ecoa_model
         self._output = output
         self._force = force
+        self._manifest = manifest
+
+    def _generate_component(self, component_impl, component_impl_name: str, component_directory_path: str) -> None:
+        generate_directory(component_directory_path)
+        ExternalInterfaceGenerator(
+            self._ecoa_model, component_directory_path, component_impl_name, self._force
+        ).generate()
+        for module_impl in component_impl.module_implementation:
+            module_directory_path = os.path.join(component_directory_path, module_impl.name)
+            generate_directory(module_directory_path)
+            ModuleCMakeListsGenerator(
+                self._ecoa_model,
+                module_directory_path,
+                component_impl_name,
+                module_impl.name,
+                module_impl.language.lower(),
+                self._force,
+            ).generate()
 
     def generate(self) -> None:
         """Generates the following files for all modules of all components:
@@ -49,21 +84,13 @@ def generate(self) -> None:
         for path, component_impl in self._ecoa_model.components.items():
             component_impl_name = os.path.normpath(path).split(os.path.sep)[-2]
             component_directory_path = os.path.join(self._output, component_impl_name)
-            generate_directory(component_directory_path)
-            ExternalInterfaceGenerator(
-                self._ecoa_model, component_directory_path, component_impl_name, self._force
-            ).generate()
-            for module_impl in component_impl.module_implementation:
-                module_directory_path = os.path.join(component_directory_path, module_impl.name)
-                generate_directory(module_directory_path)
-                ModuleCMakeListsGenerator(
-                    self._ecoa_model,
-                    module_directory_path,
-                    component_impl_name,
-                    module_impl.name,
-                    module_impl.language.lower(),
-                    self._force,
-                ).generate()
+            inputs = self._manifest.get_component_inputs(path) if self._manifest else None
+            if self._manifest and self._manifest.is_up_to_date(component_directory_path, inputs):
+                logger.info("%s is up to date, skipping its generation", component_directory_path)
+                continue
+            self._generate_component(component_impl, component_impl_name, component_directory_path)
+            if self._manifest:
+                self._manifest.update(component_directory_path, inputs, [component_directory_path])
 
 
 class CSMGenerator:
@@ -73,20 +100,87 @@ class CSMGenerator:
         ecoa_model : The ECOA model.
         output (str) : The output directory path.
         force (bool) : True if the files can be overwritten, false otherwise.
+        dispatch (str) : The dispatch of the container mock functions on the module instance identifier.
+        threads (bool) : True to run each protection domain on its own worker thread, false otherwise.
+        event_queue (int) : The capacity of the queue of the events sent by the modules, None to call the receivers
+            of the events directly.
+        metrics (bool) : True to record the call count and the latency of the container functions, false otherwise.
+        log_buffer (int) : The capacity of the ring buffer of the log records, None to print the log records directly.
+        pinfo_access (str) : The access of the pinfo container functions to the PINFO files.
+        warm_start (bool) : True to save the warm start contexts to a file and to restore them at initialization,
+            false otherwise.
     """
 
-    def __init__(self, ecoa_model, output: str, force: bool):
+    def __init__(
+        self,
+        ecoa_model,
+        output: str,
+        force: bool,
+        dispatch: str = Common.IF_DISPATCH,
+        threads: bool = False,
+        event_queue: int = None,
+        metrics: bool = False,
+        log_buffer: int = None,
+        pinfo_access: str = Common.STREAM_PINFO_ACCESS,
+        warm_start: bool = False,
+    ):
         self._ecoa_model = ecoa_model
         self._output = output
         self._force = force
+        self._dispatch = dispatch
+        self._threads = threads and bool(ecoa_model.protection_domains)
+        self._event_queue = event_queue
+        self._metrics = metrics
+        self._log_buffer = log_buffer
+        self._pinfo_access = pinfo_access
+        self._warm_start = warm_start
 
     def generate(self) -> None:
         """Generates the following files:
         - <output>/src/main.cpp.
         - <output>/src/CSM_#project_name#.cpp.
+        - <output>/src/CSM_executor.hpp (with threads).
+        - <output>/src/CSM_event_queue.hpp (with an event queue).
+        - <output>/src/CSM_metrics.hpp (with metrics).
+        - <output>/src/CSM_logger.hpp (with a log buffer).
+        - <output>/src/CSM_pinfo_mapping.hpp (with the mmap PINFO access).
+        - <output>/src/CSM_warm_start.hpp (with warm start).
         - <output>/CMakeLists.txt.
         """
         generate_directory(os.path.join(self._output, "src"))
-        MainGenerator.generate(self._ecoa_model, self._output, self._force)
-        ContainerMockGenerator.generate(self._ecoa_model, self._output, self._force)
-        CSMCMakeListsGenerator(self._ecoa_model, self._output, self._force).generate()
+        MainGenerator.generate(
+            self._ecoa_model,
+            self._output,
+            self._force,
+            self._threads,
+            bool(self._event_queue),
+            self._metrics,
+            bool(self._log_buffer),
+        )
+        ContainerMockGenerator.generate(
+            self._ecoa_model,
+            self._output,
+            self._force,
+            self._dispatch,
+            self._threads,
+            self._event_queue,
+            self._metrics,
+            self._log_buffer,
+            self._pinfo_access,
+            self._warm_start,
+        )
+        if self._threads:
+            ExecutorGenerator.generate(self._output, self._force)
+        if self._event_queue:
+            EventQueueGenerator.generate(self._output, self._force)
+        if self._metrics:
+            MetricsGenerator.generate(self._output, self._force)
+        if self._log_buffer:
+            LoggerGenerator.generate(self._output, self._force)
+        if self._pinfo_access == Common.MMAP_PINFO_ACCESS and self._ecoa_model.pinfos:
+            PinfoMappingGenerator.generate(self._output, self._force)
+        if self._warm_start:
+            WarmStartGenerator.generate(self._output, self._force)
+        CSMCMakeListsGenerator(
+            self._ecoa_model, self._output, self._force, self._threads or bool(self._log_buffer)
+        ).generate()
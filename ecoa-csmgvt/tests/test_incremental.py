@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Test of the generation context of the incremental generation of ecoa-csmgvt."""
+
+# Standard library imports
+import sys
+from types import SimpleNamespace
+
+# Internal library imports
+from ecoa_toolset.generators.manifest import GenerationManifest
+
+# Local imports
+from csmgvt.__main__ import _create_argument_parser, _get_generation_context
+
+INPUTS = {"demo.project.xml": "0"}
+UNIT = "C0"
+# Each option affecting the generated files, with a value other than its default
+OPTIONS = [["-d", "switch"], ["-t"], ["-e", "16"], ["-m"], ["-b", "64"], ["-a", "mmap"], ["-w"]]
+
+
+def _generate(tmp_path, *options) -> bool:
+    # Reruns the incremental generation of a unit with the given options, returns True if it is up to date
+    project = tmp_path / "demo.project.xml"
+    project.touch()
+    output = tmp_path / "output"
+    output.mkdir(exist_ok=True)
+    args = _create_argument_parser().parse_args(
+        ["-p", str(project), "-k", sys.executable, "-o", str(output), "-i", *options]
+    )
+    manifest = GenerationManifest(
+        SimpleNamespace(project_path=args.project), args.output, _get_generation_context(args)
+    )
+    up_to_date = manifest.is_up_to_date(UNIT, INPUTS)
+    unit = output / UNIT
+    unit.mkdir(exist_ok=True)
+    (unit / "CMakeLists.txt").touch()
+    manifest.update(UNIT, INPUTS, [str(unit)])
+    manifest.save()
+    return up_to_date
+
+
+def test_rerun_with_same_options(tmp_path):
+    assert not _generate(tmp_path, "-m")
+    assert _generate(tmp_path, "-m")
+    # The number of jobs and the cache do not affect the generated files
+    assert _generate(tmp_path, "-m", "-j", "2", "-n")
+
+
+def test_rerun_after_option_change(tmp_path):
+    assert not _generate(tmp_path)
+    for options in OPTIONS:
+        assert not _generate(tmp_path, *options), options
+        assert _generate(tmp_path, *options), options
+        assert not _generate(tmp_path), options
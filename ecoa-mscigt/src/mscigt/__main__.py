@@ -9,40 +9,94 @@
 import logging
 import os
 import sys
+from importlib.metadata import version
+from typing import Dict
 
 # Local imports
-from mscigt.component.generator import ComponentGenerator
 from mscigt.templates import Templates
 
 # Internal library imports
-from ecoa_toolset.arguments import check_ecoa_xml, create_output_directory, select_output_directory
+from ecoa_toolset.arguments import check_ecoa_xml, create_output_directory, create_xml_cache, select_output_directory
 from ecoa_toolset.configuration import ecoa_std_version
-from ecoa_toolset.generators.types.generator import TypesGenerator
-from ecoa_toolset.models.ecoa_model import ECOAModel
+from ecoa_toolset.generators.container.common import Common
+from ecoa_toolset.generators.manifest import GenerationManifest
 from ecoa_toolset.utils.arguments.argument_factory import ArgumentFactory
 from ecoa_toolset.utils.arguments.custom_action import Once, OnceAndStoreTrue
-from ecoa_toolset.utils.arguments.custom_type import check_checker_value, check_project_value, check_template_value
+from ecoa_toolset.utils.arguments.custom_type import (
+    check_checker_value,
+    check_jobs_value,
+    check_project_value,
+    check_template_value,
+    check_xsd_value,
+)
 from ecoa_toolset.utils.arguments.optional import OptionalArgument
 from ecoa_toolset.utils.logging.logger import Logger
 
 logger = logging.getLogger(__name__)
 
 
-def _generate_module_implementations(ecoa_model, project: str, output: str, force: bool, templates: Templates) -> None:
+def _generate_module_implementation(
+    ecoa_model,
+    module_directory_path: str,
+    module_impl_name: str,
+    output: str,
+    force: bool,
+    templates: Templates,
+    manifest: GenerationManifest,
+    inputs: Dict[str, str],
+    dispatch: str,
+) -> None:
+    if manifest and manifest.is_up_to_date(module_directory_path, inputs):
+        logger.info("%s is up to date, skipping its generation", module_directory_path)
+        return
+    component_impl_name = os.path.basename(os.path.dirname(module_directory_path))
+    logger.debug("Attempt to create directory %s", module_directory_path)
+    if os.path.exists(module_directory_path):
+        logger.debug("%s module directory already exists !", module_directory_path)
+    else:
+        os.mkdir(module_directory_path)
+        logger.debug("Created module directory %s", module_directory_path)
+    # Imported on first use, so that the CLI starts without loading the generators
+    from mscigt.component.generator import ComponentGenerator
+
+    component_generator = ComponentGenerator(
+        ecoa_model, module_directory_path, component_impl_name, module_impl_name, force, templates, output, dispatch
+    )
+    component_generator.generate()
+    if manifest:
+        manifest.update(module_directory_path, inputs, component_generator.get_owned_paths())
+
+
+def _generate_module_implementations(
+    ecoa_model,
+    project: str,
+    output: str,
+    force: bool,
+    templates: Templates,
+    manifest: GenerationManifest = None,
+    dispatch: str = Common.IF_DISPATCH,
+) -> None:
     for path, component_implementation in ecoa_model.components.items():
         component_directory_path = os.path.join(os.path.dirname(project), os.path.split(path)[0])
-        component_impl_name = os.path.basename(component_directory_path)
+        inputs = manifest.get_component_inputs(path) if manifest else None
         for module in component_implementation.module_implementation:
             module_directory_path = os.path.join(component_directory_path, module.name)
-            logger.debug("Attempt to create directory %s", module_directory_path)
-            if os.path.exists(module_directory_path):
-                logger.debug("%s module directory already exists !", module_directory_path)
-            else:
-                os.mkdir(module_directory_path)
-                logger.debug("Created module directory %s", module_directory_path)
-            ComponentGenerator(
-                ecoa_model, module_directory_path, component_impl_name, module.name, force, templates, output
-            ).generate()
+            _generate_module_implementation(
+                ecoa_model, module_directory_path, module.name, output, force, templates, manifest, inputs, dispatch
+            )
+
+
+def _get_generation_context(args, templates: Templates) -> str:
+    # The options affecting the generated files, and the contents of the templates (not their path)
+    return " ".join(
+        [
+            "ecoa-mscigt",
+            version("ecoa-mscigt"),
+            os.path.abspath(args.output),
+            templates.get_identity(),
+            args.dispatch,
+        ]
+    )
 
 
 def _create_argument_parser():
@@ -107,7 +161,61 @@ def _create_argument_parser():
                 ),
                 action=Once,
                 type=check_checker_value,
-                required=True,
+            ),
+            OptionalArgument(
+                "-x",
+                "--xsd",
+                (
+                    "Directory of the ECOA XSDs to check the validity of the ECOA XML files in-process, while they are "
+                    + "parsed, instead of running the checker.\n"
+                    + "One of the -k/--checker and -x/--xsd options is required."
+                ),
+                action=Once,
+                type=check_xsd_value,
+            ),
+            OptionalArgument(
+                "-F",
+                "--fast-parsing",
+                (
+                    "Bind the ECOA XML files with a lightweight lxml parser instead of the strict xsdata parser, "
+                    + "leaving their validation to the checker."
+                ),
+                action=OnceAndStoreTrue,
+            ),
+            OptionalArgument(
+                "-j",
+                "--jobs",
+                "Number of worker processes used to parse the ECOA XML files.\nDefault to 1 (serial parsing).",
+                action=Once,
+                type=check_jobs_value,
+                default=1,
+            ),
+            OptionalArgument(
+                "-n",
+                "--no-cache",
+                "Always parse the ECOA XML files instead of loading the unchanged ones from the cache.",
+                action=OnceAndStoreTrue,
+            ),
+            OptionalArgument(
+                "-i",
+                "--incremental",
+                "Only generate the modules whose ECOA XML inputs changed since the previous generation.",
+                action=OnceAndStoreTrue,
+            ),
+            OptionalArgument(
+                "-d",
+                "--dispatch",
+                (
+                    "Set how the unit test container mocks select the calling module instance\nAvailable dispatches:"
+                    + "\n\t- if: if / else if chain"
+                    + "\n\t- switch: switch statement on the dense module instance identifiers"
+                    + "\nDefault to "
+                    + Common.IF_DISPATCH
+                    + "."
+                ),
+                action=Once,
+                default=Common.IF_DISPATCH,
+                choices=Common.DISPATCHES,
             ),
         ],
     )
@@ -125,18 +233,25 @@ def main() -> None:
         # Parsing CLI arguments
         args = arg_parser.parse_args()
 
-        # Checking the ECOA XML files
-        check_ecoa_xml(args)
-
         # Init logger config for the entire app
         Logger.init(args.log, args.verbose)
 
+        # Checking the ECOA XML files
+        check_ecoa_xml(args)
+
         templates = Templates(args.template)
 
+        # The model and the generators are imported once the arguments are checked
+        from ecoa_toolset.generators.types.generator import TypesGenerator
+        from ecoa_toolset.models.ecoa_model import ECOAModel
+
         # Parsing ECOA project XML file
         project_file_name = os.path.basename(args.project)
         logger.debug("Parsing project file %s", project_file_name)
-        ecoa_model = ECOAModel(project_file_name.split(".")[0], args.project)
+        cache = create_xml_cache(args.project, args.output, args.no_cache)
+        ecoa_model = ECOAModel(
+            project_file_name.split(".")[0], args.project, args.jobs, cache, args.xsd, args.fast_parsing
+        )
         ecoa_model.parse()
 
         logger.debug("Found %d component(s)", ecoa_model.get_component_count())
@@ -147,7 +262,14 @@ def main() -> None:
         create_output_directory(args.force, args.output)
 
         # Generating the module implementation files
-        _generate_module_implementations(ecoa_model, args.project, args.output, args.force, templates)
+        manifest = None
+        if args.incremental:
+            manifest = GenerationManifest(ecoa_model, args.output, _get_generation_context(args, templates))
+        _generate_module_implementations(
+            ecoa_model, args.project, args.output, args.force, templates, manifest, args.dispatch
+        )
+        if manifest:
+            manifest.save()
 
         # Generating the types files
         TypesGenerator(ecoa_model, args.output, args.force, templates=templates).generate()
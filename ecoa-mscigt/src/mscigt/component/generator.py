@@ -7,9 +7,11 @@
 # Standard library imports
 import logging
 import os
+from typing import List
 
 # Internal library imports
 from ecoa_toolset.generators.common import Common
+from ecoa_toolset.generators.container.common import Common as ContainerCommon
 
 # Local imports
 from mscigt.component.container.interface import ContainerInterfaceGenerator
@@ -36,6 +38,7 @@ class ComponentGenerator:
         force (bool) : True if the files can be overwritten, false otherwise.
         templates (Templates): The Templates.
         output_path (str) : The output directory path.
+        dispatch (str) : The dispatch of the container mock functions on the module instance identifier.
     """
 
     def __init__(
@@ -47,6 +50,7 @@ def __init__(
         force: bool,
         templates: Templates,
         output_path: str,
+        dispatch: str = ContainerCommon.IF_DISPATCH,
     ) -> None:
         self._ecoa_model = ecoa_model
         self._path = path
@@ -55,10 +59,25 @@ def __init__(
         self._force = force
         self._templates = templates
         self._output_path = output_path
+        self._dispatch = dispatch
         self._language = self._ecoa_model.module_impls.get(
             self._component_impl_name + ":" + self._module_impl_name
         ).language.lower()
 
+    def get_owned_paths(self) -> List[str]:
+        """Gives the files overwritten on each generation, the other files being generated once for the user.
+
+        Returns:
+            List[str] : The inc-gen directory, the container mock and the CMakeLists.txt of the unit test.
+        """
+        ext = ".c" + Common.switch_lang("", "pp", self._language)
+        tests_directory_path = os.path.join(self._path, "tests")
+        return [
+            os.path.join(self._path, "inc-gen"),
+            os.path.join(tests_directory_path, self._module_impl_name + "_container_mock" + ext),
+            os.path.join(tests_directory_path, "CMakeLists.txt"),
+        ]
+
     def generate(self) -> None:
         """Generates the following files:
         .
@@ -132,6 +151,7 @@ def generate(self) -> None:
             self._module_impl_name,
             self._language,
             self._templates,
+            self._dispatch,
         ).generate()
         UnitTestMainGenerator(
             self._ecoa_model,
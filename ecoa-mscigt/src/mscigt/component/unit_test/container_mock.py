@@ -14,6 +14,7 @@
 
 # Internal library imports
 from ecoa_toolset.generators.common import Common
+from ecoa_toolset.generators.container.common import Common as ContainerCommon
 from ecoa_toolset.generators.container.generator import ContainerGenerator
 from ecoa_toolset.generators.helpers.global_variable import CMGlobalVariable, CMGlobalVariableHelper
 from ecoa_toolset.generators.helpers.platform_hook import PlatformHook, PlatformHookHelper
@@ -62,6 +63,7 @@ def __init__(
         module_impl_name: str,
         language: str,
         templates: Templates,
+        dispatch: str = ContainerCommon.IF_DISPATCH,
     ) -> None:
         self._ecoa_model = ecoa_model
         self._path = path
@@ -71,7 +73,7 @@ def __init__(
         self._templates = templates
         self._global_variable_helper = CMGlobalVariableHelper(self._ecoa_model)
         self._platform_hook_helper = PlatformHookHelper(self._ecoa_model)
-        self._generator = ContainerGenerator(0, 2, True, True)
+        self._generator = ContainerGenerator(0, 2, True, True, dispatch)
         self._visitor = ContainerMockVisitor(self._generator, self._ecoa_model)
 
     def generate(self) -> None:
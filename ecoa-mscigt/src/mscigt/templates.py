@@ -7,12 +7,11 @@
 
 # Standard library imports
 import datetime
+import hashlib
 import os
+from importlib import metadata
 from typing import Dict, List
 
-# Third-Party library imports
-import pkg_resources
-
 
 class Templates:
     """"""
@@ -20,9 +19,11 @@ class Templates:
     _path: str = None
     _user: Dict[str, List] = None
     _default: List = None
+    _version: str = None
 
     def __init__(self, path: str) -> None:
         self._path = path
+        self._version = metadata.version("ecoa-mscigt")
         self._open_user_templates()
         self._create_default_template()
 
@@ -40,6 +41,17 @@ def _open_user_template(self, file_path: str, file_name: str) -> None:
             with open(file_path) as f:
                 self._user[ext] = f.readlines()
 
+    def get_identity(self) -> str:
+        """Gives the identity of the user templates, which changes when one of them is added, removed or edited.
+
+        Returns:
+            str : The hash of the contents of the user templates.
+        """
+        digest = hashlib.sha256()
+        for key, lines in sorted(self._user.items()):
+            digest.update((key + "\0" + "".join(lines) + "\0").encode())
+        return digest.hexdigest()
+
     def _create_default_template(self) -> None:
         self._default = []
         self._default.append("")
@@ -58,7 +70,7 @@ def _replace_tags(self, template: List, file_name: str) -> None:
             new_line = new_line.replace("FILE", file_name)
             new_line = new_line.replace("DATE", datetime.datetime.now().strftime("%Y-%m-%d"))
             new_line = new_line.replace("TIME", datetime.datetime.now().strftime("%H:%M:%S.%f"))
-            new_line = new_line.replace("MSCIGT_VERSION", pkg_resources.require("ecoa-mscigt")[0].version)
+            new_line = new_line.replace("MSCIGT_VERSION", self._version)
             new_template.append(new_line)
         return new_template
 
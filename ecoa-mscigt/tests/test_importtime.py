@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Import time regression test of the ecoa-mscigt entry point."""
+
+# Standard library imports
+import os
+import subprocess
+import sys
+
+# Third-Party library imports
+import pytest
+
+MODULE = "mscigt.__main__"
+# Cumulative import time budget of the entry point in microseconds, best of RUNS runs, only checked when given
+# (the import time depends on the machine and its load)
+BUDGET = os.environ.get("ECOA_IMPORT_TIME_BUDGET")
+RUNS = 3
+# Modules which must only be loaded on first use
+LAZY_MODULES = [
+    "pkg_resources",
+    "xsdata",
+    "mscigt.component.generator",
+    "ecoa_toolset.models.ecoa_model",
+    "ecoa_toolset.models.ecoa_objects.ecoa_bin_desc_2_0",
+    "ecoa_toolset.models.ecoa_objects.ecoa_cross_platforms_view_2_0",
+    "ecoa_toolset.models.ecoa_objects.ecoa_interface_qos_2_0",
+    "ecoa_toolset.models.ecoa_objects.ecoa_logicalsystem_2_0",
+    "ecoa_toolset.models.ecoa_objects.ecoa_uid_2_0",
+]
+
+
+def _import_times():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + MODULE], capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_lazy_modules():
+    times = _import_times()
+    loaded = [lazy for lazy in LAZY_MODULES if any(name == lazy or name.startswith(lazy + ".") for name in times)]
+    assert loaded == [], "loaded at import: " + ", ".join(loaded)
+
+
+@pytest.mark.skipif(not BUDGET, reason="ECOA_IMPORT_TIME_BUDGET is not set")
+def test_import_time():
+    best = min(_import_times()[MODULE] for _ in range(RUNS))
+    assert best < int(BUDGET), MODULE + " imported in " + str(best) + " us, budget " + BUDGET + " us"
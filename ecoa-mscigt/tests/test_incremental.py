@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Test of the generation context of the incremental generation of ecoa-mscigt."""
+
+# Standard library imports
+import sys
+from types import SimpleNamespace
+
+# Internal library imports
+from ecoa_toolset.generators.manifest import GenerationManifest
+
+# Local imports
+from mscigt.__main__ import _create_argument_parser, _get_generation_context
+from mscigt.component.generator import ComponentGenerator
+from mscigt.templates import Templates
+
+INPUTS = {"demo.project.xml": "0"}
+UNIT = "C0"
+
+
+def _generate(tmp_path, *options) -> bool:
+    # Reruns the incremental generation of a unit with the given options, returns True if it is up to date
+    project = tmp_path / "demo.project.xml"
+    project.touch()
+    output = tmp_path / "output"
+    output.mkdir(exist_ok=True)
+    args = _create_argument_parser().parse_args(
+        ["-p", str(project), "-k", sys.executable, "-o", str(output), "-i", *options]
+    )
+    context = _get_generation_context(args, Templates(args.template))
+    manifest = GenerationManifest(SimpleNamespace(project_path=args.project), args.output, context)
+    up_to_date = manifest.is_up_to_date(UNIT, INPUTS)
+    unit = output / UNIT
+    unit.mkdir(exist_ok=True)
+    (unit / "CMakeLists.txt").touch()
+    manifest.update(UNIT, INPUTS, [str(unit)])
+    manifest.save()
+    return up_to_date
+
+
+def test_rerun_after_template_edit(tmp_path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    template = templates / "header_template.h"
+    template.write_text("/* FILE */\n")
+    assert not _generate(tmp_path, "-t", str(templates))
+    assert _generate(tmp_path, "-t", str(templates))
+    template.write_text("/* FILE (c) */\n")
+    assert not _generate(tmp_path, "-t", str(templates))
+    assert _generate(tmp_path, "-t", str(templates))
+    # A file which is not a template does not affect the generated files
+    (templates / "README").write_text("Templates\n")
+    assert _generate(tmp_path, "-t", str(templates))
+
+
+def test_rerun_after_option_change(tmp_path):
+    assert not _generate(tmp_path)
+    assert not _generate(tmp_path, "-d", "switch")
+    assert _generate(tmp_path, "-d", "switch")
+    assert not _generate(tmp_path)
+
+
+def test_user_files_not_recorded(tmp_path):
+    module = tmp_path / "CI0" / "M0"
+    files = ["inc/M0_user_context.h", "inc-gen/M0.h", "src/M0.c", "tests/CMakeLists.txt", "tests/M0_container_mock.c"]
+    files += ["tests/main.c"]
+    for file in files:
+        (module / file).parent.mkdir(parents=True, exist_ok=True)
+        (module / file).touch()
+    ecoa_model = SimpleNamespace(module_impls={"CI0:M0": SimpleNamespace(language="C")})
+    generator = ComponentGenerator(ecoa_model, str(module), "CI0", "M0", False, Templates(None), str(tmp_path))
+    manifest = GenerationManifest(SimpleNamespace(project_path=str(tmp_path / "demo.project.xml")), str(tmp_path), "")
+    manifest.update(UNIT, INPUTS, generator.get_owned_paths())
+    # The files generated once for the user may be removed or renamed
+    for file in ["inc/M0_user_context.h", "src/M0.c", "tests/main.c"]:
+        (module / file).unlink()
+    assert manifest.is_up_to_date(UNIT, INPUTS)
+    (module / "tests" / "M0_container_mock.c").unlink()
+    assert not manifest.is_up_to_date(UNIT, INPUTS)
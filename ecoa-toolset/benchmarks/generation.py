@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Benchmark of the parsing, linking and generation phases over a synthetic ECOA project.
+
+The project is written to a temporary directory (see synthetic_project.py), then read, parsed and generated with
+the TypesGenerator, the ComponentGenerator of ecoa-mscigt and the CSMGenerator of ecoa-csmgvt. The wall time and
+the peak RSS of the process at the end of each phase are reported as JSON; the phases of a tool that is not
+installed are skipped. Run it once per size to get scaling curves, e.g.:
+
+    for n in 10 20 40 80; do python benchmarks/generation.py --components $n --wires $n > bench_$n.json; done
+
+Usage:
+    python benchmarks/generation.py [--components 10] [--modules 5] [--types 50] [--operations 2] [--wires 10]
+"""
+
+# Standard library imports
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterator, List
+
+# Local imports
+from synthetic_project import add_size_arguments, get_size, write_project
+
+# Internal library imports
+from ecoa_toolset.generators.types.generator import TypesGenerator
+from ecoa_toolset.models.ecoa_model import ECOAModel
+from ecoa_toolset.models.ecoa_xml_model import ECOAXMLModel
+from ecoa_toolset.models.linkers.data import DataLinker
+from ecoa_toolset.models.linkers.events import EventsLinker
+from ecoa_toolset.models.linkers.requests import RequestsLinker
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def get_peak_rss() -> int:
+    """Returns the peak resident set size of the process, in KiB (None if unavailable on the platform)."""
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB on Linux
+    return peak_rss // 1024 if sys.platform == "darwin" else peak_rss
+
+
+class PhaseRecorder:
+    """Records the cumulated wall time, the number of calls and the peak RSS of named phases.
+
+    Attributes:
+        phases (Dict[str, Dict]): The measures of each phase, in the order the phases started.
+    """
+
+    phases: Dict[str, Dict] = None
+
+    def __init__(self) -> None:
+        self.phases = {}
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Context manager measuring a phase.
+
+        Args:
+            name (str): The phase name.
+        """
+
+        phase = self.phases.setdefault(name, {"calls": 0, "wall_time_s": 0.0, "peak_rss_kib": None})
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            phase["calls"] += 1
+            phase["wall_time_s"] += time.perf_counter() - start
+            phase["peak_rss_kib"] = get_peak_rss()
+
+    @contextmanager
+    def instrument(self, clazz: type, method_name: str, name: str = None) -> Iterator[None]:
+        """Context manager measuring every call to a method of a class as a phase.
+
+        Args:
+            clazz (type): The class.
+            method_name (str): The method name.
+            name (str): The phase name, default to <class name>.<method name>.
+        """
+
+        method = getattr(clazz, method_name)
+        name = name or f"{clazz.__name__}.{method_name}"
+
+        def measured_method(*args, **kwargs):
+            with self.measure(name):
+                return method(*args, **kwargs)
+
+        setattr(clazz, method_name, measured_method)
+        try:
+            yield
+        finally:
+            setattr(clazz, method_name, method)
+
+
+def _generate_module_skeletons(ecoa_model, project_path: str, output: str, skipped: List[str]) -> None:
+    try:
+        from mscigt.component.generator import ComponentGenerator
+        from mscigt.templates import Templates
+    except ImportError:
+        skipped.append("ComponentGenerator")
+        return
+    templates = Templates(None)
+    for path, component_impl in ecoa_model.components.items():
+        component_directory_path = os.path.join(os.path.dirname(project_path), os.path.dirname(path))
+        component_impl_name = os.path.basename(component_directory_path)
+        for module_impl in component_impl.module_implementation:
+            module_directory_path = os.path.join(component_directory_path, module_impl.name)
+            os.makedirs(module_directory_path, exist_ok=True)
+            ComponentGenerator(
+                ecoa_model, module_directory_path, component_impl_name, module_impl.name, True, templates, output
+            ).generate()
+
+
+def _generate_csm(ecoa_model, output: str, skipped: List[str]) -> None:
+    try:
+        from csmgvt.generators import CSMGenerator
+    except ImportError:
+        skipped.append("CSMGenerator")
+        return
+    os.makedirs(output, exist_ok=True)
+    CSMGenerator(ecoa_model, output, True).generate()
+
+
+def run(project_path: str, output: str, jobs: int = 1, fast_parsing: bool = False) -> Dict:
+    """Reads, parses and generates an ECOA project while measuring each phase.
+
+    Args:
+        project_path (str): Path to the ECOA project file.
+        output (str): The output directory.
+        jobs (int): Number of worker processes used to parse the ECOA XML files.
+        fast_parsing (bool): True to bind the ECOA XML files with the FastParser.
+
+    Returns:
+        Dict: The measures of the phases and the skipped phases.
+    """
+
+    recorder = PhaseRecorder()
+    skipped = []
+    with ExitStack() as stack:
+        stack.enter_context(recorder.instrument(ECOAXMLModel, "read"))
+        stack.enter_context(recorder.instrument(ECOAModel, "parse"))
+        for linker in [EventsLinker, RequestsLinker, DataLinker]:
+            stack.enter_context(recorder.instrument(linker, "compute", linker.__name__))
+        with recorder.measure("total"):
+            ecoa_model = ECOAModel(
+                os.path.basename(project_path).split(".")[0], project_path, jobs, fast_parsing=fast_parsing
+            )
+            ecoa_model.parse()
+            with recorder.measure("TypesGenerator"):
+                TypesGenerator(ecoa_model, output, True).generate()
+            with recorder.measure("ComponentGenerator"):
+                _generate_module_skeletons(ecoa_model, project_path, os.path.join(output, "mscigt"), skipped)
+            with recorder.measure("CSMGenerator"):
+                _generate_csm(ecoa_model, os.path.join(output, "csmgvt"), skipped)
+    phases = {name: phase for name, phase in recorder.phases.items() if name not in skipped}
+    return {"phases": phases, "skipped": skipped}
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_size_arguments(arg_parser)
+    arg_parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of XML parsing worker processes.")
+    arg_parser.add_argument("-F", "--fast-parsing", action="store_true", help="Bind the XML files with lxml.")
+    arg_parser.add_argument("-o", "--output", help="Write the JSON report to this file instead of stdout.")
+    args = arg_parser.parse_args()
+
+    size = get_size(args)
+    with tempfile.TemporaryDirectory(prefix="ecoa_benchmark_") as directory:
+        project_path = write_project(os.path.join(directory, "project"), size)
+        report = {
+            "size": size.to_dict(),
+            "jobs": args.jobs,
+            "fast_parsing": args.fast_parsing,
+            "python": platform.python_version(),
+            **run(project_path, os.path.join(directory, "output"), args.jobs, args.fast_parsing),
+        }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Writer of synthetic ECOA projects of configurable size, used by the benchmarks.
+
+Each component implementation holds a chain of module instances linked by events, requests and versioned data,
+a trigger, an external event, and operations linked to the services of the other components through the wires.
+The linked operations have the same parameters, the operations linked to a service being built from its definition.
+
+Usage:
+    python benchmarks/synthetic_project.py <directory> [--components 10] [--modules 5] [--types 50] ...
+"""
+
+# Standard library imports
+import argparse
+import math
+import os
+from dataclasses import asdict, dataclass
+from typing import Dict, List
+
+TYPES_NAMESPACE = "http://www.ecoa.technology/types-2.0"
+INTERFACE_NAMESPACE = "http://www.ecoa.technology/interface-2.0"
+IMPLEMENTATION_NAMESPACE = "http://www.ecoa.technology/implementation-2.0"
+DEPLOYMENT_NAMESPACE = "http://www.ecoa.technology/deployment-2.0"
+PROJECT_NAMESPACE = "http://www.ecoa.technology/project-2.0"
+COMPOSITE_NAMESPACE = "http://docs.oasis-open.org/ns/opencsa/sca/200912"
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>'
+PROJECT_NAME = "synthetic"
+LANGUAGES = ["C", "C++"]
+# The types library of the service definition
+SERVICE_LIBRARY = "lib0"
+# Number of types generated by each pattern (simple, enum, array, record, variant record)
+TYPES_PATTERN_SIZE = 5
+
+
+@dataclass
+class ProjectSize:
+    """The size of a synthetic ECOA project.
+
+    Attributes:
+        components (int): Number of component implementations (one component instance each).
+        modules (int): Number of module instances per component implementation.
+        types (int): Number of types, spread over the libraries.
+        operations (int): Number of events, requests and versioned data of each kind per module.
+        wires (int): Number of wires between the components.
+        libraries (int): Number of types libraries.
+    """
+
+    components: int = 10
+    modules: int = 5
+    types: int = 50
+    operations: int = 2
+    wires: int = 10
+    libraries: int = 2
+
+    @property
+    def types_per_library(self) -> int:
+        """int: The number of types of each library, rounded up to whole patterns."""
+        count = math.ceil(self.types / self.libraries / TYPES_PATTERN_SIZE)
+        return max(count, 1) * TYPES_PATTERN_SIZE
+
+    def get_references(self, component: int) -> int:
+        """Returns the number of references of a component, one per wire it is the source of.
+
+        Args:
+            component (int): The component index.
+
+        Returns:
+            int: The number of references.
+        """
+
+        return self.wires // self.components + (component < self.wires % self.components)
+
+    def to_dict(self) -> dict:
+        """Returns the size as a dictionary.
+
+        Returns:
+            dict: The size of the project.
+        """
+
+        return asdict(self)
+
+
+def _write(path: str, lines: List[str]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _get_library_type(size: ProjectSize, library: str, operation: int, offset: int) -> str:
+    index = TYPES_PATTERN_SIZE * (operation % (size.types_per_library // TYPES_PATTERN_SIZE)) + offset
+    return f"{library}:{library}_T{index}"
+
+
+def _generate_type(library: str, index: int) -> str:
+    name = f"{library}_T{index}"
+    first = f"{library}_T{index - index % TYPES_PATTERN_SIZE}"
+    pattern = index % TYPES_PATTERN_SIZE
+    if pattern == 0:
+        return f'<simple name="{name}" type="int32" minRange="0" maxRange="1000"/>'
+    if pattern == 1:
+        return f'<enum name="{name}" type="uint32"><value name="A" valnum="0"/><value name="B" valnum="1"/></enum>'
+    if pattern == 2:
+        return f'<array name="{name}" itemType="{first}" maxNumber="%{library}_MAX%"/>'
+    if pattern == 3:
+        return (
+            f'<record name="{name}"><field name="a" type="{first}"/>'
+            f'<field name="b" type="{library}:{library}_T{index - 2}"/><field name="c" type="{library}_T{index - 1}"/>'
+            "</record>"
+        )
+    return (
+        f'<variantRecord name="{name}" selectName="sel" selectType="{library}_T{index - 3}">'
+        f'<field name="x" type="{library}_T{index - 1}"/><union name="u0" type="int32" when="A"/>'
+        f'<union name="u1" type="{first}" when="B"/></variantRecord>'
+    )
+
+
+def _generate_library(size: ProjectSize, library: str, used_library: str = None) -> List[str]:
+    lines = [XML_DECLARATION, f'<library xmlns="{TYPES_NAMESPACE}">']
+    if used_library:
+        lines.append(f'  <use library="{used_library}"/>')
+    lines.append("  <types>")
+    lines.append(f'    <constant name="{library}_MAX" type="uint32" value="16"/>')
+    lines += ["    " + _generate_type(library, index) for index in range(size.types_per_library)]
+    lines += ["  </types>", "</library>"]
+    return lines
+
+
+def _get_service_operations(size: ProjectSize) -> Dict[str, str]:
+    # The type of the versioned data and the parameters of the event and of the request of the service
+    parameters = f'<input name="p" type="{_get_library_type(size, SERVICE_LIBRARY, 0, 0)}"/>'
+    return {"d": _get_library_type(size, SERVICE_LIBRARY, 0, 3), "ev": parameters, "rq": parameters}
+
+
+def _generate_service_definition(size: ProjectSize) -> List[str]:
+    operations = _get_service_operations(size)
+    return [
+        XML_DECLARATION,
+        f'<serviceDefinition xmlns="{INTERFACE_NAMESPACE}">',
+        f'  <use library="{SERVICE_LIBRARY}"/>',
+        "  <operations>",
+        f'    <data name="d" type="{operations["d"]}"/>',
+        f'    <event name="ev" direction="RECEIVED_BY_PROVIDER">{operations["ev"]}</event>',
+        f'    <requestresponse name="rq">{operations["rq"]}</requestresponse>',
+        "  </operations>",
+        "</serviceDefinition>",
+    ]
+
+
+def _generate_service_operations(size: ProjectSize, module: int, references: int) -> List[str]:
+    # The operations of the first module linked to the provided service, and of the last module linked to each reference
+    operations = _get_service_operations(size)
+    lines = []
+    if module == 0:
+        lines += [
+            f'<eventReceived name="prov_ev">{operations["ev"]}</eventReceived>',
+            f'<requestReceived name="prov_rq">{operations["rq"]}</requestReceived>',
+            f'<dataWritten name="prov_d" type="{operations["d"]}"/>',
+        ]
+    if module == size.modules - 1:
+        for reference in range(references):
+            lines += [
+                f'<eventSent name="ref{reference}_ev">{operations["ev"]}</eventSent>',
+                f'<requestSent name="ref{reference}_rq" timeout="1" isSynchronous="false">{operations["rq"]}'
+                "</requestSent>",
+                f'<dataRead name="ref{reference}_d" type="{operations["d"]}" notifying="true"/>',
+            ]
+    return lines
+
+
+def _generate_module_operations(size: ProjectSize, library: str) -> List[str]:
+    lines = []
+    for operation in range(size.operations):
+        record = _get_library_type(size, library, operation, 3)
+        simple = _get_library_type(size, library, operation, 0)
+        parameters = f'<input name="p1" type="{record}"/><input name="p2" type="{simple}"/>'
+        output = f'<output name="o1" type="{_get_library_type(size, library, operation, 2)}"/>'
+        synchronous = "true" if operation % 2 else "false"
+        lines += [
+            f'<dataWritten name="dw{operation}" type="{record}"/>',
+            f'<dataRead name="dr{operation}" type="{record}" notifying="true"/>',
+            f'<eventSent name="ev_out{operation}">{parameters}</eventSent>',
+            f'<eventReceived name="ev_in{operation}">{parameters}</eventReceived>',
+            f'<requestSent name="rq_out{operation}" timeout="1" isSynchronous="{synchronous}">{parameters}{output}'
+            "</requestSent>",
+            f'<requestReceived name="rq_in{operation}">{parameters}{output}</requestReceived>',
+        ]
+    return lines
+
+
+def _generate_module_type(size: ProjectSize, name: str, module: int, library: str, references: int) -> List[str]:
+    return (
+        [
+            f'  <moduleType name="{name}_t" hasWarmStartContext="{"true" if module % 2 else "false"}"'
+            f' isFaultHandler="{"true" if module == 0 else "false"}">',
+            '    <properties><property name="prop" type="uint32"/></properties>',
+            '    <pinfo><publicPinfo name="pinf"/></pinfo>',
+            "    <operations>",
+            '      <eventReceived name="tick"/>',
+            '      <eventReceived name="ext_in"><input name="v" type="uint32"/></eventReceived>',
+        ]
+        + ["      " + line for line in _generate_module_operations(size, library)]
+        + ["      " + line for line in _generate_service_operations(size, module, references)]
+        + ["    </operations>", "  </moduleType>"]
+    )
+
+
+def _generate_module_instance(name: str, module: int) -> str:
+    return (
+        f'  <moduleInstance name="{name}_i" implementationName="{name}" relativePriority="{module}">'
+        f'<propertyValues><propertyValue name="prop">{module}</propertyValue></propertyValues>'
+        f'<pinfo><publicPinfo name="pinf">{name}.bin</publicPinfo></pinfo></moduleInstance>'
+    )
+
+
+def _link(kind: str, first: str, second: str) -> str:
+    tags = {"event": ("senders", "receivers"), "request": ("clients", "server"), "data": ("writers", "readers")}[kind]
+    return f"  <{kind}Link><{tags[0]}>{first}</{tags[0]}><{tags[1]}>{second}</{tags[1]}></{kind}Link>"
+
+
+def _module_operation(name: str, operation: str) -> str:
+    return f'<moduleInstance instanceName="{name}_i" operationName="{operation}"/>'
+
+
+def _generate_internal_links(size: ProjectSize, component: int) -> List[str]:
+    lines = []
+    for module in range(size.modules - 1):
+        first, second = f"C{component}_M{module}", f"C{component}_M{module + 1}"
+        for operation in range(size.operations):
+            lines += [
+                _link(
+                    "event",
+                    _module_operation(first, f"ev_out{operation}"),
+                    _module_operation(second, f"ev_in{operation}"),
+                ),
+                _link(
+                    "request",
+                    _module_operation(first, f"rq_out{operation}"),
+                    _module_operation(second, f"rq_in{operation}"),
+                ),
+                _link("data", _module_operation(first, f"dw{operation}"), _module_operation(second, f"dr{operation}")),
+            ]
+    if size.modules > 2:
+        # One event broadcast to all the modules of the component
+        receivers = "".join(_module_operation(f"C{component}_M{module}", "ev_in0") for module in range(size.modules))
+        lines.append(_link("event", _module_operation(f"C{component}_M0", "ev_out0"), receivers))
+    lines += [
+        _link(
+            "event",
+            f'<trigger instanceName="C{component}_trig" period="0.1"/>',
+            _module_operation(f"C{component}_M0", "tick"),
+        ),
+        _link(
+            "event",
+            f'<external operationName="ext{component}" language="C"/>',
+            _module_operation(f"C{component}_M0", "ext_in"),
+        ),
+    ]
+    return lines
+
+
+def _generate_service_links(size: ProjectSize, component: int) -> List[str]:
+    first, last = f"C{component}_M0", f"C{component}_M{size.modules - 1}"
+    lines = [
+        _link("event", '<service instanceName="prov" operationName="ev"/>', _module_operation(first, "prov_ev")),
+        _link("request", '<service instanceName="prov" operationName="rq"/>', _module_operation(first, "prov_rq")),
+        _link("data", _module_operation(first, "prov_d"), '<service instanceName="prov" operationName="d"/>'),
+    ]
+    for reference in range(size.get_references(component)):
+        lines += [
+            _link(
+                "event",
+                _module_operation(last, f"ref{reference}_ev"),
+                f'<reference instanceName="ref{reference}" operationName="ev"/>',
+            ),
+            _link(
+                "request",
+                _module_operation(last, f"ref{reference}_rq"),
+                f'<reference instanceName="ref{reference}" operationName="rq"/>',
+            ),
+            _link(
+                "data",
+                f'<reference instanceName="ref{reference}" operationName="d"/>',
+                _module_operation(last, f"ref{reference}_d"),
+            ),
+        ]
+    return lines
+
+
+def _generate_component_implementation(size: ProjectSize, component: int, library: str) -> List[str]:
+    names = [f"C{component}_M{module}" for module in range(size.modules)]
+    lines = [
+        XML_DECLARATION,
+        f'<componentImplementation xmlns="{IMPLEMENTATION_NAMESPACE}" componentDefinition="CT{component}">',
+    ]
+    lines += [f'  <use library="{used}"/>' for used in sorted({library, SERVICE_LIBRARY})]
+    references = size.get_references(component)
+    for module, name in enumerate(names):
+        lines += _generate_module_type(size, name, module, library, references)
+    for module, name in enumerate(names):
+        language = LANGUAGES[(component + module) % len(LANGUAGES)]
+        lines.append(f'  <moduleImplementation name="{name}" language="{language}" moduleType="{name}_t"/>')
+    lines += [_generate_module_instance(name, module) for module, name in enumerate(names)]
+    lines.append(f'  <triggerInstance name="C{component}_trig" relativePriority="1"/>')
+    lines += _generate_internal_links(size, component)
+    lines += _generate_service_links(size, component)
+    lines.append("</componentImplementation>")
+    return lines
+
+
+def _generate_composite(size: ProjectSize) -> List[str]:
+    lines = [XML_DECLARATION, f'<csa:composite xmlns:csa="{COMPOSITE_NAMESPACE}" name="{PROJECT_NAME}">']
+    for component in range(size.components):
+        references = "".join(f'<csa:reference name="ref{r}"/>' for r in range(size.get_references(component)))
+        lines.append(
+            f'  <csa:component name="Comp{component}"><csa:instance componentType="CT{component}">'
+            f'<csa:implementation name="CI{component}"/></csa:instance><csa:service name="prov"/>{references}'
+            "</csa:component>"
+        )
+    for wire in range(size.wires):
+        source, reference = wire % size.components, wire // size.components
+        target = (source + 1 + reference) % size.components
+        lines.append(f'  <csa:wire source="Comp{source}/ref{reference}" target="Comp{target}/prov"/>')
+    lines.append("</csa:composite>")
+    return lines
+
+
+def _generate_deployment(size: ProjectSize) -> List[str]:
+    lines = [
+        XML_DECLARATION,
+        f'<deployment xmlns="{DEPLOYMENT_NAMESPACE}" finalAssembly="{PROJECT_NAME}" logicalSystem="ls">',
+    ]
+    for component in range(size.components):
+        lines.append(
+            f'  <protectionDomain name="PD{component}">'
+            f'<executeOn computingNode="node{component % 2}" computingPlatform="platform"/>'
+        )
+        lines += [
+            f'    <deployedModuleInstance componentName="Comp{component}" moduleInstanceName="C{component}_M{module}_i"'
+            f' modulePriority="{10 + module}"/>'
+            for module in range(size.modules)
+        ]
+        lines.append(
+            f'    <deployedTriggerInstance componentName="Comp{component}" triggerInstanceName="C{component}_trig"'
+            ' triggerPriority="30"/>'
+        )
+        lines.append("  </protectionDomain>")
+    lines += [
+        '  <logPolicy><componentLog instanceName="Comp0" enabledLevels="INFO|WARNING">'
+        '<moduleLog instanceName="C0_M0_i" enabledLevels="TRACE|DEBUG|INFO|WARNING"/></componentLog></logPolicy>',
+        '  <platformConfiguration computingPlatform="platform"/>',
+        "</deployment>",
+    ]
+    return lines
+
+
+def _generate_project(libraries: List[str], implementations: List[str]) -> List[str]:
+    return [
+        XML_DECLARATION,
+        f'<ECOAProject xmlns="{PROJECT_NAMESPACE}" name="{PROJECT_NAME}">',
+        "  <serviceDefinitions><file>1-Services/service.interface.xml</file></serviceDefinitions>",
+        "  <types>" + "".join(f"<file>0-Types/{library}.types.xml</file>" for library in libraries) + "</types>",
+        "  <componentImplementations>"
+        + "".join(f"<file>{path}</file>" for path in implementations)
+        + "</componentImplementations>",
+        "  <deploymentSchema>5-Integration/deployment.xml</deploymentSchema>",
+        "  <outputDirectory>6-Output</outputDirectory>",
+        f"  <implementationAssembly>5-Integration/{PROJECT_NAME}.impl.composite</implementationAssembly>",
+        "</ECOAProject>",
+    ]
+
+
+def write_project(directory: str, size: ProjectSize) -> str:
+    """Writes a synthetic ECOA project.
+
+    Args:
+        directory (str): The directory the project is written to.
+        size (ProjectSize): The size of the project.
+
+    Returns:
+        str: The path to the project file.
+    """
+
+    libraries = [f"lib{index}" for index in range(size.libraries)]
+    for index, library in enumerate(libraries):
+        used_library = libraries[index - 1] if index else None
+        _write(
+            os.path.join(directory, "0-Types", library + ".types.xml"), _generate_library(size, library, used_library)
+        )
+    _write(os.path.join(directory, "1-Services", "service.interface.xml"), _generate_service_definition(size))
+    implementations = []
+    for component in range(size.components):
+        path = f"4-ComponentImplementations/CI{component}/CI{component}.impl.xml"
+        library = libraries[component % size.libraries]
+        _write(os.path.join(directory, path), _generate_component_implementation(size, component, library))
+        implementations.append(path)
+        for module in range(size.modules):
+            _write(os.path.join(directory, "5-Integration", "Pinfo", f"C{component}_M{module}.bin"), ["0123456789"])
+    _write(os.path.join(directory, "5-Integration", PROJECT_NAME + ".impl.composite"), _generate_composite(size))
+    _write(os.path.join(directory, "5-Integration", "deployment.xml"), _generate_deployment(size))
+    project_path = os.path.join(directory, PROJECT_NAME + ".project.xml")
+    _write(project_path, _generate_project(libraries, implementations))
+    return project_path
+
+
+def add_size_arguments(arg_parser: argparse.ArgumentParser) -> None:
+    """Adds the arguments defining the size of a synthetic ECOA project.
+
+    Args:
+        arg_parser (argparse.ArgumentParser): The argument parser.
+
+    Returns:
+        None.
+    """
+
+    default = ProjectSize()
+    arg_parser.add_argument("--components", type=int, default=default.components, help="Number of components.")
+    arg_parser.add_argument("--modules", type=int, default=default.modules, help="Number of modules per component.")
+    arg_parser.add_argument("--types", type=int, default=default.types, help="Number of types.")
+    arg_parser.add_argument(
+        "--operations", type=int, default=default.operations, help="Number of events, requests and data per module."
+    )
+    arg_parser.add_argument("--wires", type=int, default=default.wires, help="Number of wires between the components.")
+    arg_parser.add_argument("--libraries", type=int, default=default.libraries, help="Number of types libraries.")
+
+
+def get_size(args: argparse.Namespace) -> ProjectSize:
+    """Builds the size of a synthetic ECOA project from the parsed arguments.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        ProjectSize: The size of the project.
+    """
+
+    return ProjectSize(args.components, args.modules, args.types, args.operations, args.wires, args.libraries)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("directory", help="The directory the project is written to.")
+    add_size_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    print(write_project(args.directory, get_size(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Micro-benchmark of the TypeHelper lookups over a synthetic types library.
+
+Usage:
+    python benchmarks/type_helper.py [--types 20000] [--lookups 20000]
+"""
+
+# Standard library imports
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+# Internal library imports
+from ecoa_toolset.models.ecoa_objects import ecoa_types_2_0
+from ecoa_toolset.models.helpers.type import TypeHelper
+
+CATEGORIES = [
+    ecoa_types_2_0.Simple,
+    ecoa_types_2_0.Enum,
+    ecoa_types_2_0.Array,
+    ecoa_types_2_0.Record,
+    ecoa_types_2_0.VariantRecord,
+]
+
+
+def _build_model(types_count: int, libraries_count: int) -> SimpleNamespace:
+    types = {}
+    for index in range(types_count):
+        category = CATEGORIES[index % len(CATEGORIES)]
+        types[f"lib{index % libraries_count}:T{index}"] = category(name=f"T{index}")
+    return SimpleNamespace(types=types)
+
+
+def _linear_find_one(ecoa_model, type_name: str):
+    """The previous implementation of TypeHelper.find_one(type_name=...), kept as a reference."""
+    filtered = {k: v for k, v in ecoa_model.types.items() if k.endswith(f":{type_name}")}
+    return next(iter(filtered.items()), None)
+
+
+def _measure(name: str, function, arguments) -> float:
+    start = time.perf_counter()
+    for argument in arguments:
+        function(argument)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {elapsed * 1e3:10.2f} ms {elapsed / len(arguments) * 1e6:10.2f} us/lookup")
+    return elapsed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--types", type=int, default=20000, help="Number of types in the library.")
+    arg_parser.add_argument("--libraries", type=int, default=20, help="Number of libraries (namespaces).")
+    arg_parser.add_argument("--lookups", type=int, default=20000, help="Number of indexed lookups.")
+    arg_parser.add_argument("--linear-lookups", type=int, default=200, help="Number of linear (reference) lookups.")
+    args = arg_parser.parse_args()
+
+    ecoa_model = _build_model(args.types, args.libraries)
+    types_helper = TypeHelper(ecoa_model)
+    random.seed(0)
+    names = [f"T{random.randrange(args.types)}" for _ in range(args.lookups)]
+
+    start = time.perf_counter()
+    types_helper.build_indexes()
+    print(f"{'build_indexes':<40} {(time.perf_counter() - start) * 1e3:10.2f} ms")
+    linear = _measure(
+        "linear find_one (reference)", lambda name: _linear_find_one(ecoa_model, name), names[: args.linear_lookups]
+    ) / min(args.linear_lookups, len(names))
+    indexed = _measure("find_one(type_name=...)", lambda name: types_helper.find_one(type_name=name), names)
+    _measure("add_namespace", types_helper.add_namespace, names)
+    complete_names = [types_helper.add_namespace(name) for name in names]
+    _measure("get_type_category", types_helper.get_type_category, complete_names)
+    _measure("find_all(namespace=...)", lambda name: types_helper.find_all(namespace="lib0"), names[:100])
+    _measure("find_all(category=[Record])", lambda name: types_helper.find_all(category=["Record"]), names[:100])
+    print(f"find_one speedup: x{linear / (indexed / len(names)):.0f}")
+
+
+if __name__ == "__main__":
+    main()
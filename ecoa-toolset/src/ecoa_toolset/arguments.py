@@ -8,14 +8,46 @@
 # Standard library imports
 import logging
 import os
+import shutil
 import subprocess
-from typing import List
+from typing import List, Tuple
+
+# Internal library imports
+from ecoa_toolset.models.xml_cache import XMLCache
 
 logger = logging.getLogger(__name__)
 
 
+def _get_checker_identity(checker: str) -> str:
+    # The command, and the path, modification time and size of its executable and of its file arguments
+    identity = [checker]
+    for index, word in enumerate(checker.split()):
+        path = shutil.which(word) if index == 0 else word
+        if path and os.path.isfile(path):
+            stat = os.stat(path)
+            identity.append(os.path.abspath(path) + ":" + str(stat.st_mtime_ns) + ":" + str(stat.st_size))
+    return "|".join(identity)
+
+
+def _get_check_cache(args: List) -> Tuple[XMLCache, str]:
+    from ecoa_toolset.models.ecoa_xml_model import ECOAXMLModel
+
+    try:
+        cache = create_xml_cache(args.project, args.output, args.no_cache)
+        if cache is None:
+            return None, None
+        paths = [args.project] + ECOAXMLModel.read_project_files(args.project)
+    except Exception as e:
+        logger.debug("Cannot use the cache to check %s: %s", args.project, e)
+        return None, None
+    return cache, cache.get_check_digest(_get_checker_identity(args.checker), paths)
+
+
 def check_ecoa_xml(args: List) -> None:
     """Check if the checker flag is used and check the given ecoa xml is valid.
+    With the xsd flag, the ecoa xml files are checked in-process while they are parsed instead.
+    The checker is not run again while the checker, the project file and the files it references are unchanged since
+    the last successful check, unless the cache is disabled.
 
     Args:
         args: optional arguments
@@ -23,9 +55,20 @@ def check_ecoa_xml(args: List) -> None:
     Returns:
         None
     """
+    if args.xsd:
+        logger.debug("Checking the ECOA XML files against the XSDs of %s", args.xsd)
+        return
+    if not args.checker:
+        raise Exception("One of the -k/--checker and -x/--xsd options is required.")
+    cache, digest = _get_check_cache(args)
+    if cache is not None and cache.is_checked(args.project, digest):
+        logger.info("The ECOA XML files are unchanged since their last check, skipping the checker")
+        return
     result = subprocess.run(args.checker.split() + ["-p", args.project])
     if result.returncode != 0:
         raise Exception("The check of the ECOA XML file : " + args.project + " failed.")
+    if cache is not None:
+        cache.store_check(args.project, digest)
 
 
 def _check_output_directory(path: str, subpaths: List[str]) -> bool:
@@ -60,6 +103,29 @@ def select_output_directory(project_flag: str, output_flag: str, xml_output: Lis
         raise ValueError("No given output ! Please use -o or --output flag or give the output in the xml project.")
 
 
+def create_xml_cache(project_flag: str, output_flag: str, no_cache: bool) -> XMLCache:
+    """Creates the cache of the parsed ECOA XML files in the output directory.
+
+    Args:
+        project_flag (str) : The path to the project xml file given by the project flag.
+        output_flag (str) : The path to the output directory given by the output flag.
+        no_cache (bool) : The no-cache flag.
+
+    Return:
+        XMLCache : The cache, None if disabled or if no output directory is given.
+    """
+    if no_cache:
+        return None
+    # Imported on first use, so that the CLI starts without loading the XML parsers
+    from ecoa_toolset.models.ecoa_xml_model import ECOAXMLModel
+
+    try:
+        output = select_output_directory(project_flag, output_flag, ECOAXMLModel.read_output_directory(project_flag))
+    except ValueError:
+        return None
+    return XMLCache(os.path.join(output, XMLCache.DIRECTORY_NAME))
+
+
 def create_output_directory(force: bool, path: str, subpaths: List[str] = []) -> None:
     """Creates the output directory if it doesn't exist.
     Checks that elements to be generated do not exist otherwise.
@@ -5,10 +5,11 @@
 """Common attributes for container code generation.
 """
 
-from typing import Any
+from typing import Any, Callable, Dict, List, Set
 
 # Internal library imports
 from ecoa_toolset.generators.common import Common as GlobalCommon
+from ecoa_toolset.generators.emitter import Emitter
 from ecoa_toolset.models.components import EventReceived, Variable
 from ecoa_toolset.models.ecoa_objects import ecoa_types_2_0
 
@@ -16,6 +17,24 @@
 class Common(GlobalCommon):
     """Common attributes."""
 
+    # Dispatch of the container functions bodies on the calling module instance identifier (mod_id)
+    IF_DISPATCH: str = "if"
+    SWITCH_DISPATCH: str = "switch"
+    DISPATCHES: List[str] = [IF_DISPATCH, SWITCH_DISPATCH]
+    # Executors of the protection domains when the CSM runs one worker thread per protection domain
+    EXECUTOR_PREFIX: str = "CM_EXECUTOR_"
+    VERSIONED_DATA_MUTEX: str = "CM_VERSIONED_DATA_MUTEX"
+    # Access of the pinfo container functions to the PINFO files: stream reads or memory mapping shared by the
+    # module instances
+    STREAM_PINFO_ACCESS: str = "stream"
+    MMAP_PINFO_ACCESS: str = "mmap"
+    PINFO_ACCESSES: List[str] = [STREAM_PINFO_ACCESS, MMAP_PINFO_ACCESS]
+    PINFO_MAPPING: str = "CM_Pinfo_mapping"
+    PINFO_MAP: str = "cm_pinfo_map"
+    PINFO_UNMAP: str = "cm_pinfo_unmap"
+    # Copy of the log records to the ring buffer of the CSM logger, flushed by a background thread
+    LOG_PUSH: str = "cm_log_push"
+
     @classmethod
     def cast_enum_c_to_cpp(cls, argument: Variable):
         argument_complete_type = f'{argument.namespace.replace(".", "::")}::{argument.type}'
@@ -77,10 +96,8 @@ def cast_argument(cls, element: Any, other: Any, argument: Variable):
 
     @classmethod
     def _generate_event_received_argument(
-        cls, sender: Any, receiver: EventReceived, argument: Variable, index: int, indent_level: int
-    ):
-        parameters_used = set()
-        generation = ""
+        cls, emitter: Emitter, sender: Any, receiver: EventReceived, argument: Variable, index: int
+    ) -> Set[str]:
         argument_found = next(
             (
                 v
@@ -90,78 +107,198 @@ def _generate_event_received_argument(
             ),
             None,
         )
-        if argument_found:
-            generation += (
-                cls.SPACE_INDENTATION[:indent_level]
-                + cls.cast_argument(sender, receiver, argument_found)
-                + ("" if index == len(receiver.inputs) - 1 else ",")
-                + cls.LINE_BREAK[:1]
-            )
-            parameters_used.add(argument_found.namespace + ":" + argument_found.type + ":" + argument_found.name)
-        return generation, parameters_used
+        if not argument_found:
+            return set()
+        emitter.write_line(
+            cls.cast_argument(sender, receiver, argument_found), "" if index == len(receiver.inputs) - 1 else ","
+        )
+        return {argument_found.namespace + ":" + argument_found.type + ":" + argument_found.name}
 
     @classmethod
     def generate_event_received_call(
         cls,
+        emitter: Emitter,
         sender: Any,
         receiver: EventReceived,
         module_inst_name_receiver: str,
         component_name_receiver: str,
-        indent_level: int,
-        indent_step: int,
-    ) -> str:
+    ) -> Set[str]:
         """"""
         parameters_used = set()
-        generation = cls.SPACE_INDENTATION[:indent_level]
-        generation += cls.switch_lang(
-            receiver.module_impl_name + "__",
-            module_inst_name_receiver + "_" + component_name_receiver + "_Module.",
-            receiver.language,
+        emitter.write(
+            emitter.indentation,
+            cls.switch_lang(
+                receiver.module_impl_name + "__",
+                module_inst_name_receiver + "_" + component_name_receiver + "_Module.",
+                receiver.language,
+            ),
+            receiver.name + "__received (",
         )
-        generation += receiver.name + "__received (" + cls.LINE_BREAK[:1]
-        indent_level += indent_step
-        if receiver.language == "c":
-            generation += (
-                cls.SPACE_INDENTATION[:indent_level]
-                + "&"
-                + module_inst_name_receiver
-                + "_"
-                + component_name_receiver
-                + "_Context"
-                + ("," if receiver.inputs else "")
-                + cls.LINE_BREAK[:1]
-            )
-        for index, argument in enumerate(receiver.inputs):
-            tmp = cls._generate_event_received_argument(sender, receiver, argument, index, indent_level)
-            generation += tmp[0]
-            parameters_used |= tmp[1]
-        indent_level -= indent_step
-        generation += cls.SPACE_INDENTATION[:indent_level] + ");" + cls.LINE_BREAK[:1]
-        return generation, parameters_used
+        emitter.line_break()
+        with emitter.indented():
+            if receiver.language == "c":
+                emitter.write_line(
+                    "&" + module_inst_name_receiver + "_" + component_name_receiver + "_Context",
+                    "," if receiver.inputs else "",
+                )
+            for index, argument in enumerate(receiver.inputs):
+                parameters_used |= cls._generate_event_received_argument(emitter, sender, receiver, argument, index)
+        emitter.write_line(");")
+        return parameters_used
+
+    @classmethod
+    def generate_mod_id(cls, language: str) -> str:
+        """Generates the expression of the calling module instance identifier."""
+        return cls.switch_lang("context->platform_", "this->", language) + "hook->mod_id"
 
     @classmethod
     def generate_mod_id_if_statement(
-        cls, module_inst_name: str, component_name: str, language: str, index: int, indent_level: int
-    ) -> str:
+        cls, emitter: Emitter, module_inst_name: str, component_name: str, language: str, index: int
+    ) -> None:
         """"""
-        generation = (
-            cls.SPACE_INDENTATION[:indent_level]
-            + ("if" if index == 0 else "else if")
-            + " ("
-            + cls.switch_lang("context->platform_", "this->", language)
-            + "hook->mod_id == "
-            + module_inst_name.upper()
-            + "_"
-            + component_name.upper()
-            + "_ID)"
-            + cls.LINE_BREAK[:1]
-            + cls.SPACE_INDENTATION[:indent_level]
-            + "{"
-            + cls.LINE_BREAK[:1]
+        emitter.write_line(
+            "if" if index == 0 else "else if",
+            " (",
+            cls.generate_mod_id(language),
+            " == ",
+            module_inst_name.upper(),
+            "_",
+            component_name.upper(),
+            "_ID)",
         )
-        return generation
+        emitter.write_line("{")
+
+    @classmethod
+    def generate_mod_id_switch_statement(cls, emitter: Emitter, selector: str) -> None:
+        """Opens a switch statement on a module instance identifier, its cases being indented by one step."""
+        emitter.write_line("switch (", selector, ")")
+        emitter.write_line("{")
+        emitter.indent()
+
+    @classmethod
+    def generate_mod_id_case_statement(cls, emitter: Emitter, module_inst_name: str, component_name: str) -> None:
+        """"""
+        emitter.write_line("case ", module_inst_name.upper(), "_", component_name.upper(), "_ID:")
+        emitter.write_line("{")
+
+    @classmethod
+    def generate_mod_id_statement(
+        cls, emitter: Emitter, module_inst_name: str, component_name: str, language: str, index: int, dispatch: str
+    ) -> None:
+        """Opens the branch of a module instance, as an if statement or as a case of a switch statement opened by
+        the first branch.
+        """
+        if dispatch == cls.SWITCH_DISPATCH:
+            if index == 0:
+                cls.generate_mod_id_switch_statement(emitter, cls.generate_mod_id(language))
+            cls.generate_mod_id_case_statement(emitter, module_inst_name, component_name)
+        else:
+            cls.generate_mod_id_if_statement(emitter, module_inst_name, component_name, language, index)
+
+    @classmethod
+    def generate_mod_id_break_statement(cls, emitter: Emitter, dispatch: str) -> None:
+        """Ends the body of a module instance branch."""
+        if dispatch == cls.SWITCH_DISPATCH:
+            emitter.write_line("break;")
+
+    @classmethod
+    def generate_mod_id_default_statement(cls, emitter: Emitter, dispatch: str) -> None:
+        """Opens the branch of the unknown module instances."""
+        emitter.write_line("default:" if dispatch == cls.SWITCH_DISPATCH else "else")
+        emitter.write_line("{")
+
+    @classmethod
+    def generate_mod_id_switch_end(cls, emitter: Emitter, dispatch: str, line_break: bool = True) -> None:
+        """Closes the switch statement opened by generate_mod_id_statement."""
+        if dispatch == cls.SWITCH_DISPATCH:
+            emitter.dedent()
+            emitter.write(emitter.indentation, "}")
+            emitter.line_break(line_break)
+
+    @classmethod
+    def generate_executor_name(cls, protection_domain_name: str) -> str:
+        """Generates the name of the executor of a protection domain."""
+        return cls.EXECUTOR_PREFIX + protection_domain_name
+
+    @classmethod
+    def get_executor(cls, protection_domains: Dict[str, str], key_sender: str, key_receiver: str) -> str:
+        """Returns the executor of the protection domain of the receiver if a call from the sender crosses
+        protection domains, None if the receiver is called directly.
+
+        Args:
+            protection_domains (Dict[str, str]) : The protection domain of each module instance, keyed by
+                <module instance name>:<component name>, None if the CSM runs on a single thread.
+            key_sender (str) : The sender module instance key.
+            key_receiver (str) : The receiver module instance key.
+
+        Returns:
+            str : The executor name or None.
+        """
+        if not protection_domains:
+            return None
+        protection_domain_name = protection_domains.get(key_receiver)
+        if protection_domain_name is None or protection_domain_name == protection_domains.get(key_sender):
+            return None
+        return cls.generate_executor_name(protection_domain_name)
+
+    @classmethod
+    def generate_executor_post(
+        cls,
+        emitter: Emitter,
+        executor: str,
+        pointers: List[Variable],
+        generate_call: Callable[[], Set[str]],
+        wait: bool = False,
+    ) -> Set[str]:
+        """Posts a call to an executor instead of calling the receiver directly.
+
+        The job is a lambda capturing the parameters by value. The pointed values of the C parameters passed by
+        pointer are copied too, the pointers being redeclared in the job to point to their copies.
+
+        Args:
+            emitter (Emitter) : The emitter.
+            executor (str) : The executor name.
+            pointers (List[Variable]) : The parameters passed by pointer.
+            generate_call (Callable[[], Set[str]]) : Generates the call, returns the parameters it uses.
+            wait (bool) : True to block the sender until the job is done, False otherwise.
+
+        Returns:
+            Set[str] : The parameters used by the call.
+        """
+        position = emitter.mark()
+        with emitter.indented():
+            parameters_used = generate_call()
+        pointers = [p for p in pointers if p.namespace + ":" + p.type + ":" + p.name in parameters_used]
+        indentation = emitter.indentation
+        emitter.insert(
+            position,
+            indentation,
+            executor,
+            ".call" if wait else ".post",
+            "([=",
+            *[", " + p.name + "_value = *" + p.name for p in pointers],
+            "]()",
+            cls.LINE_BREAK[:1],
+            indentation,
+            "{",
+            cls.LINE_BREAK[:1],
+            *[
+                cls.SPACE_INDENTATION[: emitter.indent_level + emitter.indent_step]
+                + "const "
+                + cls.construct_complete_variable_type(p, "c")
+                + " * "
+                + p.name
+                + " = &"
+                + p.name
+                + "_value;"
+                + cls.LINE_BREAK[:1]
+                for p in pointers
+            ],
+        )
+        emitter.write_line("});")
+        return parameters_used
 
     @classmethod
-    def generate_body_unit_test(cls, indent_level: int) -> str:
+    def generate_body_unit_test(cls, emitter: Emitter) -> None:
         """"""
-        return Common.SPACE_INDENTATION[:indent_level] + "// Insert logic here."
+        emitter.write(emitter.indentation, "// Insert logic here.")
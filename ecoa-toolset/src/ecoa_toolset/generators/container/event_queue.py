@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Event queue generation class.
+"""
+
+# Standard library imports
+from typing import Dict, List, Set
+
+# Internal library imports
+from ecoa_toolset.generators.container.common import Common
+from ecoa_toolset.generators.emitter import Emitter
+from ecoa_toolset.models.components import EventReceived, EventSend, Variable
+
+
+class EventQueue:
+    """The events queued by the event send container functions instead of calling their receivers.
+
+    Each queued event (a sender instance, its event send operation, a receiver instance and its event received
+    operation) gets an identifier. The send function pushes the identifier, the priority of the receiver and the
+    parameters used by the receiver, packed one after the other, to the queue. The dispatch case of the identifier
+    unpacks them and calls the receiver.
+
+    Attributes:
+        priorities (Dict[str, int]): The priority of each deployed instance, keyed by
+            <instance name>:<component name>.
+        cases (List[str]): The dispatch case of each event, indexed by its identifier.
+        parameters_sizes (List[str]): The size of the packed parameters of each event, indexed by its identifier
+            ("" if the event has no parameter).
+    """
+
+    PUSH: str = "cm_event_queue_push"
+    DISPATCH: str = "cm_event_queue_dispatch"
+    REPORT: str = "cm_event_queue_report"
+    priorities: Dict[str, int] = None
+    cases: List[str] = None
+    parameters_sizes: List[str] = None
+
+    def __init__(self, priorities: Dict[str, int]) -> None:
+        self.priorities = priorities
+        self.cases = []
+        self.parameters_sizes = []
+
+    @classmethod
+    def _is_pointer(cls, element: EventSend, parameter: Variable) -> bool:
+        return element.language == "c" and getattr(parameter.type_category, "is_complex", "")
+
+    @classmethod
+    def _generate_unpack(cls, emitter: Emitter, element: EventSend, parameters: List[Variable]) -> None:
+        if parameters:
+            emitter.write_line("const unsigned char * parameters = event->parameters;")
+        offset = ""
+        for parameter in parameters:
+            parameter_type = Common.construct_complete_variable_type(parameter, element.language)
+            value = parameter.name + "_value" if cls._is_pointer(element, parameter) else parameter.name
+            emitter.write_line(parameter_type, " ", value, ";")
+            emitter.write_line("memcpy(&", value, ", parameters", offset, ", sizeof(", parameter_type, "));")
+            if cls._is_pointer(element, parameter):
+                emitter.write_line("const ", parameter_type, " * ", parameter.name, " = &", value, ";")
+            offset += " + sizeof(" + parameter_type + ")"
+
+    @classmethod
+    def _generate_pack(cls, emitter: Emitter, element: EventSend, parameters: List[Variable]) -> None:
+        offset = ""
+        for parameter in parameters:
+            parameter_type = Common.construct_complete_variable_type(parameter, element.language)
+            value = parameter.name if cls._is_pointer(element, parameter) else "&" + parameter.name
+            emitter.write_line("memcpy(parameters", offset, ", ", value, ", sizeof(", parameter_type, "));")
+            offset += " + sizeof(" + parameter_type + ")"
+
+    def generate_push(
+        self,
+        emitter: Emitter,
+        element: EventSend,
+        key_sender: str,
+        receiver: EventReceived,
+        key_receiver: str,
+    ) -> Set[str]:
+        """Generates the push of an event to the queue and records its dispatch case.
+
+        Args:
+            emitter (Emitter) : The emitter of the event send function.
+            element (EventSend) : The event send operation.
+            key_sender (str) : The sender module instance key.
+            receiver (EventReceived) : The event received operation.
+            key_receiver (str) : The receiver module instance key.
+
+        Returns:
+            Set[str] : The parameters used by the receiver.
+        """
+        identifier = len(self.cases)
+        module_inst_name_receiver, component_name_receiver = tuple(key_receiver.split(":"))
+        call = Emitter(8, emitter.indent_step)
+        parameters_used = Common.generate_event_received_call(
+            call, element, receiver, module_inst_name_receiver, component_name_receiver
+        )
+        parameters = [p for p in element.inputs or [] if p.namespace + ":" + p.type + ":" + p.name in parameters_used]
+        # Dispatch case
+        case = Emitter(6, emitter.indent_step)
+        description = key_sender + " " + element.name + " -> " + key_receiver + " " + receiver.name
+        case.write_line("case ", str(identifier), ": /* ", description, " */")
+        case.write_line("{")
+        with case.indented():
+            self._generate_unpack(case, element, parameters)
+            case.write(call.getvalue())
+            case.write_line("break;")
+        case.write_line("}")
+        self.cases.append(case.getvalue())
+        self.parameters_sizes.append(
+            " + ".join(
+                "sizeof(" + Common.construct_complete_variable_type(p, element.language) + ")" for p in parameters
+            )
+        )
+        # Push
+        push = self.PUSH + "(" + str(identifier) + ", " + str(self.priorities.get(key_receiver, 0)) + ")"
+        if not parameters:
+            emitter.write_line(push, ";")
+            return parameters_used
+        emitter.write_line("if (unsigned char * parameters = ", push, ")")
+        emitter.write_line("{")
+        with emitter.indented():
+            self._generate_pack(emitter, element, parameters)
+        emitter.write_line("}")
+        return parameters_used
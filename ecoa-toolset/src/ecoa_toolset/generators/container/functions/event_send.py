@@ -5,11 +5,14 @@
 """Event Send generation class.
 """
 
-from typing import Dict
+from functools import partial
+from typing import Dict, Set
 
 from ecoa_toolset.generators.container.common import Common
 
 # Internal library imports
+from ecoa_toolset.generators.container.event_queue import EventQueue
+from ecoa_toolset.generators.container.instrumentation import Instrumentation
 from ecoa_toolset.generators.generic.function import FunctionGenerator
 from ecoa_toolset.models.components import EventSend
 
@@ -18,79 +21,104 @@ class EventSendGenerator(FunctionGenerator):
     """"""
 
     unit_test: bool = None
+    dispatch: str = None
+    protection_domains: Dict[str, str] = None
+    event_queue: EventQueue = None
 
-    def __init__(self, indent_level: int, indent_step: int, body: bool, unit_test: bool):
+    def __init__(
+        self,
+        indent_level: int,
+        indent_step: int,
+        body: bool,
+        unit_test: bool,
+        dispatch: str = Common.IF_DISPATCH,
+        protection_domains: Dict[str, str] = None,
+        event_queue: EventQueue = None,
+        instrumentation: Instrumentation = None,
+    ):
         super().__init__(indent_level, indent_step, body)
         self.unit_test = unit_test
+        self.dispatch = dispatch
+        self.protection_domains = protection_domains
+        self.event_queue = event_queue
+        self.instrumentation = instrumentation
 
-    def _generate_prototype(self, element: EventSend) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "void"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
+    def _generate_prototype(self, element: EventSend) -> None:
+        emitter = self._emitter
+        emitter.write_line("void")
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                element.module_impl_name + "_container__",
+                element.module_impl_name + "::Container::" if self.body else "",
+                element.language,
+            ),
+            element.name + "__send (",
         )
-        generation += Common.switch_lang(
-            element.module_impl_name + "_container__",
-            element.module_impl_name + "::Container::" if self.body else "",
-            element.language,
-        )
-        generation += element.name + "__send (" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
-        if element.language == "c":
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + element.module_impl_name
-                + "__context * context"
-                + ("," if element.inputs else "")
-                + Common.LINE_BREAK[:1]
-            )
-        generation += Common.generate_function_parameters(element.inputs, element.language, self.indent_level)
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
+        emitter.line_break()
+        with emitter.indented():
+            if element.language == "c":
+                emitter.write_line(element.module_impl_name + "__context * context", "," if element.inputs else "")
+            emitter.write(Common.generate_function_parameters(element.inputs, element.language, emitter.indent_level))
+        emitter.write(emitter.indentation, ")")
 
-    def _generate_event_received_calls(self, element: EventSend, receivers: Dict) -> str:
+    def _generate_event_received_calls(self, element: EventSend, key_sender: str, receivers: Dict) -> Set[str]:
         parameters_used = set()
-        generation = ""
+        pointers = [p for p in element.inputs or [] if getattr(p.type_category, "is_complex", "")]
         for key_receiver, receiver in receivers.items():
             module_inst_name_receiver, component_name_receiver = tuple(key_receiver.split(":"))
-            tmp = Common.generate_event_received_call(
+            generate_call = partial(
+                Common.generate_event_received_call,
+                self._emitter,
                 element,
                 receiver,
                 module_inst_name_receiver,
                 component_name_receiver,
-                self.indent_level,
-                self.indent_step,
             )
-            generation += tmp[0]
-            parameters_used |= tmp[1]
-        return generation, parameters_used
+            executor = Common.get_executor(self.protection_domains, key_sender, key_receiver)
+            if executor:
+                parameters_used |= Common.generate_executor_post(
+                    self._emitter, executor, pointers if element.language == "c" else [], generate_call
+                )
+            elif self.event_queue:
+                parameters_used |= self.event_queue.generate_push(
+                    self._emitter, element, key_sender, receiver, key_receiver
+                )
+            else:
+                parameters_used |= generate_call()
+        return parameters_used
 
-    def _generate_body(self, element: EventSend) -> str:
+    def _generate_dispatch(self, element: EventSend) -> Set[str]:
+        emitter = self._emitter
         parameters_used = set()
-        generation = ""
+        for index, (key_sender, receivers) in enumerate(element.receivers.items()):
+            module_inst_name_sender, component_name_sender = tuple(key_sender.split(":"))
+            emitter.line_break(index != 0)
+            Common.generate_mod_id_statement(
+                emitter, module_inst_name_sender, component_name_sender, element.language, index, self.dispatch
+            )
+            with emitter.indented():
+                parameters_used |= self._generate_event_received_calls(element, key_sender, receivers)
+                Common.generate_mod_id_break_statement(emitter, self.dispatch)
+            emitter.write(emitter.indentation, "}")
+        emitter.line_break(self.dispatch == Common.SWITCH_DISPATCH)
+        Common.generate_mod_id_switch_end(emitter, self.dispatch, line_break=False)
+        return parameters_used
+
+    def _generate_body(self, element: EventSend) -> None:
+        emitter = self._emitter
+        parameters_used = set()
+        self._generate_probe(element, element.name + "__send")
+        position = emitter.mark()
         if self.unit_test:
-            generation += Common.generate_body_unit_test(self.indent_level)
+            Common.generate_body_unit_test(emitter)
+        elif element.receivers:
+            parameters_used = self._generate_dispatch(element)
         else:
-            for index, (key_sender, receivers) in enumerate(element.receivers.items()):
-                module_inst_name_sender, component_name_sender = tuple(key_sender.split(":"))
-                generation += Common.LINE_BREAK[: index != 0]
-                generation += Common.generate_mod_id_if_statement(
-                    module_inst_name_sender, component_name_sender, element.language, index, self.indent_level
-                )
-                self.indent_level += self.indent_step
-                tmp = self._generate_event_received_calls(element, receivers)
-                generation += tmp[0]
-                parameters_used |= tmp[1]
-                self.indent_level -= self.indent_step
-                generation += Common.SPACE_INDENTATION[: self.indent_level] + "}"
-            if not element.receivers:
-                generation += Common.SPACE_INDENTATION[: self.indent_level] + "/* Does nothing */"
+            emitter.write(emitter.indentation, "/* Does nothing */")
         tmp1 = ""
         if self.unit_test or not element.receivers:
             if element.language == "c":
-                tmp1 += Common.SPACE_INDENTATION[: self.indent_level] + "(void) context;" + Common.LINE_BREAK[:1]
-        tmp2 = Common.cast_unused_parameters(element.inputs, parameters_used, self.indent_level)
-        generation = tmp1 + tmp2 + Common.LINE_BREAK[: tmp2 != ""] + generation
-        return generation
+                tmp1 += emitter.indentation + "(void) context;" + Common.LINE_BREAK[:1]
+        tmp2 = Common.cast_unused_parameters(element.inputs, parameters_used, emitter.indent_level)
+        emitter.insert(position, tmp1, tmp2, Common.LINE_BREAK[: tmp2 != ""])
@@ -8,6 +8,8 @@
 from ecoa_toolset.generators.container.common import Common
 
 # Internal library imports
+from ecoa_toolset.generators.container.log_masks import LogMasks
+from ecoa_toolset.generators.emitter import Emitter
 from ecoa_toolset.generators.generic.function import FunctionGenerator
 from ecoa_toolset.models.components import Log, LogType
 
@@ -16,69 +18,104 @@ class LogsGenerator(FunctionGenerator):
     """"""
 
     log_level: int = None
+    async_logs: bool = None
+    log_masks: LogMasks = None
 
-    def __init__(self, indent_level: int, indent_step: int, body: bool):
+    def __init__(
+        self, indent_level: int, indent_step: int, body: bool, async_logs: bool = False, log_masks: LogMasks = None
+    ):
         super().__init__(indent_level, indent_step, body)
+        self.async_logs = async_logs
+        self.log_masks = log_masks
 
-    def _generate_prototype(self, element: Log) -> str:
-        generation = Common.SPACE_INDENTATION[: self.indent_level] + "void" + Common.LINE_BREAK[:1]
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + Common.switch_lang(
-            element.module_impl_name + "_container__",
-            element.module_impl_name + "::Container::" if self.body else "",
-            element.language,
+    def _generate_prototype(self, element: Log) -> None:
+        emitter = self._emitter
+        emitter.write_line("void")
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                element.module_impl_name + "_container__",
+                element.module_impl_name + "::Container::" if self.body else "",
+                element.language,
+            ),
+            self.log_level.name.lower() + " (",
         )
-        generation += self.log_level.name.lower() + " (" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
-        if element.language == "c":
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + element.module_impl_name
-                + "__context * context,"
-                + Common.LINE_BREAK[:1]
+        emitter.line_break()
+        with emitter.indented():
+            if element.language == "c":
+                emitter.write_line(element.module_impl_name + "__context * context,")
+            emitter.write(
+                emitter.indentation,
+                "const ECOA",
+                Common.switch_lang("__", "::", element.language),
+                "log",
+                Common.switch_lang(" ", " & ", element.language),
+                "log",
             )
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "const ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "log"
-            + Common.switch_lang(" ", " & ", element.language)
-            + "log"
+            if self.log_level in [LogType.RAISE_ERROR, LogType.RAISE_FATAL_ERROR]:
+                emitter.write(",")
+                emitter.line_break()
+                emitter.write(
+                    emitter.indentation,
+                    "const ECOA",
+                    Common.switch_lang("__", "::", element.language),
+                    "error_code error_code",
+                )
+        emitter.line_break()
+        emitter.write(emitter.indentation, ")")
+
+    def _generate_async_body(self, element: Log) -> None:
+        emitter = self._emitter
+        if self.log_level in [LogType.RAISE_ERROR, LogType.RAISE_FATAL_ERROR]:
+            emitter.write_line("(void) error_code;")
+        emitter.write(
+            emitter.indentation,
+            Common.LOG_PUSH,
+            "(",
+            Common.generate_mod_id(element.language),
+            ", ",
+            str(self.log_level.value),
+            ", log.data);",
         )
+
+    def _generate_disabled_body(self, element: Log) -> None:
+        emitter = self._emitter
+        if element.language == "c":
+            emitter.write_line("(void) context;")
         if self.log_level in [LogType.RAISE_ERROR, LogType.RAISE_FATAL_ERROR]:
-            generation += (
-                ","
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "const ECOA"
-                + Common.switch_lang("__", "::", element.language)
-                + "error_code error_code"
-            )
-        self.indent_level -= self.indent_step
-        generation += Common.LINE_BREAK[:1] + Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
+            emitter.write_line("(void) error_code;")
+        emitter.write(emitter.indentation, "(void) log;")
+
+    def _generate_body(self, element: Log) -> None:
+        if self.log_masks and not self.log_masks.generate_check(self._emitter, element, self.log_level):
+            self._generate_disabled_body(element)
+            return
+        if self.async_logs:
+            self._generate_async_body(element)
+        else:
+            self._generate_sync_body(element)
 
-    def _generate_body(self, element: Log) -> str:
-        generation = ""
+    def _generate_sync_body(self, element: Log) -> None:
+        emitter = self._emitter
         if element.language == "c":
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "(void) context;" + Common.LINE_BREAK[:1]
+            emitter.write_line("(void) context;")
         if self.log_level in [LogType.RAISE_ERROR, LogType.RAISE_FATAL_ERROR]:
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "(void) error_code;" + Common.LINE_BREAK[:1]
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + 'printf("[\\x1B['
+            emitter.write_line("(void) error_code;")
+        emitter.write(emitter.indentation, 'printf("[\\x1B[')
         if self.log_level == LogType.LOG_WARNING:
-            generation += "33"
+            emitter.write("33")
         elif self.log_level == LogType.RAISE_ERROR:
-            generation += "31"
+            emitter.write("31")
         elif self.log_level == LogType.RAISE_FATAL_ERROR:
-            generation += "41"
+            emitter.write("41")
         else:
-            generation += "32"
-        generation += "m" + "_".join(self.log_level.name.split("_")[1:]) + '\\x1B[39m] %s\\n", log.data);'
-        return generation
+            emitter.write("32")
+        emitter.write("m", "_".join(self.log_level.name.split("_")[1:]), '\\x1B[39m] %s\\n", log.data);')
 
     def generate(self, element: Log) -> str:
         """"""
-        generation = ""
+        self._emitter = Emitter(self.indent_level, self.indent_step)
         for log_level in LogType:
             self.log_level = log_level
-            generation += super().generate(element)
-        return generation
+            self._generate_function(element)
+        return self._emitter.getvalue()
@@ -8,324 +8,285 @@
 from ecoa_toolset.generators.container.common import Common
 
 # Internal library imports
+from ecoa_toolset.generators.container.instrumentation import Instrumentation
 from ecoa_toolset.generators.generic.function import FunctionGenerator
 from ecoa_toolset.models.components import Pinfo
 
 
+def _generate_return_status(language: str, status: str) -> str:
+    return Common.switch_lang("ECOA__return_status_" + status, "ECOA::return_status::" + status, language)
+
+
+def _generate_pinfo(element: Pinfo) -> str:
+    return Common.switch_lang("context->platform_", "this->", element.language) + "hook->" + element.name
+
+
 class ReadGenerator(FunctionGenerator):
     """"""
 
-    def __init__(self, indent_level: int, indent_step: int, body: bool):
+    mmap: bool = None
+
+    def __init__(
+        self,
+        indent_level: int,
+        indent_step: int,
+        body: bool,
+        instrumentation: Instrumentation = None,
+        access: str = Common.STREAM_PINFO_ACCESS,
+    ):
         super().__init__(indent_level, indent_step, body)
+        self.instrumentation = instrumentation
+        self.mmap = access == Common.MMAP_PINFO_ACCESS
 
-    def _generate_prototype(self, element: Pinfo) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-        )
-        generation += Common.switch_lang(
-            element.module_impl_name + "_container__",
-            element.module_impl_name + "::Container::" if self.body else "",
-            element.language,
-        )
-        generation += "read_" + element.name + Common.SPACE_INDENTATION[:1] + "(" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
-        if element.language == "c":
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + element.module_impl_name
-                + "__context * context,"
-                + Common.LINE_BREAK[:1]
-            )
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "byte * memory_address,"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "uint32 in_size,"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "uint32 * out_size"
-            + Common.LINE_BREAK[:1]
+    def _generate_prototype(self, element: Pinfo) -> None:
+        emitter = self._emitter
+        emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "return_status")
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                element.module_impl_name + "_container__",
+                element.module_impl_name + "::Container::" if self.body else "",
+                element.language,
+            ),
+            "read_" + element.name + Common.SPACE_INDENTATION[:1] + "(",
         )
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
+        emitter.line_break()
+        with emitter.indented():
+            if element.language == "c":
+                emitter.write_line(element.module_impl_name + "__context * context,")
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "byte * memory_address,")
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "uint32 in_size,")
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "uint32 * out_size")
+        emitter.write(emitter.indentation, ")")
 
-    def _generate_body(self, element: Pinfo) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "if (!memory_address)"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level += self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            "fclose(context->platform_hook->" + element.name + "->pinfo_file);",
-            "this->hook->" + element.name + "->pinfo_file.close();",
-            element.language,
-        )
-        generation += (
-            Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "return ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.switch_lang("_", "::", element.language)
-            + "INVALID_PARAMETER;"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level -= self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "}"
-            + Common.LINE_BREAK[:2]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-        )
-        generation += Common.switch_lang(
-            (
+    def _generate_mmap_body(self, element: Pinfo) -> None:
+        emitter = self._emitter
+        pinfo = _generate_pinfo(element)
+        emitter.write_line("if (!memory_address)")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line("return ", _generate_return_status(element.language, "INVALID_PARAMETER"), ";")
+        emitter.write_line("}")
+        emitter.line_break()
+        emitter.write_line("const ", Common.PINFO_MAPPING, " * mapping = ", pinfo, "->pinfo_mapping;")
+        emitter.write_line("if (!mapping->data)")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line("return ", _generate_return_status(element.language, "RESOURCE_NOT_AVAILABLE"), ";")
+        emitter.write_line("}")
+        emitter.line_break()
+        emitter.write_line("unsigned int count_elem = mapping->size - ", pinfo, "->pinfo_index;")
+        emitter.write_line("if (in_size < count_elem)")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line("count_elem = in_size;")
+        emitter.write_line("}")
+        emitter.write_line("memcpy(memory_address, mapping->data + ", pinfo, "->pinfo_index, count_elem);")
+        emitter.write_line(pinfo, "->pinfo_index += count_elem;")
+        emitter.line_break()
+        emitter.write_line("*out_size = count_elem;")
+        emitter.write(emitter.indentation, "return ", _generate_return_status(element.language, "OK"), ";")
+
+    def _generate_body(self, element: Pinfo) -> None:
+        emitter = self._emitter
+        self._generate_probe(element, "read_" + element.name)
+        if self.mmap:
+            self._generate_mmap_body(element)
+            return
+        emitter.write_line("if (!memory_address)")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line(
+                Common.switch_lang(
+                    "fclose(context->platform_hook->" + element.name + "->pinfo_file);",
+                    "this->hook->" + element.name + "->pinfo_file.close();",
+                    element.language,
+                )
+            )
+            emitter.write_line(
+                "return ECOA",
+                Common.switch_lang("__", "::", element.language),
+                "return_status",
+                Common.switch_lang("_", "::", element.language),
+                "INVALID_PARAMETER;",
+            )
+        emitter.write_line("}")
+        emitter.line_break()
+        if element.language == "c":
+            emitter.write_line(
                 "unsigned int count_elem = fread(memory_address, sizeof(ECOA__byte), in_size, context->platform_hook->"
                 + element.name
                 + "->pinfo_file);"
+            )
+        elif element.language == "c++":
+            emitter.write_line("this->hook->" + element.name + "->pinfo_file.read((char*)memory_address, in_size);")
+            emitter.write_line("unsigned int count_elem = this->hook->" + element.name + "->pinfo_file.gcount();")
+        emitter.line_break()
+        emitter.write_line(
+            Common.switch_lang(
+                "if ((in_size + context->platform_hook->", "if ((in_size + this->hook->", element.language
             ),
-            (
-                "this->hook->"
-                + element.name
-                + "->pinfo_file.read((char*)memory_address, in_size);"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "unsigned int count_elem = this->hook->"
-                + element.name
-                + "->pinfo_file.gcount();"
+            element.name,
+            Common.switch_lang(
+                "->pinfo_index) > context->platform_hook->", "->pinfo_index) > this->hook->", element.language
             ),
-            element.language,
-        )
-        generation += Common.LINE_BREAK[:2] + Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            "if ((in_size + context->platform_hook->", "if ((in_size + this->hook->", element.language
-        )
-        generation += element.name
-        generation += Common.switch_lang(
-            "->pinfo_index) > context->platform_hook->", "->pinfo_index) > this->hook->", element.language
-        )
-        generation += (
-            element.name
-            + "->pinfo_size)"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
+            element.name + "->pinfo_size)",
         )
-        self.indent_level += self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + Common.switch_lang("context->platform_", "this->", element.language)
-            + "hook->"
-            + element.name
-            + "->pinfo_index = "
-            + Common.switch_lang("context->platform_", "this->", element.language)
-            + "hook->"
-            + element.name
-            + "->pinfo_size;"
-            + Common.LINE_BREAK[:1]
+        hook = Common.switch_lang("context->platform_", "this->", element.language) + "hook->" + element.name
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line(hook + "->pinfo_index = " + hook + "->pinfo_size;")
+        emitter.write_line("}")
+        emitter.write_line("else")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line(hook + "->pinfo_index = " + hook + "->pinfo_index + in_size;")
+        emitter.write_line("}")
+        emitter.line_break()
+        emitter.write_line("*out_size = count_elem;")
+        emitter.write(
+            emitter.indentation,
+            "return ECOA",
+            Common.switch_lang("__", "::", element.language),
+            "return_status",
+            Common.switch_lang("_OK", "()", element.language),
+            ";",
         )
-        self.indent_level -= self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "}"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "else"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level += self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + Common.switch_lang("context->platform_", "this->", element.language)
-            + "hook->"
-            + element.name
-            + "->pinfo_index = "
-            + Common.switch_lang("context->platform_", "this->", element.language)
-            + "hook->"
-            + element.name
-            + "->pinfo_index + in_size;"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level -= self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "}"
-            + Common.LINE_BREAK[:2]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "*out_size = count_elem;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "return ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.switch_lang("_OK", "()", element.language)
-            + ";"
-        )
-        return generation
 
 
 class SeekGenerator(FunctionGenerator):
     """"""
 
-    def __init__(self, indent_level: int, indent_step: int, body: bool):
+    mmap: bool = None
+
+    def __init__(self, indent_level: int, indent_step: int, body: bool, access: str = Common.STREAM_PINFO_ACCESS):
         super().__init__(indent_level, indent_step, body)
+        self.mmap = access == Common.MMAP_PINFO_ACCESS
 
-    def _generate_prototype(self, element: Pinfo) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-        )
-        generation += Common.switch_lang(
-            element.module_impl_name + "_container__",
-            element.module_impl_name + "::Container::" if self.body else "",
-            element.language,
+    def _generate_prototype(self, element: Pinfo) -> None:
+        emitter = self._emitter
+        emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "return_status")
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                element.module_impl_name + "_container__",
+                element.module_impl_name + "::Container::" if self.body else "",
+                element.language,
+            ),
+            "seek_" + element.name + " (",
         )
-        generation += "seek_" + element.name + " (" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
+        emitter.line_break()
+        with emitter.indented():
+            if element.language == "c":
+                emitter.write_line(element.module_impl_name + "__context * context,")
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "int32 offset,")
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "seek_whence_type whence,")
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "uint32 * new_position")
+        emitter.write(emitter.indentation, ")")
+
+    def _generate_mmap_body(self, element: Pinfo) -> None:
+        emitter = self._emitter
+        pinfo = _generate_pinfo(element)
+        whence = Common.switch_lang("ECOA__seek_whence_type_", "ECOA::seek_whence_type::ECOA_", element.language)
+        emitter.write_line("long long position = offset;")
+        emitter.write_line("if (whence == ", whence, "SEEK_CUR)")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line("position += ", pinfo, "->pinfo_index;")
+        emitter.write_line("}")
+        emitter.write_line("else if (whence == ", whence, "SEEK_END)")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line("position += ", pinfo, "->pinfo_mapping->size;")
+        emitter.write_line("}")
+        emitter.write_line("else if (whence != ", whence, "SEEK_SET)")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line("return ", _generate_return_status(element.language, "INVALID_PARAMETER"), ";")
+        emitter.write_line("}")
+        emitter.line_break()
+        emitter.write_line("if (position < 0 || position > (long long) ", pinfo, "->pinfo_mapping->size)")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line("return ", _generate_return_status(element.language, "INVALID_PARAMETER"), ";")
+        emitter.write_line("}")
+        emitter.line_break()
+        emitter.write_line(pinfo, "->pinfo_index = (unsigned int) position;")
+        emitter.write_line("*new_position = ", pinfo, "->pinfo_index;")
+        emitter.write(emitter.indentation, "return ", _generate_return_status(element.language, "OK"), ";")
+
+    def _generate_body(self, element: Pinfo) -> None:
+        if self.mmap:
+            self._generate_mmap_body(element)
+            return
+        emitter = self._emitter
         if element.language == "c":
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + element.module_impl_name
-                + "__context * context,"
-                + Common.LINE_BREAK[:1]
+            emitter.write_line(
+                "int returnCode = fseek(context->platform_hook->" + element.name + "->pinfo_file, offset, whence);"
             )
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "int32 offset,"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "seek_whence_type whence,"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "uint32 * new_position"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
-
-    def _generate_body(self, element: Pinfo) -> str:
-        generation = Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            (
-                "int returnCode = fseek(context->platform_hook->"
-                + element.name
-                + "->pinfo_file, offset, whence);"
-                + Common.LINE_BREAK[:2]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "if (returnCode != 0)"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "{"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
-                + "fclose(context->platform_hook->"
-                + element.name
-                + "->pinfo_file);"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
-                + "return ECOA__return_status_INVALID_PARAMETER;"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "}"
-            ),
-            "this->hook->" + element.name + "->pinfo_file.seekg(offset, (std::ios_base::seekdir) ((int) whence));",
-            element.language,
-        )
-        generation += Common.LINE_BREAK[:2] + Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            (
+            emitter.line_break()
+            emitter.write_line("if (returnCode != 0)")
+            emitter.write_line("{")
+            with emitter.indented():
+                emitter.write_line("fclose(context->platform_hook->" + element.name + "->pinfo_file);")
+                emitter.write_line("return ECOA__return_status_INVALID_PARAMETER;")
+            emitter.write_line("}")
+            emitter.line_break()
+            emitter.write_line(
                 "context->platform_hook->"
                 + element.name
                 + "->pinfo_index = ftell(context->platform_hook->"
                 + element.name
                 + "->pinfo_file);"
+            )
+        elif element.language == "c++":
+            emitter.write_line(
+                "this->hook->" + element.name + "->pinfo_file.seekg(offset, (std::ios_base::seekdir) ((int) whence));"
+            )
+            emitter.line_break()
+            emitter.write_line(
+                "this->hook->" + element.name + "->pinfo_index = this->hook->" + element.name + "->pinfo_file.tellg();"
+            )
+        emitter.line_break()
+        emitter.write_line(
+            Common.switch_lang("if (context->platform_hook->", "if (this->hook->", element.language),
+            element.name,
+            Common.switch_lang(
+                "->pinfo_index > context->platform_hook->", "->pinfo_index > this->hook->", element.language
             ),
-            "this->hook->" + element.name + "->pinfo_index = this->hook->" + element.name + "->pinfo_file.tellg();",
-            element.language,
+            element.name + "->pinfo_size)",
         )
-        generation += Common.LINE_BREAK[:2] + Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang("if (context->platform_hook->", "if (this->hook->", element.language)
-        generation += element.name
-        generation += Common.switch_lang(
-            "->pinfo_index > context->platform_hook->", "->pinfo_index > this->hook->", element.language
-        )
-        generation += (
-            element.name
-            + "->pinfo_size)"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level += self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            "fclose(context->platform_hook->" + element.name + "->pinfo_file);",
-            "this->hook->" + element.name + "->pinfo_file.close();",
-            element.language,
-        )
-        generation += (
-            Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "return ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.switch_lang("_", "::", element.language)
-            + "INVALID_PARAMETER;"
-            + Common.LINE_BREAK[:1]
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line(
+                Common.switch_lang(
+                    "fclose(context->platform_hook->" + element.name + "->pinfo_file);",
+                    "this->hook->" + element.name + "->pinfo_file.close();",
+                    element.language,
+                )
+            )
+            emitter.write_line(
+                "return ECOA",
+                Common.switch_lang("__", "::", element.language),
+                "return_status",
+                Common.switch_lang("_", "::", element.language),
+                "INVALID_PARAMETER;",
+            )
+        emitter.write_line("}")
+        emitter.line_break()
+        emitter.write_line(
+            "*new_position = ",
+            Common.switch_lang("context->platform_", "this->", element.language),
+            "hook->" + element.name + "->pinfo_index;",
         )
-        self.indent_level -= self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "}"
-            + Common.LINE_BREAK[:2]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "*new_position = "
-            + Common.switch_lang("context->platform_", "this->", element.language)
-            + "hook->"
-            + element.name
-            + "->pinfo_index;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "return ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.switch_lang("_OK", "()", element.language)
-            + ";"
+        emitter.write(
+            emitter.indentation,
+            "return ECOA",
+            Common.switch_lang("__", "::", element.language),
+            "return_status",
+            Common.switch_lang("_OK", "()", element.language),
+            ";",
         )
-        return generation
 
 
 class PinfoGenerator:
@@ -334,6 +295,13 @@ class PinfoGenerator:
     read: ReadGenerator = None
     seek: SeekGenerator = None
 
-    def __init__(self, indent_level: int, indent_step: int, body: bool):
-        self.read = ReadGenerator(indent_level, indent_step, body)
-        self.seek = SeekGenerator(indent_level, indent_step, body)
+    def __init__(
+        self,
+        indent_level: int,
+        indent_step: int,
+        body: bool,
+        instrumentation: Instrumentation = None,
+        access: str = Common.STREAM_PINFO_ACCESS,
+    ):
+        self.read = ReadGenerator(indent_level, indent_step, body, instrumentation, access)
+        self.seek = SeekGenerator(indent_level, indent_step, body, access)
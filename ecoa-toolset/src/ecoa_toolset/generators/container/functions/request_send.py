@@ -5,155 +5,125 @@
 """Request Send generation class.
 """
 
-from typing import Dict
+from functools import partial
+from typing import Dict, List, Set
 
 from ecoa_toolset.generators.container.common import Common
 
 # Internal library imports
+from ecoa_toolset.generators.container.instrumentation import Instrumentation
 from ecoa_toolset.generators.generic.function import FunctionGenerator
 from ecoa_toolset.models.components import RequestReceived, RequestSend, Variable
+from ecoa_toolset.models.ecoa_objects import ecoa_types_2_0
 
 
 class RequestSendGenerator(FunctionGenerator):
     """"""
 
     unit_test: bool = None
+    dispatch: str = None
+    protection_domains: Dict[str, str] = None
 
-    def __init__(self, indent_level: int, indent_step: int, body: bool, unit_test: bool):
+    def __init__(
+        self,
+        indent_level: int,
+        indent_step: int,
+        body: bool,
+        unit_test: bool,
+        dispatch: str = Common.IF_DISPATCH,
+        protection_domains: Dict[str, str] = None,
+        instrumentation: Instrumentation = None,
+    ):
         super().__init__(indent_level, indent_step, body)
         self.unit_test = unit_test
+        self.dispatch = dispatch
+        self.protection_domains = protection_domains
+        self.instrumentation = instrumentation
 
-    def _generate_context_argument(self, element: RequestSend) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + element.module_impl_name
-            + "__context * context"
-            + (
+    def _generate_context_argument(self, element: RequestSend) -> None:
+        self._emitter.write_line(
+            element.module_impl_name + "__context * context",
+            (
                 ","
                 if not element.is_synchronous or element.inputs or (element.is_synchronous and element.outputs)
                 else ""
-            )
-            + Common.LINE_BREAK[:1]
+            ),
         )
-        return generation
 
-    def _generate_id_argument(self, element: RequestSend) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "uint32 "
-            + Common.switch_lang("*", "&", element.language)
-            + " ID"
-            + ("," if element.inputs or (element.is_synchronous and element.outputs) else "")
-            + Common.LINE_BREAK[:1]
+    def _generate_id_argument(self, element: RequestSend) -> None:
+        self._emitter.write_line(
+            "ECOA",
+            Common.switch_lang("__", "::", element.language),
+            "uint32 ",
+            Common.switch_lang("*", "&", element.language),
+            " ID",
+            "," if element.inputs or (element.is_synchronous and element.outputs) else "",
         )
-        return generation
 
-    def _generate_prototype(self, element: RequestSend) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-        )
-        generation += Common.switch_lang(
-            element.module_impl_name + "_container__",
-            element.module_impl_name + "::Container::" if self.body else "",
-            element.language,
-        )
-        generation += (
-            element.name + "__request_" + ("sync" if element.is_synchronous else "async") + " (" + Common.LINE_BREAK[:1]
-        )
-        self.indent_level += self.indent_step
-        if element.language == "c":
-            generation += self._generate_context_argument(element)
-        if not element.is_synchronous:
-            generation += self._generate_id_argument(element)
-        generation += Common.generate_function_parameters(
-            element.inputs, element.language, self.indent_level, last_comma=(element.is_synchronous and element.outputs)
+    def _generate_prototype(self, element: RequestSend) -> None:
+        emitter = self._emitter
+        emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "return_status")
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                element.module_impl_name + "_container__",
+                element.module_impl_name + "::Container::" if self.body else "",
+                element.language,
+            ),
+            element.name + "__request_" + ("sync" if element.is_synchronous else "async") + " (",
         )
-        if element.is_synchronous:
-            generation += Common.generate_function_parameters(
-                element.outputs, element.language, self.indent_level, is_out=True
+        emitter.line_break()
+        with emitter.indented():
+            if element.language == "c":
+                self._generate_context_argument(element)
+            if not element.is_synchronous:
+                self._generate_id_argument(element)
+            emitter.write(
+                Common.generate_function_parameters(
+                    element.inputs,
+                    element.language,
+                    emitter.indent_level,
+                    last_comma=(element.is_synchronous and element.outputs),
+                )
             )
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
+            if element.is_synchronous:
+                emitter.write(
+                    Common.generate_function_parameters(
+                        element.outputs, element.language, emitter.indent_level, is_out=True
+                    )
+                )
+        emitter.write(emitter.indentation, ")")
 
-    def _generate_body_update_global_variable(self, element: RequestSend) -> str:
-        generation = ""
+    def _generate_body_update_global_variable(self, element: RequestSend) -> None:
+        emitter = self._emitter
+        prefix = "CM_GLOBAL_" + element.module_impl_name + "__" + element.name
         if element.is_synchronous:
             for parameter in element.outputs:
-                generation += (
-                    Common.SPACE_INDENTATION[: self.indent_level]
-                    + "CM_GLOBAL_"
-                    + element.module_impl_name
-                    + "__"
-                    + element.name
-                    + "_"
-                    + parameter.name
-                    + " = "
+                emitter.write_line(
+                    prefix + "_" + parameter.name + " = ",
+                    Common.switch_lang("", "&", element.language),
+                    parameter.name + ";",
                 )
-                generation += Common.switch_lang("", "&", element.language)
-                generation += parameter.name + ";" + Common.LINE_BREAK[:1]
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "CM_GLOBAL_"
-            + element.module_impl_name
-            + "__"
-            + element.name
-            + "_RRI_ID = "
-            + "CM_GLOBAL_"
-            + element.module_impl_name
-            + "__"
-            + element.name
-            + "_RRI_ID + 1;"
-            + Common.LINE_BREAK[:2]
-        )
-        return generation
+        emitter.write_line(prefix + "_RRI_ID = " + prefix + "_RRI_ID + 1;")
+        emitter.line_break()
 
-    def _generate_body_init_id(self, element: RequestSend) -> str:
-        generation = ""
+    def _generate_body_init_id(self, element: RequestSend) -> None:
+        emitter = self._emitter
+        prefix = "CM_GLOBAL_" + element.module_impl_name + "__" + element.name
+        pointer = Common.switch_lang("*" if not element.is_synchronous else "", "", element.language)
         if element.is_synchronous:
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + "ECOA"
-                + Common.switch_lang("__", "::", element.language)
-                + "uint32 ID;"
-                + Common.LINE_BREAK[:1]
-            )
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + Common.switch_lang("*" if not element.is_synchronous else "", "", element.language)
-            + "ID = (ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "uint16) "
-            + Common.switch_lang("context->platform_", "this->", element.language)
-            + "hook->mod_id;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + Common.switch_lang("*" if not element.is_synchronous else "", "", element.language)
-            + "ID |= "
-            + "CM_GLOBAL_"
-            + element.module_impl_name
-            + "__"
-            + element.name
-            + "_RR_ID << 16;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + Common.switch_lang("*" if not element.is_synchronous else "", "", element.language)
-            + "ID |= "
-            + "CM_GLOBAL_"
-            + element.module_impl_name
-            + "__"
-            + element.name
-            + "_RRI_ID << 24;"
-            + Common.LINE_BREAK[:2]
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "uint32 ID;")
+        emitter.write_line(
+            pointer,
+            "ID = (ECOA",
+            Common.switch_lang("__", "::", element.language),
+            "uint16) ",
+            Common.switch_lang("context->platform_", "this->", element.language),
+            "hook->mod_id;",
         )
-        return generation
+        emitter.write_line(pointer, "ID |= " + prefix + "_RR_ID << 16;")
+        emitter.write_line(pointer, "ID |= " + prefix + "_RRI_ID << 24;")
+        emitter.line_break()
 
     def _generate_request_received_id_argument(self, element: RequestSend, receiver: RequestReceived) -> str:
         cast = ""
@@ -165,11 +135,12 @@ def _generate_request_received_id_argument(self, element: RequestSend, receiver:
 
     def _generate_request_received_argument(
         self, element: RequestSend, receiver: RequestReceived, argument: Variable, index: int
-    ) -> str:
+    ) -> Set[str]:
+        emitter = self._emitter
         parameters_used = set()
-        generation = Common.SPACE_INDENTATION[: self.indent_level]
+        emitter.write(emitter.indentation)
         if argument.name == "ID":
-            generation += self._generate_request_received_id_argument(element, receiver)
+            emitter.write(self._generate_request_received_id_argument(element, receiver))
         else:
             argument_found = next(
                 (
@@ -181,10 +152,10 @@ def _generate_request_received_argument(
                 None,
             )
             if argument_found:
-                generation += Common.cast_argument(element, receiver, argument_found)
+                emitter.write(Common.cast_argument(element, receiver, argument_found))
                 parameters_used.add(argument_found.namespace + ":" + argument_found.type + ":" + argument_found.name)
-        generation += ("" if index == len(receiver.inputs) - 1 else ",") + Common.LINE_BREAK[:1]
-        return generation, parameters_used
+        emitter.write("" if index == len(receiver.inputs) - 1 else ",", Common.LINE_BREAK[:1])
+        return parameters_used
 
     def _generate_request_received_call(
         self,
@@ -192,107 +163,110 @@ def _generate_request_received_call(
         receiver: RequestReceived,
         module_inst_name_receiver: str,
         component_name_receiver: str,
-    ) -> str:
+    ) -> Set[str]:
+        emitter = self._emitter
         parameters_used = set()
-        generation = Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            receiver.module_impl_name + "__",
-            module_inst_name_receiver + "_" + component_name_receiver + "_Module.",
-            receiver.language,
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                receiver.module_impl_name + "__",
+                module_inst_name_receiver + "_" + component_name_receiver + "_Module.",
+                receiver.language,
+            ),
+            receiver.name + "__request_received (",
         )
-        generation += receiver.name + "__request_received (" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
-        if receiver.language == "c":
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + "&"
-                + module_inst_name_receiver
-                + "_"
-                + component_name_receiver
-                + "_Context"
-                + ("," if receiver.inputs else "")
-                + Common.LINE_BREAK[:1]
-            )
-        for index, argument in enumerate(receiver.inputs):
-            tmp = self._generate_request_received_argument(element, receiver, argument, index)
-            generation += tmp[0]
-            parameters_used |= tmp[1]
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ");" + Common.LINE_BREAK[:1]
-        return generation, parameters_used
+        emitter.line_break()
+        with emitter.indented():
+            if receiver.language == "c":
+                emitter.write_line(
+                    "&" + module_inst_name_receiver + "_" + component_name_receiver + "_Context",
+                    "," if receiver.inputs else "",
+                )
+            for index, argument in enumerate(receiver.inputs):
+                parameters_used |= self._generate_request_received_argument(element, receiver, argument, index)
+        emitter.write_line(");")
+        if not element.is_synchronous and element.language == "c":
+            parameters_used.add("ECOA:uint32:ID")
+        return parameters_used
+
+    def _get_pointers(self, element: RequestSend) -> List[Variable]:
+        if element.language != "c":
+            return []
+        pointers = [p for p in element.inputs or [] if getattr(p.type_category, "is_complex", "")]
+        if not element.is_synchronous:
+            pointers.append(Variable("ID", "ECOA", "uint32", ecoa_types_2_0.Simple))
+        return pointers
 
-    def _generate_request_received_calls(self, element: RequestSend, receivers: Dict) -> str:
+    def _generate_request_received_calls(self, element: RequestSend, key_sender: str, receivers: Dict) -> Set[str]:
         parameters_used = set()
-        generation = ""
         for key_receiver, receiver in receivers.items():
             module_inst_name_receiver, component_name_receiver = tuple(key_receiver.split(":"))
-            tmp = self._generate_request_received_call(
+            generate_call = partial(
+                self._generate_request_received_call,
                 element,
                 receiver,
                 module_inst_name_receiver,
                 component_name_receiver,
             )
-            generation += tmp[0]
-            parameters_used |= tmp[1]
-        return generation, parameters_used
+            executor = Common.get_executor(self.protection_domains, key_sender, key_receiver)
+            if executor:
+                parameters_used |= Common.generate_executor_post(
+                    self._emitter, executor, self._get_pointers(element), generate_call, wait=element.is_synchronous
+                )
+            else:
+                parameters_used |= generate_call()
+        return parameters_used
 
-    def _generate_else_statement(self, element: RequestSend) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "else"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level += self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "return ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.switch_lang("_", "::", element.language)
-            + ("NO_RESPONSE" if element.is_synchronous else "RESOURCE_NOT_AVAILABLE")
-            + ";"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:2]
-        return generation
+    def _generate_else_statement(self, element: RequestSend) -> None:
+        emitter = self._emitter
+        Common.generate_mod_id_default_statement(emitter, self.dispatch)
+        with emitter.indented():
+            emitter.write_line(
+                "return ECOA",
+                Common.switch_lang("__", "::", element.language),
+                "return_status",
+                Common.switch_lang("_", "::", element.language),
+                "NO_RESPONSE" if element.is_synchronous else "RESOURCE_NOT_AVAILABLE",
+                ";",
+            )
+        emitter.write_line("}")
+        Common.generate_mod_id_switch_end(emitter, self.dispatch)
+        emitter.line_break()
 
-    def _generate_return_statement(self, element: RequestSend) -> str:
-        return (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "return ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.switch_lang("_OK", "()", element.language)
-            + ";"
+    def _generate_return_statement(self, element: RequestSend) -> None:
+        self._emitter.write(
+            self._emitter.indentation,
+            "return ECOA",
+            Common.switch_lang("__", "::", element.language),
+            "return_status",
+            Common.switch_lang("_OK", "()", element.language),
+            ";",
         )
 
-    def _generate_body(self, element: RequestSend) -> str:
+    def _generate_body(self, element: RequestSend) -> None:
+        emitter = self._emitter
         parameters_used = set()
-        generation = self._generate_body_update_global_variable(element)
-        generation += self._generate_body_init_id(element)
+        self._generate_probe(element, element.name + "__request_" + ("sync" if element.is_synchronous else "async"))
+        position = emitter.mark()
+        self._generate_body_update_global_variable(element)
+        self._generate_body_init_id(element)
         if self.unit_test:
-            generation += Common.generate_body_unit_test(self.indent_level) + Common.LINE_BREAK[:2]
+            Common.generate_body_unit_test(emitter)
+            emitter.line_break(2)
         else:
             for index, (key_sender, receivers) in enumerate(element.receivers.items()):
                 module_inst_name_sender, component_name_sender = tuple(key_sender.split(":"))
-                generation += Common.generate_mod_id_if_statement(
-                    module_inst_name_sender, component_name_sender, element.language, index, self.indent_level
+                Common.generate_mod_id_statement(
+                    emitter, module_inst_name_sender, component_name_sender, element.language, index, self.dispatch
                 )
-                self.indent_level += self.indent_step
-                tmp = self._generate_request_received_calls(element, receivers)
-                generation += tmp[0]
-                parameters_used |= tmp[1]
-                self.indent_level -= self.indent_step
-                generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:1]
+                with emitter.indented():
+                    parameters_used |= self._generate_request_received_calls(element, key_sender, receivers)
+                    Common.generate_mod_id_break_statement(emitter, self.dispatch)
+                emitter.write_line("}")
             if element.receivers:
-                generation += self._generate_else_statement(element)
+                self._generate_else_statement(element)
             else:
-                generation += Common.SPACE_INDENTATION[: self.indent_level] + "/* Does nothing */"
-        generation += self._generate_return_statement(element)
-        tmp = Common.cast_unused_parameters(element.inputs, parameters_used, self.indent_level)
-        generation = tmp + Common.LINE_BREAK[: tmp != ""] + generation
-        return generation
+                emitter.write(emitter.indentation, "/* Does nothing */")
+        self._generate_return_statement(element)
+        tmp = Common.cast_unused_parameters(element.inputs, parameters_used, emitter.indent_level)
+        emitter.insert(position, tmp, Common.LINE_BREAK[: tmp != ""])
@@ -5,9 +5,13 @@
 """Response Send generation class.
 """
 
+from functools import partial
+from typing import Dict, Set
+
 from ecoa_toolset.generators.container.common import Common
 
 # Internal library imports
+from ecoa_toolset.generators.container.instrumentation import Instrumentation
 from ecoa_toolset.generators.generic.function import FunctionGenerator
 from ecoa_toolset.models.components import RequestReceived, RequestSend, Variable
 
@@ -16,57 +20,59 @@ class ResponseSendGenerator(FunctionGenerator):
     """"""
 
     unit_test: bool = None
+    dispatch: str = None
+    protection_domains: Dict[str, str] = None
 
-    def __init__(self, indent_level: int, indent_step: int, body: bool, unit_test: bool):
+    def __init__(
+        self,
+        indent_level: int,
+        indent_step: int,
+        body: bool,
+        unit_test: bool,
+        dispatch: str = Common.IF_DISPATCH,
+        protection_domains: Dict[str, str] = None,
+        instrumentation: Instrumentation = None,
+    ):
         super().__init__(indent_level, indent_step, body)
         self.unit_test = unit_test
+        self.dispatch = dispatch
+        self.protection_domains = protection_domains
+        self.instrumentation = instrumentation
 
-    def _generate_prototype(self, element: RequestReceived) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-        )
-        generation += Common.switch_lang(
-            element.module_impl_name + "_container__",
-            element.module_impl_name + "::Container::" if self.body else "",
-            element.language,
+    def _generate_prototype(self, element: RequestReceived) -> None:
+        emitter = self._emitter
+        emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "return_status")
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                element.module_impl_name + "_container__",
+                element.module_impl_name + "::Container::" if self.body else "",
+                element.language,
+            ),
+            element.name + "__response_send (",
         )
-        generation += element.name + "__response_send (" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
-        if element.language == "c":
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + element.module_impl_name
-                + "__context * context,"
-                + Common.LINE_BREAK[:1]
+        emitter.line_break()
+        with emitter.indented():
+            if element.language == "c":
+                emitter.write_line(element.module_impl_name + "__context * context,")
+            emitter.write_line(
+                "const ECOA",
+                Common.switch_lang("__", "::", element.language),
+                "uint32 ID",
+                "," if element.outputs else "",
             )
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "const ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "uint32 ID"
-            + ("," if element.outputs else "")
-            + Common.LINE_BREAK[:1]
-        )
-        generation += Common.generate_function_parameters(element.outputs, element.language, self.indent_level)
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
+            emitter.write(Common.generate_function_parameters(element.outputs, element.language, emitter.indent_level))
+        emitter.write(emitter.indentation, ")")
 
-    def _generate_sender_mod_id(self, element: RequestReceived) -> str:
-        return (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "uint16 sender_mod_id = (ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "uint16)(ID & 0xffffU);"
-            + Common.LINE_BREAK[:2]
+    def _generate_sender_mod_id(self, element: RequestReceived) -> None:
+        self._emitter.write_line(
+            "ECOA",
+            Common.switch_lang("__", "::", element.language),
+            "uint16 sender_mod_id = (ECOA",
+            Common.switch_lang("__", "::", element.language),
+            "uint16)(ID & 0xffffU);",
         )
+        self._emitter.line_break()
 
     def _generate_if_statement(
         self,
@@ -76,26 +82,22 @@ def _generate_if_statement(
         component_name_sender: str,
         language: str,
         index: int,
-    ) -> str:
-        return (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + ("if" if index == 0 else "else if")
-            + " ("
-            + Common.switch_lang("context->platform_", "this->", language)
-            + "hook->mod_id == "
-            + module_inst_name_receiver.upper()
-            + "_"
-            + component_name_receiver.upper()
-            + "_ID && sender_mod_id == "
-            + module_inst_name_sender.upper()
-            + "_"
-            + component_name_sender.upper()
-            + "_ID)"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
+    ) -> None:
+        self._emitter.write_line(
+            "if" if index == 0 else "else if",
+            " (",
+            Common.switch_lang("context->platform_", "this->", language),
+            "hook->mod_id == ",
+            module_inst_name_receiver.upper(),
+            "_",
+            component_name_receiver.upper(),
+            "_ID && sender_mod_id == ",
+            module_inst_name_sender.upper(),
+            "_",
+            component_name_sender.upper(),
+            "_ID)",
         )
+        self._emitter.write_line("{")
 
     def _generate_memcpy_call_cast_c_to_cpp(self, parameter: Variable) -> str:
         generation = (
@@ -113,43 +115,36 @@ def _generate_memcpy_call_cast_cpp_to_c(self, parameter: Variable) -> str:
 
     def _generate_memcpy_call(
         self, element: RequestReceived, sender: RequestSend, parameter: Variable, parameter_sender: Variable
-    ) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "memcpy(CM_GLOBAL_"
-            + sender.module_impl_name
-            + "__"
-            + sender.name
-            + "_"
-            + parameter_sender.name
-            + ", "
+    ) -> None:
+        emitter = self._emitter
+        emitter.write(
+            emitter.indentation,
+            "memcpy(CM_GLOBAL_" + sender.module_impl_name + "__" + sender.name + "_" + parameter_sender.name + ", ",
         )
         if element.language == "c" and sender.language == "c++":
-            generation += self._generate_memcpy_call_cast_c_to_cpp(parameter)
+            emitter.write(self._generate_memcpy_call_cast_c_to_cpp(parameter))
         elif element.language == "c++" and sender.language == "c":
-            generation += self._generate_memcpy_call_cast_cpp_to_c(parameter)
+            emitter.write(self._generate_memcpy_call_cast_cpp_to_c(parameter))
         else:
-            generation += (
+            emitter.write(
                 "&" if sender.language == "c++" or not getattr(parameter.type_category, "is_complex", "") else ""
             )
-        generation += (
-            parameter.name
-            + ", sizeof("
-            + parameter.namespace.replace(".", Common.switch_lang("__", "::", sender.language))
-            + Common.switch_lang("__", "::", sender.language)
-            + parameter.type
-            + "));"
-            + Common.LINE_BREAK[:1]
+        emitter.write(
+            parameter.name,
+            ", sizeof(",
+            parameter.namespace.replace(".", Common.switch_lang("__", "::", sender.language)),
+            Common.switch_lang("__", "::", sender.language),
+            parameter.type,
+            "));",
+            Common.LINE_BREAK[:1],
         )
-        return generation
 
     def _generate_memcpy_calls(
         self,
         element: RequestReceived,
         sender: RequestSend,
-    ) -> str:
+    ) -> Set[str]:
         parameters_used = set()
-        generation = ""
         for parameter in element.outputs:
             parameter_sender = next(
                 (
@@ -161,15 +156,13 @@ def _generate_memcpy_calls(
                 None,
             )
             if parameter_sender:
-                generation += self._generate_memcpy_call(element, sender, parameter, parameter_sender)
+                self._generate_memcpy_call(element, sender, parameter, parameter_sender)
                 parameters_used.add(parameter.namespace + ":" + parameter.type + ":" + parameter.name)
-        return generation, parameters_used
+        return parameters_used
 
     def _generate_response_received_argument(
         self, element: RequestReceived, sender: RequestSend, parameter: Variable, index: int
-    ) -> str:
-        parameters_used = set()
-        generation = ""
+    ) -> Set[str]:
         parameter_found = next(
             (
                 v
@@ -179,15 +172,12 @@ def _generate_response_received_argument(
             ),
             None,
         )
-        if parameter_found:
-            parameters_used.add(parameter_found.namespace + ":" + parameter_found.type + ":" + parameter_found.name)
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + Common.cast_argument(element, sender, parameter_found)
-                + ("" if index == len(sender.outputs) - 1 else ",")
-                + Common.LINE_BREAK[:1]
-            )
-        return generation, parameters_used
+        if not parameter_found:
+            return set()
+        self._emitter.write_line(
+            Common.cast_argument(element, sender, parameter_found), "" if index == len(sender.outputs) - 1 else ","
+        )
+        return {parameter_found.namespace + ":" + parameter_found.type + ":" + parameter_found.name}
 
     def _generate_response_received_call(
         self,
@@ -195,51 +185,34 @@ def _generate_response_received_call(
         sender: RequestSend,
         module_inst_name_sender: str,
         component_name_sender: str,
-    ) -> str:
+    ) -> Set[str]:
+        emitter = self._emitter
         parameters_used = set()
-        generation = Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            sender.module_impl_name + "__",
-            module_inst_name_sender + "_" + component_name_sender + "_Module.",
-            sender.language,
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                sender.module_impl_name + "__",
+                module_inst_name_sender + "_" + component_name_sender + "_Module.",
+                sender.language,
+            ),
+            sender.name + "__response_received (",
         )
-        generation += sender.name + "__response_received (" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
-        if sender.language == "c":
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + "&"
-                + module_inst_name_sender
-                + "_"
-                + component_name_sender
-                + "_Context,"
-                + Common.LINE_BREAK[:1]
+        emitter.line_break()
+        with emitter.indented():
+            if sender.language == "c":
+                emitter.write_line("&" + module_inst_name_sender + "_" + component_name_sender + "_Context,")
+            emitter.write_line("ID,")
+            emitter.write_line(
+                "ECOA",
+                Common.switch_lang("__", "::", sender.language),
+                "return_status",
+                Common.switch_lang("_OK", "()", sender.language),
+                "," if sender.outputs else "",
             )
-        cast = ""
-        if element.language == "c" and sender.language == "c++":
-            cast += "(const ECOA::uint32) "
-        elif element.language == "c++" and sender.language == "c":
-            cast += "(const ECOA__uint32) "
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ID,"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-        )
-        generation += (
-            "ECOA"
-            + Common.switch_lang("__", "::", sender.language)
-            + "return_status"
-            + Common.switch_lang("_OK", "()", sender.language)
-        )
-        generation += ("," if sender.outputs else "") + Common.LINE_BREAK[:1]
-        for index, parameter in enumerate(sender.outputs):
-            tmp = self._generate_response_received_argument(element, sender, parameter, index)
-            generation += tmp[0]
-            parameters_used |= tmp[1]
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ");" + Common.LINE_BREAK[:1]
-        return generation, parameters_used
+            for index, parameter in enumerate(sender.outputs):
+                parameters_used |= self._generate_response_received_argument(element, sender, parameter, index)
+        emitter.write_line(");")
+        return parameters_used
 
     def _generate_body_core(
         self,
@@ -250,9 +223,9 @@ def _generate_body_core(
         module_inst_name_sender: str,
         component_name_sender: str,
         index: int,
-    ) -> str:
-        parameters_used = set()
-        generation = self._generate_if_statement(
+    ) -> Set[str]:
+        emitter = self._emitter
+        self._generate_if_statement(
             module_inst_name_receiver,
             component_name_receiver,
             module_inst_name_sender,
@@ -260,90 +233,142 @@ def _generate_body_core(
             element.language,
             index,
         )
-        self.indent_level += self.indent_step
-        if sender.is_synchronous:
-            tmp = self._generate_memcpy_calls(element, sender)
-            generation += tmp[0]
-            parameters_used |= tmp[1]
-        else:
-            tmp = self._generate_response_received_call(
+        with emitter.indented():
+            parameters_used = self._generate_response(
                 element,
+                module_inst_name_receiver + ":" + component_name_receiver,
                 sender,
                 module_inst_name_sender,
                 component_name_sender,
             )
-            generation += tmp[0]
-            parameters_used |= tmp[1]
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:1]
-        return generation, parameters_used
+        emitter.write_line("}")
+        return parameters_used
 
-    def _generate_else_statement(self, element: RequestReceived) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "else"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
+    def _generate_response(
+        self,
+        element: RequestReceived,
+        key_receiver: str,
+        sender: RequestSend,
+        module_inst_name_sender: str,
+        component_name_sender: str,
+    ) -> Set[str]:
+        if sender.is_synchronous:
+            # The sender is blocked until the request is handled, the outputs are copied from its thread
+            return self._generate_memcpy_calls(element, sender)
+        generate_call = partial(
+            self._generate_response_received_call, element, sender, module_inst_name_sender, component_name_sender
         )
-        self.indent_level += self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "return ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.switch_lang("_", "::", element.language)
-            + "INVALID_IDENTIFIER;"
-            + Common.LINE_BREAK[:1]
+        executor = Common.get_executor(
+            self.protection_domains, key_receiver, module_inst_name_sender + ":" + component_name_sender
         )
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:2]
-        return generation
+        if executor:
+            pointers = [p for p in element.outputs or [] if getattr(p.type_category, "is_complex", "")]
+            return Common.generate_executor_post(
+                self._emitter, executor, pointers if element.language == "c" else [], generate_call
+            )
+        return generate_call()
+
+    def _generate_body_switch(self, element: RequestReceived) -> Set[str]:
+        emitter = self._emitter
+        parameters_used = set()
+        for index, (key_receiver, senders) in enumerate(element.senders.items()):
+            module_inst_name_receiver, component_name_receiver = tuple(key_receiver.split(":"))
+            Common.generate_mod_id_statement(
+                emitter, module_inst_name_receiver, component_name_receiver, element.language, index, self.dispatch
+            )
+            with emitter.indented():
+                parameters_used |= self._generate_senders_switch(element, key_receiver, senders)
+                emitter.write_line("break;")
+            emitter.write_line("}")
+        return parameters_used
+
+    def _generate_senders_switch(self, element: RequestReceived, key_receiver: str, senders: Dict) -> Set[str]:
+        emitter = self._emitter
+        parameters_used = set()
+        Common.generate_mod_id_switch_statement(emitter, "sender_mod_id")
+        for key_sender, sender in senders.items():
+            module_inst_name_sender, component_name_sender = tuple(key_sender.split(":"))
+            Common.generate_mod_id_case_statement(emitter, module_inst_name_sender, component_name_sender)
+            with emitter.indented():
+                parameters_used |= self._generate_response(
+                    element, key_receiver, sender, module_inst_name_sender, component_name_sender
+                )
+                emitter.write_line("break;")
+            emitter.write_line("}")
+        self._generate_invalid_identifier_statement(element)
+        return parameters_used
+
+    def _generate_invalid_identifier_statement(self, element: RequestReceived) -> None:
+        emitter = self._emitter
+        Common.generate_mod_id_default_statement(emitter, self.dispatch)
+        with emitter.indented():
+            emitter.write_line(
+                "return ECOA",
+                Common.switch_lang("__", "::", element.language),
+                "return_status",
+                Common.switch_lang("_", "::", element.language),
+                "INVALID_IDENTIFIER;",
+            )
+        emitter.write_line("}")
+        Common.generate_mod_id_switch_end(emitter, self.dispatch)
+
+    def _generate_else_statement(self, element: RequestReceived) -> None:
+        self._generate_invalid_identifier_statement(element)
+        self._emitter.line_break()
 
-    def _generate_return_statement(self, element: RequestReceived) -> str:
-        return (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "return ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.switch_lang("_OK", "()", element.language)
-            + ";"
+    def _generate_body_if(self, element: RequestReceived) -> Set[str]:
+        parameters_used = set()
+        for index1, (key_receiver, senders) in enumerate(element.senders.items()):
+            module_inst_name_receiver, component_name_receiver = tuple(key_receiver.split(":"))
+            for index2, (key_sender, sender) in enumerate(senders.items()):
+                module_inst_name_sender, component_name_sender = tuple(key_sender.split(":"))
+                parameters_used |= self._generate_body_core(
+                    element,
+                    module_inst_name_receiver,
+                    component_name_receiver,
+                    sender,
+                    module_inst_name_sender,
+                    component_name_sender,
+                    index1 + index2,
+                )
+        return parameters_used
+
+    def _generate_return_statement(self, element: RequestReceived) -> None:
+        self._emitter.write(
+            self._emitter.indentation,
+            "return ECOA",
+            Common.switch_lang("__", "::", element.language),
+            "return_status",
+            Common.switch_lang("_OK", "()", element.language),
+            ";",
         )
 
-    def _generate_body(self, element: RequestReceived) -> str:
+    def _generate_dispatch(self, element: RequestReceived) -> Set[str]:
+        self._generate_sender_mod_id(element)
+        if self.dispatch == Common.SWITCH_DISPATCH:
+            parameters_used = self._generate_body_switch(element)
+        else:
+            parameters_used = self._generate_body_if(element)
+        self._generate_else_statement(element)
+        return parameters_used
+
+    def _generate_body(self, element: RequestReceived) -> None:
+        emitter = self._emitter
         parameters_used = set()
-        generation = ""
+        self._generate_probe(element, element.name + "__response_send")
+        position = emitter.mark()
         if self.unit_test:
-            generation += Common.generate_body_unit_test(self.indent_level) + Common.LINE_BREAK[:2]
+            Common.generate_body_unit_test(emitter)
+            emitter.line_break(2)
+        elif element.senders:
+            parameters_used = self._generate_dispatch(element)
         else:
-            if element.senders:
-                generation += self._generate_sender_mod_id(element)
-            for index1, (key_receiver, senders) in enumerate(element.senders.items()):
-                module_inst_name_receiver, component_name_receiver = tuple(key_receiver.split(":"))
-                for index2, (key_sender, sender) in enumerate(senders.items()):
-                    module_inst_name_sender, component_name_sender = tuple(key_sender.split(":"))
-                    tmp = self._generate_body_core(
-                        element,
-                        module_inst_name_receiver,
-                        component_name_receiver,
-                        sender,
-                        module_inst_name_sender,
-                        component_name_sender,
-                        index1 + index2,
-                    )
-                    generation += tmp[0]
-                    parameters_used |= tmp[1]
-            if element.senders:
-                generation += self._generate_else_statement(element)
-            else:
-                generation += Common.SPACE_INDENTATION[: self.indent_level] + "/* Does nothing */"
-        generation += self._generate_return_statement(element)
+            emitter.write(emitter.indentation, "/* Does nothing */")
+        self._generate_return_statement(element)
         tmp1 = ""
         if self.unit_test or not element.senders:
             if element.language == "c":
-                tmp1 += Common.SPACE_INDENTATION[: self.indent_level] + "(void) context;" + Common.LINE_BREAK[:1]
-            tmp1 += Common.SPACE_INDENTATION[: self.indent_level] + "(void) ID;" + Common.LINE_BREAK[:1]
-        tmp2 = Common.cast_unused_parameters(element.outputs, parameters_used, self.indent_level)
-        generation = tmp1 + tmp2 + Common.LINE_BREAK[: tmp2 != ""] + generation
-        return generation
+                tmp1 += emitter.indentation + "(void) context;" + Common.LINE_BREAK[:1]
+            tmp1 += emitter.indentation + "(void) ID;" + Common.LINE_BREAK[:1]
+        tmp2 = Common.cast_unused_parameters(element.outputs, parameters_used, emitter.indent_level)
+        emitter.insert(position, tmp1, tmp2, Common.LINE_BREAK[: tmp2 != ""])
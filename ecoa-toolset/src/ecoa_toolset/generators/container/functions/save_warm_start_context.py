@@ -10,41 +10,40 @@
 from ecoa_toolset.generators.container.common import Common
 
 # Internal library imports
+from ecoa_toolset.generators.container.warm_start import WarmStart
 from ecoa_toolset.generators.generic.function import FunctionGenerator
 
 
 class SaveWarmStartContextGenerator(FunctionGenerator):
     """"""
 
-    def __init__(self, indent_level: int, indent_step: int, body: bool):
-        super().__init__(indent_level, indent_step, body)
+    warm_start: WarmStart = None
 
-    def _generate_prototype(self, element: Tuple) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "void"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-        )
-        generation += Common.switch_lang(
-            element[0] + "_container__",
-            element[0] + "::Container::" if self.body else "",
-            element[1],
+    def __init__(self, indent_level: int, indent_step: int, body: bool, warm_start: WarmStart = None):
+        super().__init__(indent_level, indent_step, body)
+        self.warm_start = warm_start
+
+    def _generate_prototype(self, element: Tuple) -> None:
+        emitter = self._emitter
+        emitter.write_line("void")
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                element[0] + "_container__", element[0] + "::Container::" if self.body else "", element[1]
+            ),
+            "save_warm_start_context (",
         )
-        generation += "save_warm_start_context (" + Common.LINE_BREAK[:1]
+        emitter.line_break()
         if element[1] == "c":
-            generation += (
-                Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
-                + element[0]
-                + "__context * context"
-                + Common.LINE_BREAK[:1]
-            )
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
-
-    def _generate_body(self, element: Tuple) -> str:
-        generation = Common.SPACE_INDENTATION[: self.indent_level]
+            with emitter.indented():
+                emitter.write_line(element[0] + "__context * context")
+        emitter.write(emitter.indentation, ")")
+
+    def _generate_body(self, element: Tuple) -> None:
+        emitter = self._emitter
+        if self.warm_start:
+            emitter.write(emitter.indentation, WarmStart.SAVE, "(", Common.generate_mod_id(element[1]), ");")
+            return
         if element[1] == "c":
-            generation += "(void) context;" + Common.LINE_BREAK[:1] + Common.SPACE_INDENTATION[: self.indent_level]
-        generation += 'printf("Saving warm start context of ' + element[0] + '\\n");'
-        return generation
+            emitter.write_line("(void) context;")
+        emitter.write(emitter.indentation, 'printf("Saving warm start context of ' + element[0] + '\\n");')
@@ -21,140 +21,102 @@ def __init__(self, indent_level: int, indent_step: int, body: bool, type: str):
         super().__init__(indent_level, indent_step, body)
         self.type = type
 
-    def _generate_prototype(self, element: Time) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + (
+    def _generate_prototype(self, element: Time) -> None:
+        emitter = self._emitter
+        emitter.write_line(
+            (
                 "void"
                 if self.type == "relative_local"
                 else "ECOA" + Common.switch_lang("__", "::", element.language) + "return_status"
             )
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-        )
-        generation += Common.switch_lang(
-            element.module_impl_name + "_container__",
-            element.module_impl_name + "::Container::" if self.body else "",
-            element.language,
-        )
-        generation += "get_" + self.type + "_time (" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
-        if element.language == "c":
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + element.module_impl_name
-                + "__context * context,"
-                + Common.LINE_BREAK[:1]
-            )
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + ("hr" if self.type == "relative_local" else "global")
-            + "_time "
-            + Common.switch_lang("*", "&", element.language)
-            + " "
-            + self.type.lower()
-            + "_time"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
-
-    def _generate_body(self, element: Time) -> str:
-        generation = Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            (
-                "(void) context;"
-                + Common.LINE_BREAK[:2]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "struct timespec ts;"
-                + Common.LINE_BREAK[:2]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "#if defined(__unix__)"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "int result = clock_gettime (CLOCK_"
-                + ("MONOTONIC" if self.type == "relative_local" else "REALTIME")
-                + ", & ts);"
-                + Common.LINE_BREAK[:2]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "if (result == -1)"
-            ),
-            (
-                "std::chrono::"
-                + ("steady" if self.type == "relative_local" else "system")
-                + "_clock::time_point tp = std::chrono::"
-                + ("steady" if self.type == "relative_local" else "system")
-                + "_clock::now();"
-            ),
-            element.language,
         )
-        generation += Common.LINE_BREAK[:1] + Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            (
-                "{"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
-                + "return"
-                + (" ECOA__return_status_OPERATION_NOT_AVAILABLE" if self.type != "relative_local" else "")
-                + ";"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "}"
-                + Common.LINE_BREAK[:2]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "#else"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "if (timespec_get(&ts, TIME_UTC) != TIME_UTC) {"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
-                + "return"
-                + (" ECOA__return_status_OPERATION_NOT_AVAILABLE" if self.type != "relative_local" else "")
-                + ";"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "}"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "#endif"
-            ),
-            (
-                "std::chrono::"
-                + ("steady" if self.type == "relative_local" else "system")
-                + "_clock::duration dtn = tp.time_since_epoch();"
-            ),
-            element.language,
-        )
-        generation += Common.LINE_BREAK[:2] + Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            self.type.lower() + "_time->seconds = (ECOA__uint32) ts.tv_sec;",
-            self.type.lower() + "_time.seconds = static_cast < ECOA::uint32 > (dtn.count());",
-            element.language,
-        )
-        generation += Common.LINE_BREAK[:1] + Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            self.type.lower() + "_time->nanoseconds = (ECOA__uint32) ts.tv_nsec;",
-            (
-                self.type.lower()
-                + "_time.nanoseconds = static_cast < ECOA::uint32 > "
-                + "(std::chrono::duration_cast < std::chrono::nanoseconds > (dtn).count());"
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                element.module_impl_name + "_container__",
+                element.module_impl_name + "::Container::" if self.body else "",
+                element.language,
             ),
-            element.language,
-        )
+            "get_" + self.type + "_time (",
+        )
+        emitter.line_break()
+        with emitter.indented():
+            if element.language == "c":
+                emitter.write_line(element.module_impl_name + "__context * context,")
+            emitter.write_line(
+                "ECOA",
+                Common.switch_lang("__", "::", element.language),
+                "hr" if self.type == "relative_local" else "global",
+                "_time ",
+                Common.switch_lang("*", "&", element.language),
+                " ",
+                self.type.lower(),
+                "_time",
+            )
+        emitter.write(emitter.indentation, ")")
+
+    def _generate_body_c(self) -> None:
+        emitter = self._emitter
+        return_statement = (
+            "return" + (" ECOA__return_status_OPERATION_NOT_AVAILABLE" if self.type != "relative_local" else "") + ";"
+        )
+        emitter.write_line("(void) context;")
+        emitter.line_break()
+        emitter.write_line("struct timespec ts;")
+        emitter.line_break()
+        emitter.write_line("#if defined(__unix__)")
+        emitter.write_line(
+            "int result = clock_gettime (CLOCK_",
+            "MONOTONIC" if self.type == "relative_local" else "REALTIME",
+            ", & ts);",
+        )
+        emitter.line_break()
+        emitter.write_line("if (result == -1)")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line(return_statement)
+        emitter.write_line("}")
+        emitter.line_break()
+        emitter.write_line("#else")
+        emitter.write_line("if (timespec_get(&ts, TIME_UTC) != TIME_UTC) {")
+        with emitter.indented():
+            emitter.write_line(return_statement)
+        emitter.write_line("}")
+        emitter.write_line("#endif")
+        emitter.line_break()
+        emitter.write_line(self.type.lower() + "_time->seconds = (ECOA__uint32) ts.tv_sec;")
+        emitter.write(emitter.indentation, self.type.lower() + "_time->nanoseconds = (ECOA__uint32) ts.tv_nsec;")
+
+    def _generate_body_cpp(self) -> None:
+        emitter = self._emitter
+        clock = "std::chrono::" + ("steady" if self.type == "relative_local" else "system") + "_clock::"
+        emitter.write_line(clock + "time_point tp = " + clock + "now();")
+        emitter.write_line(clock + "duration dtn = tp.time_since_epoch();")
+        emitter.line_break()
+        emitter.write_line(self.type.lower() + "_time.seconds = static_cast < ECOA::uint32 > (dtn.count());")
+        emitter.write(
+            emitter.indentation,
+            self.type.lower(),
+            "_time.nanoseconds = static_cast < ECOA::uint32 > ",
+            "(std::chrono::duration_cast < std::chrono::nanoseconds > (dtn).count());",
+        )
+
+    def _generate_body(self, element: Time) -> None:
+        emitter = self._emitter
+        if element.language == "c":
+            self._generate_body_c()
+        elif element.language == "c++":
+            self._generate_body_cpp()
         if self.type != "relative_local":
-            generation += (
-                Common.LINE_BREAK[:2]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "return ECOA"
-                + Common.switch_lang("__", "::", element.language)
-                + "return_status"
-                + Common.switch_lang("_OK", "()", element.language)
-                + ";"
+            emitter.line_break(2)
+            emitter.write(
+                emitter.indentation,
+                "return ECOA",
+                Common.switch_lang("__", "::", element.language),
+                "return_status",
+                Common.switch_lang("_OK", "()", element.language),
+                ";",
             )
-        return generation
 
 
 class TimeResolutionGenerator(FunctionGenerator):
@@ -166,162 +128,97 @@ def __init__(self, indent_level: int, indent_step: int, body: bool, type: str):
         super().__init__(indent_level, indent_step, body)
         self.type = type
 
-    def _generate_prototype(self, element: Time) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "void"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-        )
-        generation += Common.switch_lang(
-            element.module_impl_name + "_container__",
-            element.module_impl_name + "::Container::" if self.body else "",
-            element.language,
-        )
-        generation += "get_" + self.type + "_time_resolution (" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
-        if element.language == "c":
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + element.module_impl_name
-                + "__context * context,"
-                + Common.LINE_BREAK[:1]
+    def _generate_prototype(self, element: Time) -> None:
+        emitter = self._emitter
+        emitter.write_line("void")
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                element.module_impl_name + "_container__",
+                element.module_impl_name + "::Container::" if self.body else "",
+                element.language,
+            ),
+            "get_" + self.type + "_time_resolution (",
+        )
+        emitter.line_break()
+        with emitter.indented():
+            if element.language == "c":
+                emitter.write_line(element.module_impl_name + "__context * context,")
+            emitter.write_line(
+                "ECOA",
+                Common.switch_lang("__", "::", element.language),
+                "duration ",
+                Common.switch_lang("*", "&", element.language),
+                " ",
+                self.type.lower(),
+                "_time_resolution",
             )
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "duration "
-            + Common.switch_lang("*", "&", element.language)
-            + " "
-            + self.type.lower()
-            + "_time_resolution"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
-
-    def _generate_body(self, element: Time) -> str:
-        generation = Common.SPACE_INDENTATION[: self.indent_level]
+        emitter.write(emitter.indentation, ")")
+
+    def _generate_return_block(self) -> None:
+        emitter = self._emitter
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line("return;")
+        emitter.write_line("}")
+
+    def _generate_body_timespec_get(self) -> None:
+        emitter = self._emitter
+        emitter.write_line("struct timespec ts1, ts2;")
+        emitter.write_line("int result = timespec_get(&ts1, TIME_UTC);")
+        emitter.write_line("if (result != TIME_UTC)")
+        self._generate_return_block()
+        emitter.write_line("do")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line("result = timespec_get(&ts2, TIME_UTC);")
+            emitter.write_line("if (result != TIME_UTC)")
+            self._generate_return_block()
+        emitter.write_line("} while(ts1.tv_sec == ts2.tv_sec && ts1.tv_nsec == ts2.tv_nsec);")
+        emitter.write_line("ts.tv_sec = ts2.tv_sec - ts1.tv_sec;")
+        emitter.write_line("long double tmp = (long double) ts.tv_sec + ((ts2.tv_nsec - ts1.tv_nsec) * 1E-9);")
+        emitter.write_line("if (ts1.tv_nsec > ts2.tv_nsec)")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line("ts.tv_sec--;")
+        emitter.write_line("}")
+        emitter.write_line("ts.tv_nsec = (long) ((tmp - (long double) ts.tv_sec) * 1E9);")
+
+    def _generate_body(self, element: Time) -> None:
+        emitter = self._emitter
         if element.language == "c":
-            generation += "(void) context;" + Common.LINE_BREAK[:2] + Common.SPACE_INDENTATION[: self.indent_level]
-        generation += (
-            "struct timespec ts;"
-            + Common.LINE_BREAK[:2]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "#if defined(__unix__)"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "int result = clock_getres (CLOCK_"
-            + ("MONOTONIC" if self.type == "relative_local" else "REALTIME")
-            + ", & ts);"
-            + Common.LINE_BREAK[:2]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "if (result == -1)"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level += self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + "return;" + Common.LINE_BREAK[:1]
-        self.indent_level -= self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "}"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "#else"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "struct timespec ts1, ts2;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "int result = timespec_get(&ts1, TIME_UTC);"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "if (result != TIME_UTC)"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level += self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + "return;" + Common.LINE_BREAK[:1]
-        self.indent_level -= self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "}"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "do"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level += self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "result = timespec_get(&ts2, TIME_UTC);"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "if (result != TIME_UTC)"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level += self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + "return;" + Common.LINE_BREAK[:1]
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:1]
-        self.indent_level -= self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "} while(ts1.tv_sec == ts2.tv_sec && ts1.tv_nsec == ts2.tv_nsec);"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "ts.tv_sec = ts2.tv_sec - ts1.tv_sec;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "long double tmp = (long double) ts.tv_sec + ((ts2.tv_nsec - ts1.tv_nsec) * 1E-9);"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "if (ts1.tv_nsec > ts2.tv_nsec)"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level += self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + "ts.tv_sec--;" + Common.LINE_BREAK[:1]
-        self.indent_level -= self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "}"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "ts.tv_nsec = (long) ((tmp - (long double) ts.tv_sec) * 1E9);"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "#endif"
-            + Common.LINE_BREAK[:2]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-        )
-        generation += Common.switch_lang(
-            self.type.lower() + "_time_resolution->seconds = (ECOA__uint32) ts.tv_sec;",
-            self.type.lower() + "_time_resolution.seconds = static_cast < ECOA::uint32 > (ts.tv_sec);",
-            element.language,
+            emitter.write_line("(void) context;")
+            emitter.line_break()
+        emitter.write_line("struct timespec ts;")
+        emitter.line_break()
+        emitter.write_line("#if defined(__unix__)")
+        emitter.write_line(
+            "int result = clock_getres (CLOCK_",
+            "MONOTONIC" if self.type == "relative_local" else "REALTIME",
+            ", & ts);",
+        )
+        emitter.line_break()
+        emitter.write_line("if (result == -1)")
+        self._generate_return_block()
+        emitter.write_line("#else")
+        self._generate_body_timespec_get()
+        emitter.write_line("#endif")
+        emitter.line_break()
+        emitter.write_line(
+            Common.switch_lang(
+                self.type.lower() + "_time_resolution->seconds = (ECOA__uint32) ts.tv_sec;",
+                self.type.lower() + "_time_resolution.seconds = static_cast < ECOA::uint32 > (ts.tv_sec);",
+                element.language,
+            )
         )
-        generation += Common.LINE_BREAK[:1] + Common.SPACE_INDENTATION[: self.indent_level]
-        generation += Common.switch_lang(
-            self.type.lower() + "_time_resolution->nanoseconds = (ECOA__uint32) ts.tv_nsec;",
-            self.type.lower() + "_time_resolution.nanoseconds = static_cast < ECOA::uint32 > (ts.tv_nsec);",
-            element.language,
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                self.type.lower() + "_time_resolution->nanoseconds = (ECOA__uint32) ts.tv_nsec;",
+                self.type.lower() + "_time_resolution.nanoseconds = static_cast < ECOA::uint32 > (ts.tv_nsec);",
+                element.language,
+            ),
         )
-        return generation
 
 
 class TimeServicesGenerator:
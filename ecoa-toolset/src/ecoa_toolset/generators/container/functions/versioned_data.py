@@ -5,9 +5,14 @@
 """Versioned Data generation class.
 """
 
-from ecoa_toolset.generators.container.common import Common
+# Standard library imports
+from functools import partial
+from typing import Dict, Set
 
 # Internal library imports
+from ecoa_toolset.generators.container.common import Common
+from ecoa_toolset.generators.container.instrumentation import Instrumentation
+from ecoa_toolset.generators.emitter import Emitter
 from ecoa_toolset.generators.generic.function import FunctionGenerator
 from ecoa_toolset.models.components import DataRead, DataWritten, VersionedData
 
@@ -18,431 +23,265 @@ class VersionedDataGenerator(FunctionGenerator):
     type: str = None
     mode: str = None
     unit_test: bool = None
+    dispatch: str = None
+    protection_domains: Dict[str, str] = None
 
-    def __init__(self, indent_level: int, indent_step: int, body: bool, unit_test: bool):
+    def __init__(
+        self,
+        indent_level: int,
+        indent_step: int,
+        body: bool,
+        unit_test: bool,
+        dispatch: str = Common.IF_DISPATCH,
+        protection_domains: Dict[str, str] = None,
+        instrumentation: Instrumentation = None,
+    ):
         super().__init__(indent_level, indent_step, body)
         self.unit_test = unit_test
+        self.dispatch = dispatch
+        self.protection_domains = protection_domains
+        self.instrumentation = instrumentation
 
-    def _generate_prototype(self, element: VersionedData) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-        )
-
-        generation += Common.switch_lang(
-            element.module_impl_name + "_container__",
-            element.module_impl_name + "::Container::" if self.body else "",
-            element.language,
+    def _generate_prototype(self, element: VersionedData) -> None:
+        emitter = self._emitter
+        emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "return_status")
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(
+                element.module_impl_name + "_container__",
+                element.module_impl_name + "::Container::" if self.body else "",
+                element.language,
+            ),
+            element.name + "__" + self.mode + "_" + self.type + "_access (",
         )
-        generation += element.name + "__" + self.mode + "_" + self.type + "_access (" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level]
-        if element.language == "c":
-            generation += (
-                element.module_impl_name
-                + "__context * context,"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
+        emitter.line_break()
+        with emitter.indented():
+            if element.language == "c":
+                emitter.write_line(element.module_impl_name + "__context * context,")
+            emitter.write_line(
+                Common.switch_lang(element.module_impl_name + "_container__", "", element.language),
+                element.name,
+                "_handle ",
+                Common.switch_lang("*", "&", element.language),
+                " data_handle",
             )
-        generation += (
-            Common.switch_lang(element.module_impl_name + "_container__", "", element.language)
-            + element.name
-            + "_handle "
-            + Common.switch_lang("*", "&", element.language)
-            + " data_handle"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
+        emitter.write(emitter.indentation, ")")
 
-    def _generate_vd_instance_id(
-        self, element: VersionedData, index: int, module_inst_name: str, component_name: str
-    ) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + ("if" if index == 0 else "else if")
-            + " ("
-            + Common.switch_lang("context->platform_", "this->", element.language)
-            + "hook->mod_id == "
-            + module_inst_name.upper()
-            + "_"
-            + component_name.upper()
-            + "_ID)"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "{"
-            + Common.LINE_BREAK[:1]
+    def _generate_vd_data_handle_storage(self, data_variable_name: str, language: str) -> None:
+        emitter = self._emitter
+        emitter.write_line(
+            "data_handle", Common.switch_lang("->", ".", language), "data = ", data_variable_name, "_data;"
         )
-        return generation
-
-    def _generate_vd_data_handle_storage(self, data_variable_name: str, language: str) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "data_handle"
-            + Common.switch_lang("->", ".", language)
-            + "data = "
-            + data_variable_name
-            + "_data;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "data_handle"
-            + Common.switch_lang("->", ".", language)
-            + "stamp = "
-            + data_variable_name
-            + "_stamp;"
-            + Common.LINE_BREAK[:1]
+        emitter.write_line(
+            "data_handle", Common.switch_lang("->", ".", language), "stamp = ", data_variable_name, "_stamp;"
         )
-        return generation
 
-    def _generate_vd_return_status(self, language: str, else_statement: bool) -> str:
-        generation = ""
+    def _generate_vd_return_status(self, language: str, else_statement: bool) -> None:
+        emitter = self._emitter
         if else_statement:
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + "else"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "{"
-                + Common.LINE_BREAK[:1]
-            )
-            self.indent_level += self.indent_step
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + "return ECOA"
-                + Common.switch_lang("__", "::", language)
-                + "return_status"
-                + Common.switch_lang("_", "::", language)
-                + "INVALID_IDENTIFIER;"
-                + Common.LINE_BREAK[:1]
-            )
-            self.indent_level -= self.indent_step
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:2]
+            Common.generate_mod_id_default_statement(emitter, self.dispatch)
+            with emitter.indented():
+                emitter.write_line(
+                    "return ECOA",
+                    Common.switch_lang("__", "::", language),
+                    "return_status",
+                    Common.switch_lang("_", "::", language),
+                    "INVALID_IDENTIFIER;",
+                )
+            emitter.write_line("}")
+            Common.generate_mod_id_switch_end(emitter, self.dispatch)
         else:
             if language == "c":
-                generation += Common.SPACE_INDENTATION[: self.indent_level] + "(void) context;" + Common.LINE_BREAK[:1]
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "(void) data_handle;" + Common.LINE_BREAK[:2]
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "return ECOA"
+                emitter.write_line("(void) context;")
+            emitter.write_line("(void) data_handle;")
+        emitter.line_break()
+        emitter.write(
+            emitter.indentation,
+            "return ECOA",
+            Common.switch_lang("__", "::", language),
+            "return_status",
+            Common.switch_lang("_OK", "()", language),
+            ";",
+        )
+
+    def _generate_vd_status(self, language: str, status: str) -> str:
+        return (
+            "ECOA"
             + Common.switch_lang("__", "::", language)
             + "return_status"
-            + Common.switch_lang("_OK", "()", language)
-            + ";"
+            + Common.switch_lang("_", "::", language)
+            + status
         )
-        return generation
 
-    def _generate_get_read_access_body(self, element: DataRead) -> str:
-        generation = ""
+    def _generate_vd_type(self, element: VersionedData) -> str:
+        return element.type.replace(":", Common.switch_lang("__", "::", element.language)).replace(
+            ".", Common.switch_lang("__", "::", element.language)
+        )
+
+    def _generate_vd_memcpy(self, language: str, destination: str, source: str, size: str) -> None:
+        self._emitter.write_line(
+            Common.switch_lang("", "std::", language), "memcpy(", destination, ", ", source, ", sizeof(", size, "));"
+        )
+
+    def _generate_vd_slot_hook(self, language: str, slot_used: str = None) -> None:
+        """Stores the address of the pool slot usage flag in the platform hook of the data handle, so that the
+        release and cancel operations can free the slot without dispatching on the module instance. Without slot,
+        declares the flag address as NULL: the get access functions store it first, so that the platform hook is set
+        on every return path.
+        """
+        emitter = self._emitter
+        if slot_used is None:
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", language), "boolean8 * slot_used = NULL;")
+        else:
+            emitter.write_line("slot_used = ", slot_used, ";")
+        self._generate_vd_memcpy(
+            language,
+            "data_handle" + Common.switch_lang("->", ".", language) + "platform_hook",
+            "&slot_used",
+            "slot_used",
+        )
+
+    def _generate_vd_slot_acquire(self, element: VersionedData, data_variable_name: str) -> None:
+        """Hands out a free buffer of the pool of the module instance."""
+        emitter = self._emitter
+        max_versions = str(element.max_versions)
+        emitter.write_line("ECOA", Common.switch_lang("__", "::", element.language), "uint32 slot = 0;")
+        emitter.write_line("while (slot < ", max_versions, " && ", data_variable_name, "_pool_used[slot])")
+        with emitter.indented():
+            emitter.write_line("slot++;")
+        emitter.write_line("if (slot == ", max_versions, ")")
+        with emitter.indented():
+            emitter.write_line("return ", self._generate_vd_status(element.language, "RESOURCE_NOT_AVAILABLE"), ";")
+        emitter.write_line(data_variable_name, "_pool_used[slot] = 1;")
+        self._generate_vd_slot_hook(element.language, "&" + data_variable_name + "_pool_used[slot]")
+        emitter.write_line(
+            "data_handle",
+            Common.switch_lang("->", ".", element.language),
+            "data = &",
+            data_variable_name,
+            "_pool[slot];",
+        )
+
+    def _generate_vd_slot_release(self, language: str) -> None:
+        emitter = self._emitter
+        emitter.write_line("ECOA", Common.switch_lang("__", "::", language), "boolean8 * slot_used;")
+        self._generate_vd_memcpy(
+            language,
+            "&slot_used",
+            "data_handle" + Common.switch_lang("->", ".", language) + "platform_hook",
+            "slot_used",
+        )
+        emitter.write_line("if (slot_used)")
+        with emitter.indented():
+            emitter.write_line("*slot_used = 0;")
+
+    def _generate_get_read_access_copy(self, element: DataRead, data_variable_name: str) -> None:
+        emitter = self._emitter
+        emitter.write_line(
+            "data_handle", Common.switch_lang("->", ".", element.language), "stamp = ", data_variable_name, "_stamp;"
+        )
+        # No buffer is handed out before the first publication, the module not releasing the data handle
+        emitter.write_line("if (!", data_variable_name, "_data)")
+        with emitter.indented():
+            emitter.write_line("return ", self._generate_vd_status(element.language, "DATA_NOT_INITIALIZED"), ";")
+        self._generate_vd_slot_acquire(element, data_variable_name)
+        self._generate_vd_memcpy(
+            element.language,
+            "data_handle" + Common.switch_lang("->", ".", element.language) + "data",
+            data_variable_name + "_data",
+            self._generate_vd_type(element),
+        )
+
+    def _generate_get_read_access_body(self, element: DataRead) -> None:
+        emitter = self._emitter
+        self._generate_vd_slot_hook(element.language)
         for index, (key_reader, (_, controlled)) in enumerate(element.writers.items()):
             module_inst_name_reader, component_name_reader, comp_op = tuple(key_reader.split(":"))
-            generation += self._generate_vd_instance_id(element, index, module_inst_name_reader, component_name_reader)
+            Common.generate_mod_id_statement(
+                emitter, module_inst_name_reader, component_name_reader, element.language, index, self.dispatch
+            )
             data_variable_name = (
                 "CM_GLOBAL_" + module_inst_name_reader + "_" + component_name_reader + "__" + element.name
             )
-            self.indent_level += self.indent_step
-            if controlled:
-                data_variable_name_copy = data_variable_name + "_copy"
-                if element.language == "c++":
-                    generation += (
-                        Common.SPACE_INDENTATION[: self.indent_level]
-                        + "try"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                        + "{"
-                        + Common.LINE_BREAK[:1]
-                    )
-                    self.indent_level += self.indent_step
-                generation += (
-                    Common.SPACE_INDENTATION[: self.indent_level]
-                    + element.type.replace(":", Common.switch_lang("__", "::", element.language)).replace(
-                        ".", Common.switch_lang("__", "::", element.language)
-                    )
-                    + " * "
-                    + data_variable_name_copy
-                    + " = "
-                )
-                generation += Common.switch_lang(
-                    (
-                        "("
-                        + element.type.replace(":", "__").replace(".", "__")
-                        + " *) malloc(sizeof("
-                        + element.type.replace(":", "__")
-                        + "));"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                        + "if (!"
-                        + data_variable_name_copy
-                        + ")"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
-                        + "return ECOA__return_status_DATA_NOT_INITIALIZED;"
-                        + Common.LINE_BREAK[:2]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                    ),
-                    (
-                        "new "
-                        + element.type.replace(":", "::").replace(".", "::")
-                        + ";"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                        + "std::"
-                    ),
-                    element.language,
-                )
-                generation += (
-                    "memcpy("
-                    + data_variable_name_copy
-                    + ", "
-                    + data_variable_name
-                    + "_data, sizeof("
-                    + element.type.replace(":", Common.switch_lang("__", "::", element.language))
-                    + "));"
-                    + Common.LINE_BREAK[:2]
-                    + Common.SPACE_INDENTATION[: self.indent_level]
-                    + "data_handle"
-                    + Common.switch_lang("->", ".", element.language)
-                    + "data = "
-                    + data_variable_name_copy
-                    + ";"
-                    + Common.LINE_BREAK[:1]
-                    + Common.SPACE_INDENTATION[: self.indent_level]
-                    + "data_handle"
-                    + Common.switch_lang("->", ".", element.language)
-                    + "stamp = "
-                    + data_variable_name
-                    + "_stamp;"
-                    + Common.LINE_BREAK[:1]
-                )
-                if element.language == "c++":
-                    self.indent_level -= self.indent_step
-                    generation += (
-                        Common.SPACE_INDENTATION[: self.indent_level]
-                        + "}"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                        + "catch (std::bad_alloc& e)"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                        + "{"
-                        + Common.LINE_BREAK[:1]
-                    )
-                    self.indent_level += self.indent_step
-                    generation += (
-                        Common.SPACE_INDENTATION[: self.indent_level]
-                        + "return ECOA::return_status(ECOA::return_status::EnumValues::OPERATION_NOT_AVAILABLE);"
-                        + Common.LINE_BREAK[:1]
-                    )
-                    self.indent_level -= self.indent_step
-                    generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:1]
-            else:
-                generation += self._generate_vd_data_handle_storage(data_variable_name, element.language)
-            self.indent_level -= self.indent_step
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:1]
-        generation += self._generate_vd_return_status(element.language, element.writers)
-        return generation
+            with emitter.indented():
+                if controlled:
+                    self._generate_get_read_access_copy(element, data_variable_name)
+                else:
+                    self._generate_vd_data_handle_storage(data_variable_name, element.language)
+                Common.generate_mod_id_break_statement(emitter, self.dispatch)
+            emitter.write_line("}")
+        self._generate_vd_return_status(element.language, element.writers)
 
-    def _generate_get_write_access_body(self, element: DataWritten) -> str:
-        generation = ""
+    def _generate_get_write_access_first_write(self, element: DataWritten, component_name_writer: str, first: str):
+        emitter = self._emitter
+        others = [
+            "CM_GLOBAL_"
+            + write_link.instance_name
+            + "_"
+            + component_name_writer
+            + "__"
+            + write_link.operation_name
+            + "_first_write"
+            for value in element.links_written.values()
+            for write_link in value
+        ]
+        emitter.write_line("if (", first, *[" || " + other for other in others], ")")
+        emitter.write_line("{")
+        with emitter.indented():
+            emitter.write_line(first, " = 0;")
+            for other in others:
+                emitter.write_line(other, " = 0;")
+            emitter.write_line("return ", self._generate_vd_status(element.language, "DATA_NOT_INITIALIZED"), ";")
+        emitter.write_line("}")
+
+    def _generate_get_write_access_copy(self, element: DataWritten, data_variable_name: str) -> None:
+        emitter = self._emitter
+        emitter.write_line("if (", data_variable_name, "_data)")
+        with emitter.indented():
+            self._generate_vd_memcpy(
+                element.language,
+                "data_handle" + Common.switch_lang("->", ".", element.language) + "data",
+                data_variable_name + "_data",
+                self._generate_vd_type(element),
+            )
+
+    def _generate_get_write_access_body(self, element: DataWritten) -> None:
+        emitter = self._emitter
+        self._generate_vd_slot_hook(element.language)
         for index, (key_writer, (_, controlled)) in enumerate(element.readers.items()):
             module_inst_name_writer, component_name_writer, comp_op = tuple(key_writer.split(":"))
-            generation += self._generate_vd_instance_id(element, index, module_inst_name_writer, component_name_writer)
+            Common.generate_mod_id_statement(
+                emitter, module_inst_name_writer, component_name_writer, element.language, index, self.dispatch
+            )
             data_variable_name = (
                 "CM_GLOBAL_" + module_inst_name_writer + "_" + component_name_writer + "__" + element.name
             )
-            data_variable_name_first = (
-                "CM_GLOBAL_"
-                + module_inst_name_writer
-                + "_"
-                + component_name_writer
-                + "__"
-                + element.name
-                + "_first_write"
-            )
-            data_variable_name_stamp = data_variable_name + "_stamp"
-            self.indent_level += self.indent_step
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "if (" + data_variable_name_first
-            for key, value in element.links_written.items():
-                for write_link in value:
-                    glob_other = (
-                        "CM_GLOBAL_"
-                        + write_link.instance_name
-                        + "_"
-                        + component_name_writer
-                        + "__"
-                        + write_link.operation_name
-                        + "_first_write"
+            with emitter.indented():
+                if controlled:
+                    self._generate_vd_slot_acquire(element, data_variable_name)
+                else:
+                    emitter.write_line(
+                        "data_handle",
+                        Common.switch_lang("->", ".", element.language),
+                        "data = &",
+                        data_variable_name,
+                        "_value;",
                     )
-                    generation += " || " + glob_other
-            generation += (
-                ")"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "{"
-                + Common.LINE_BREAK[:1]
-            )
-            self.indent_level += self.indent_step
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + data_variable_name_first
-                + " = 0;"
-                + Common.LINE_BREAK[:1]
-            )
-            for key, value in element.links_written.items():
-                for write_link in value:
-                    glob_other = (
-                        "CM_GLOBAL_"
-                        + write_link.instance_name
-                        + "_"
-                        + component_name_writer
-                        + "__"
-                        + write_link.operation_name
-                        + "_first_write"
-                    )
-                    generation += (
-                        Common.SPACE_INDENTATION[: self.indent_level] + glob_other + " = 0;" + Common.LINE_BREAK[:1]
-                    )
-            generation += Common.SPACE_INDENTATION[: self.indent_level]
-            generation += Common.switch_lang(
-                (
-                    element.type.replace(":", "__").replace(".", "__")
-                    + "* data = ("
-                    + element.type.replace(":", "__").replace(".", "__")
-                    + " *) malloc(sizeof("
-                    + element.type.replace(":", "__").replace(".", "__")
-                    + "));"
-                    + Common.LINE_BREAK[:1]
-                    + Common.SPACE_INDENTATION[: self.indent_level]
-                    + "data_handle->data = data;"
-                ),
-                (
-                    element.type.replace(":", "::").replace(".", "::")
-                    + "* data = new "
-                    + element.type.replace(":", "::").replace(".", "::")
-                    + ";"
-                    + Common.LINE_BREAK[:1]
-                    + Common.SPACE_INDENTATION[: self.indent_level]
-                    + "data_handle.data = data;"
-                ),
-                element.language,
-            )
-            generation += (
-                Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "return ECOA"
-                + Common.switch_lang("__", "::", element.language)
-                + "return_status"
-                + Common.switch_lang("_", "::", element.language)
-                + "DATA_NOT_INITIALIZED;"
-                + Common.LINE_BREAK[:1]
-            )
-            self.indent_level -= self.indent_step
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:2]
-            if controlled:
-                data_variable_name_copy = data_variable_name + "_copy"
-                if element.language == "c++":
-                    generation += (
-                        Common.SPACE_INDENTATION[: self.indent_level]
-                        + "try"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                        + "{"
-                        + Common.LINE_BREAK[:1]
-                    )
-                    self.indent_level += self.indent_step
-                generation += (
-                    Common.SPACE_INDENTATION[: self.indent_level]
-                    + element.type.replace(":", Common.switch_lang("__", "::", element.language)).replace(
-                        ".", Common.switch_lang("__", "::", element.language)
-                    )
-                    + " * "
-                    + data_variable_name_copy
-                    + " = "
-                )
-                generation += Common.switch_lang(
-                    (
-                        "("
-                        + element.type.replace(":", "__").replace(".", "__")
-                        + " *) malloc(sizeof("
-                        + element.type.replace(":", "__")
-                        + "));"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                        + "if (!"
-                        + data_variable_name_copy
-                        + ")"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
-                        + "return ECOA__return_status_NO_DATA;"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                    ),
-                    (
-                        "new "
-                        + element.type.replace(":", "::").replace(".", "::")
-                        + ";"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                    ),
-                    element.language,
+                emitter.write_line(
+                    "data_handle",
+                    Common.switch_lang("->", ".", element.language),
+                    "stamp = ",
+                    data_variable_name,
+                    "_stamp;",
                 )
-                generation += (
-                    Common.LINE_BREAK[:1]
-                    + Common.SPACE_INDENTATION[: self.indent_level]
-                    + data_variable_name_copy
-                    + Common.SPACE_INDENTATION[1]
-                    + "= "
-                    + data_variable_name
-                    + "_data;"
-                    + Common.LINE_BREAK[:2]
-                    + Common.SPACE_INDENTATION[: self.indent_level]
-                    + "data_handle"
-                    + Common.switch_lang("->", ".", element.language)
-                    + "data ="
-                    + Common.SPACE_INDENTATION[1]
-                    + data_variable_name_copy
-                    + ";"
-                    + Common.LINE_BREAK[:1]
-                    + Common.SPACE_INDENTATION[: self.indent_level]
-                    + "data_handle"
-                    + Common.switch_lang("->", ".", element.language)
-                    + "stamp ="
-                    + Common.SPACE_INDENTATION[1]
-                    + data_variable_name_stamp
-                    + ";"
-                    + Common.LINE_BREAK[:1]
+                self._generate_get_write_access_first_write(
+                    element, component_name_writer, data_variable_name + "_first_write"
                 )
-                if element.language == "c++":
-                    self.indent_level -= self.indent_step
-                    generation += (
-                        Common.SPACE_INDENTATION[: self.indent_level]
-                        + "}"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                        + "catch (std::bad_alloc& e)"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                        + "{"
-                        + Common.LINE_BREAK[:1]
-                    )
-                    self.indent_level += self.indent_step
-                    generation += (
-                        Common.SPACE_INDENTATION[: self.indent_level]
-                        + "return ECOA::return_status(ECOA::return_status::EnumValues::OPERATION_NOT_AVAILABLE);"
-                        + Common.LINE_BREAK[:1]
-                    )
-                    self.indent_level -= self.indent_step
-                    generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:1]
-            else:
-                generation += self._generate_vd_data_handle_storage(data_variable_name, element.language)
-            self.indent_level -= self.indent_step
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:1]
-        generation += self._generate_vd_return_status(element.language, element.readers)
-        return generation
+                if controlled:
+                    self._generate_get_write_access_copy(element, data_variable_name)
+                Common.generate_mod_id_break_statement(emitter, self.dispatch)
+            emitter.write_line("}")
+        self._generate_vd_return_status(element.language, element.readers)
 
     def _cast_argument(self, written_language, reader_language, reader_type) -> str:
         generation = ""
@@ -452,197 +291,137 @@ def _cast_argument(self, written_language, reader_language, reader_type) -> str:
             generation += "(" + reader_type.replace(":", "__") + " *) "
         return generation
 
-    def _generate_publish_write_access_body(self, element: DataWritten) -> str:
-        generation = ""
-        for index, (key_writer, (readers, notif)) in enumerate(element.readers.items()):
-            module_inst_name_writer, component_name_writer, comp_op = tuple(key_writer.split(":"))
-            generation += self._generate_vd_instance_id(element, index, module_inst_name_writer, component_name_writer)
-            self.indent_level += self.indent_step
-            written_global = "CM_GLOBAL_" + module_inst_name_writer + "_" + component_name_writer + "__" + element.name
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + written_global
-                + "_data = data_handle"
-                + Common.switch_lang("->", ".", element.language)
-                + "data;"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + written_global
-                + "_stamp += 1;"
-                + Common.LINE_BREAK[:1]
-            )
-            for key, value in element.links_written.items():
-                for write_link in value:
-                    glob_other = (
-                        "CM_GLOBAL_"
-                        + write_link.instance_name
-                        + "_"
-                        + component_name_writer
-                        + "__"
-                        + write_link.operation_name
-                    )
-                    generation += (
-                        Common.SPACE_INDENTATION[: self.indent_level]
-                        + glob_other
-                        + "_data = data_handle"
-                        + Common.switch_lang("->", ".", element.language)
-                        + "data;"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                        + glob_other
-                        + "_stamp += 1;"
-                        + Common.LINE_BREAK[:1]
-                    )
-            if not self.unit_test:
-                generation += Common.LINE_BREAK[:1]
-                for key_reader, reader in readers.items():
-                    module_inst_name_reader, component_name_reader, comp_op_r = tuple(key_reader.split(":"))
-                    data_variable_name = (
-                        "CM_GLOBAL_" + module_inst_name_reader + "_" + component_name_reader + "__" + reader.name
-                    )
-                    generation += (
-                        Common.SPACE_INDENTATION[: self.indent_level]
-                        + data_variable_name
-                        + "_data = "
-                        + self._cast_argument(element.language, reader.language, reader.type)
-                        + written_global
-                        + "_data;"
-                        + Common.LINE_BREAK[:1]
-                        + Common.SPACE_INDENTATION[: self.indent_level]
-                        + data_variable_name
-                        + "_stamp"
-                        + Common.SPACE_INDENTATION[1]
-                        + "+= 1;"
-                        + Common.LINE_BREAK[:1]
-                    )
-                generation += Common.LINE_BREAK[:1]
-                for key_reader, reader in readers.items():
-                    if reader.notifying:
-                        module_inst_name_reader, component_name_reader, comp_op_r = tuple(key_reader.split(":"))
-                        if reader.language == "c++":
-                            generation += (
-                                Common.SPACE_INDENTATION[: self.indent_level]
-                                + module_inst_name_reader
-                                + "_"
-                                + component_name_reader
-                                + "_Module."
-                                + reader.name
-                                + "__updated();"
-                                + Common.LINE_BREAK[:1]
-                            )
-                        elif reader.language == "c":
-                            generation += (
-                                Common.SPACE_INDENTATION[: self.indent_level]
-                                + reader.module_impl_name
-                                + "__"
-                                + reader.name
-                                + "__updated(&"
-                                + module_inst_name_reader
-                                + "_"
-                                + component_name_reader
-                                + "_Context);"
-                                + Common.LINE_BREAK[:1]
-                            )
-            self.indent_level -= self.indent_step
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:1]
-        if element.readers:
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + "else"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "{"
-                + Common.LINE_BREAK[:1]
+    def _generate_data_updated_call(self, key_reader: str, reader: DataRead) -> Set[str]:
+        module_inst_name_reader, component_name_reader, comp_op_r = tuple(key_reader.split(":"))
+        if reader.language == "c++":
+            self._emitter.write_line(
+                module_inst_name_reader + "_" + component_name_reader + "_Module." + reader.name + "__updated();"
             )
-            self.indent_level += self.indent_step
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + "return ECOA"
-                + Common.switch_lang("__", "::", element.language)
-                + "return_status"
-                + Common.switch_lang("_", "::", element.language)
-                + "INVALID_IDENTIFIER;"
-                + Common.LINE_BREAK[:1]
+        elif reader.language == "c":
+            self._emitter.write_line(
+                reader.module_impl_name,
+                "__",
+                reader.name,
+                "__updated(&",
+                module_inst_name_reader + "_" + component_name_reader + "_Context);",
             )
-            self.indent_level -= self.indent_step
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:2]
+        return set()
+
+    def _generate_data_updated_notification(self, key_writer: str, key_reader: str, reader: DataRead) -> None:
+        generate_call = partial(self._generate_data_updated_call, key_reader, reader)
+        executor = Common.get_executor(
+            self.protection_domains, ":".join(key_writer.split(":")[:2]), ":".join(key_reader.split(":")[:2])
+        )
+        if executor:
+            Common.generate_executor_post(self._emitter, executor, [], generate_call)
         else:
-            if element.language == "c":
-                generation += Common.SPACE_INDENTATION[: self.indent_level] + "(void) context;" + Common.LINE_BREAK[:1]
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "(void) data_handle;" + Common.LINE_BREAK[:2]
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "return ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.switch_lang("_OK", "()", element.language)
-            + ";"
+            generate_call()
+
+    def _generate_publish_write_access_readers(
+        self, element: DataWritten, key_writer: str, readers, written_global: str
+    ) -> None:
+        emitter = self._emitter
+        emitter.line_break()
+        for key_reader, reader in readers.items():
+            module_inst_name_reader, component_name_reader, comp_op_r = tuple(key_reader.split(":"))
+            data_variable_name = (
+                "CM_GLOBAL_" + module_inst_name_reader + "_" + component_name_reader + "__" + reader.name
+            )
+            emitter.write_line(
+                data_variable_name,
+                "_data = ",
+                self._cast_argument(element.language, reader.language, reader.type),
+                written_global,
+                "_data;",
+            )
+            emitter.write_line(data_variable_name, "_stamp", Common.SPACE_INDENTATION[1], "+= 1;")
+        emitter.line_break()
+        for key_reader, reader in readers.items():
+            if reader.notifying:
+                self._generate_data_updated_notification(key_writer, key_reader, reader)
+
+    def _generate_publish_write_access_value(self, element: DataWritten, written_global: str) -> None:
+        emitter = self._emitter
+        emitter.write_line(
+            "if (data_handle", Common.switch_lang("->", ".", element.language), "data != &", written_global, "_value)"
         )
-        return generation
+        with emitter.indented():
+            self._generate_vd_memcpy(
+                element.language,
+                "&" + written_global + "_value",
+                "data_handle" + Common.switch_lang("->", ".", element.language) + "data",
+                self._generate_vd_type(element),
+            )
+        self._generate_vd_slot_release(element.language)
+        emitter.line_break()
 
-    def _generate_release_read_or_cancel_write_access_body(self, element: VersionedData) -> str:
-        generation = Common.SPACE_INDENTATION[: self.indent_level]
-        if element.language == "c":
-            generation += (
-                "(void) context;"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
-                + "if (!data_handle)"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
-                + "return ECOA__return_status_INVALID_HANDLE;"
-                + Common.LINE_BREAK[:1]
-                + Common.SPACE_INDENTATION[: self.indent_level]
+    def _generate_publish_write_access_body(self, element: DataWritten) -> None:
+        emitter = self._emitter
+        for index, (key_writer, (readers, notif)) in enumerate(element.readers.items()):
+            module_inst_name_writer, component_name_writer, comp_op = tuple(key_writer.split(":"))
+            Common.generate_mod_id_statement(
+                emitter, module_inst_name_writer, component_name_writer, element.language, index, self.dispatch
             )
-        generation += (
-            "if (!data_handle"
-            + Common.switch_lang("->", ".", element.language)
-            + "data)"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
-            + Common.switch_lang("free(data_handle->data);", "delete data_handle.data;", element.language)
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "return ECOA"
-            + Common.switch_lang("__", "::", element.language)
-            + "return_status"
-            + Common.switch_lang("_OK", "()", element.language)
-            + ";"
+            written_global = "CM_GLOBAL_" + module_inst_name_writer + "_" + component_name_writer + "__" + element.name
+            globals_written = [written_global] + [
+                "CM_GLOBAL_" + write_link.instance_name + "_" + component_name_writer + "__" + write_link.operation_name
+                for value in element.links_written.values()
+                for write_link in value
+            ]
+            with emitter.indented():
+                self._generate_publish_write_access_value(element, written_global)
+                for global_written in globals_written:
+                    emitter.write_line(global_written, "_data = &", written_global, "_value;")
+                    emitter.write_line(global_written, "_stamp += 1;")
+                if not self.unit_test:
+                    self._generate_publish_write_access_readers(element, key_writer, readers, written_global)
+                Common.generate_mod_id_break_statement(emitter, self.dispatch)
+            emitter.write_line("}")
+        self._generate_vd_return_status(element.language, element.readers)
+
+    def _generate_release_read_or_cancel_write_access_body(self, element: VersionedData) -> None:
+        emitter = self._emitter
+        if element.language == "c":
+            emitter.write_line("(void) context;")
+            emitter.write_line("if (!data_handle)")
+            with emitter.indented():
+                emitter.write_line("return ECOA__return_status_INVALID_HANDLE;")
+        self._generate_vd_slot_release(element.language)
+        emitter.write(
+            emitter.indentation,
+            "return ECOA",
+            Common.switch_lang("__", "::", element.language),
+            "return_status",
+            Common.switch_lang("_OK", "()", element.language),
+            ";",
         )
-        return generation
 
-    def _generate_body(self, element: VersionedData) -> str:
-        generation = ""
+    def _generate_vd_lock(self) -> None:
+        if self.protection_domains:
+            self._emitter.write_line("std::lock_guard<std::recursive_mutex> lock(", Common.VERSIONED_DATA_MUTEX, ");")
+
+    def _generate_body(self, element: VersionedData) -> None:
+        self._generate_vd_lock()
+        self._generate_probe(element, element.name + "__" + self.mode + "_" + self.type + "_access")
         if self.mode == "get" and self.type == "read":
-            generation += self._generate_get_read_access_body(element)
+            self._generate_get_read_access_body(element)
         elif self.mode == "get" and self.type == "write":
-            generation += self._generate_get_write_access_body(element)
+            self._generate_get_write_access_body(element)
         elif self.mode == "publish" and self.type == "write":
-            generation += self._generate_publish_write_access_body(element)
+            self._generate_publish_write_access_body(element)
         elif self.mode == "release" or self.mode == "cancel":
-            generation += self._generate_release_read_or_cancel_write_access_body(element)
-        return generation
-
-    def _generate_data_read(self, element: DataRead) -> str:
-        generation = ""
-        for mode in ["get", "release"]:
-            self.mode = mode
-            generation += super().generate(element)
-        return generation
-
-    def _generate_data_written(self, element: DataWritten) -> str:
-        generation = ""
-        for mode in ["get", "cancel", "publish"]:
-            self.mode = mode
-            generation += super().generate(element)
-        return generation
+            self._generate_release_read_or_cancel_write_access_body(element)
 
     def generate(self, element: VersionedData, type: str) -> str:
         """"""
         self.type = type
-        generation = ""
+        self._emitter = Emitter(self.indent_level, self.indent_step)
+        modes = []
         if type == "read":
-            generation += self._generate_data_read(element)
+            modes = ["get", "release"]
         elif type == "write":
-            generation += self._generate_data_written(element)
-        return generation
+            modes = ["get", "cancel", "publish"]
+        for mode in modes:
+            self.mode = mode
+            self._generate_function(element)
+        return self._emitter.getvalue()
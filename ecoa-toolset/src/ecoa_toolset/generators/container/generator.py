@@ -11,6 +11,7 @@
 
 # Internal library imports
 from ecoa_toolset.generators.container.common import Common
+from ecoa_toolset.generators.container.event_queue import EventQueue
 from ecoa_toolset.generators.container.functions.event_send import EventSendGenerator
 from ecoa_toolset.generators.container.functions.external import ExternalGenerator
 from ecoa_toolset.generators.container.functions.get_value import GetValueGenerator
@@ -22,8 +23,11 @@
 from ecoa_toolset.generators.container.functions.save_warm_start_context import SaveWarmStartContextGenerator
 from ecoa_toolset.generators.container.functions.time import TimeServicesGenerator
 from ecoa_toolset.generators.container.functions.versioned_data import VersionedDataGenerator
+from ecoa_toolset.generators.container.instrumentation import Instrumentation
+from ecoa_toolset.generators.container.log_masks import LogMasks
 from ecoa_toolset.generators.container.variables.global_variable import CMGlobalVariableGenerator
 from ecoa_toolset.generators.container.variables.module_instantiation import ModuleInstantiationGenerator
+from ecoa_toolset.generators.container.warm_start import WarmStart
 
 
 class ContainerGenerator:
@@ -44,23 +48,47 @@ class ContainerGenerator:
     versioned_data: VersionedDataGenerator = None
     global_variable: CMGlobalVariableGenerator = None
     module_instantiation: ModuleInstantiationGenerator = None
+    warm_start: WarmStart = None
 
-    def __init__(self, indent_level: int, indent_step: int, body: bool, unit_test: bool):
+    def __init__(
+        self,
+        indent_level: int,
+        indent_step: int,
+        body: bool,
+        unit_test: bool,
+        dispatch: str = Common.IF_DISPATCH,
+        protection_domains: Dict[str, str] = None,
+        event_queue: EventQueue = None,
+        instrumentation: Instrumentation = None,
+        async_logs: bool = False,
+        log_masks: LogMasks = None,
+        pinfo_access: str = Common.STREAM_PINFO_ACCESS,
+        warm_start: WarmStart = None,
+    ):
         self.indent_level = indent_level
         self.indent_step = indent_step
-        self.event_send = EventSendGenerator(indent_level, indent_step, body, unit_test)
+        self.event_send = EventSendGenerator(
+            indent_level, indent_step, body, unit_test, dispatch, protection_domains, event_queue, instrumentation
+        )
         self.external = ExternalGenerator(indent_level, indent_step, body)
         self.get_value = GetValueGenerator(indent_level, indent_step, body)
-        self.logs = LogsGenerator(indent_level, indent_step, body)
-        self.pinfo = PinfoGenerator(indent_level, indent_step, body)
+        self.logs = LogsGenerator(indent_level, indent_step, body, async_logs, log_masks)
+        self.pinfo = PinfoGenerator(indent_level, indent_step, body, instrumentation, pinfo_access)
         self.recovery_action = RecoveryActionGenerator(indent_level, indent_step, body)
-        self.request_send = RequestSendGenerator(indent_level, indent_step, body, unit_test)
-        self.response_send = ResponseSendGenerator(indent_level, indent_step, body, unit_test)
-        self.save_warm_start_context = SaveWarmStartContextGenerator(indent_level, indent_step, body)
+        self.request_send = RequestSendGenerator(
+            indent_level, indent_step, body, unit_test, dispatch, protection_domains, instrumentation
+        )
+        self.response_send = ResponseSendGenerator(
+            indent_level, indent_step, body, unit_test, dispatch, protection_domains, instrumentation
+        )
+        self.save_warm_start_context = SaveWarmStartContextGenerator(indent_level, indent_step, body, warm_start)
         self.time = TimeServicesGenerator(indent_level, indent_step, body)
-        self.versioned_data = VersionedDataGenerator(indent_level, indent_step, body, unit_test)
+        self.versioned_data = VersionedDataGenerator(
+            indent_level, indent_step, body, unit_test, dispatch, protection_domains, instrumentation
+        )
         self.global_variable = CMGlobalVariableGenerator()
-        self.module_instantiation = ModuleInstantiationGenerator(indent_level, indent_step)
+        self.module_instantiation = ModuleInstantiationGenerator(indent_level, indent_step, pinfo_access)
+        self.warm_start = warm_start
 
     def generate_container_constructor(self, module_impl_name) -> str:
         generation = (
@@ -132,7 +160,7 @@ def _generate_init_context(self, hook, component_name: str) -> str:
             + "_hook;"
             + Common.LINE_BREAK[:1]
         )
-        if hook.pinfos:
+        if hook.pinfos and not self.module_instantiation.mmap:
             generation += self._generate_open_pinfos(hook, component_name)
         return generation
 
@@ -151,6 +179,40 @@ def _generate_init_module(self, hook, component_name: str) -> str:
         )
         return generation
 
+    def _generate_pinfo_mappings(self, function_name: str, path: bool) -> str:
+        generation = ""
+        for pinfo_file_path, name in self.module_instantiation.pinfo_mappings.items():
+            generation += (
+                Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
+                + function_name
+                + "(&"
+                + name
+                + (', "' + Common.replace_escape_string(pinfo_file_path) + '"' if path else "")
+                + ");"
+                + Common.LINE_BREAK[:1]
+            )
+        if generation:
+            generation = (
+                Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
+                + "/* PINFO files */"
+                + Common.LINE_BREAK[:1]
+                + generation
+            )
+        return generation
+
+    def _generate_restore_warm_start(self) -> str:
+        if not self.warm_start:
+            return ""
+        return (
+            Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
+            + "/* Warm start contexts */"
+            + Common.LINE_BREAK[:1]
+            + Common.SPACE_INDENTATION[: (self.indent_level + self.indent_step)]
+            + WarmStart.RESTORE
+            + "();"
+            + Common.LINE_BREAK[:1]
+        )
+
     def generate_cm_initialize(self, hooks: Dict) -> str:
         generation = (
             Common.SPACE_INDENTATION[: self.indent_level]
@@ -159,6 +221,7 @@ def generate_cm_initialize(self, hooks: Dict) -> str:
             + Common.SPACE_INDENTATION[: self.indent_level]
             + "{"
             + Common.LINE_BREAK[:1]
+            + self._generate_pinfo_mappings(Common.PINFO_MAP, True)
         )
         for hook in hooks:
             for component_name in hook.component_names:
@@ -178,6 +241,7 @@ def generate_cm_initialize(self, hooks: Dict) -> str:
                         + Common.LINE_BREAK[:1]
                         + tmp
                     )
+        generation += self._generate_restore_warm_start()
         generation += Common.SPACE_INDENTATION[: self.indent_level] + "}" + Common.LINE_BREAK[:2]
         return generation
 
@@ -217,8 +281,9 @@ def generate_cm_shutdown(self, hooks: Dict) -> str:
             + Common.SPACE_INDENTATION[: self.indent_level]
             + "{"
             + Common.LINE_BREAK[:1]
+            + self._generate_pinfo_mappings(Common.PINFO_UNMAP, False)
         )
-        for hook in hooks:
+        for hook in [] if self.module_instantiation.mmap else hooks:
             for component_name in hook.component_names:
                 tmp = self._generate_close_pinfos(hook, component_name)
                 if tmp:
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Instrumentation generation class.
+"""
+
+# Standard library imports
+from typing import Any, Dict, List, Tuple
+
+# Internal library imports
+from ecoa_toolset.generators.container.common import Common
+from ecoa_toolset.generators.emitter import Emitter
+
+
+class Instrumentation:
+    """The metrics (call count and latency) recorded by the instrumented container functions.
+
+    A metric is recorded per module instance and operation. The metrics of an operation are consecutive, one per
+    instance of its module implementation, so that a function finds the metric of its calling module instance from
+    the offset of the operation and the index of the instance among the instances of its module implementation.
+
+    Attributes:
+        instances (List[Tuple[str, str]]): The module instance and component names of each module instance,
+            indexed by the module instance identifier (mod_id).
+        instance_indexes (List[int]): The index of each module instance among the instances of its module
+            implementation, indexed by the module instance identifier.
+        metrics (List[Tuple[int, str]]): The module instance identifier and the operation of each metric.
+    """
+
+    PROBE: str = "CM_Probe"
+    METRICS: str = "cm_metrics"
+    INSTANCE_INDEXES: str = "cm_metrics_instance"
+    REPORT: str = "cm_metrics_report"
+    instances: List[Tuple[str, str]] = None
+    instance_indexes: List[int] = None
+    metrics: List[Tuple[int, str]] = None
+    _module_impl_instances: Dict[str, List[int]] = None
+
+    def __init__(self, ecoa_model) -> None:
+        self.instances = []
+        self.instance_indexes = []
+        self.metrics = []
+        self._module_impl_instances = {}
+        # Same order as the module instance identifiers (see ContainerGenerator.generate_modules_id)
+        for key, component_names in ecoa_model.component_names.items():
+            component_impl_name, module_inst_name = tuple(key.split(":"))
+            module_inst = ecoa_model.module_insts.get(key)
+            module_impl_instances = self._module_impl_instances.setdefault(
+                component_impl_name + ":" + module_inst.implementation_name, []
+            )
+            for component_name in component_names:
+                self.instance_indexes.append(len(module_impl_instances))
+                module_impl_instances.append(len(self.instances))
+                self.instances.append((module_inst_name, component_name))
+
+    def generate_probe(self, emitter: Emitter, element: Any, operation_name: str) -> None:
+        """Generates the probe recording the latency of a container function in the metric of its calling module
+        instance.
+
+        Args:
+            emitter (Emitter) : The emitter of the container function, at the beginning of its body.
+            element (Any) : The operation of the container function.
+            operation_name (str) : The name of the container function.
+        """
+        offset = len(self.metrics)
+        for mod_id in self._module_impl_instances.get(element.component_impl_name + ":" + element.module_impl_name, []):
+            self.metrics.append((mod_id, element.module_impl_name + "." + operation_name))
+        if len(self.metrics) == offset:
+            return
+        emitter.write_line(
+            self.PROBE,
+            " cm_probe(",
+            self.METRICS,
+            " + ",
+            str(offset),
+            " + ",
+            self.INSTANCE_INDEXES,
+            "[",
+            Common.generate_mod_id(element.language),
+            "]);",
+        )
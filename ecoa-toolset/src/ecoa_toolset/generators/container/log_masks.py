@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Log masks generation class.
+"""
+
+# Standard library imports
+from typing import Dict, List, Set
+
+# Internal library imports
+from ecoa_toolset.generators.container.common import Common
+from ecoa_toolset.generators.emitter import Emitter
+from ecoa_toolset.models.components import Log, LogType
+
+
+class LogMasks:
+    """The log levels enabled for each module instance by the log policy of the deployment.
+
+    The mask of a module instance has the bit 1 << level set for each enabled level (all the levels if the log policy
+    does not cover the instance). A log container function is generated as a no-op when its level is disabled for all
+    the instances of its module implementation, without check when it is enabled for all of them, and checks the mask
+    of the calling instance before any formatting otherwise.
+
+    Attributes:
+        masks (List[int]): The mask of each module instance, indexed by the module instance identifier (mod_id).
+    """
+
+    TABLE: str = "cm_log_masks"
+    ALL_LEVELS: int = (1 << len(LogType)) - 1
+    masks: List[int] = None
+    _module_impl_masks: Dict[str, Set[int]] = None
+
+    def __init__(self, ecoa_model) -> None:
+        self.masks = []
+        self._module_impl_masks = {}
+        # Same order as the module instance identifiers (see ContainerGenerator.generate_modules_id)
+        for key, component_names in ecoa_model.component_names.items():
+            component_impl_name, module_inst_name = tuple(key.split(":"))
+            module_inst = ecoa_model.module_insts.get(key)
+            module_impl_masks = self._module_impl_masks.setdefault(
+                component_impl_name + ":" + module_inst.implementation_name, set()
+            )
+            for component_name in component_names:
+                levels = ecoa_model.log_levels.get(module_inst_name + ":" + component_name)
+                mask = self.ALL_LEVELS if levels is None else sum(1 << level.value for level in levels)
+                module_impl_masks.add(mask)
+                self.masks.append(mask)
+
+    def generate_check(self, emitter: Emitter, element: Log, log_level: LogType) -> bool:
+        """Generates the check of the mask of the calling module instance, if the level is enabled for some of the
+        instances of the module implementation only.
+
+        Args:
+            emitter (Emitter) : The emitter of the log container function, at the beginning of its body.
+            element (Log) : The log operations of the module implementation.
+            log_level (LogType) : The level of the log container function.
+
+        Returns:
+            bool : False if the level is disabled for all the instances of the module implementation, True otherwise.
+        """
+        bit = 1 << log_level.value
+        masks = self._module_impl_masks.get(element.component_impl_name + ":" + element.module_impl_name, set())
+        enabled = [bool(mask & bit) for mask in masks]
+        if masks and not any(enabled):
+            return False
+        if not all(enabled):
+            emitter.write_line(
+                "if (!(", self.TABLE, "[", Common.generate_mod_id(element.language), "] & ", hex(bit), "))"
+            )
+            with emitter.indented():
+                emitter.write_line("return;")
+        return True
@@ -22,6 +22,8 @@ def generate(self, element: CMGlobalVariable):
             + "CM_GLOBAL_"
             + element.name
         )
+        if element.size is not None:
+            generation += "[" + str(element.size) + "]"
         if element.value:
             generation += " = " + element.value
         generation += ";" + Common.LINE_BREAK[:1]
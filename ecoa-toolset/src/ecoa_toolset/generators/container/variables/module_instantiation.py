@@ -7,7 +7,7 @@
 
 # Standard library imports
 import os
-from typing import List
+from typing import Dict, List
 
 # Internal library imports
 from ecoa_toolset.generators.container.common import Common
@@ -16,17 +16,26 @@
 
 
 class ModuleInstantiationGenerator:
-    """"""
+    """The instantiation of the module instances: their platform hooks, properties and PINFO.
+
+    Attributes:
+        pinfo_mappings (Dict[str, str]): The mapping variable of each PINFO file, by absolute path, with the mmap
+            PINFO access: a file is mapped once and shared by all the module instances referencing it.
+    """
 
     indent_level: int = None
     indent_step: int = None
     visited: List = None
     property_value_helper = None
+    mmap: bool = None
+    pinfo_mappings: Dict[str, str] = None
 
-    def __init__(self, indent_level: int, indent_step: int):
+    def __init__(self, indent_level: int, indent_step: int, pinfo_access: str = Common.STREAM_PINFO_ACCESS):
         self.indent_level = indent_level
         self.indent_step = indent_step
         self.visited = []
+        self.mmap = pinfo_access == Common.MMAP_PINFO_ACCESS
+        self.pinfo_mappings = {}
 
     def _generate_properties_struct_init(self, element: PlatformHook) -> str:
         generation = (
@@ -111,7 +120,19 @@ def _generate_pinfo_struct_init(self, element: PlatformHook) -> str:
             + Common.switch_lang("__", "::", element.language)
             + "uint32 pinfo_index;"
             + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
+        )
+        if self.mmap:
+            generation += (
+                Common.SPACE_INDENTATION[: self.indent_level]
+                + "const "
+                + Common.PINFO_MAPPING
+                + " * pinfo_mapping;"
+                + Common.LINE_BREAK[:1]
+            )
+            self.indent_level -= self.indent_step
+            return generation + Common.SPACE_INDENTATION[: self.indent_level] + "};" + Common.LINE_BREAK[:2]
+        generation += (
+            Common.SPACE_INDENTATION[: self.indent_level]
             + Common.switch_lang("unsigned int", "std::streampos", element.language)
             + " pinfo_size;"
             + Common.LINE_BREAK[:1]
@@ -142,9 +163,51 @@ def _generate_pinfo_files(self, element: PlatformHook) -> str:
         generation += Common.LINE_BREAK[:2]
         return generation
 
+    def _generate_pinfo_mapping(self, pinfo_file_path: str) -> str:
+        path = os.path.abspath(pinfo_file_path)
+        if path in self.pinfo_mappings:
+            return ""
+        name = "cm_pinfo_mapping_" + str(len(self.pinfo_mappings))
+        self.pinfo_mappings[path] = name
+        return (
+            Common.SPACE_INDENTATION[: self.indent_level]
+            + "static "
+            + Common.PINFO_MAPPING
+            + Common.SPACE_INDENTATION[:1]
+            + name
+            + " = {0, 0};"
+            + Common.LINE_BREAK[:2]
+        )
+
+    def _generate_pinfo_mapping_struct(self, element: PlatformHook, component_name: str, pinfo) -> str:
+        pinfo_file_path = pinfo.values.get(
+            element.component_impl_name + ":" + element.module_inst_name + ":" + component_name
+        )
+        return (
+            self._generate_pinfo_mapping(pinfo_file_path)
+            + Common.SPACE_INDENTATION[: self.indent_level]
+            + "struct"
+            + Common.SPACE_INDENTATION[:1]
+            + element.module_impl_name
+            + "_pinfo_struct"
+            + Common.SPACE_INDENTATION[:1]
+            + element.module_inst_name
+            + "_"
+            + component_name
+            + "_pinfo_struct_"
+            + pinfo.name
+            + " = {0, &"
+            + self.pinfo_mappings[os.path.abspath(pinfo_file_path)]
+            + "};"
+            + Common.LINE_BREAK[:2]
+        )
+
     def _generate_pinfo_struct(self, element: PlatformHook, component_name: str) -> str:
         generation = ""
         for pinfo in element.pinfos:
+            if self.mmap:
+                generation += self._generate_pinfo_mapping_struct(element, component_name, pinfo)
+                continue
             pinfo_file_path = pinfo.values.get(
                 element.component_impl_name + ":" + element.module_inst_name + ":" + component_name
             )
@@ -375,7 +438,7 @@ def generate(self, element: PlatformHook, types_helper):
             if element.pinfos:
                 generation += self._generate_pinfo_struct_init(element)
             generation += self._generate_platform_hook_struct_init(element)
-        if element.language == "c++" and element.pinfos:
+        if element.language == "c++" and element.pinfos and not self.mmap:
             generation += self._generate_pinfo_files(element)
         for component_name in element.component_names:
             if element.properties:
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Warm start generation class.
+"""
+
+# Standard library imports
+from typing import List
+
+# Internal library imports
+from ecoa_toolset.generators.container.common import Common
+
+
+class WarmStart:
+    """The warm start contexts of the module instances, saved by the save_warm_start_context container functions and
+    restored at the end of cm_initialize.
+
+    Attributes:
+        contexts (List[str]): The warm start context of each module instance, indexed by the module instance
+            identifier (mod_id), None if its module type has no warm start context.
+    """
+
+    SAVE: str = "cm_warm_start_save"
+    RESTORE: str = "cm_warm_start_restore"
+    contexts: List[str] = None
+
+    def __init__(self, ecoa_model) -> None:
+        self.contexts = []
+        # Same order as the module instance identifiers (see ContainerGenerator.generate_modules_id)
+        for key, component_names in ecoa_model.component_names.items():
+            component_impl_name, module_inst_name = tuple(key.split(":"))
+            module_impl = ecoa_model.module_impls.get(
+                component_impl_name + ":" + ecoa_model.module_insts.get(key).implementation_name
+            )
+            module_type = ecoa_model.module_types.get(component_impl_name + ":" + module_impl.module_type)
+            for component_name in component_names:
+                self.contexts.append(
+                    module_inst_name
+                    + "_"
+                    + component_name
+                    + Common.switch_lang("_Context", "_Module", module_impl.language.lower())
+                    + ".warm_start"
+                    if module_type.has_warm_start_context
+                    else None
+                )
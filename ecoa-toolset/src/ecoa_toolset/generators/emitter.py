@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Emitter of generated source code.
+"""
+
+# Standard library imports
+from typing import List
+
+# Internal library imports
+from ecoa_toolset.generators.common import Common
+
+
+class Emitter:
+    """Accumulates the fragments of a generated source code and tracks its indentation.
+
+    The fragments are appended to a list, joined once by getvalue. The methods are called for each generated line, so
+    they only append to the list: the indentation is computed when it changes, not on each line.
+
+    Attributes:
+        indent_level (int): The current indentation level, in spaces.
+        indent_step (int): The number of spaces added by each indentation.
+    """
+
+    indent_level: int = None
+    indent_step: int = None
+    _indentation: str = None
+    _chunks: List[str] = None
+    _fragments: List[str] = None
+
+    def __init__(self, indent_level: int = 0, indent_step: int = 2) -> None:
+        """The emitter constructor.
+
+        Args:
+            indent_level (int): The initial indentation level, in spaces.
+            indent_step (int): The number of spaces added by each indentation.
+
+        Returns:
+            None.
+        """
+
+        self.indent_level = indent_level
+        self.indent_step = indent_step
+        self._indentation = Common.SPACE_INDENTATION[:indent_level]
+        self._chunks = []
+        self._fragments = []
+
+    @property
+    def indentation(self) -> str:
+        """str: The spaces of the current indentation level."""
+        return self._indentation
+
+    def _join_fragments(self) -> None:
+        self._chunks.append("".join(self._fragments))
+        self._fragments.clear()
+
+    def write(self, *fragments: str) -> None:
+        """Appends fragments to the generation.
+
+        Args:
+            *fragments (str): The fragments to append.
+
+        Returns:
+            None.
+        """
+
+        self._fragments.extend(fragments)
+
+    def write_line(self, *fragments: str) -> None:
+        """Appends an indented line to the generation.
+
+        Args:
+            *fragments (str): The fragments of the line.
+
+        Returns:
+            None.
+        """
+
+        self._fragments += (self._indentation, *fragments, "\n")
+
+    def line_break(self, count: int = 1) -> None:
+        """Appends line breaks to the generation.
+
+        Args:
+            count (int): The number of line breaks.
+
+        Returns:
+            None.
+        """
+
+        self._fragments.append(Common.LINE_BREAK[:count])
+
+    def indent(self) -> None:
+        """Increases the indentation level by one step."""
+        self.indent_level += self.indent_step
+        self._indentation = Common.SPACE_INDENTATION[: self.indent_level]
+
+    def dedent(self) -> None:
+        """Decreases the indentation level by one step."""
+        self.indent_level -= self.indent_step
+        self._indentation = Common.SPACE_INDENTATION[: self.indent_level]
+
+    def indented(self) -> "Emitter":
+        """Increases the indentation level by one step until the end of the with statement using the returned value.
+
+        Returns:
+            Emitter: The emitter, as context manager decreasing the indentation level on exit.
+        """
+
+        self.indent()
+        return self
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        self.dedent()
+
+    def mark(self) -> int:
+        """Returns the current position in the generation, to insert fragments there later.
+
+        Returns:
+            int: The position.
+        """
+
+        self._join_fragments()
+        return len(self._chunks)
+
+    def insert(self, position: int, *fragments: str) -> None:
+        """Inserts fragments at a position returned by mark.
+
+        Args:
+            position (int): The position.
+            *fragments (str): The fragments to insert.
+
+        Returns:
+            None.
+        """
+
+        self._chunks.insert(position, "".join(fragments))
+
+    def getvalue(self) -> str:
+        """Returns the generation.
+
+        Returns:
+            str: The generated source code.
+        """
+
+        self._join_fragments()
+        return "".join(self._chunks)
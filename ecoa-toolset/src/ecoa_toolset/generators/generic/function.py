@@ -10,15 +10,24 @@
 from typing import Any
 
 # Internal library imports
-from ecoa_toolset.generators.common import Common
+from ecoa_toolset.generators.emitter import Emitter
 
 
 class FunctionGenerator(ABC):
-    """Base class for all function's generators."""
+    """Base class for all function's generators.
+
+    The prototype and the body of the function are written to an emitter, which tracks the indentation.
+
+    Attributes:
+        instrumentation (Any): The instrumentation recording the latency of the function, None if the function
+            is not instrumented (see ecoa_toolset.generators.container.instrumentation).
+    """
 
     indent_level: int = None
     indent_step: int = None
     body: bool = None
+    instrumentation: Any = None
+    _emitter: Emitter = None
 
     def __init__(self, indent_level: int, indent_step: int, body: bool):
         super().__init__()
@@ -27,25 +36,41 @@ def __init__(self, indent_level: int, indent_step: int, body: bool):
         self.body = body
 
     @abstractmethod
-    def _generate_prototype(self, element: Any) -> str:
+    def _generate_prototype(self, element: Any) -> None:
         pass
 
     @abstractmethod
-    def _generate_body(self, element: Any) -> str:
+    def _generate_body(self, element: Any) -> None:
         pass
 
-    def generate(self, element: Any) -> str:
-        """"""
-        generation = self._generate_prototype(element)
+    def _generate_probe(self, element: Any, operation_name: str) -> None:
+        if self.instrumentation:
+            self.instrumentation.generate_probe(self._emitter, element, operation_name)
+
+    def _generate_function(self, element: Any) -> None:
+        emitter = self._emitter
+        self._generate_prototype(element)
         if self.body:
-            generation += (
-                Common.LINE_BREAK[:1] + Common.SPACE_INDENTATION[: self.indent_level] + "{" + Common.LINE_BREAK[:1]
-            )
-            self.indent_level += self.indent_step
-            generation += self._generate_body(element) + Common.LINE_BREAK[:1]
-            self.indent_level -= self.indent_step
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "}"
+            emitter.line_break()
+            emitter.write_line("{")
+            with emitter.indented():
+                self._generate_body(element)
+            emitter.line_break()
+            emitter.write(emitter.indentation, "}")
         else:
-            generation += ";"
-        generation += Common.LINE_BREAK[:2]
-        return generation
+            emitter.write(";")
+        emitter.line_break(2)
+
+    def generate(self, element: Any) -> str:
+        """Generates the function.
+
+        Args:
+            element (Any): The element the function is generated for.
+
+        Returns:
+            str: The function prototype, followed by its body if required.
+        """
+
+        self._emitter = Emitter(self.indent_level, self.indent_step)
+        self._generate_function(element)
+        return self._emitter.getvalue()
@@ -24,12 +24,14 @@ class CMGlobalVariable(Variable):
         language: The language
         value: Variable's default value
         is_out: True if the variable is an ouput, False otherwise
+        size: Number of elements if the variable is an array, None otherwise
     """
 
     module_impl_name: str = None
     language: str = None
     value: str = None
     is_out: bool = None
+    size: int = None
 
     def __init__(
         self,
@@ -41,12 +43,14 @@ def __init__(
         language: str,
         value: str,
         is_out: str = False,
+        size: int = None,
     ):
         super().__init__(name, namespace, type, type_category)
         self.module_impl_name = module_impl_name
         self.language = language
         self.value = value
         self.is_out = is_out
+        self.size = size
 
     def accept(self, visitor, **kwargs) -> Any:
         return visitor.visit_CMGlobalVariable(self, **kwargs)
@@ -69,6 +73,7 @@ def _build_global_variables(self):
         request_send = [send for v in self._ecoa_model.requests_send.values() for send in v]
 
         self._add_global_vars_for_versioned_data(data_read, data_written)
+        self._add_global_pools_for_versioned_data(data_read, data_written)
         self._add_global_request_response_id(request_send)
         self._add_global_request_response_instance_id(request_send)
         self._add_global_request_response_out_parameter(request_send)
@@ -128,6 +133,67 @@ def _add_global_vars_for_versioned_data(self, data_read, data_written) -> None:
         self._global_variables["Versioned Data Stamp"] = liste2
         self._global_variables["Versioned Data First Write"] = liste3
 
+    def _add_versioned_data_pools(self, pools, pools_used, vd, instances) -> None:
+        module_impl = self._ecoa_model.module_impls.get(vd.component_impl_name + ":" + vd.module_impl_name)
+        for key, (_, controlled) in instances.items():
+            if not controlled:
+                continue
+            module_inst_name, component_name, component_operation = tuple(key.split(":"))
+            variable_name = module_inst_name + "_" + component_name + "__" + component_operation
+            pools.append(
+                CMGlobalVariable(
+                    variable_name + "_pool",
+                    vd.type.split(":")[0],
+                    vd.type.split(":")[1],
+                    self._ecoa_model.types_helper.get_type_category(vd.type),
+                    module_impl.name,
+                    module_impl.language.lower(),
+                    None,
+                    size=vd.max_versions,
+                )
+            )
+            pools_used.append(
+                CMGlobalVariable(
+                    variable_name + "_pool_used",
+                    "ECOA",
+                    "boolean8",
+                    ecoa_types_2_0.Simple,
+                    module_impl.name,
+                    module_impl.language.lower(),
+                    None,
+                    size=vd.max_versions,
+                )
+            )
+
+    def _add_global_pools_for_versioned_data(self, data_read, data_written) -> None:
+        """Adds the storage of the published values (one per writer instance) and the pools of buffers handed out
+        by the controlled accesses (maxVersions buffers per reader or writer instance).
+        """
+        values = []
+        pools = []
+        pools_used = []
+        for vd in data_read:
+            self._add_versioned_data_pools(pools, pools_used, vd, vd.writers)
+        for vd in data_written:
+            module_impl = self._ecoa_model.module_impls.get(vd.component_impl_name + ":" + vd.module_impl_name)
+            for key in vd.readers.keys():
+                module_inst_name, component_name, component_operation = tuple(key.split(":"))
+                values.append(
+                    CMGlobalVariable(
+                        module_inst_name + "_" + component_name + "__" + component_operation + "_value",
+                        vd.type.split(":")[0],
+                        vd.type.split(":")[1],
+                        self._ecoa_model.types_helper.get_type_category(vd.type),
+                        module_impl.name,
+                        module_impl.language.lower(),
+                        None,
+                    )
+                )
+            self._add_versioned_data_pools(pools, pools_used, vd, vd.readers)
+        self._global_variables["Versioned Data Value"] = values
+        self._global_variables["Versioned Data Pool"] = pools
+        self._global_variables["Versioned Data Pool Usage"] = pools_used
+
     def _add_global_request_response_id(self, request_send) -> None:
         variable_name_list = []
         liste = []
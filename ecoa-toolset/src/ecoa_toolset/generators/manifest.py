@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Dependency manifest used for the incremental generation.
+"""
+
+# Standard library imports
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationManifest:
+    """Records, for each generation unit (e.g. a module directory), the hashes of the ECOA XML files its files
+    were derived from and the files it produced.
+
+    The inputs of a component implementation are its own XML file, the types libraries it uses (transitively),
+    the service definitions, the assembly (wires and property values) and the deployment files.
+    A unit is up to date when its inputs and the generation context (tool version, options) are unchanged
+    and all the files it produced still exist. Only the files owned by the generator are recorded, not the files
+    generated once for the user to complete (e.g. the module sources).
+
+    Attributes:
+        path (str): Path to the manifest file.
+        context (str): The generation context (e.g. tool name, version and options).
+    """
+
+    FILE_NAME: str = ".ecoa_manifest.json"
+    VERSION: int = 2
+    path: str = None
+    context: str = None
+    _ecoa_model = None
+    _directory: str = None
+    _units: Dict[str, Dict] = None
+    _hashes: Dict[str, str] = None
+
+    def __init__(self, ecoa_model, output: str, context: str) -> None:
+        """The generation manifest constructor.
+
+        Args:
+            ecoa_model : The ECOA model.
+            output (str): Path to the output directory holding the manifest file.
+            context (str): The generation context (e.g. tool name, version and options).
+
+        Returns:
+            None.
+        """
+
+        self._ecoa_model = ecoa_model
+        self._directory = os.path.dirname(ecoa_model.project_path)
+        self.path = os.path.join(output, self.FILE_NAME)
+        self.context = context
+        self._units = {}
+        self._hashes = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        if manifest.get("version") == self.VERSION and manifest.get("context") == self.context:
+            self._units = manifest.get("units", {})
+        else:
+            logger.debug("Generation context changed, ignoring the manifest %s", self.path)
+
+    def _hash_file(self, file: str) -> str:
+        if file not in self._hashes:
+            with open(os.path.join(self._directory, file), "rb") as f:
+                self._hashes[file] = hashlib.sha256(f.read()).hexdigest()
+        return self._hashes[file]
+
+    def _get_library_files(self, library_names: List[str]) -> List[str]:
+        xml_types = self._ecoa_model.ecoa_xml_model._types
+        files_by_library = {os.path.basename(file).split(".")[0]: file for file in xml_types.keys()}
+        files = []
+        pending = list(library_names)
+        while pending:
+            file = files_by_library.get(pending.pop())
+            if file and file not in files:
+                files.append(file)
+                pending.extend(use.library for use in xml_types[file].use)
+        return sorted(files)
+
+    def get_component_inputs(self, component_path: str) -> Dict[str, str]:
+        """Computes the inputs of a component implementation.
+
+        Args:
+            component_path (str): Path to the component implementation XML file, relative to the project.
+
+        Returns:
+            Dict[str, str]: The hash of each input file.
+        """
+
+        xml_model = self._ecoa_model.ecoa_xml_model
+        component_impl = xml_model._components[component_path]
+        files = [component_path]
+        files += self._get_library_files([use.library for use in component_impl.use])
+        files += list(xml_model._services.keys())
+        files += list(xml_model._assembly.keys())
+        files += list(xml_model._deployment.keys())
+        return {file: self._hash_file(file) for file in files}
+
+    def is_up_to_date(self, unit: str, inputs: Dict[str, str]) -> bool:
+        """Checks if a generation unit can be skipped.
+
+        Args:
+            unit (str): The generation unit identifier.
+            inputs (Dict[str, str]): The hash of each input file of the unit.
+
+        Returns:
+            bool: True if the inputs are unchanged and all the generated files exist, False otherwise.
+        """
+
+        entry = self._units.get(unit)
+        if entry is None or entry["inputs"] != inputs:
+            return False
+        return all(os.path.exists(output) for output in entry["outputs"])
+
+    def update(self, unit: str, inputs: Dict[str, str], paths: List[str]) -> None:
+        """Records the inputs and the files owned by the generator for a generation unit.
+
+        Args:
+            unit (str): The generation unit identifier.
+            inputs (Dict[str, str]): The hash of each input file of the unit.
+            paths (List[str]): The files owned by the generator and the directories holding only such files.
+
+        Returns:
+            None.
+        """
+
+        outputs = []
+        for path in paths:
+            if os.path.isdir(path):
+                for root, _, files in os.walk(path):
+                    outputs.extend(os.path.join(root, file) for file in files)
+            else:
+                outputs.append(path)
+        self._units[unit] = {"inputs": inputs, "outputs": sorted(outputs)}
+
+    def save(self) -> None:
+        """Writes the manifest file.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+
+        with open(self.path, "w") as f:
+            json.dump({"version": self.VERSION, "context": self.context, "units": self._units}, f, indent=2)
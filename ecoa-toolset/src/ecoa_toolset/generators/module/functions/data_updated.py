@@ -18,45 +18,32 @@ class DataUpdatedGenerator(FunctionGenerator):
     def __init__(self, indent_level: int, indent_step: int, body: bool):
         super().__init__(indent_level, indent_step, body)
 
-    def _generate_prototype(self, element: DataRead) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "void"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
+    def _generate_prototype(self, element: DataRead) -> None:
+        emitter = self._emitter
+        emitter.write_line("void")
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(element.module_impl_name + "__", "Module::" if self.body else "", element.language),
+            element.name + "__updated (",
         )
-        generation += Common.switch_lang(
-            element.module_impl_name + "__", "Module::" if self.body else "", element.language
-        )
-        generation += element.name + "__updated (" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
-        if element.language == "c":
-            generation += (
-                Common.SPACE_INDENTATION[: self.indent_level]
-                + element.module_impl_name
-                + "__context * context"
-                + Common.LINE_BREAK[:1]
-            )
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
-
-    def _generate_body(self, element: DataRead) -> str:
-        generation = ""
+        emitter.line_break()
+        with emitter.indented():
+            if element.language == "c":
+                emitter.write_line(element.module_impl_name + "__context * context")
+        emitter.write(emitter.indentation, ")")
+
+    def _generate_body(self, element: DataRead) -> None:
+        emitter = self._emitter
         if element.language == "c":
-            generation += Common.SPACE_INDENTATION[: self.indent_level] + "(void) context;" + Common.LINE_BREAK[:1]
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + "// Insert logic here."
-        return generation
+            emitter.write_line("(void) context;")
+        emitter.write(emitter.indentation, "// Insert logic here.")
 
-    def generate(self, element: DataRead) -> str:
-        """"""
-        generation = ""
+    def _generate_function(self, element: DataRead) -> None:
         if self.body:
             arguments = []
             if element.language == "c":
                 arguments = [
                     Parameter("context", element.module_impl_name, "context", ecoa_types_2_0.Record)
                 ] + arguments
-            generation += Common.generate_function_header_comment(arguments)
-        generation += super().generate(element)
-        return generation
+            self._emitter.write(Common.generate_function_header_comment(arguments))
+        super()._generate_function(element)
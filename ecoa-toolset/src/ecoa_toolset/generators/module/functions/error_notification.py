@@ -19,76 +19,38 @@ class ErrorNotificationGenerator(FunctionGenerator):
     def __init__(self, indent_level: int, indent_step: int, body: bool):
         super().__init__(indent_level, indent_step, body)
 
-    def _generate_prototype(self, element: Tuple) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "void"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
+    def _generate_prototype(self, element: Tuple) -> None:
+        emitter = self._emitter
+        emitter.write_line("void")
+        emitter.write(
+            emitter.indentation,
+            Common.switch_lang(element[0] + "__", "Module::" if self.body else "", element[1]),
+            "error_notification (",
         )
-        generation += Common.switch_lang(element[0] + "__", "Module::" if self.body else "", element[1])
-        generation += "error_notification (" + Common.LINE_BREAK[:1]
-        self.indent_level += self.indent_step
-        generation += (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + Common.switch_lang(element[0] + "__context * context", "ECOA::error_id error_id", element[1])
-            + ","
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "const ECOA"
-            + Common.switch_lang("__", "::", element[1])
-            + "global_time "
-            + Common.switch_lang("*", "&", element[1])
-            + " timestamp,"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element[1])
-            + "asset_id asset_id,"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element[1])
-            + "asset_type asset_type,"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element[1])
-            + "error_type error_type,"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "ECOA"
-            + Common.switch_lang("__", "::", element[1])
-            + "error_code error_code"
-            + Common.LINE_BREAK[:1]
-        )
-        self.indent_level -= self.indent_step
-        generation += Common.SPACE_INDENTATION[: self.indent_level] + ")"
-        return generation
-
-    def _generate_body(self, element: Tuple) -> str:
-        generation = (
-            Common.SPACE_INDENTATION[: self.indent_level]
-            + "(void) "
-            + Common.switch_lang("context", "error_id", element[1])
-            + ";"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "(void) timestamp;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "(void) asset_id;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "(void) asset_type;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "(void) error_type;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "(void) error_code;"
-            + Common.LINE_BREAK[:1]
-            + Common.SPACE_INDENTATION[: self.indent_level]
-            + "// Insert logic here."
-        )
-        return generation
+        emitter.line_break()
+        with emitter.indented():
+            emitter.write_line(
+                Common.switch_lang(element[0] + "__context * context", "ECOA::error_id error_id", element[1]), ","
+            )
+            emitter.write_line(
+                "const ECOA",
+                Common.switch_lang("__", "::", element[1]),
+                "global_time ",
+                Common.switch_lang("*", "&", element[1]),
+                " timestamp,",
+            )
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", element[1]), "asset_id asset_id,")
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", element[1]), "asset_type asset_type,")
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", element[1]), "error_type error_type,")
+            emitter.write_line("ECOA", Common.switch_lang("__", "::", element[1]), "error_code error_code")
+        emitter.write(emitter.indentation, ")")
+
+    def _generate_body(self, element: Tuple) -> None:
+        emitter = self._emitter
+        emitter.write_line("(void) ", Common.switch_lang("context", "error_id", element[1]), ";")
+        emitter.write_line("(void) timestamp;")
+        emitter.write_line("(void) asset_id;")
+        emitter.write_line("(void) asset_type;")
+        emitter.write_line("(void) error_type;")
+        emitter.write_line("(void) error_code;")
+        emitter.write(emitter.indentation, "// Insert logic here.")
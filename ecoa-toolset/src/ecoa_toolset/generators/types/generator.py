@@ -7,10 +7,9 @@
 # Standard library imports
 import logging
 import os
+import pkgutil
 from typing import Any, List
 
-import pkg_resources
-
 # Internal library imports
 from ecoa_toolset.generators.common import Common
 from ecoa_toolset.generators.types.derived.array import ArrayGenerator
@@ -166,7 +165,7 @@ def _generate_custom_librairies(self, language: str, ext: str) -> None:
 
     def _generate_ecoa_library(self, language: str, ext: str) -> None:
         file_name = "ECOA" + ext
-        generation = pkg_resources.resource_string(__name__, "./basic/" + file_name).decode("utf-8")
+        generation = pkgutil.get_data(__name__, "basic/" + file_name).decode("utf-8")
         generation = generation.replace("\r\n", "\n").replace("\r", "\n")
         file_path = os.path.join(self._path, file_name)
         try:
@@ -5,7 +5,7 @@
 """TypesSorter class."""
 
 # Standard library imports
-from typing import Any, List
+from typing import Any, Iterator, List
 
 # Internal library imports
 from ecoa_toolset.models.ecoa_objects import ecoa_types_2_0
@@ -18,14 +18,20 @@ class TypesSorter:
         _ecoa_model : The ECOA Model.
         _library_name (str) : The library name.
         _types (ecoa_types_2_0.DataTypes) : The types.
+        _types_by_name (Dict) : The types by name.
         _ordered_types (List) : The ordered types.
+        _visited (Set) : The identifiers of the ordered types.
     """
 
     def __init__(self, ecoa_model, library_name: str, types: ecoa_types_2_0.DataTypes):
         self._ecoa_model = ecoa_model
         self._library_name = library_name
         self._types = self._construct_types(types)
+        self._types_by_name = {}
+        for element in self._types:
+            self._types_by_name.setdefault(element.name, []).append(element)
         self._ordered_types = []
+        self._visited = set()
 
     def _construct_types(self, types: ecoa_types_2_0.DataTypes) -> List:
         types_name = [
@@ -43,55 +49,87 @@ def _construct_types(self, types: ecoa_types_2_0.DataTypes) -> List:
             types_list = [*types_list, *tmp]
         return types_list
 
-    def _find_constant_reference(self, value: str) -> None:
+    def _get_constant_reference(self, value: str) -> List[str]:
         if value and value[0] == "%" and value[-1] == "%":
-            self._find_type_dependency(value[1:-1])
+            return [value[1:-1]]
+        return []
 
-    def _find_type_dependency(self, type_to_find: str) -> None:
+    def _find_type_dependency(self, type_to_find: str) -> List[Any]:
         complete_type_to_find = self._ecoa_model.types_helper.add_namespace(type_to_find)
         namespace = self._ecoa_model.types_helper.get_namespace(complete_type_to_find)
         type_name = self._ecoa_model.types_helper.get_name(complete_type_to_find)
         if namespace == self._library_name:
-            for other in self._types:
-                if other.name == type_name and other not in self._ordered_types:
-                    self._find_dependencies(other)
+            return self._types_by_name.get(type_name, [])
+        return []
 
-    def _find_dependencies(self, element: Any) -> None:
+    def _get_dependencies_names(self, element: Any) -> List[str]:
         if isinstance(element, ecoa_types_2_0.Constant):
-            self._find_type_dependency(element.type)
-            self._find_constant_reference(element.value)
+            return [element.type, *self._get_constant_reference(element.value)]
         elif isinstance(element, ecoa_types_2_0.Enum):
-            self._find_type_dependency(element.type)
-            for value in element.value:
-                self._find_constant_reference(value.valnum)
+            return [
+                element.type,
+                *[name for value in element.value for name in self._get_constant_reference(value.valnum)],
+            ]
         elif isinstance(element, ecoa_types_2_0.Simple):
-            self._find_type_dependency(element.type)
-            self._find_constant_reference(element.min_range)
-            self._find_constant_reference(element.max_range)
-            self._find_constant_reference(element.precision)
+            return [
+                element.type,
+                *self._get_constant_reference(element.min_range),
+                *self._get_constant_reference(element.max_range),
+                *self._get_constant_reference(element.precision),
+            ]
         elif isinstance(element, (ecoa_types_2_0.Array, ecoa_types_2_0.FixedArray)):
-            self._find_type_dependency(element.item_type)
-            self._find_constant_reference(element.max_number)
+            return [element.item_type, *self._get_constant_reference(element.max_number)]
         elif isinstance(element, ecoa_types_2_0.Record):
-            for field in element.field:
-                self._find_type_dependency(field.type)
+            return [field.type for field in element.field]
         elif isinstance(element, ecoa_types_2_0.VariantRecord):
-            field_list = {f.type for f in element.field}
-            union_list = {f.type for f in element.union}
-            all_types = {element.select_type}.union(field_list, union_list)
-            for type in all_types:
-                self._find_type_dependency(type)
-        self._ordered_types.append(element)
+            # dict.fromkeys removes the duplicates while keeping a stable order
+            return list(
+                dict.fromkeys([element.select_type, *[f.type for f in element.field], *[f.type for f in element.union]])
+            )
+        return []
+
+    def _find_dependencies(self, element: Any) -> Iterator[Any]:
+        for name in self._get_dependencies_names(element):
+            yield from self._find_type_dependency(name)
+
+    def _raise_cycle_error(self, stack: List, dependency: Any) -> None:
+        chain = [element for element, _ in stack]
+        chain = chain[next(index for index, element in enumerate(chain) if element is dependency) :]
+        raise ValueError(
+            f"Cycle detected between the types of the library {self._library_name}: "
+            + " -> ".join(element.name for element in [*chain, dependency])
+        )
+
+    def _visit(self, root: Any) -> None:
+        # Iterative depth-first search, the types are ordered after all their dependencies (post-order)
+        stack = [(root, self._find_dependencies(root))]
+        in_progress = {id(root)}
+        while stack:
+            element, dependencies = stack[-1]
+            dependency = next((d for d in dependencies if id(d) not in self._visited), None)
+            if dependency is None:
+                stack.pop()
+                in_progress.discard(id(element))
+                self._visited.add(id(element))
+                self._ordered_types.append(element)
+            elif id(dependency) in in_progress:
+                self._raise_cycle_error(stack, dependency)
+            else:
+                in_progress.add(id(dependency))
+                stack.append((dependency, self._find_dependencies(dependency)))
 
     def sort(self) -> List:
         """Sort the types by dependencies.
 
         Return:
             List : The ordered types.
+
+        Raise:
+            ValueError : If the types dependencies contain a cycle.
         """
         if self._ordered_types:
             return self._ordered_types
         for element in self._types:
-            if element not in self._ordered_types:
-                self._find_dependencies(element)
+            if id(element) not in self._visited:
+                self._visit(element)
         return self._ordered_types
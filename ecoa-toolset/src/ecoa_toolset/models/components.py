@@ -7,6 +7,7 @@
 
 # Standard library imports
 import logging
+import sys
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any, Dict, List
@@ -14,8 +15,19 @@
 logger = logging.getLogger(__name__)
 
 
+def _intern(name: str) -> str:
+    # The same names are held by many components, interned they are stored once
+    return sys.intern(name) if isinstance(name, str) else name
+
+
 class Component(ABC):
-    """The base class of all ECOA objects."""
+    """The base class of all ECOA objects.
+
+    The components are slotted, a large project holding hundreds of thousands of them: the attributes of each class
+    are declared by its __slots__, without class-level default.
+    """
+
+    __slots__ = ()
 
     @abstractmethod
     def accept(self, visitor, **kwargs) -> None:
@@ -32,15 +44,17 @@ class Variable(Component):
         type_category: Variable's type_category
     """
 
-    name: str = None
-    namespace: str = None
-    type: str = None
-    type_category = None
+    __slots__ = ("name", "namespace", "type", "type_category")
+
+    name: str
+    namespace: str
+    type: str
+    type_category: Any
 
     def __init__(self, name: str, namespace: str, type: str, type_category):
-        self.name = name
-        self.namespace = namespace
-        self.type = type
+        self.name = _intern(name)
+        self.namespace = _intern(namespace)
+        self.type = _intern(type)
         self.type_category = type_category
 
     def accept(self, visitor, **kwargs) -> Any:
@@ -55,6 +69,8 @@ class Parameter(Variable):
         type: Parameter's type
     """
 
+    __slots__ = ()
+
     def accept(self, visitor, **kwargs) -> Any:
         return visitor.visit_parameter(self, **kwargs)
 
@@ -68,16 +84,18 @@ class Time(Component):
         module_impl_name: Module implementation name
     """
 
-    component_impl_name: str = None
-    module_type_name: str = None
-    module_impl_name: str = None
-    language: str = None
+    __slots__ = ("component_impl_name", "module_type_name", "module_impl_name", "language")
+
+    component_impl_name: str
+    module_type_name: str
+    module_impl_name: str
+    language: str
 
     def __init__(self, component_impl_name: str, module_type_name: str, module_impl_name: str, language: str):
-        self.component_impl_name = component_impl_name
-        self.module_type_name = module_type_name
-        self.module_impl_name = module_impl_name
-        self.language = language
+        self.component_impl_name = _intern(component_impl_name)
+        self.module_type_name = _intern(module_type_name)
+        self.module_impl_name = _intern(module_impl_name)
+        self.language = _intern(language)
 
     def accept(self, visitor, **kwargs) -> Any:
         return visitor.visit_time(self, **kwargs)
@@ -101,16 +119,18 @@ class Log(Component):
         module_impl_name: Module implementation name
     """
 
-    component_impl_name: str = None
-    module_type_name: str = None
-    module_impl_name: str = None
-    language: str = None
+    __slots__ = ("component_impl_name", "module_type_name", "module_impl_name", "language")
+
+    component_impl_name: str
+    module_type_name: str
+    module_impl_name: str
+    language: str
 
     def __init__(self, component_impl_name: str, module_type_name: str, module_impl_name: str, language: str):
-        self.component_impl_name = component_impl_name
-        self.module_type_name = module_type_name
-        self.module_impl_name = module_impl_name
-        self.language = language
+        self.component_impl_name = _intern(component_impl_name)
+        self.module_type_name = _intern(module_type_name)
+        self.module_impl_name = _intern(module_impl_name)
+        self.language = _intern(language)
 
     def accept(self, visitor, **kwargs) -> Any:
         return visitor.visit_log(self, **kwargs)
@@ -119,12 +139,15 @@ def accept(self, visitor, **kwargs) -> Any:
 class Link:
     """The Link."""
 
-    type: str = None
-    instance_name: str = None
-    operation_name: str = None
-    activating: bool = None
-    language: str = None
-    controlled: bool = None
+    __slots__ = ("type", "instance_name", "operation_name", "activating", "language", "controlled", "period")
+
+    type: str
+    instance_name: str
+    operation_name: str
+    activating: bool
+    language: str
+    controlled: bool
+    period: float
 
     def __init__(
         self,
@@ -134,34 +157,39 @@ def __init__(
         activating: bool,
         language: str,
         controlled: bool = None,
+        period: float = None,
     ):
-        self.type = type
-        self.instance_name = instance_name
-        self.operation_name = operation_name
+        self.type = _intern(type)
+        self.instance_name = _intern(instance_name)
+        self.operation_name = _intern(operation_name)
         self.activating = activating
-        self.language = language
+        self.language = _intern(language)
         self.controlled = controlled
+        self.period = period
 
 
 class External(Component):
     """The External."""
 
-    component_impl_name: str = None
-    name: str = None
-    inputs: List[Parameter] = None
-    language: str = None
-    links: Dict[Link, List[Link]] = None
-    receivers: Dict = None
+    __slots__ = ("component_impl_name", "name", "inputs", "language", "links", "receivers")
+
+    component_impl_name: str
+    name: str
+    inputs: List[Parameter]
+    language: str
+    links: Dict[Link, List[Link]]
+    receivers: Dict
 
     def __init__(self, component_impl_name: str, name: str, language: str, links: Dict[Link, List[Link]]):
-        self.component_impl_name = component_impl_name
-        self.name = name
-        self.language = language
+        self.component_impl_name = _intern(component_impl_name)
+        self.name = _intern(name)
+        self.inputs = None
+        self.language = _intern(language)
         self.links = links
         self.receivers = {}
 
     def add_receiver(self, key_receiver: str, receiver: Any) -> None:
-        self.receivers[key_receiver] = receiver
+        self.receivers[_intern(key_receiver)] = receiver
 
     def accept(self, visitor, **kwargs) -> Any:
         return visitor.visit_external(self, **kwargs)
@@ -170,32 +198,40 @@ def accept(self, visitor, **kwargs) -> Any:
 class Trigger:
     """The Trigger."""
 
-    component_impl_name: str = None
-    name: str = None
-    links: Dict[Link, List[Link]] = None
-    receivers: Dict = None
+    __slots__ = ("component_impl_name", "name", "links", "receivers", "periods")
+
+    component_impl_name: str
+    name: str
+    links: Dict[Link, List[Link]]
+    receivers: Dict
+    periods: Dict[str, float]
 
     def __init__(self, component_impl_name: str, name: str, links: Dict[Link, List[Link]]):
-        self.component_impl_name = component_impl_name
-        self.name = name
+        self.component_impl_name = _intern(component_impl_name)
+        self.name = _intern(name)
         self.links = links
         self.receivers = {}
+        self.periods = {}
 
-    def add_receiver(self, key_receiver: str, receiver: Any) -> None:
+    def add_receiver(self, key_receiver: str, receiver: Any, period: float = None) -> None:
+        key_receiver = _intern(key_receiver)
         self.receivers[key_receiver] = receiver
+        self.periods[key_receiver] = period
 
 
 class DynamicTrigger:
     """The Dynamic Trigger."""
 
-    component_impl_name: str = None
-    name: str = None
-    parameters: List[Parameter] = None
-    links: Dict[Link, List[Link]] = None
+    __slots__ = ("component_impl_name", "name", "parameters", "links")
+
+    component_impl_name: str
+    name: str
+    parameters: List[Parameter]
+    links: Dict[Link, List[Link]]
 
     def __init__(self, component_impl_name: str, name: str, parameters: List[Parameter], links: Dict[Link, List[Link]]):
-        self.component_impl_name = component_impl_name
-        self.name = name
+        self.component_impl_name = _intern(component_impl_name)
+        self.name = _intern(name)
         self.parameters = parameters
         self.links = links
 
@@ -203,13 +239,16 @@ def __init__(self, component_impl_name: str, name: str, parameters: List[Paramet
 class DynamicTriggerSend(DynamicTrigger):
     """The Dynamic Trigger Send."""
 
-    receivers: Dict = None
+    __slots__ = ("receivers",)
+
+    receivers: Dict
 
     def __init__(self, component_impl_name: str, name: str, parameters: List[Parameter], links: Dict[Link, List[Link]]):
         super().__init__(component_impl_name, name, parameters, links)
         self.receivers = {}
 
     def add_receiver(self, key_sender: str, key_receiver: str, receiver: Any) -> None:
+        key_sender, key_receiver = _intern(key_sender), _intern(key_receiver)
         if self.receivers.get(key_sender):
             self.receivers[key_sender][key_receiver] = receiver
         else:
@@ -219,13 +258,16 @@ def add_receiver(self, key_sender: str, key_receiver: str, receiver: Any) -> Non
 class DynamicTriggerReceived(DynamicTrigger):
     """The Dynamic Trigger Received."""
 
-    senders: Dict = None
+    __slots__ = ("senders",)
+
+    senders: Dict
 
     def __init__(self, component_impl_name: str, name: str, parameters: List[Parameter], links: Dict[Link, List[Link]]):
         super().__init__(component_impl_name, name, parameters, links)
         self.senders = {}
 
     def add_sender(self, key_receiver: str, key_sender: str, sender: Any) -> None:
+        key_receiver, key_sender = _intern(key_receiver), _intern(key_sender)
         if self.senders.get(key_receiver):
             self.senders[key_receiver][key_sender] = sender
         else:
@@ -235,14 +277,25 @@ def add_sender(self, key_receiver: str, key_sender: str, sender: Any) -> None:
 class EventSend(Component):
     """The Event Send."""
 
-    component_impl_name: str = None
-    module_type_name: str = None
-    module_impl_name: str = None
-    language: str = None
-    name: str = None
-    inputs: List[Parameter] = None
-    links: Dict[Link, List[Link]] = None
-    receivers: Dict = None
+    __slots__ = (
+        "component_impl_name",
+        "module_type_name",
+        "module_impl_name",
+        "language",
+        "name",
+        "inputs",
+        "links",
+        "receivers",
+    )
+
+    component_impl_name: str
+    module_type_name: str
+    module_impl_name: str
+    language: str
+    name: str
+    inputs: List[Parameter]
+    links: Dict[Link, List[Link]]
+    receivers: Dict
 
     def __init__(
         self,
@@ -254,16 +307,17 @@ def __init__(
         inputs: List[Parameter],
         links: Dict[Link, List[Link]],
     ):
-        self.component_impl_name = component_impl_name
-        self.module_type_name = module_type_name
-        self.module_impl_name = module_impl_name
-        self.language = language
-        self.name = name
+        self.component_impl_name = _intern(component_impl_name)
+        self.module_type_name = _intern(module_type_name)
+        self.module_impl_name = _intern(module_impl_name)
+        self.language = _intern(language)
+        self.name = _intern(name)
         self.inputs = inputs
         self.links = links
         self.receivers = {}
 
     def add_receiver(self, key_sender: str, key_receiver: str, receiver: Any) -> None:
+        key_sender, key_receiver = _intern(key_sender), _intern(key_receiver)
         if self.receivers.get(key_sender):
             self.receivers[key_sender][key_receiver] = receiver
         else:
@@ -276,8 +330,10 @@ def accept(self, visitor, **kwargs) -> Any:
 class RequestSend(EventSend):
     """The Request Send."""
 
-    is_synchronous: bool = None
-    outputs: List[Parameter] = None
+    __slots__ = ("is_synchronous", "outputs")
+
+    is_synchronous: bool
+    outputs: List[Parameter]
 
     def __init__(
         self,
@@ -302,14 +358,25 @@ def accept(self, visitor, **kwargs) -> Any:
 class EventReceived(Component):
     """The Event Received."""
 
-    component_impl_name: str = None
-    module_type_name: str = None
-    module_impl_name: str = None
-    language: str = None
-    name: str = None
-    inputs: List[Parameter] = None
-    links: Dict[Link, List[Link]] = None
-    senders: Dict = None
+    __slots__ = (
+        "component_impl_name",
+        "module_type_name",
+        "module_impl_name",
+        "language",
+        "name",
+        "inputs",
+        "links",
+        "senders",
+    )
+
+    component_impl_name: str
+    module_type_name: str
+    module_impl_name: str
+    language: str
+    name: str
+    inputs: List[Parameter]
+    links: Dict[Link, List[Link]]
+    senders: Dict
 
     def __init__(
         self,
@@ -321,16 +388,17 @@ def __init__(
         inputs: List[Parameter],
         links: Dict[Link, List[Link]],
     ):
-        self.component_impl_name = component_impl_name
-        self.module_type_name = module_type_name
-        self.module_impl_name = module_impl_name
-        self.language = language
-        self.name = name
+        self.component_impl_name = _intern(component_impl_name)
+        self.module_type_name = _intern(module_type_name)
+        self.module_impl_name = _intern(module_impl_name)
+        self.language = _intern(language)
+        self.name = _intern(name)
         self.inputs = inputs
         self.links = links
         self.senders = {}
 
     def add_sender(self, key_receiver: str, key_sender: str, sender: Any) -> None:
+        key_receiver, key_sender = _intern(key_receiver), _intern(key_sender)
         if self.senders.get(key_receiver):
             self.senders[key_receiver][key_sender] = sender
         else:
@@ -343,7 +411,9 @@ def accept(self, visitor, **kwargs) -> Any:
 class RequestReceived(EventReceived):
     """The Request Received."""
 
-    outputs: List[Parameter] = None
+    __slots__ = ("outputs",)
+
+    outputs: List[Parameter]
 
     def __init__(
         self,
@@ -366,14 +436,25 @@ def accept(self, visitor, **kwargs) -> Any:
 class VersionedData(Component):
     """The Versioned Data."""
 
-    component_impl_name: str = None
-    module_type_name: str = None
-    module_impl_name: str = None
-    language: str = None
-    name: str = None
-    type: str = None
-    max_versions: int = None
-    links: Dict[Link, List[Link]] = None
+    __slots__ = (
+        "component_impl_name",
+        "module_type_name",
+        "module_impl_name",
+        "language",
+        "name",
+        "type",
+        "max_versions",
+        "links",
+    )
+
+    component_impl_name: str
+    module_type_name: str
+    module_impl_name: str
+    language: str
+    name: str
+    type: str
+    max_versions: int
+    links: Dict[Link, List[Link]]
 
     def __init__(
         self,
@@ -386,12 +467,12 @@ def __init__(
         max_versions: int,
         links: Dict[Link, List[Link]],
     ):
-        self.component_impl_name = component_impl_name
-        self.module_type_name = module_type_name
-        self.module_impl_name = module_impl_name
-        self.language = language
-        self.name = name
-        self.type = type
+        self.component_impl_name = _intern(component_impl_name)
+        self.module_type_name = _intern(module_type_name)
+        self.module_impl_name = _intern(module_impl_name)
+        self.language = _intern(language)
+        self.name = _intern(name)
+        self.type = _intern(type)
         self.max_versions = max_versions
         self.links = links
 
@@ -399,8 +480,10 @@ def __init__(
 class DataRead(VersionedData):
     """The Data Read."""
 
-    notifying: bool = None
-    writers: Dict = None
+    __slots__ = ("notifying", "writers")
+
+    notifying: bool
+    writers: Dict
 
     def __init__(
         self,
@@ -421,6 +504,7 @@ def __init__(
         self.writers = {}
 
     def add_writer(self, key_reader, key_writer, writer) -> None:
+        key_reader, key_writer = _intern(key_reader), _intern(key_writer)
         if self.writers.get(key_reader):
             self.writers[key_reader][key_writer] = writer
         else:
@@ -433,9 +517,11 @@ def accept(self, visitor, **kwargs) -> Any:
 class DataWritten(VersionedData):
     """The Data Written."""
 
-    write_only: bool = None
-    readers: Dict = None
-    links_written: Dict[Link, List[Link]] = None
+    __slots__ = ("write_only", "readers", "links_written")
+
+    write_only: bool
+    readers: Dict
+    links_written: Dict[Link, List[Link]]
 
     def __init__(
         self,
@@ -458,6 +544,7 @@ def __init__(
         self.links_written = links_written
 
     def add_reader(self, key_writer: str, key_reader: str, reader) -> None:
+        key_writer, key_reader = _intern(key_writer), _intern(key_reader)
         if self.readers.get(key_writer):
             self.readers[key_writer][key_reader] = reader
         else:
@@ -481,10 +568,12 @@ class Property(Variable):
         values: Property's values
     """
 
-    component_impl_name: str = None
-    module_impl_name: str = None
-    language: str = None
-    values: Dict = None
+    __slots__ = ("component_impl_name", "module_impl_name", "language", "values")
+
+    component_impl_name: str
+    module_impl_name: str
+    language: str
+    values: Dict
 
     def __init__(
         self,
@@ -498,9 +587,9 @@ def __init__(
         values: Dict,
     ):
         super().__init__(name, namespace, type, type_category)
-        self.component_impl_name = component_impl_name
-        self.module_impl_name = module_impl_name
-        self.language = language
+        self.component_impl_name = _intern(component_impl_name)
+        self.module_impl_name = _intern(module_impl_name)
+        self.language = _intern(language)
         self.values = values
 
     def accept(self, visitor, **kwargs) -> Any:
@@ -510,12 +599,14 @@ def accept(self, visitor, **kwargs) -> Any:
 class Pinfo(Component):
     """The Pinfo component."""
 
-    component_impl_name: str = None
-    module_impl_name: str = None
-    language: str = None
-    name: str = None
-    is_private: bool = None
-    values: Dict = None
+    __slots__ = ("component_impl_name", "module_impl_name", "language", "name", "is_private", "values")
+
+    component_impl_name: str
+    module_impl_name: str
+    language: str
+    name: str
+    is_private: bool
+    values: Dict
 
     def __init__(
         self,
@@ -526,10 +617,10 @@ def __init__(
         is_private: bool,
         values: Dict,
     ):
-        self.component_impl_name = component_impl_name
-        self.module_impl_name = module_impl_name
-        self.language = language
-        self.name = name
+        self.component_impl_name = _intern(component_impl_name)
+        self.module_impl_name = _intern(module_impl_name)
+        self.language = _intern(language)
+        self.name = _intern(name)
         self.is_private = is_private
         self.values = values
 
@@ -8,7 +8,8 @@
 # Standard library imports
 import logging
 import os
-from typing import Dict, List
+import re
+from typing import Dict, List, Set, Tuple
 
 # Internal library imports
 from ecoa_toolset.models.checkers.languages import LanguagesChecker
@@ -22,6 +23,7 @@
     EventSend,
     External,
     Log,
+    LogType,
     Parameter,
     Pinfo,
     Property,
@@ -42,6 +44,7 @@
 from ecoa_toolset.models.parsers.pinfos import PinfosParser
 from ecoa_toolset.models.parsers.properties import PropertiesParser
 from ecoa_toolset.models.parsers.requests import RequestsParser
+from ecoa_toolset.models.xml_cache import XMLCache
 
 logger = logging.getLogger(__name__)
 
@@ -53,38 +56,124 @@ class ECOAModel:
     project_path: str = None
     ecoa_xml_model: ECOAXMLModel = None
     types_helper: TypeHelper = None
-    types: Dict = {}
-    use: Dict = {}
-    services: Dict = {}
-    components: Dict = {}
-    module_impls: Dict = {}
-    module_types: Dict = {}
-    module_insts: Dict = {}
-    component_names: Dict[str, List[str]] = {}
-    logs: Dict[str, Log] = {}
-    times: Dict[str, Time] = {}
-    events_received: Dict[str, List[EventReceived]] = {}
-    events_send: Dict[str, List[EventSend]] = {}
-    externals: Dict[str, List[External]] = {}
-    triggers: Dict[str, List[Trigger]] = {}
-    dynamic_triggers_received: Dict[str, List[DynamicTriggerReceived]] = {}
-    dynamic_triggers_send: Dict[str, List[DynamicTriggerSend]] = {}
-    requests_received: Dict[str, List[RequestReceived]] = {}
-    requests_send: Dict[str, List[RequestSend]] = {}
-    data_read: Dict[str, List[DataRead]] = {}
-    data_written: Dict[str, List[DataWritten]] = {}
-    properties: Dict[str, List[Property]] = {}
-    pinfos: Dict[str, List[Pinfo]] = {}
-
-    def __init__(self, project_name: str, path: str):
+    _jobs: int = 1
+    _cache: XMLCache = None
+    _xsd: str = None
+    _fast_parsing: bool = False
+    types: Dict = None
+    use: Dict = None
+    services: Dict = None
+    components: Dict = None
+    module_impls: Dict = None
+    module_types: Dict = None
+    module_insts: Dict = None
+    component_names: Dict[str, List[str]] = None
+    protection_domains: Dict[str, str] = None
+    priorities: Dict[str, int] = None
+    log_levels: Dict[str, Set[LogType]] = None
+    logs: Dict[str, Log] = None
+    times: Dict[str, Time] = None
+    events_received: Dict[str, List[EventReceived]] = None
+    events_send: Dict[str, List[EventSend]] = None
+    externals: Dict[str, List[External]] = None
+    triggers: Dict[str, List[Trigger]] = None
+    dynamic_triggers_received: Dict[str, List[DynamicTriggerReceived]] = None
+    dynamic_triggers_send: Dict[str, List[DynamicTriggerSend]] = None
+    requests_received: Dict[str, List[RequestReceived]] = None
+    requests_send: Dict[str, List[RequestSend]] = None
+    data_read: Dict[str, List[DataRead]] = None
+    data_written: Dict[str, List[DataWritten]] = None
+    properties: Dict[str, List[Property]] = None
+    pinfos: Dict[str, List[Pinfo]] = None
+    _parameters: Dict[Tuple[str, str], Parameter] = None
+    _parameter_lists: Dict[Tuple[Tuple[str, str], ...], List[Parameter]] = None
+
+    def __init__(
+        self,
+        project_name: str,
+        path: str,
+        jobs: int = 1,
+        cache: XMLCache = None,
+        xsd: str = None,
+        fast_parsing: bool = False,
+    ):
         self.project_name = project_name
         self.project_path = path
-        self.ecoa_xml_model = ECOAXMLModel(path)
+        self._jobs = jobs
+        self._cache = cache
+        self._xsd = xsd
+        self._fast_parsing = fast_parsing
+        self._read()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _reset(self) -> None:
+        self.types = {}
+        self.use = {}
+        self.services = {}
+        self.components = {}
+        self.module_impls = {}
+        self.module_types = {}
+        self.module_insts = {}
+        self.component_names = {}
+        self.protection_domains = {}
+        self.priorities = {}
+        self.log_levels = {}
+        self.logs = {}
+        self.times = {}
+        self.events_received = {}
+        self.events_send = {}
+        self.externals = {}
+        self.triggers = {}
+        self.dynamic_triggers_received = {}
+        self.dynamic_triggers_send = {}
+        self.requests_received = {}
+        self.requests_send = {}
+        self.data_read = {}
+        self.data_written = {}
+        self.properties = {}
+        self.pinfos = {}
+        self._parameters = {}
+        self._parameter_lists = {}
+
+    def _read(self) -> None:
+        self._reset()
+        self.ecoa_xml_model = ECOAXMLModel(self.project_path, self._jobs, self._cache, self._xsd, self._fast_parsing)
         self.ecoa_xml_model.read()
         if logger.root.level == logging.DEBUG:
             self.ecoa_xml_model.print_model()
         self.types_helper = TypeHelper(self)
 
+    def reload(self) -> None:
+        """Reads the ECOA project files again and parses them, discarding the previous model.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        logger.debug(f"Reloading {self.project_path}")
+        self._read()
+        self.parse()
+
+    def close(self) -> None:
+        """Releases the model so that the instance no longer holds any parsed data.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        self._reset()
+        self.ecoa_xml_model = None
+        self.types_helper = None
+
     def get_component_count(self) -> int:
         return len(self.components)
 
@@ -123,9 +212,11 @@ def _parse_module_instances(self) -> None:
                 key = component_impl_name + ":" + module_inst.name
                 self.module_insts[key] = module_inst
 
-    def _add_component_name(self, deployed_module_instance):
+    def _add_component_name(self, deployed_module_instance, protection_domain_name: str):
         component_name = deployed_module_instance.component_name
         module_inst_name = deployed_module_instance.module_instance_name
+        self.protection_domains[module_inst_name + ":" + component_name] = protection_domain_name
+        self.priorities[module_inst_name + ":" + component_name] = int(deployed_module_instance.module_priority)
         component_impl_name = self.ecoa_xml_model._components_assembly.get(
             component_name
         ).component_instance.implementation_name
@@ -135,11 +226,44 @@ def _add_component_name(self, deployed_module_instance):
         else:
             self.component_names[key] = [component_name]
 
+    def _add_trigger_priorities(self, protection_domain) -> None:
+        for dti in protection_domain.deployed_trigger_instance:
+            self.priorities[dti.trigger_instance_name + ":" + dti.component_name] = int(dti.trigger_priority)
+
     def _parse_component_names(self):
         for v in self.ecoa_xml_model._deployment.values():
             for pd in v.protection_domain:
                 for dmi in pd.deployed_module_instance:
-                    self._add_component_name(dmi)
+                    self._add_component_name(dmi, pd.name)
+                self._add_trigger_priorities(pd)
+
+    @classmethod
+    def _parse_log_levels(cls, enabled_levels: str) -> Set[LogType]:
+        # Levels named as in the log container functions (e.g. LOG_INFO, RAISE_ERROR) or without prefix (e.g. INFO)
+        log_types = {**{t.name: t for t in LogType}, **{t.name.split("_", 1)[1]: t for t in LogType}}
+        log_types["FATAL"] = LogType.RAISE_FATAL_ERROR
+        levels = [level for level in re.split(r"[|,\s]+", enabled_levels or "") if level]
+        for level in levels:
+            if level.upper() not in log_types:
+                logger.warning("Unknown log level %s in the log policy, ignoring it", level)
+        return {log_types[level.upper()] for level in levels if level.upper() in log_types}
+
+    def _parse_log_policies(self) -> None:
+        component_levels = {}
+        module_levels = {}
+        component_logs = [
+            cl for v in self.ecoa_xml_model._deployment.values() for lp in v.log_policy for cl in lp.component_log
+        ]
+        for component_log in component_logs:
+            component_levels[component_log.instance_name] = self._parse_log_levels(component_log.enabled_levels)
+            for module_log in component_log.module_log:
+                key = module_log.instance_name + ":" + component_log.instance_name
+                module_levels[key] = self._parse_log_levels(module_log.enabled_levels)
+        # The level of a module instance defaults to the level of its component instance
+        for key in self.protection_domains:
+            levels = module_levels.get(key, component_levels.get(key.split(":")[1]))
+            if levels is not None:
+                self.log_levels[key] = levels
 
     def parse(self) -> None:
         """Parses types and component implementations.
@@ -156,10 +280,12 @@ def parse(self) -> None:
         """
         self.components = self.ecoa_xml_model._components
         self._parse_types()
+        self.types_helper.build_indexes()
         self._parse_module_types()
         self._parse_module_implementations()
         self._parse_module_instances()
         self._parse_component_names()
+        self._parse_log_policies()
         LanguagesChecker(self).compute()
         for path, component_implementation in self.components.items():
             component_impl_name = os.path.normpath(path).split(os.path.sep)[-2]
@@ -180,25 +306,34 @@ def parse(self) -> None:
         logger.debug(f"Total number of request received: {len(self.requests_received)}")
         logger.debug(f"Total number of request send: {len(self.requests_send)}")
 
+    def _build_parameter(self, name: str, type: str) -> Parameter:
+        parameter = self._parameters.get((name, type))
+        if parameter is None:
+            parameter_type = self.types_helper.add_namespace(type)
+            parameter = self._parameters[(name, type)] = Parameter(
+                name,
+                self.types_helper.get_namespace(parameter_type),
+                self.types_helper.get_name(parameter_type),
+                self.types_helper.get_type_category(parameter_type),
+            )
+        return parameter
+
     def build_parameters(self, parameters: List) -> None:
         """Build the list of parameters.
 
+        The lists are shared by the operations with the same parameters (the sender and the receivers of an event for
+        instance) and must not be modified.
+
         Args:
             parameters (inputs or outputs from an operation of module_type.operations) : The parameters.
 
         Returns:
             parameters (List[Parameter]) : The parameters.
         """
-        liste = []
-        for param in parameters:
-            parameter_type = self.types_helper.add_namespace(param.type)
-            parameter = Parameter(
-                param.name,
-                self.types_helper.get_namespace(parameter_type),
-                self.types_helper.get_name(parameter_type),
-                self.types_helper.get_type_category(parameter_type),
-            )
-            liste.append(parameter)
+        key = tuple((param.name, param.type) for param in parameters)
+        liste = self._parameter_lists.get(key)
+        if liste is None:
+            liste = self._parameter_lists[key] = [self._build_parameter(name, type) for name, type in key]
         return liste
 
     def _find_final_receivers(self, component_impl_name: str, name: str) -> Dict:
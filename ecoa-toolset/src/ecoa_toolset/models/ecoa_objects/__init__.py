@@ -2,72 +2,115 @@
 # Copyright (c) 2023 Dassault Aviation
 # SPDX-License-Identifier: MIT
 
-"""The ecoa_object module."""
+"""The ecoa_object module.
 
-from .ecoa_bin_desc_2_0 import BinaryDependency, BinaryModule, BinDesc, ProcessorTarget
-from .ecoa_common_2_0 import ProgrammingLanguage, Use
-from .ecoa_cross_platforms_view_2_0 import Composite, EuidsBinding, View, WireMapping
-from .ecoa_deployment_2_0 import (
-    ComponentLog,
-    ComputingNodeConfiguration,
-    Deployment,
-    LogPolicy,
-    ModuleLog,
-    PlatformConfiguration,
-    PlatformMessages,
-    ProtectionDomain,
-    WireMapping,
-)
-from .ecoa_implementation_2_0 import (
-    ComponentImplementation,
-    DataLink,
-    DynamicTriggerInstance,
-    Event,
-    EventLink,
-    Instance,
-    ModuleImplementation,
-    ModuleInstance,
-    ModuleType,
-    OpRef,
-    OpRefActivatable,
-    OpRefActivatableFifo,
-    OpRefActivatingFifo,
-    OpRefExternal,
-    OpRefTrigger,
-    Parameter,
-    PinfoValue,
-    PrivatePinfo,
-    PropertyValue,
-    PropertyValues,
-    PublicPinfo,
-    RequestLink,
-    RequestResponse,
-    ServiceQoS,
-    TriggerInstance,
-    VersionedData,
-)
-from .ecoa_interface_2_0 import Data, EEventDirection, Event, Operations, Parameter, RequestResponse, ServiceDefinition
-from .ecoa_interface_qos_2_0 import Data, Event, OperationRate, Operations, RequestResponse, ServiceInstanceQoS
-from .ecoa_logicalsystem_2_0 import (
-    LogicalComputingNodeLinks,
-    LogicalComputingPlatform,
-    LogicalComputingPlatformLinks,
-    LogicalSystem,
-)
-from .ecoa_project_2_0 import Ecoaproject, EcoaProject, EliEuids, Files
-from .ecoa_types_2_0 import (
-    Array,
-    Constant,
-    DataTypes,
-    EBasic,
-    Enum,
-    EnumValue,
-    Field,
-    FixedArray,
-    Library,
-    Record,
-    Simple,
-    Union,
-    VariantRecord,
-)
-from .ecoa_uid_2_0 import Id, IdMap
+The schema modules are imported on first use (PEP 562), so that the tools only load the schemas they parse.
+"""
+
+# Standard library imports
+import importlib
+
+# The exported dataclasses of each schema module, a name exported by several modules being the one of the last module
+_EXPORTS = {
+    "ecoa_bin_desc_2_0": ["BinaryDependency", "BinaryModule", "BinDesc", "ProcessorTarget"],
+    "ecoa_common_2_0": ["ProgrammingLanguage", "Use"],
+    "ecoa_cross_platforms_view_2_0": ["Composite", "EuidsBinding", "View", "WireMapping"],
+    "ecoa_deployment_2_0": [
+        "ComponentLog",
+        "ComputingNodeConfiguration",
+        "Deployment",
+        "LogPolicy",
+        "ModuleLog",
+        "PlatformConfiguration",
+        "PlatformMessages",
+        "ProtectionDomain",
+        "WireMapping",
+    ],
+    "ecoa_implementation_2_0": [
+        "ComponentImplementation",
+        "DataLink",
+        "DynamicTriggerInstance",
+        "Event",
+        "EventLink",
+        "Instance",
+        "ModuleImplementation",
+        "ModuleInstance",
+        "ModuleType",
+        "OpRef",
+        "OpRefActivatable",
+        "OpRefActivatableFifo",
+        "OpRefActivatingFifo",
+        "OpRefExternal",
+        "OpRefTrigger",
+        "Parameter",
+        "PinfoValue",
+        "PrivatePinfo",
+        "PropertyValue",
+        "PropertyValues",
+        "PublicPinfo",
+        "RequestLink",
+        "RequestResponse",
+        "ServiceQoS",
+        "TriggerInstance",
+        "VersionedData",
+    ],
+    "ecoa_interface_2_0": [
+        "Data",
+        "EEventDirection",
+        "Event",
+        "Operations",
+        "Parameter",
+        "RequestResponse",
+        "ServiceDefinition",
+    ],
+    "ecoa_interface_qos_2_0": [
+        "Data",
+        "Event",
+        "OperationRate",
+        "Operations",
+        "RequestResponse",
+        "ServiceInstanceQoS",
+    ],
+    "ecoa_logicalsystem_2_0": [
+        "LogicalComputingNodeLinks",
+        "LogicalComputingPlatform",
+        "LogicalComputingPlatformLinks",
+        "LogicalSystem",
+    ],
+    "ecoa_project_2_0": ["Ecoaproject", "EcoaProject", "EliEuids", "Files"],
+    "ecoa_types_2_0": [
+        "Array",
+        "Constant",
+        "DataTypes",
+        "EBasic",
+        "Enum",
+        "EnumValue",
+        "Field",
+        "FixedArray",
+        "Library",
+        "Record",
+        "Simple",
+        "Union",
+        "VariantRecord",
+    ],
+    "ecoa_uid_2_0": ["Id", "IdMap"],
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+_SUBMODULES = set(_EXPORTS) | {"ecoa_composite"}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+    value = getattr(importlib.import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | set(_MODULES))
@@ -9,11 +9,15 @@
 import logging
 import os
 import pathlib
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Union
 
 # Internal library imports
 from ecoa_toolset.models import ecoa_objects
-from ecoa_toolset.models.ecoa_objects.ecoa_composite import ECOAComponentAssembly, ECOAServiceLink
+from ecoa_toolset.models.ecoa_objects.ecoa_composite import ECOAComponentAssembly, ECOAService, ECOAServiceLink
+from ecoa_toolset.models.xml_cache import XMLCache
+from ecoa_toolset.utils.xml.checker import Checker
+from ecoa_toolset.utils.xml.fast_parser import FastParser
 
 # Third-Party library imports
 from lxml import etree
@@ -21,13 +25,69 @@
 
 logger = logging.getLogger(__name__)
 
+_worker_xml_parser: Union[parsers.XmlParser, FastParser] = None
+_worker_checker: Checker = None
+
+
+def _create_xml_parser(fast_parsing: bool = False) -> Union[parsers.XmlParser, FastParser]:
+    if fast_parsing:
+        return FastParser()
+    return parsers.XmlParser(
+        config=parsers.config.ParserConfig(
+            fail_on_unknown_properties=True,
+            fail_on_unknown_attributes=True,
+            fail_on_converter_warnings=True,
+        )
+    )
+
+
+def _read_file(xml_parser: Union[parsers.XmlParser, FastParser], checker: Checker, path: str, clazz: type):
+    """Parses an ECOA XML file, validating it first if a checker is given.
+
+    Args:
+        xml_parser (XmlParser | FastParser): The parser binding the XML file.
+        checker (Checker): The in-process checker, None if the XML files are checked by an external checker.
+        path (str): Path to the XML file.
+        clazz (type): The dataclass to bind the XML file to.
+
+    Returns:
+        The parsed dataclass instance.
+    """
+
+    if checker is None:
+        return xml_parser.from_path(pathlib.Path(path), clazz)
+    # The tree validated is the one bound, the XML file is parsed once
+    tree = etree.parse(path, etree.XMLParser(remove_comments=True))
+    checker.validate(tree, path)
+    return xml_parser.parse(tree, clazz)
+
+
+def _init_worker(xsd: str, fast_parsing: bool) -> None:
+    global _worker_xml_parser, _worker_checker
+    _worker_xml_parser = _create_xml_parser(fast_parsing)
+    _worker_checker = Checker(xsd) if xsd else None
+
+
+def _parse_file_in_worker(path: str, clazz: type):
+    """Parses an ECOA XML file inside a worker process.
+
+    Args:
+        path (str): Path to the XML file.
+        clazz (type): The dataclass to bind the XML file to.
+
+    Returns:
+        The parsed dataclass instance.
+    """
+
+    return _read_file(_worker_xml_parser, _worker_checker, path, clazz)
+
 
 class ECOAXMLModel:
     """Naive representation of ECOA XML.
 
     Attributes:
         _path (str): Path to the ECOA project file.
-        _xml_parser (XmlParser): An XmlParser instance.
+        _xml_parser (XmlParser | FastParser): An XmlParser instance, or a FastParser instance with fast parsing.
         _types (dict): The types dictionary (ecoa_types_2_0).
         _services (dict): The services dictionary (ecoa_interface_2_0.ServiceDefinition).
         _components (dict): The components dictionary (ecoa_implementation_2_0.ComponentImplementation).
@@ -35,79 +95,215 @@ class ECOAXMLModel:
         _deployment (dict): The deployment dictionary.
         _components_assembly (list): The components assembly list.
         _wires (list): The wires list.
+        _component_services (dict): The components services by "component_name/service_name".
+        _wires_by_source (dict): The wires positions by (source component_name, source service_name).
+        _wires_by_target (dict): The wires positions by (target component_name, target service_name).
         _output (str): Path to the output directory.
+        _jobs (int): Number of worker processes used to parse the XML files.
+        _cache (XMLCache): The cache of the parsed XML files, None if disabled.
+        _xsd (str): Path to the XSDs directory, None if the XML files are checked by an external checker.
+        _checker (Checker): The in-process checker of the XML files, None if disabled.
+        _fast_parsing (bool): True if the XML files are bound by the FastParser, False if bound by the XmlParser.
     """
 
     _path: str = None
-    _xml_parser: parsers.XmlParser = None
+    _xml_parser: Union[parsers.XmlParser, FastParser] = None
     _project = None
-    _types: Dict = {}
-    _services: Dict = {}
-    _components: Dict = {}
-    _assembly: Dict = {}
-    _deployment: Dict = {}
-    _components_assembly: Dict[str, ECOAComponentAssembly] = {}
-    _wires: List[ECOAServiceLink] = []
+    _types: Dict = None
+    _services: Dict = None
+    _components: Dict = None
+    _assembly: Dict = None
+    _deployment: Dict = None
+    _components_assembly: Dict[str, ECOAComponentAssembly] = None
+    _wires: List[ECOAServiceLink] = None
+    _component_services: Dict[str, ECOAService] = None
+    _wires_by_source: Dict[Tuple[str, str], List[int]] = None
+    _wires_by_target: Dict[Tuple[str, str], List[int]] = None
     _output: str = None
-
-    def __init__(self, path: str) -> None:
+    _jobs: int = 1
+    _cache: XMLCache = None
+    _xsd: str = None
+    _checker: Checker = None
+    _fast_parsing: bool = False
+
+    def __init__(
+        self, path: str, jobs: int = 1, cache: XMLCache = None, xsd: str = None, fast_parsing: bool = False
+    ) -> None:
         """The ecoa xml model constructor.
 
         Args:
             path (str): Path to the ECOA project file.
+            jobs (int): Number of worker processes used to parse the XML files (1 means serial parsing).
+            cache (XMLCache): The cache of the parsed XML files, None to always parse them.
+            xsd (str): Path to the XSDs directory to validate the XML files in-process against, None if they are
+                checked by an external checker.
+            fast_parsing (bool): True to bind the XML files with the FastParser instead of the strict XmlParser.
 
         Returns:
             None.
         """
 
         self._path = path
-        self._xml_parser = parsers.XmlParser(
-            config=parsers.config.ParserConfig(
-                fail_on_unknown_properties=True,
-                fail_on_unknown_attributes=True,
-                fail_on_converter_warnings=True,
-            )
+        self._jobs = jobs
+        self._cache = cache
+        self._xsd = xsd
+        self._checker = Checker(xsd) if xsd else None
+        self._fast_parsing = fast_parsing
+        self._xml_parser = _create_xml_parser(fast_parsing)
+        self._types = {}
+        self._services = {}
+        self._components = {}
+        self._assembly = {}
+        self._deployment = {}
+        self._components_assembly = {}
+        self._wires = []
+        self._component_services = {}
+        self._wires_by_source = {}
+        self._wires_by_target = {}
+
+    @staticmethod
+    def read_output_directory(path: str) -> List[str]:
+        """Reads the output directories declared in an ECOA project file.
+
+        Args:
+            path (str): Path to the ECOA project file.
+
+        Returns:
+            List[str]: The output directories.
+        """
+
+        return (
+            _create_xml_parser()
+            .from_path(pathlib.Path(path), ecoa_objects.ecoa_project_2_0.Ecoaproject)
+            .output_directory
+        )
+
+    @staticmethod
+    def read_project_files(path: str) -> List[str]:
+        """Reads the paths of the files referenced by an ECOA project file.
+
+        Args:
+            path (str): Path to the ECOA project file.
+
+        Returns:
+            List[str]: The paths of the referenced files, relative to the current directory.
+        """
+
+        project = _create_xml_parser().from_path(pathlib.Path(path), ecoa_objects.ecoa_project_2_0.Ecoaproject)
+        files = []
+        for group in (
+            project.service_definitions
+            + project.component_definitions
+            + project.types
+            + project.component_implementations
+        ):
+            files.extend(group.file)
+        for euids in project.euids:
+            files.extend(euids.euid)
+        files.extend(
+            project.initial_assembly
+            + project.logical_system
+            + project.cross_platforms_view
+            + project.deployment_schema
+            + project.implementation_assembly
         )
+        directory = os.path.dirname(path)
+        return [os.path.join(directory, file.strip()) for file in files]
+
+    def _get_cache_variant(self) -> str:
+        # The FastParser binds the XML files leniently, its entries must not be loaded by the strict XmlParser
+        variant = "fast" if self._fast_parsing else ""
+        if self._checker is not None:
+            variant += "|xsd:" + self._checker.identity
+        return variant
+
+    def _parse_file(self, directory: str, file: str, clazz: type):
+        path = os.path.join(directory, file)
+        if self._cache is None:
+            return _read_file(self._xml_parser, self._checker, path, clazz)
+        # The entries loaded are the ones stored by a reading of the same variant: same parser, same XSDs
+        key, value = self._cache.load(path, clazz, self._get_cache_variant())
+        if value is None:
+            value = _read_file(self._xml_parser, self._checker, path, clazz)
+            self._cache.store(key, value)
+        return value
 
     def _parse_types(self, project, directory) -> None:
         for type in project.types:
             for file in type.file:
                 logger.info(f"\t{file}")
-                self._types[file] = self._xml_parser.from_path(
-                    pathlib.Path(os.path.join(directory, file)),
-                    ecoa_objects.ecoa_types_2_0.Library,
-                )
+                self._types[file] = self._parse_file(directory, file, ecoa_objects.ecoa_types_2_0.Library)
 
     def _parse_services(self, project, directory) -> None:
         for service in project.service_definitions:
             for file in service.file:
                 logger.info(f"\t{file}")
-                self._services[file] = self._xml_parser.from_path(
-                    pathlib.Path(os.path.join(directory, file)),
-                    ecoa_objects.ecoa_interface_2_0.ServiceDefinition,
+                self._services[file] = self._parse_file(
+                    directory, file, ecoa_objects.ecoa_interface_2_0.ServiceDefinition
                 )
 
     def _parse_components(self, project, directory) -> None:
         for component in project.component_implementations:
             for file in component.file:
                 logger.info(f"\t{file}")
-                self._components[file] = self._xml_parser.from_path(
-                    pathlib.Path(os.path.join(directory, file)),
-                    ecoa_objects.ecoa_implementation_2_0.ComponentImplementation,
+                self._components[file] = self._parse_file(
+                    directory, file, ecoa_objects.ecoa_implementation_2_0.ComponentImplementation
                 )
 
     def _parse_assembly(self, project, directory) -> None:
         for file in project.implementation_assembly:
             logger.info(f"\t{file}")
             self._assembly[file] = etree.parse(os.path.join(directory, file))
+            if self._checker is not None:
+                self._checker.validate(self._assembly[file], os.path.join(directory, file))
 
     def _parse_deployement(self, project, directory) -> None:
         for file in project.deployment_schema:
             logger.info(f"\t{file}")
-            self._deployment[file] = self._xml_parser.from_path(
-                pathlib.Path(os.path.join(directory, file)),
-                ecoa_objects.ecoa_deployment_2_0.Deployment,
+            self._deployment[file] = self._parse_file(directory, file, ecoa_objects.ecoa_deployment_2_0.Deployment)
+
+    def _get_files(self, project) -> List[Tuple[Dict, str, type]]:
+        files = []
+        for type in project.types:
+            files.extend((self._types, file, ecoa_objects.ecoa_types_2_0.Library) for file in type.file)
+        for service in project.service_definitions:
+            files.extend(
+                (self._services, file, ecoa_objects.ecoa_interface_2_0.ServiceDefinition) for file in service.file
             )
+        for component in project.component_implementations:
+            files.extend(
+                (self._components, file, ecoa_objects.ecoa_implementation_2_0.ComponentImplementation)
+                for file in component.file
+            )
+        files.extend(
+            (self._deployment, file, ecoa_objects.ecoa_deployment_2_0.Deployment) for file in project.deployment_schema
+        )
+        return files
+
+    def _load_files_from_cache(self, paths: List[str], files: List[Tuple[Dict, str, type]]) -> List[Tuple]:
+        if self._cache is None:
+            return [(None, None)] * len(paths)
+        variant = self._get_cache_variant()
+        return [self._cache.load(path, clazz, variant) for path, (_, _, clazz) in zip(paths, files)]
+
+    def _parse_files_in_parallel(self, project, directory) -> None:
+        files = self._get_files(project)
+        paths = [os.path.join(directory, file) for _, file, _ in files]
+        results = self._load_files_from_cache(paths, files)
+        misses = [index for index, (_, value) in enumerate(results) if value is None]
+        if misses:
+            with ProcessPoolExecutor(
+                max_workers=self._jobs, initializer=_init_worker, initargs=(self._xsd, self._fast_parsing)
+            ) as executor:
+                # executor.map yields results in submission order, keeping the dicts identical to the serial path
+                values = executor.map(_parse_file_in_worker, [paths[i] for i in misses], [files[i][2] for i in misses])
+                for index, value in zip(misses, values):
+                    results[index] = (results[index][0], value)
+                    if self._cache is not None:
+                        self._cache.store(results[index][0], value)
+        for (container, file, _), (_, value) in zip(files, results):
+            logger.info(f"\t{file}")
+            container[file] = value
 
     def _set_component_instance_to_component_assembly(self, node, component_name: str) -> None:
         type_name = node.get("componentType")
@@ -163,20 +359,48 @@ def _parse_components_assembly(self) -> None:
                 if child.tag is not etree.Comment and etree.QName(child).localname == "component":
                     self._add_component_assembly(child)
 
-    def _get_component_service(self, service):
+    def _index_component_services(self) -> None:
         for component_assembly in self._components_assembly.values():
             for component_service in component_assembly.services:
-                if component_service.component_name + "/" + component_service.service_name == service:
-                    return component_service
-        return None
+                key = component_service.component_name + "/" + component_service.service_name
+                self._component_services.setdefault(key, component_service)
+
+    def _get_component_service(self, service):
+        return self._component_services.get(service)
+
+    def _index_wire(self, wire: ECOAServiceLink) -> None:
+        if wire.source is None or wire.target is None:
+            return
+        position = len(self._wires) - 1
+        self._wires_by_source.setdefault((wire.source.component_name, wire.source.service_name), []).append(position)
+        self._wires_by_target.setdefault((wire.target.component_name, wire.target.service_name), []).append(position)
 
     def _parse_wires(self) -> None:
+        self._index_component_services()
         for key, value in self._assembly.items():
             for child in self._assembly[key].getroot():
                 if child.tag is not etree.Comment and etree.QName(child).localname == "wire":
                     source = self._get_component_service(child.get("source"))
                     target = self._get_component_service(child.get("target"))
                     self._wires.append(ECOAServiceLink(source, target))
+                    self._index_wire(self._wires[-1])
+
+    def get_wires(self, component_names: List[str], service_name: str) -> List[ECOAServiceLink]:
+        """Gets the wires whose source or target is the given service of one of the given components.
+
+        Args:
+            component_names (List[str]): The component names.
+            service_name (str): The service (or reference) name.
+
+        Returns:
+            List[ECOAServiceLink]: The wires, in the assembly order.
+        """
+
+        positions = set()
+        for component_name in component_names:
+            positions.update(self._wires_by_source.get((component_name, service_name), []))
+            positions.update(self._wires_by_target.get((component_name, service_name), []))
+        return [self._wires[position] for position in sorted(positions)]
 
     def read(self) -> None:
         """Reads an ECOA model and returns a MRT model.
@@ -190,16 +414,25 @@ def read(self) -> None:
 
         logger.info(f"Parsing {self._path}")
         directory = os.path.dirname(self._path)
-        project = self._xml_parser.from_path(pathlib.Path(self._path), ecoa_objects.ecoa_project_2_0.Ecoaproject)
+        project = _read_file(self._xml_parser, self._checker, self._path, ecoa_objects.ecoa_project_2_0.Ecoaproject)
         self._project = project
-        self._parse_types(project, directory)
-        self._parse_services(project, directory)
-        self._parse_components(project, directory)
-        self._parse_assembly(project, directory)
-        self._parse_deployement(project, directory)
+        if self._jobs > 1:
+            self._parse_files_in_parallel(project, directory)
+            self._parse_assembly(project, directory)
+        else:
+            self._parse_types(project, directory)
+            self._parse_services(project, directory)
+            self._parse_components(project, directory)
+            self._parse_assembly(project, directory)
+            self._parse_deployement(project, directory)
         self._parse_components_assembly()
         self._parse_wires()
         self._output = project.output_directory
+        if self._cache is not None:
+            logger.debug(
+                "Loaded %d XML file(s) from the cache, parsed %d XML file(s)", self._cache.hits, self._cache.misses
+            )
+            self._cache.evict()
 
     def print_model(self):
         logger.debug("== PRINT TYPES ==")
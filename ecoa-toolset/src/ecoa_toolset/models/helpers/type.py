@@ -6,7 +6,7 @@
 """
 
 # Standard library imports
-from typing import ClassVar, Dict, List
+from typing import ClassVar, Dict, List, Tuple
 
 # Internal library imports
 from ecoa_toolset.models.ecoa_objects import ecoa_types_2_0
@@ -45,10 +45,61 @@ class TypeHelper:
     }
 
     _ecoa_model = None
+    _indexed_types: Tuple[int, int] = None
+    _types_by_name: Dict[str, List[str]] = None
+    _types_by_namespace: Dict[str, List[str]] = None
+    _types_by_category: Dict[str, List[str]] = None
+    _types_position: Dict[str, int] = None
 
     def __init__(self, ecoa_model) -> None:
         self._ecoa_model = ecoa_model
 
+    def build_indexes(self) -> None:
+        """Indexes the ECOA model library types by name, namespace and category.
+
+        The indexes are rebuilt automatically by the search functions when the library types change,
+        calling this function once the types are parsed avoids doing it during the first search.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        self._types_by_name = {}
+        self._types_by_namespace = {}
+        self._types_by_category = {}
+        self._types_position = {}
+        for position, (key, value) in enumerate(self._ecoa_model.types.items()):
+            namespace, _, name = key.partition(":")
+            self._types_by_name.setdefault(name, []).append(key)
+            self._types_by_namespace.setdefault(namespace, []).append(key)
+            self._types_by_category.setdefault(type(value).__name__, []).append(key)
+            self._types_position[key] = position
+        self._indexed_types = (id(self._ecoa_model.types), len(self._ecoa_model.types))
+
+    def _check_indexes(self) -> None:
+        if self._indexed_types != (id(self._ecoa_model.types), len(self._ecoa_model.types)):
+            self.build_indexes()
+
+    def _find_keys(self, namespace: str, type_name: str) -> List[str]:
+        if namespace and not type_name:
+            return self._types_by_namespace.get(namespace.replace(".", "__"), [])
+        elif type_name and not namespace:
+            return self._types_by_name.get(type_name, [])
+        elif type_name and namespace:
+            key = f"{namespace.replace('.', '__')}:{type_name}"
+            return [key] if key in self._ecoa_model.types else []
+        return None
+
+    def _filter_keys(self, keys: List[str], category: List[str]) -> List[str]:
+        if keys is None and len(category) == 1:
+            return self._types_by_category.get(category[0], [])
+        keys_in_category = {key for name in category for key in self._types_by_category.get(name, [])}
+        if keys is None:
+            return sorted(keys_in_category, key=self._types_position.get)
+        return [key for key in keys if key in keys_in_category]
+
     def find_all(self, namespace: str = None, type_name: str = None, category: List[str] = []) -> Dict:
         """Search in ECOA model library types.
 
@@ -71,22 +122,13 @@ def find_all(self, namespace: str = None, type_name: str = None, category: List[
         Comments:
             cf. models/ecoa_objects/ecoa_types_2_0.py
         """
-        filtered = None
-        if namespace and not type_name:
-            filtered = {
-                k: v for k, v in self._ecoa_model.types.items() if k.startswith(f"{namespace.replace('.', '__')}:")
-            }
-        elif type_name and not namespace:
-            filtered = {k: v for k, v in self._ecoa_model.types.items() if k.endswith(f":{type_name}")}
-        elif type_name and namespace:
-            filtered = {
-                k: v for k, v in self._ecoa_model.types.items() if f"{namespace.replace('.', '__')}:{type_name}" in k
-            }
-        else:
-            filtered = self._ecoa_model.types
+        self._check_indexes()
+        keys = self._find_keys(namespace, type_name)
         if category:
-            filtered = {k: v for k, v in filtered.items() if type(v).__name__ in category}
-        return filtered
+            keys = self._filter_keys(keys, category)
+        if keys is None:
+            return self._ecoa_model.types
+        return {key: self._ecoa_model.types[key] for key in keys}
 
     def find_one(self, complete_name: str = None, namespace: str = None, type_name: str = None) -> Dict:
         """Search the first type that matches with the query in ECOA model library types.
@@ -103,20 +145,12 @@ def find_one(self, complete_name: str = None, namespace: str = None, type_name:
             cf. models/ecoa_objects/ecoa_types_2_0.py
         """
         if complete_name:
-            if complete_name.startswith("ECOA:"):
-                return {complete_name: self.ecoa_types.get(self.get_name(complete_name), None)}
-            else:
-                return {complete_name: self._ecoa_model.types.get(complete_name.replace(".", "__"), None)}
-        elif type_name:
-            try:
-                return next(iter(self.find_all(type_name=type_name).items()))
-            except StopIteration:
-                pass
-        elif namespace:
-            try:
-                return next(iter(self.find_all(namespace=namespace).items()))
-            except StopIteration:
-                pass
+            return {complete_name: self.get_type_category(complete_name)}
+        elif type_name or namespace:
+            self._check_indexes()
+            keys = self._find_keys(None, type_name) if type_name else self._find_keys(namespace, None)
+            if keys:
+                return keys[0], self._ecoa_model.types[keys[0]]
         return None
 
     def add_namespace(self, type_name: str = None) -> str:
@@ -188,4 +222,6 @@ def get_type_category(self, complete_type_name: str) -> str:
         Returns:
             The element type category
         """
-        return self.find_one(complete_name=complete_type_name).get(complete_type_name)
+        if complete_type_name.startswith("ECOA:"):
+            return self.ecoa_types.get(self.get_name(complete_type_name), None)
+        return self._ecoa_model.types.get(complete_type_name.replace(".", "__"), None)
@@ -61,7 +61,9 @@ def _link_send_and_received_with_services(
         if not sender_component_names or not received_component_names:
             return
         if send_receiver_link.operation_name == received_sender_link.operation_name:
-            for wire in self._ecoa_model.ecoa_xml_model._wires:
+            for wire in self._ecoa_model.ecoa_xml_model.get_wires(
+                sender_component_names, send_receiver_link.instance_name
+            ):
                 key = None
                 if (
                     wire.source.component_name in sender_component_names
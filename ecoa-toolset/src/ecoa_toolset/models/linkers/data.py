@@ -73,7 +73,7 @@ def _link_read_and_written_with_services(
         if not read_component_names or not written_component_names:
             return
         if read_writer_link.operation_name == written_reader_link.operation_name:
-            for wire in self._ecoa_model.ecoa_xml_model._wires:
+            for wire in self._ecoa_model.ecoa_xml_model.get_wires(read_component_names, read_writer_link.instance_name):
                 key = None
                 if (
                     wire.source.component_name in read_component_names
@@ -5,7 +5,7 @@
 """EventsLinker class.
 """
 
-from typing import Any, List
+from typing import Any, Dict, List, Set, Tuple
 
 # Internal library imports
 from ecoa_toolset.models.components import (
@@ -85,7 +85,7 @@ def _link_trigger_and_event_received(
             key_sender = trigger_sender_link.instance_name
             for received_component_name in received_component_names:
                 key_receiver = received_receiver_link.instance_name + ":" + received_component_name
-                trigger.add_receiver(key_receiver, received)
+                trigger.add_receiver(key_receiver, received, trigger_sender_link.period)
                 received.add_sender(key_receiver, key_sender, trigger)
 
     def _link_dynamic_trigger_and_event_received(
@@ -226,12 +226,48 @@ def _compare_events(self, send: Any, received: Any) -> None:
                     received_senders_links,
                 )
 
+    @staticmethod
+    def _get_link_key(component_impl_name: str, link: Link) -> Tuple:
+        # Links through services are matched by operation name across components (cf. wires)
+        if link.type == "reference" or link.type == "service":
+            return (None, "service", None, link.operation_name)
+        return (component_impl_name, link.type, link.instance_name, link.operation_name)
+
+    def _get_received_keys(self, received: EventReceived) -> Set[Tuple]:
+        return {
+            self._get_link_key(received.component_impl_name, received_sender_link)
+            for received_senders_links in received.links.values()
+            for received_sender_link in received_senders_links
+        }
+
+    def _index_events_received(self, events_received: List[EventReceived]) -> Dict[Tuple, List[int]]:
+        index = {}
+        for position, received in enumerate(events_received):
+            for key in self._get_received_keys(received):
+                index.setdefault(key, []).append(position)
+        return index
+
+    def _get_send_keys(self, send: EventSend) -> List[Tuple]:
+        keys = []
+        for send_sender_link, send_receivers_links in send.links.items():
+            keys.append(self._get_link_key(send.component_impl_name, send_sender_link))
+            keys.extend(
+                self._get_link_key(send.component_impl_name, send_receiver_link)
+                for send_receiver_link in send_receivers_links
+                if send_receiver_link.type == "reference" or send_receiver_link.type == "service"
+            )
+        return keys
+
     def _link_events(self) -> None:
         events_send = [send for v in self._ecoa_model.events_send.values() for send in v]
         events_received = [received for v in self._ecoa_model.events_received.values() for received in v]
+        # Only the received events sharing a sender link with the send can match, they are visited in their
+        # original order so that the receivers and senders dictionaries are filled in the same order
+        index = self._index_events_received(events_received)
         for send in events_send:
-            for received in events_received:
-                self._compare_events(send, received)
+            positions = {position for key in self._get_send_keys(send) for position in index.get(key, [])}
+            for position in sorted(positions):
+                self._compare_events(send, events_received[position])
 
     def _link_externals_and_events_received(self) -> None:
         for key, externals in self._ecoa_model.externals.items():
@@ -43,6 +43,7 @@ def _build_links(self, senders, receivers) -> None:
                 getattr(sender, "operation_name", ""),
                 getattr(sender, "activating", True),
                 getattr(sender, "language", "").lower(),
+                period=float(sender.period) if getattr(sender, "period", None) else None,
             )
             for sender_type, senders_list in senders.items()
             for sender in senders_list or []
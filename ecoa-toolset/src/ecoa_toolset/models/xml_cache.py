@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""On-disk cache of the parsed ECOA XML files.
+"""
+
+# Standard library imports
+import hashlib
+import logging
+import os
+import pickle
+from importlib import metadata
+from typing import List
+
+# Internal library imports
+from ecoa_toolset.configuration import ecoa_std_version
+
+logger = logging.getLogger(__name__)
+
+
+def _get_distribution_version(name: str) -> str:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _list_files(path: str) -> List[str]:
+    if not os.path.isdir(path):
+        return [path]
+    return sorted(os.path.join(root, file) for root, _, files in os.walk(path) for file in files)
+
+
+class XMLCache:
+    """Stores the dataclasses parsed from the ECOA XML files, one pickle file per XML file content.
+
+    An entry is identified by the path of the XML file, the hash of its content, the ECOA standard version,
+    the versions of ecoa-toolset and xsdata and the variant of the reading (the XSDs the XML file is checked against
+    for instance), so that any of them changing invalidates the entry.
+    The least recently used entries are evicted when the cache exceeds its maximum size.
+
+    The cache also records the last successful check of each ECOA project by the external checker, identified by the
+    checker identity and the content of the project file and of all the files it references, so that an unchanged
+    project is not checked again.
+
+    Attributes:
+        directory (str): Path to the cache directory.
+        max_size (int): Maximum size of the cache directory in bytes.
+        hits (int): Number of XML files loaded from the cache.
+        misses (int): Number of XML files that had to be parsed.
+    """
+
+    DIRECTORY_NAME: str = ".ecoa_cache"
+    EXTENSION: str = ".pickle"
+    CHECK_EXTENSION: str = ".check"
+    DEFAULT_MAX_SIZE: int = 256 * 1024 * 1024
+    directory: str = None
+    max_size: int = None
+    hits: int = 0
+    misses: int = 0
+    _version: bytes = None
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """The xml cache constructor.
+
+        Args:
+            directory (str): Path to the cache directory, created if needed.
+            max_size (int): Maximum size of the cache directory in bytes.
+
+        Returns:
+            None.
+        """
+
+        self.directory = directory
+        self.max_size = max_size
+        self._version = "|".join(
+            [ecoa_std_version, _get_distribution_version("ecoa-toolset"), _get_distribution_version("xsdata")]
+        ).encode()
+        os.makedirs(directory, exist_ok=True)
+
+    def _get_entry_path(self, path: str, content: bytes, clazz: type, variant: str) -> str:
+        digest = hashlib.sha256(self._version)
+        digest.update(os.path.normpath(path).encode() + b"\0")
+        digest.update(clazz.__qualname__.encode() + b"\0")
+        digest.update(variant.encode() + b"\0")
+        digest.update(content)
+        return os.path.join(self.directory, digest.hexdigest() + self.EXTENSION)
+
+    def load(self, path: str, clazz: type, variant: str = ""):
+        """Loads the dataclass of an XML file from the cache.
+
+        Args:
+            path (str): Path to the XML file.
+            clazz (type): The dataclass the XML file is bound to.
+            variant (str): The variant of the reading, an entry being only loaded by a reading of the same variant.
+
+        Returns:
+            A tuple (key, dataclass instance), the instance being None on a cache miss.
+        """
+
+        with open(path, "rb") as f:
+            key = self._get_entry_path(path, f.read(), clazz, variant)
+        try:
+            with open(key, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return key, None
+        except Exception as e:
+            logger.debug("Ignoring corrupted cache entry %s: %s", key, e)
+            self.misses += 1
+            return key, None
+        # Refresh the entry so that the eviction removes the least recently used entries first
+        os.utime(key)
+        self.hits += 1
+        return key, value
+
+    def store(self, key: str, value) -> None:
+        """Stores the dataclass of an XML file in the cache.
+
+        Args:
+            key (str): The key returned by load.
+            value: The parsed dataclass instance.
+
+        Returns:
+            None.
+        """
+
+        temporary_path = key + ".tmp"
+        with open(temporary_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, key)
+
+    def get_check_digest(self, checker: str, paths: List[str]) -> str:
+        """Computes the digest of a check, changing with the checker or the content of any checked file.
+
+        Args:
+            checker (str): The identity of the checker.
+            paths (List[str]): Paths to the checked files, the files of a directory being all checked.
+
+        Returns:
+            str: The digest, None if a file cannot be read.
+        """
+
+        digest = hashlib.sha256(self._version)
+        digest.update(checker.encode())
+        for file in [file for path in paths for file in _list_files(path)]:
+            try:
+                with open(file, "rb") as f:
+                    content = f.read()
+            except OSError:
+                return None
+            digest.update(os.path.normpath(file).encode() + b"\0")
+            digest.update(hashlib.sha256(content).digest())
+        return digest.hexdigest()
+
+    def _get_check_path(self, project: str) -> str:
+        name = hashlib.sha256(os.path.abspath(project).encode()).hexdigest()
+        return os.path.join(self.directory, name + self.CHECK_EXTENSION)
+
+    def is_checked(self, project: str, digest: str) -> bool:
+        """Checks if the last successful check of an ECOA project has the given digest.
+
+        Args:
+            project (str): Path to the ECOA project file.
+            digest (str): The digest returned by get_check_digest.
+
+        Returns:
+            bool: True if the project was successfully checked with the same checker and files, False otherwise.
+        """
+
+        try:
+            with open(self._get_check_path(project), "r") as f:
+                return digest is not None and f.read() == digest
+        except OSError:
+            return False
+
+    def store_check(self, project: str, digest: str) -> None:
+        """Records a successful check of an ECOA project.
+
+        Args:
+            project (str): Path to the ECOA project file.
+            digest (str): The digest returned by get_check_digest.
+
+        Returns:
+            None.
+        """
+
+        if digest is None:
+            return
+        check_path = self._get_check_path(project)
+        with open(check_path + ".tmp", "w") as f:
+            f.write(digest)
+        os.replace(check_path + ".tmp", check_path)
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache fits its maximum size.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(self.EXTENSION):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            logger.debug("Evicting cache entry %s", entry_path)
+            os.remove(entry_path)
+            total_size -= size
@@ -66,3 +66,85 @@ def check_template_value(template_directory_path):
     if not os.path.isdir(template_directory_path):
         raise argparse.ArgumentTypeError("invalid value, path is not leading to a directory")
     return template_directory_path
+
+
+def check_jobs_value(jobs):
+    """Check if the number of jobs is a strictly positive integer.
+
+    Args:
+        jobs (str): The number of jobs.
+
+    Returns:
+        jobs (int): The number of jobs.
+
+    Raise:
+        argparse.ArgumentTypeError
+    """
+    try:
+        value = int(jobs)
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid value, not an integer")
+    if value < 1:
+        raise argparse.ArgumentTypeError("invalid value, must be greater than or equal to 1")
+    return value
+
+
+def check_event_queue_value(capacity):
+    """Check if the capacity of the event queue is a strictly positive integer.
+
+    Args:
+        capacity (str): The capacity of the event queue.
+
+    Returns:
+        capacity (int): The capacity of the event queue.
+
+    Raise:
+        argparse.ArgumentTypeError
+    """
+    try:
+        value = int(capacity)
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid value, not an integer")
+    if value < 1:
+        raise argparse.ArgumentTypeError("invalid value, must be greater than or equal to 1")
+    return value
+
+
+def check_log_buffer_value(capacity):
+    """Check if the capacity of the log buffer is an integer greater than or equal to 2.
+
+    Args:
+        capacity (str): The capacity of the log buffer.
+
+    Returns:
+        capacity (int): The capacity of the log buffer.
+
+    Raise:
+        argparse.ArgumentTypeError
+    """
+    try:
+        value = int(capacity)
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid value, not an integer")
+    if value < 2:
+        raise argparse.ArgumentTypeError("invalid value, must be greater than or equal to 2")
+    return value
+
+
+def check_xsd_value(xsd_directory_path):
+    """Check if the XSDs directory exists and contains XSD files.
+
+    Args:
+        xsd_directory_path (str): The XSDs directory path.
+
+    Returns:
+        xsd_directory_path (str): The XSDs directory path.
+
+    Raise:
+        argparse.ArgumentTypeError
+    """
+    if not os.path.isdir(xsd_directory_path):
+        raise argparse.ArgumentTypeError("invalid value, path is not leading to a directory")
+    if not any(file.endswith(".xsd") for _, _, files in os.walk(xsd_directory_path) for file in files):
+        raise argparse.ArgumentTypeError("invalid value, directory doesn't contain any XSD file")
+    return xsd_directory_path
@@ -4,11 +4,111 @@
 
 """The XML checker implementation."""
 
-from lxml.etree import DocumentInvalid, XMLSchema, _ElementTree
+# Standard library imports
+import hashlib
+import logging
+import os
+import pathlib
+from typing import Dict, List
+
+# Third-Party library imports
+from lxml.etree import DocumentInvalid, QName, XMLParser, XMLSchema, _ElementTree, fromstring, parse
+
+logger = logging.getLogger(__name__)
 
 
 class Checker:
-    """The XML Checker."""
+    """The XML Checker.
+
+    Validates the XML files in-process against the XSDs of a directory. The XSDs are indexed by target namespace and
+    the schema of a namespace is compiled once, on the first XML file whose root element is in this namespace.
+
+    Attributes:
+        directory (str): Path to the XSDs directory.
+        identity (str): The digest of the paths and the contents of the XSDs, changing with any of them.
+    """
+
+    directory: str = None
+    identity: str = None
+    _locations: Dict[str, List[str]] = None
+    _schemas: Dict[str, XMLSchema] = None
+
+    def __init__(self, directory: str) -> None:
+        """The xml checker constructor.
+
+        Args:
+            directory (str): Path to the XSDs directory, searched recursively.
+
+        Returns:
+            None.
+        """
+
+        self.directory = directory
+        self._locations = {}
+        self._schemas = {}
+        parser = XMLParser(remove_comments=True)
+        digest = hashlib.sha256(os.path.abspath(directory).encode())
+        for root, _, files in sorted(os.walk(directory)):
+            for file in sorted(files):
+                if file.endswith(".xsd"):
+                    path = os.path.abspath(os.path.join(root, file))
+                    with open(path, "rb") as f:
+                        content = f.read()
+                    digest.update(path.encode() + b"\0" + hashlib.sha256(content).digest())
+                    namespace = fromstring(content, parser, base_url=path).get("targetNamespace", "")
+                    self._locations.setdefault(namespace, []).append(path)
+        self.identity = digest.hexdigest()
+
+    def _compile(self, namespace: str) -> XMLSchema:
+        locations = self._locations.get(namespace)
+        if not locations:
+            raise Exception("No XSD found in " + self.directory + " for the namespace '" + namespace + "'.")
+        logger.debug("Compiling the XSD(s) of the namespace '%s'", namespace)
+        if len(locations) == 1:
+            return XMLSchema(parse(locations[0]))
+        # The XSDs sharing a target namespace are included by a single schema
+        return XMLSchema(
+            fromstring(
+                '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="'
+                + namespace
+                + '">'
+                + "".join(
+                    '<xs:include schemaLocation="' + pathlib.Path(location).as_uri() + '"/>' for location in locations
+                )
+                + "</xs:schema>"
+            )
+        )
+
+    def get_schema(self, namespace: str) -> XMLSchema:
+        """Gets the compiled schema of a namespace, compiling it on the first call.
+
+        Args:
+            namespace (str): The target namespace.
+
+        Returns:
+            XMLSchema: The compiled schema.
+        """
+
+        schema = self._schemas.get(namespace)
+        if schema is None:
+            schema = self._schemas[namespace] = self._compile(namespace)
+        return schema
+
+    def validate(self, xml_file: _ElementTree, path: str) -> None:
+        """Validates an xml file against the schema of the namespace of its root element.
+
+        Args:
+            xml_file (_ElementTree): The xml file.
+            path (str): Path to the xml file, for the error message.
+
+        Raise:
+            Exception: If the xml file does not fit its schema.
+        """
+
+        schema = self.get_schema(QName(xml_file.getroot()).namespace or "")
+        if not Checker.is_valid(xml_file, schema):
+            errors = [path + ":" + str(error.line) + ": " + error.message for error in schema.error_log]
+            raise Exception("The check of the ECOA XML file : " + path + " failed.\n" + "\n".join(errors))
 
     @staticmethod
     def is_valid(xml_file: _ElementTree, xml_schema: XMLSchema) -> bool:
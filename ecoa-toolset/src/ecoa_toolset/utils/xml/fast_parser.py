@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""The fast XML parser implementation."""
+
+# Standard library imports
+import dataclasses
+import enum
+import pathlib
+import typing
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+
+# Third-Party library imports
+from lxml import etree
+
+_EVENTS = ("start", "end")
+
+
+def _convert_bool(value: str) -> bool:
+    value = value.strip()
+    if value in ("true", "1"):
+        return True
+    if value in ("false", "0"):
+        return False
+    raise ValueError("'" + value + "' is not a boolean")
+
+
+_CONVERTERS: Dict[type, Callable[[str], Any]] = {bool: _convert_bool, int: int, float: float, Decimal: Decimal}
+
+
+def _unwrap(hint) -> Tuple[bool, type]:
+    # Optional[X] and List[X] are bound as X, a list being filled by each occurrence of the element
+    is_list = False
+    while typing.get_origin(hint) in (typing.Union, list):
+        is_list = is_list or typing.get_origin(hint) is list
+        hint = next(arg for arg in typing.get_args(hint) if arg is not type(None))
+    return is_list, hint
+
+
+def _get_converter(hint: type) -> Callable[[str], Any]:
+    if isinstance(hint, type) and issubclass(hint, enum.Enum):
+        return hint
+    return _CONVERTERS.get(hint, str)
+
+
+class _Binding:
+    """The binding of a dataclass, its fields being indexed by the local names of the XML attributes and elements.
+
+    Attributes:
+        clazz (type): The dataclass.
+        name (str): The local name of the XML element bound to the dataclass, when it is a root element.
+        attributes (Dict[str, Tuple[str, Callable]]): The field and the converter of each attribute.
+        elements (Dict[str, Tuple[str, bool, type, Callable]]): The field, the list flag, the dataclass (None for a
+            simple element) and the converter of each child element.
+        text (Tuple[str, Callable]): The field and the converter of the text content, None if not bound.
+    """
+
+    clazz: type = None
+    name: str = None
+    attributes: Dict[str, Tuple[str, Callable]] = None
+    elements: Dict[str, Tuple[str, bool, type, Callable]] = None
+    text: Tuple[str, Callable] = None
+
+    def __init__(self, clazz: type) -> None:
+        self.clazz = clazz
+        meta = getattr(clazz, "Meta", None)
+        self.name = getattr(meta, "name", clazz.__name__)
+        self.attributes = {}
+        self.elements = {}
+        hints = typing.get_type_hints(clazz)
+        for field in dataclasses.fields(clazz):
+            self._add_field(field, hints[field.name])
+
+    def _add_field(self, field: dataclasses.Field, hint) -> None:
+        # As xsdata, a field without XML type is an element if it is a dataclass, the text content otherwise
+        xml_type = field.metadata.get("type")
+        is_list, hint = _unwrap(hint)
+        child = hint if dataclasses.is_dataclass(hint) else None
+        name = field.metadata.get("name", field.name)
+        if xml_type == "Attribute":
+            self.attributes[name] = (field.name, _get_converter(hint))
+        elif xml_type == "Element" or (xml_type is None and child):
+            self.elements[name] = (field.name, is_list, child, _get_converter(hint))
+        elif xml_type is None:
+            self.text = (field.name, _get_converter(hint))
+
+
+class FastParser:
+    """The fast XML parser.
+
+    Binds an XML file to the same dataclasses as the xsdata XmlParser, walking the lxml events once with the bindings
+    of the dataclasses computed from their fields metadata. Only the attributes, elements and text contents known by
+    the dataclasses are bound: the other ones are ignored and the values are converted without any check of the
+    restrictions of the XSDs, the XML files being checked by the checker.
+    """
+
+    _bindings: Dict[type, _Binding] = None
+
+    def __init__(self) -> None:
+        """The fast parser constructor.
+
+        Returns:
+            None.
+        """
+
+        self._bindings = {}
+
+    def _get_binding(self, clazz: type) -> _Binding:
+        binding = self._bindings.get(clazz)
+        if binding is None:
+            binding = self._bindings[clazz] = _Binding(clazz)
+        return binding
+
+    def _start(self, stack: List[List], tag: str, clazz: type) -> List:
+        name = tag.rpartition("}")[2]
+        if not stack:
+            binding = self._get_binding(clazz)
+            if name != binding.name:
+                raise Exception("Unexpected root element " + name + ", expected " + binding.name + ".")
+            return [binding, {}, None, None]
+        parent = stack[-1][0]
+        element = parent.elements.get(name) if parent is not None else None
+        if element is None:
+            # Ignored element, with its children
+            return [None, None, None, None]
+        field_name, is_list, child, converter = element
+        if child is None:
+            return [None, None, (field_name, is_list), converter]
+        return [self._get_binding(child), {}, (field_name, is_list), None]
+
+    @staticmethod
+    def _build(binding: _Binding, values: Dict[str, Any], element: etree._Element):
+        for name, value in element.attrib.items():
+            attribute = binding.attributes.get(name)
+            if attribute is not None:
+                values[attribute[0]] = attribute[1](value)
+        if binding.text is not None and element.text is not None:
+            values[binding.text[0]] = binding.text[1](element.text)
+        return binding.clazz(**values)
+
+    @classmethod
+    def _convert(cls, binding: _Binding, values: Dict[str, Any], converter: Callable, element: etree._Element):
+        try:
+            if binding is not None:
+                return cls._build(binding, values, element)
+            return converter(element.text or "") if converter is not None else None
+        except ValueError as e:
+            raise Exception("Line " + str(element.sourceline) + ": " + str(e)) from e
+
+    @classmethod
+    def _end(cls, stack: List[List], element: etree._Element):
+        binding, values, target, converter = stack.pop()
+        value = cls._convert(binding, values, converter, element)
+        if target is not None:
+            field_name, is_list = target
+            if is_list:
+                stack[-1][1].setdefault(field_name, []).append(value)
+            else:
+                stack[-1][1][field_name] = value
+        return value
+
+    def _bind(self, events, clazz: type, clear: bool):
+        stack = []
+        for event, element in events:
+            if event == "start":
+                stack.append(self._start(stack, element.tag, clazz))
+                continue
+            value = self._end(stack, element)
+            if clear:
+                element.clear()
+            if not stack:
+                return value
+
+    def from_path(self, path: pathlib.Path, clazz: type):
+        """Binds an XML file to a dataclass, parsing it incrementally.
+
+        Args:
+            path (pathlib.Path): Path to the XML file.
+            clazz (type): The dataclass of the root element.
+
+        Returns:
+            The dataclass instance.
+        """
+
+        events = etree.iterparse(str(path), events=_EVENTS, tag=etree.Element, remove_comments=True)
+        return self._bind(events, clazz, True)
+
+    def parse(self, tree: etree._ElementTree, clazz: type):
+        """Binds an already parsed XML file to a dataclass.
+
+        Args:
+            tree (etree._ElementTree): The XML file.
+            clazz (type): The dataclass of the root element.
+
+        Returns:
+            The dataclass instance.
+        """
+
+        return self._bind(etree.iterwalk(tree, events=_EVENTS, tag=etree.Element), clazz, False)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Fixtures shared by the tests of ecoa-toolset."""
+
+# Standard library imports
+import enum
+import importlib.util
+import os
+import sys
+
+# Third-Party library imports
+import pytest
+
+# Internal library imports
+from ecoa_toolset.models.ecoa_model import ECOAModel
+
+SYNTHETIC_PROJECT_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "benchmarks", "synthetic_project.py")
+# The attributes of the ECOA model which are not built from the ECOA XML files
+IGNORED_ATTRIBUTES = ["project_path", "ecoa_xml_model", "types_helper"]
+
+
+def _get_attributes(value):
+    # The attributes of an object, the components being slotted
+    if hasattr(value, "__dict__"):
+        return vars(value)
+    slots = [name for clazz in type(value).__mro__ for name in getattr(clazz, "__slots__", ())]
+    return {name: getattr(value, name) for name in slots} if slots else None
+
+
+def _normalize(value, parents=()):
+    # Comparable representation of the model, the objects being compared by type and attributes
+    if isinstance(value, (enum.Enum, str, int, float, bool, type(None))):
+        return value
+    if id(value) in parents:
+        return "<cycle>"
+    parents = parents + (id(value),)
+    if isinstance(value, dict):
+        return [(_normalize(key, parents), _normalize(item, parents)) for key, item in value.items()]
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item, parents) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_normalize(item, parents) for item in value), key=repr)
+    attributes = _get_attributes(value)
+    if attributes is not None:
+        return (type(value).__name__, _normalize(attributes, parents))
+    return repr(value)
+
+
+@pytest.fixture(scope="session")
+def synthetic_project():
+    """The writer of synthetic ECOA projects of the benchmarks, loaded from its file."""
+    spec = importlib.util.spec_from_file_location("synthetic_project", SYNTHETIC_PROJECT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # Registered before being executed, as required by its dataclass
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def write_project(tmp_path, synthetic_project):
+    """Writes a synthetic ECOA project of the given size (see ProjectSize) and returns the path to its project file."""
+
+    def write(**size) -> str:
+        return synthetic_project.write_project(str(tmp_path), synthetic_project.ProjectSize(**size))
+
+    return write
+
+
+@pytest.fixture
+def read_ecoa_model():
+    """Reads and parses an ECOA project."""
+
+    def read(project_path: str, fast_parsing: bool = False) -> ECOAModel:
+        project_name = os.path.basename(project_path).split(".")[0]
+        ecoa_model = ECOAModel(project_name, project_path, 1, None, None, fast_parsing)
+        ecoa_model.parse()
+        return ecoa_model
+
+    return read
+
+
+@pytest.fixture
+def normalize_model():
+    """Gives a comparable representation of each attribute of an ECOA model built from the ECOA XML files, the
+    objects being compared by type and attributes (not by identity)."""
+
+    def normalize(ecoa_model: ECOAModel) -> dict:
+        return {
+            name: _normalize(getattr(ecoa_model, name))
+            for name in ECOAModel.__annotations__
+            if not name.startswith("_") and name not in IGNORED_ATTRIBUTES
+        }
+
+    return normalize
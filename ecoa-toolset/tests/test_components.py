@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Test of the slotted components of the ECOA model, built from a synthetic ECOA project."""
+
+# Standard library imports
+import sys
+
+# Internal library imports
+from ecoa_toolset.models import components
+from ecoa_toolset.models.components import Parameter
+from ecoa_toolset.models.ecoa_model import ECOAModel
+
+SIZE = dict(components=6, modules=3, types=40, operations=2, wires=8, libraries=3)
+
+
+def _build_unshared_parameters(ecoa_model: ECOAModel, parameters):
+    # A new list of new parameters on each call, without any memoization
+    types_helper = ecoa_model.types_helper
+    unshared_parameters = []
+    for param in parameters:
+        parameter_type = types_helper.add_namespace(param.type)
+        unshared_parameters.append(
+            Parameter(
+                param.name,
+                types_helper.get_namespace(parameter_type),
+                types_helper.get_name(parameter_type),
+                types_helper.get_type_category(parameter_type),
+            )
+        )
+    return unshared_parameters
+
+
+def _get_operations(ecoa_model: ECOAModel):
+    return [
+        operation
+        for operations in [*ecoa_model.events_send.values(), *ecoa_model.events_received.values()]
+        for operation in operations
+    ]
+
+
+def test_slotted_components(write_project, read_ecoa_model):
+    for operation in _get_operations(read_ecoa_model(write_project(**SIZE))):
+        assert not hasattr(operation, "__dict__")
+        assert all(not hasattr(parameter, "__dict__") for parameter in operation.inputs)
+        assert operation.name is sys.intern(operation.name)
+
+
+def test_shared_parameters(write_project, read_ecoa_model):
+    operations = _get_operations(read_ecoa_model(write_project(**SIZE)))
+    lists = {}
+    for operation in operations:
+        key = tuple((parameter.name, parameter.namespace, parameter.type) for parameter in operation.inputs)
+        lists.setdefault(key, set()).add(id(operation.inputs))
+    # The operations with the same parameters share a single list
+    assert len(lists) < len(operations)
+    assert all(len(ids) == 1 for ids in lists.values())
+
+
+def test_same_model_without_memoization(write_project, read_ecoa_model, normalize_model, monkeypatch):
+    project_path = write_project(**SIZE)
+    ecoa_model = read_ecoa_model(project_path)
+    # The model built without interning the names nor sharing the parameters
+    monkeypatch.setattr(components, "_intern", lambda name: name)
+    monkeypatch.setattr(ECOAModel, "build_parameters", _build_unshared_parameters)
+    unshared_model = read_ecoa_model(project_path)
+    assert len({id(operation.inputs) for operation in _get_operations(unshared_model)}) > len(
+        {id(operation.inputs) for operation in _get_operations(ecoa_model)}
+    )
+    expected = normalize_model(unshared_model)
+    for name, value in normalize_model(ecoa_model).items():
+        assert value == expected[name], name
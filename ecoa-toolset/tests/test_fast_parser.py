@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Differential test of the FastParser against the xsdata XmlParser on synthetic ECOA projects."""
+
+# Standard library imports
+import glob
+import os
+import pathlib
+
+# Third-Party library imports
+import pytest
+from lxml import etree
+
+# Internal library imports
+from ecoa_toolset.models.ecoa_objects import ecoa_project_2_0
+from ecoa_toolset.models.ecoa_xml_model import _create_xml_parser
+from ecoa_toolset.utils.xml.fast_parser import FastParser
+
+SIZES = [
+    dict(components=2, modules=2, types=10, operations=1, wires=2, libraries=1),
+    dict(components=6, modules=3, types=40, operations=2, wires=8, libraries=3),
+]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_same_ecoa_model(write_project, read_ecoa_model, normalize_model, size):
+    project_path = write_project(**size)
+    xsdata_model = read_ecoa_model(project_path, False)
+    fast_model = read_ecoa_model(project_path, True)
+    for name in ["_project", "_types", "_services", "_components", "_deployment"]:
+        assert getattr(fast_model.ecoa_xml_model, name) == getattr(xsdata_model.ecoa_xml_model, name), name
+    expected = normalize_model(xsdata_model)
+    for name, value in normalize_model(fast_model).items():
+        assert value == expected[name], name
+
+
+def test_same_bindings_of_parsed_trees(write_project, read_ecoa_model):
+    project_path = write_project(**SIZES[0])
+    xml_model = read_ecoa_model(project_path).ecoa_xml_model
+    directory = os.path.dirname(project_path)
+    files = {project_path: ecoa_project_2_0.Ecoaproject}
+    for bound_files in [xml_model._types, xml_model._services, xml_model._components, xml_model._deployment]:
+        files.update((os.path.join(directory, file), type(value)) for file, value in bound_files.items())
+    assert len(files) == len(glob.glob(os.path.join(directory, "**", "*.xml"), recursive=True))
+    xml_parser = _create_xml_parser()
+    fast_parser = FastParser()
+    for path, clazz in files.items():
+        expected = xml_parser.from_path(pathlib.Path(path), clazz)
+        assert fast_parser.parse(etree.parse(path), clazz) == expected, path
+        assert fast_parser.from_path(pathlib.Path(path), clazz) == expected, path
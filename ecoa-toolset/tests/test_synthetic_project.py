@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Test of the validity of the default synthetic ECOA project of the benchmarks."""
+
+# Standard library imports
+import glob
+import os
+import shutil
+import subprocess
+import sys
+
+# Third-Party library imports
+import pytest
+from lxml import etree
+
+# The ECOA checker command, opt-in (the checker is not distributed with the toolset)
+CHECKER = os.environ.get("ECOA_CHECKER")
+# Command standing for the checker when the generators are run without it
+NO_CHECKER = sys.executable + " -c pass"
+COMPILER = shutil.which("g++")
+GENERATORS = [shutil.which("ecoa-csmgvt"), shutil.which("ecoa-mscigt")]
+
+
+def _get_signature(operation):
+    # The type of a versioned data or the direction and type of each parameter of an event or a request
+    if operation.get("type"):
+        return [operation.get("type")]
+    return [(etree.QName(parameter).localname, parameter.get("type")) for parameter in operation]
+
+
+def _get_operations(component_impl, service_operations):
+    # The signature of each operation of each module instance, and of each operation of the services
+    module_types = {module_type.get("name"): module_type for module_type in component_impl.iterfind("{*}moduleType")}
+    module_impls = {
+        module_impl.get("name"): module_impl for module_impl in component_impl.iterfind("{*}moduleImplementation")
+    }
+    operations = {}
+    for instance in component_impl.iterfind("{*}moduleInstance"):
+        module_type = module_types[module_impls[instance.get("implementationName")].get("moduleType")]
+        for operation in module_type.find("{*}operations"):
+            operations[(instance.get("name"), operation.get("name"))] = _get_signature(operation)
+    for kind in ["service", "reference"]:
+        operations.update(((kind, name), signature) for name, signature in service_operations.items())
+    return operations
+
+
+def _get_link_signatures(link, operations):
+    # The signatures of the operations of a link, except the triggers and the external operations
+    signatures = []
+    for end in link.iterfind("*/*"):
+        kind = etree.QName(end).localname
+        if kind in ["moduleInstance", "service", "reference"]:
+            key = end.get("instanceName") if kind == "moduleInstance" else kind
+            signatures.append(operations[(key, end.get("operationName"))])
+    return signatures
+
+
+def test_linked_operations(write_project):
+    directory = os.path.dirname(write_project())
+    service = etree.parse(os.path.join(directory, "1-Services", "service.interface.xml")).find("{*}operations")
+    service_operations = {operation.get("name"): _get_signature(operation) for operation in service}
+    for path in glob.glob(os.path.join(directory, "4-ComponentImplementations", "*", "*.impl.xml")):
+        component_impl = etree.parse(path).getroot()
+        operations = _get_operations(component_impl, service_operations)
+        links = [element for element in component_impl if etree.QName(element).localname.endswith("Link")]
+        assert links, path
+        for link in links:
+            signatures = _get_link_signatures(link, operations)
+            assert all(signature == signatures[0] for signature in signatures), etree.tostring(link)
+
+
+@pytest.mark.skipif(not CHECKER, reason="ECOA_CHECKER is not set")
+def test_checker(write_project):
+    assert subprocess.run(CHECKER.split() + ["-p", write_project()]).returncode == 0
+
+
+@pytest.mark.skipif(not COMPILER or not all(GENERATORS), reason="g++ or the generators are not available")
+def test_csm_compiles(write_project, tmp_path):
+    project_path = write_project()
+    directory = os.path.dirname(project_path)
+    csm = tmp_path / "csm"
+    for generator, output in zip(GENERATORS, [csm, tmp_path / "mscigt"]):
+        command = [generator, "-p", project_path, "-k", CHECKER or NO_CHECKER, "-o", str(output), "-n"]
+        assert subprocess.run(command, cwd=directory, capture_output=True).returncode == 0, generator
+    includes = [csm / "src", csm / "0-Types" / "inc", *csm.glob("CI*")]
+    includes += glob.glob(os.path.join(directory, "4-ComponentImplementations", "*", "*", "inc*"))
+    for source in (csm / "src").glob("*.cpp"):
+        command = [COMPILER, "-std=c++14", "-fsyntax-only", *("-I" + str(path) for path in includes), str(source)]
+        result = subprocess.run(command, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
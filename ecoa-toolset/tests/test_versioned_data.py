@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023 Dassault Aviation
+# SPDX-License-Identifier: MIT
+
+"""Test of the versioned data accesses generated for a synthetic ECOA project."""
+
+# Third-Party library imports
+import pytest
+
+# Internal library imports
+from ecoa_toolset.generators.container.common import Common
+from ecoa_toolset.generators.container.functions.versioned_data import VersionedDataGenerator
+
+SIZE = dict(components=2, modules=2, types=10, operations=1, wires=2, libraries=1)
+# The operation following the get access function of each type of access
+NEXT_OPERATION = {"read": "__release_read_access", "write": "__cancel_write_access"}
+
+
+def _get_access_functions(ecoa_model, dispatch: str):
+    generator = VersionedDataGenerator(0, 2, True, False, dispatch)
+    for type, elements in [("read", ecoa_model.data_read), ("write", ecoa_model.data_written)]:
+        for element in [element for values in elements.values() for element in values]:
+            yield element, generator.generate(element, type).split(NEXT_OPERATION[type])[0]
+
+
+@pytest.mark.parametrize("dispatch", [Common.IF_DISPATCH, Common.SWITCH_DISPATCH])
+def test_platform_hook_set_on_every_return(write_project, read_ecoa_model, dispatch):
+    controlled = 0
+    for element, code in _get_access_functions(read_ecoa_model(write_project(**SIZE)), dispatch):
+        lines = [line.strip() for line in code.splitlines()]
+        hook = lines.index(
+            next(line for line in lines if line.endswith("platform_hook, &slot_used, sizeof(slot_used));"))
+        )
+        returns = [index for index, line in enumerate(lines) if line.startswith("return ")]
+        # The release and cancel operations read the platform hook of the handle, whatever the returned status
+        assert returns and min(returns) > hook, element.name
+        controlled += "RESOURCE_NOT_AVAILABLE" in code
+    assert controlled